@@ -31,6 +31,7 @@ CREATE TABLE `customers` (
   `customer_zip_code` int DEFAULT NULL,
   PRIMARY KEY (`customer_id`),
   KEY `customer_fk1_idx` (`customer_zip_code`),
+  KEY `customer_email_idx` (`customer_email`),
   CONSTRAINT `customer_fk1` FOREIGN KEY (`customer_zip_code`) REFERENCES `geolocation` (`geolocation_id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -73,6 +74,20 @@ INSERT INTO `geolocation` VALUES (58712,47.96799,-100.54559,'Balfour','North Dak
 /*!40000 ALTER TABLE `geolocation` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `id_sequences`
+--
+
+DROP TABLE IF EXISTS `id_sequences`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `id_sequences` (
+  `name` varchar(64) NOT NULL,
+  `next_id` bigint NOT NULL,
+  PRIMARY KEY (`name`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `order_items`
 --
@@ -221,6 +236,23 @@ INSERT INTO `product_stock` VALUES ('P1','S1',45),('P10','S10',48),('P100','S100
 /*!40000 ALTER TABLE `product_stock` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `product_stock_shards`
+--
+
+DROP TABLE IF EXISTS `product_stock_shards`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `product_stock_shards` (
+  `product_id` varchar(200) NOT NULL,
+  `seller_id` varchar(200) NOT NULL,
+  `shard` int NOT NULL,
+  `stock` int NOT NULL DEFAULT '0',
+  PRIMARY KEY (`product_id`,`seller_id`,`shard`),
+  CONSTRAINT `product_stock_shards_ibfk_1` FOREIGN KEY (`product_id`, `seller_id`) REFERENCES `product_stock` (`product_id`, `seller_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `products`
 --
@@ -237,7 +269,11 @@ CREATE TABLE `products` (
   `product_height` double DEFAULT NULL,
   `product_width` double DEFAULT NULL,
   `product_price` decimal(5,2) DEFAULT NULL,
-  PRIMARY KEY (`product_id`)
+  `product_updated_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (`product_id`),
+  KEY `product_price_idx` (`product_price`,`product_id`),
+  KEY `product_category_price_idx` (`product_category`,`product_price`,`product_id`),
+  KEY `product_updated_at_idx` (`product_updated_at`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -247,7 +283,7 @@ CREATE TABLE `products` (
 
 LOCK TABLES `products` WRITE;
 /*!40000 ALTER TABLE `products` DISABLE KEYS */;
-INSERT INTO `products` VALUES ('P01000','Shoes','Black Boots',500,40,30,25,56.00),('P1','Electronics','Soft cotton t-shirt',8.9,56.85,62.25,77.25,42.25),('P10','Books','Wooden picture frame',25.32,10.19,88.65,72.09,30.31),('P100','Toys','Soft cotton t-shirt',12.54,58.22,64.73,13.21,23.79),('P1000','Clothing','Leather wallet',7.08,40.77,90.06,53.31,27.04),('P1001','Electronics','Smartphone with 64GB storage',0.5,15,8,1,699.99),('P1002','Home Appliances','Vacuum Cleaner 1200W',3,50,20,15,299.99),('P1003','Books','Fictional novel',0.3,22,15,2,19.99),('P101','Sports & Outdoors','Wooden picture frame',22.72,20.81,25.81,29.01,62.83),('P102','Sports & Outdoors','Wooden picture frame',49.01,70.56,52.15,80.12,34.03),('P103','Food & Beverage','Soft cotton t-shirt',47.41,28.33,26.74,14.69,79.65),('P104','Beauty','Wooden picture frame',4.34,1.01,61,20.96,97.15),('P105','Home Decor','Leather wallet',5.57,91.89,78.91,99.45,47.83),('P106','Home Decor','Leather wallet',4.16,36.24,60.1,19.31,45.68),('P107','Electronics','Ceramic coffee mug',40.17,39.01,58.71,87.52,83.90),('P108','Sports & Outdoors','Leather wallet',7.77,95.93,35.22,43.32,83.47),('P109','Sports & Outdoors','Ceramic coffee mug',0.24,93.15,41.16,72.99,65.64),('P11','Home Decor','Wooden picture frame',16.97,78.2,60.43,25,76.82),('P110','Toys','Stainless steel water bottle',15.96,60.18,65.55,75.72,87.15),('P111','Toys','Ceramic coffee mug',9.07,50.98,58.85,30.49,6.31),('P112','Electronics','Stainless steel water bottle',4.3,83.07,15.79,87.35,66.10),('P113','Electronics','Ceramic coffee mug',45.45,42.85,67.35,74.25,13.58),('P114','Sports & Outdoors','Soft cotton t-shirt',39.46,64.35,23.01,58.05,66.58),('P115','Food & Beverage','Soft cotton t-shirt',30.62,81.5,13.8,52.13,93.16),('P116','Sports & Outdoors','Leather wallet',39.39,48.92,52.19,33.83,67.07),('P117','Toys','Leather wallet',19.74,68.67,99.19,73.74,54.85),('P118','Beauty','Soft cotton t-shirt',27.53,79.93,67.4,50.15,72.07),('P119','Clothing','Leather wallet',18.8,25.93,18.64,19.34,95.77),('P12','Home Decor','Ceramic coffee mug',39.72,45.02,89.42,68.97,63.64),('P120','Toys','Ceramic coffee mug',34.67,60.12,38.96,63.27,29.91),('P121','Clothing','Soft cotton t-shirt',25.25,95.2,54.4,52.27,56.62),('P122','Beauty','Soft cotton t-shirt',1.61,16.4,76.56,25.42,93.39),('P123','Home Decor','Stainless steel water bottle',43.48,34.76,38.96,23.51,98.06),('P124','Books','Ceramic coffee mug',16.35,79.84,66.91,88.44,11.15),('P125','Toys','Ceramic coffee mug',31.73,77.52,21.22,53.42,57.55),('P126','Beauty','Stainless steel water bottle',33.97,98.15,45.61,68.61,55.32),('P127','Electronics','Leather wallet',29.9,28.39,6.75,96.06,3.93),('P128','Sports & Outdoors','Ceramic coffee mug',7.09,12.35,22.24,61.6,50.70),('P129','Books','Wooden picture frame',3.98,25.38,47.39,83.77,42.73),('P13','Food & Beverage','Stainless steel water bottle',38.61,40.51,13.26,21.86,60.52),('P130','Books','Wooden picture frame',40.21,16.02,8.51,84.35,74.44),('P131','Food & Beverage','Stainless steel water bottle',14.9,49.33,78.39,22.4,90.63),('P132','Electronics','Soft cotton t-shirt',3.69,60.85,91.09,96.83,30.84),('P133','Home Decor','Soft cotton t-shirt',15.7,49.66,2.35,98.38,79.29),('P134','Food & Beverage','Stainless steel water bottle',0.28,24.15,28.74,99.31,5.92),('P135','Food & Beverage','Wooden picture frame',18.35,75.04,1.42,89.88,87.76),('P136','Clothing','Stainless steel water bottle',35.51,97.37,65.74,81.55,24.01),('P137','Books','Wooden picture frame',8.32,55.55,17.56,23.48,53.79),('P138','Clothing','Stainless steel water bottle',5.66,21.06,15.84,8.9,96.89),('P139','Clothing','Leather wallet',36.86,79.5,14.5,82.88,25.11),('P14','Clothing','Wooden picture frame',33.85,92.96,56.98,97.16,31.89),('P140','Sports & Outdoors','Leather wallet',26.35,1.89,28.89,51.28,83.11),('P141','Sports & Outdoors','Soft cotton t-shirt',39.5,49.13,75.01,79.42,21.86),('P142','Toys','Leather wallet',4.21,12.3,22.02,79.76,56.99),('P143','Sports & Outdoors','Stainless steel water bottle',6.86,33.25,33.95,8.56,20.37),('P144','Electronics','Soft cotton t-shirt',31.23,32.2,13.35,10.79,28.87),('P145','Electronics','Soft cotton t-shirt',15.16,19.52,43.08,92.64,82.25),('P146','Books','Soft cotton t-shirt',1.93,83.09,95.87,58.14,26.65),('P147','Food & Beverage','Soft cotton t-shirt',43.63,84.93,8.92,97.18,83.50),('P148','Home Decor','Soft cotton t-shirt',32.49,8.38,39.14,51.04,39.52),('P149','Books','Ceramic coffee mug',7.45,44.81,57.6,37.4,45.13),('P15','Beauty','Soft cotton t-shirt',10.95,75.22,34.99,39.77,7.10),('P150','Sports & Outdoors','Stainless steel water bottle',17.3,21.11,12.36,44.86,97.08),('P151','Beauty','Soft cotton t-shirt',26.48,20.9,68.94,69.72,67.11),('P152','Beauty','Soft cotton t-shirt',39.83,16.62,22.79,56.34,43.29),('P153','Toys','Wooden picture frame',39.05,76.61,2.02,18.29,14.14),('P154','Beauty','Ceramic coffee mug',17.05,81.52,28.41,91.52,38.85),('P155','Electronics','Soft cotton t-shirt',28.31,69.69,48.75,19.7,51.79),('P156','Electronics','Wooden picture frame',36.16,80.17,47.25,71.39,42.42),('P157','Clothing','Leather wallet',11.66,37.97,98.85,93.86,55.75),('P158','Beauty','Soft cotton t-shirt',10.49,80.61,86.8,20.04,51.47),('P159','Food & Beverage','Ceramic coffee mug',34.01,62.51,88.03,52.27,89.10),('P16','Home Decor','Wooden picture frame',38.99,53.33,53.19,95.49,92.10),('P160','Clothing','Leather wallet',4,73.59,22.42,70.13,93.19),('P161','Toys','Soft cotton t-shirt',48.54,73.28,90.67,78.54,89.67),('P162','Beauty','Leather wallet',3.47,69.63,17.52,73.77,68.75),('P163','Sports & Outdoors','Leather wallet',26.26,50.78,25.83,82.05,73.76),('P164','Electronics','Leather wallet',0.63,58.91,34.12,76.3,62.54),('P165','Beauty','Leather wallet',35.91,16.59,56.78,85.31,90.42),('P166','Home Decor','Wooden picture frame',49.6,23.1,87.11,49.69,65.47),('P167','Toys','Ceramic coffee mug',38.21,41.32,91.73,48.59,55.08),('P168','Books','Wooden picture frame',41.52,16.51,79.1,84.36,78.00),('P169','Home Decor','Wooden picture frame',4.62,38.82,60.5,70.98,25.76),('P17','Sports & Outdoors','Leather wallet',35.12,89.11,6.28,47.89,91.82),('P170','Beauty','Ceramic coffee mug',43.77,17.34,50.72,52.91,83.80),('P171','Books','Soft cotton t-shirt',44.02,18.3,88.92,18.77,43.55),('P172','Toys','Ceramic coffee mug',46.65,71.77,96.49,53.05,64.35),('P173','Toys','Stainless steel water bottle',14.01,97.67,84.07,55.92,91.10),('P174','Toys','Wooden picture frame',8.78,44.75,88.58,96.1,63.43),('P175','Food & Beverage','Wooden picture frame',5.65,72.37,28.94,11.27,42.87),('P176','Sports & Outdoors','Stainless steel water bottle',11.28,34.69,23.55,72.96,23.07),('P177','Books','Soft cotton t-shirt',5.53,2.89,22.63,13.77,84.73),('P178','Books','Ceramic coffee mug',26.36,79.73,15.91,76.18,56.43),('P179','Beauty','Stainless steel water bottle',48,75.49,98.18,49.12,26.98),('P18','Toys','Soft cotton t-shirt',42.34,21.42,89.8,21.03,63.60),('P180','Home Decor','Leather wallet',47.34,1.9,48.83,36.95,38.06),('P181','Toys','Ceramic coffee mug',10.64,22.45,39.69,84.38,97.48),('P182','Electronics','Leather wallet',32.05,82.48,97.58,62.41,75.25),('P183','Books','Stainless steel water bottle',42.52,87.91,79.38,8.8,82.78),('P184','Clothing','Soft cotton t-shirt',47.08,18,54.65,89.76,88.17),('P185','Electronics','Stainless steel water bottle',20.81,53.56,57.87,27.83,92.49),('P186','Books','Wooden picture frame',39.99,95.05,52.75,37.13,97.95),('P187','Clothing','Ceramic coffee mug',35.31,28.05,73.65,64.31,13.26),('P188','Sports & Outdoors','Soft cotton t-shirt',37.44,85.53,59.97,30.15,68.47),('P189','Books','Ceramic coffee mug',38.92,52.3,86.21,97.48,4.58),('P19','Sports & Outdoors','Stainless steel water bottle',14.14,99.65,18.16,42.33,14.50),('P190','Toys','Wooden picture frame',46.41,7.52,51.37,51.96,57.74),('P191','Home Decor','Ceramic coffee mug',36.2,51.9,35.13,86.38,46.21),('P192','Beauty','Leather wallet',40.27,20.75,77.7,11.25,56.84),('P193','Books','Ceramic coffee mug',33.7,41.27,62.76,57.2,45.54),('P194','Toys','Ceramic coffee mug',19.34,62.55,15.98,99.67,56.21),('P195','Home Decor','Soft cotton t-shirt',10.29,24.44,20.35,85.73,44.41),('P196','Home Decor','Wooden picture frame',41.69,39.34,7.84,56.87,52.44),('P197','Home Decor','Ceramic coffee mug',35.41,51.13,86.64,70.97,28.94),('P198','Food & Beverage','Soft cotton t-shirt',24.71,3.5,94.49,14.29,85.41),('P199','Home Decor','Soft cotton t-shirt',7.71,89.61,45.97,60.85,42.23),('P2','Books','Leather wallet',46.25,81.98,19.02,57.61,52.91),('P20','Home Decor','Leather wallet',28.94,100,74.08,81.11,37.87),('P200','Books','Soft cotton t-shirt',28.77,17.83,85.58,21.94,29.63),('P201','Clothing','Wooden picture frame',44.23,1.65,62.6,17.74,33.54),('P202','Sports & Outdoors','Ceramic coffee mug',46.29,17.44,27.96,38.63,77.82),('P203','Food & Beverage','Wooden picture frame',39.24,4.53,45.55,84.38,89.45),('P204','Sports & Outdoors','Soft cotton t-shirt',32.17,26.21,66.76,33.57,14.81),('P205','Home Decor','Soft cotton t-shirt',45.77,87.71,44.94,13.25,2.70),('P206','Electronics','Stainless steel water bottle',12.8,75.24,23.82,64.74,67.05),('P207','Beauty','Soft cotton t-shirt',32.27,36.82,52.2,29.74,29.14),('P208','Home Decor','Wooden picture frame',43.37,91.63,74.84,86.61,42.57),('P209','Beauty','Stainless steel water bottle',27.1,41.27,61.5,78.51,25.44),('P21','Toys','Soft cotton t-shirt',7.91,6.34,19.52,8.42,97.48),('P210','Books','Leather wallet',11.83,12.36,22.25,72.46,14.10),('P211','Electronics','Soft cotton t-shirt',18.92,25.73,31.65,13.38,74.03),('P212','Books','Soft cotton t-shirt',33.03,24.6,15.83,66.27,29.88),('P213','Clothing','Leather wallet',37.23,73.1,14.02,49.32,25.29),('P214','Home Decor','Soft cotton t-shirt',10.39,81.32,38.74,1.9,35.82),('P215','Food & Beverage','Ceramic coffee mug',12.61,69.91,51.55,50.88,3.22),('P216','Home Decor','Stainless steel water bottle',17.32,17.79,40.02,86.9,6.63),('P217','Books','Leather wallet',16.7,68.55,58.5,63.41,22.50),('P218','Beauty','Wooden picture frame',5.84,6.98,21.04,92.14,91.63),('P219','Toys','Wooden picture frame',49.25,66.45,2.81,40.81,92.62),('P22','Electronics','Soft cotton t-shirt',1.65,42.47,73.65,30.84,88.24),('P220','Electronics','Leather wallet',18.5,36.77,73.6,88.81,63.33),('P221','Food & Beverage','Leather wallet',48.2,88.51,75.36,1.6,50.92),('P222','Food & Beverage','Ceramic coffee mug',36.67,76.49,95.54,54.56,63.62),('P223','Sports & Outdoors','Soft cotton t-shirt',24.11,30.19,82.61,81.95,65.33),('P224','Electronics','Ceramic coffee mug',40.72,85.03,12.76,71.16,35.79),('P225','Food & Beverage','Soft cotton t-shirt',18.22,72.48,78.66,7.13,80.95),('P226','Sports & Outdoors','Ceramic coffee mug',9.78,63.33,93.29,48.83,98.38),('P227','Books','Ceramic coffee mug',48.49,13.68,50.04,47.39,50.07),('P228','Clothing','Stainless steel water bottle',12.87,57.84,34.28,53.06,53.19),('P229','Books','Leather wallet',0.38,39.86,1.07,80.22,15.73),('P23','Beauty','Wooden picture frame',34.43,63.03,58.5,48.19,17.11),('P230','Food & Beverage','Ceramic coffee mug',8.24,78.65,39.7,65.7,37.34),('P231','Clothing','Ceramic coffee mug',30.58,97.89,70.07,48.01,35.38),('P232','Sports & Outdoors','Stainless steel water bottle',11.36,96.21,47.64,7.5,63.86),('P233','Sports & Outdoors','Wooden picture frame',16.66,76.29,35.85,52.08,14.17),('P234','Home Decor','Ceramic coffee mug',34.8,58.67,40.43,44.34,76.28),('P235','Clothing','Ceramic coffee mug',2.51,81.55,23.55,67.28,40.90),('P236','Beauty','Soft cotton t-shirt',19.91,61.63,89.68,81.73,73.66),('P237','Clothing','Stainless steel water bottle',23.33,62.48,83.38,14.02,46.58),('P238','Toys','Ceramic coffee mug',42.91,11.49,50.27,47.65,10.91),('P239','Food & Beverage','Wooden picture frame',16.89,7.65,61.29,41.95,12.84),('P24','Clothing','Soft cotton t-shirt',19.74,4.61,9.33,92.54,30.44),('P240','Food & Beverage','Ceramic coffee mug',9.78,18.07,71.97,90.88,13.69),('P241','Clothing','Wooden picture frame',23.98,78.79,6.38,34.36,75.14),('P242','Food & Beverage','Stainless steel water bottle',16.5,55.35,15.02,95.45,36.62),('P243','Food & Beverage','Ceramic coffee mug',17.5,86.79,47.15,92.57,55.70),('P244','Clothing','Stainless steel water bottle',24.91,79.27,18.7,89.47,68.63),('P245','Clothing','Soft cotton t-shirt',30.2,65.82,96.34,95.57,76.04),('P246','Sports & Outdoors','Leather wallet',39.04,29.92,73.62,49.05,74.30),('P247','Home Decor','Stainless steel water bottle',1.28,43.07,72.85,10.79,43.39),('P248','Toys','Wooden picture frame',45.94,21.55,56.16,5.09,92.06),('P249','Beauty','Wooden picture frame',20.19,24.11,73.53,31.45,32.13),('P25','Toys','Wooden picture frame',44.95,38.47,97.46,33.05,81.46),('P250','Toys','Ceramic coffee mug',22.81,52.82,19.98,90.96,12.90),('P251','Toys','Ceramic coffee mug',5.68,80.47,29.39,38.95,17.11),('P252','Clothing','Soft cotton t-shirt',20.01,22.96,93.32,44.47,45.86),('P253','Electronics','Soft cotton t-shirt',11.13,68.92,31.55,2.53,77.99),('P254','Toys','Ceramic coffee mug',46.48,8.25,74.66,66.89,53.37),('P255','Home Decor','Ceramic coffee mug',43.2,51.55,64.87,30.11,31.88),('P256','Books','Leather wallet',14.02,61.11,64.55,3.02,97.29),('P257','Clothing','Leather wallet',5.4,50.55,29.07,69.07,92.82),('P258','Food & Beverage','Stainless steel water bottle',2.33,22.92,21.61,78.37,72.20),('P259','Toys','Wooden picture frame',47.68,80.4,2.64,16.34,81.56),('P26','Food & Beverage','Leather wallet',2.01,55.59,74.7,80.23,91.21),('P260','Home Decor','Soft cotton t-shirt',18.94,96.97,23.18,42.36,12.36),('P261','Beauty','Leather wallet',22.44,61.43,26.48,87.6,84.15),('P262','Beauty','Ceramic coffee mug',32.69,23.97,98.55,28.07,85.69),('P263','Books','Stainless steel water bottle',27.74,49.11,72.6,34.33,75.99),('P264','Sports & Outdoors','Soft cotton t-shirt',37.03,70.56,87.75,45.82,22.89),('P265','Sports & Outdoors','Stainless steel water bottle',45.42,90.12,33.96,77.72,83.46),('P266','Books','Stainless steel water bottle',16.02,1.85,25.9,56.91,50.62),('P267','Food & Beverage','Leather wallet',6.61,68.79,2.7,60.11,1.74),('P268','Home Decor','Wooden picture frame',3.77,32.34,26.39,15.95,53.82),('P269','Toys','Leather wallet',38.43,28.56,45.17,9.29,64.89),('P27','Home Decor','Soft cotton t-shirt',37.21,75.3,35.6,10.63,63.01),('P270','Beauty','Wooden picture frame',37.55,67.11,9.71,68.57,20.36),('P271','Beauty','Stainless steel water bottle',28.1,63.43,51.03,87.05,10.80),('P272','Home Decor','Wooden picture frame',29.78,75.85,24.05,83.98,90.89),('P273','Food & Beverage','Stainless steel water bottle',30.52,78.91,81.1,26.67,25.04),('P274','Books','Ceramic coffee mug',27.67,48.68,56.59,23.45,49.54),('P275','Beauty','Soft cotton t-shirt',21.29,67.58,35.95,47.75,72.59),('P276','Toys','Leather wallet',30.31,92.76,10.47,83.84,15.32),('P277','Electronics','Ceramic coffee mug',3.07,24.24,95.91,97.21,55.85),('P278','Beauty','Leather wallet',13.71,57.27,82.19,79.13,34.27),('P279','Clothing','Wooden picture frame',47.4,39.76,82.57,66.3,2.80),('P28','Toys','Ceramic coffee mug',39.55,65.43,79.47,18.88,9.20),('P280','Toys','Stainless steel water bottle',25.79,20.62,16.31,58.32,36.58),('P281','Sports & Outdoors','Leather wallet',32.19,90.31,77.49,49.17,55.32),('P282','Home Decor','Wooden picture frame',30.91,15,55.04,61.93,66.84),('P283','Books','Soft cotton t-shirt',4,72.3,19.69,24.75,68.23),('P284','Clothing','Stainless steel water bottle',19.59,19.4,62.6,94.96,40.65),('P285','Clothing','Ceramic coffee mug',32.79,51.44,56.21,2.82,96.55),('P286','Food & Beverage','Soft cotton t-shirt',21,30.8,40.33,99.75,62.79),('P287','Food & Beverage','Stainless steel water bottle',33.09,62.03,78.62,52.54,23.31),('P288','Food & Beverage','Stainless steel water bottle',4.46,12.01,89.17,60.25,26.20),('P289','Electronics','Soft cotton t-shirt',11.4,60.96,92.71,5.84,60.04),('P29','Electronics','Stainless steel water bottle',45.46,2.59,60.24,55.33,22.60),('P290','Toys','Wooden picture frame',44.53,16.62,82.08,83.04,30.89),('P291','Clothing','Stainless steel water bottle',13.76,5.55,31.5,1.56,85.66),('P292','Beauty','Leather wallet',7.17,19.29,27.44,38.26,37.61),('P293','Toys','Soft cotton t-shirt',16.12,51.18,61.24,77.43,29.08),('P294','Food & Beverage','Soft cotton t-shirt',14.34,4.17,85.66,4.54,31.55),('P295','Clothing','Soft cotton t-shirt',22.59,59.95,85.75,10.85,69.52),('P296','Food & Beverage','Ceramic coffee mug',30.53,20.89,3.4,49.64,53.95),('P297','Beauty','Stainless steel water bottle',32.73,89.41,94.31,48.09,60.21),('P298','Beauty','Ceramic coffee mug',43.44,58.03,31.31,80.1,39.20),('P299','Toys','Soft cotton t-shirt',3.43,86.35,68.06,41.46,14.36),('P3','Home Decor','Stainless steel water bottle',49.91,87.74,96.41,54.16,52.18),('P30','Books','Stainless steel water bottle',9.19,28.47,14.15,83.9,18.85),('P300','Electronics','Ceramic coffee mug',26.29,46.27,57.03,89.56,35.70),('P301','Toys','Soft cotton t-shirt',12.24,28.66,52.26,46.47,21.96),('P302','Books','Soft cotton t-shirt',48.4,16.5,32.85,93.07,1.71),('P303','Beauty','Ceramic coffee mug',21.27,7.93,12.58,42.69,40.65),('P304','Electronics','Wooden picture frame',8.66,88.5,58.46,25.79,98.11),('P305','Electronics','Soft cotton t-shirt',29.91,11.09,47.69,27.42,70.63),('P306','Books','Wooden picture frame',49.58,51.26,59.91,34.76,57.81),('P307','Books','Ceramic coffee mug',29.92,6.39,15.13,55.11,76.14),('P308','Clothing','Leather wallet',37.14,42.41,5.61,72.09,8.30),('P309','Electronics','Ceramic coffee mug',44.6,91.76,14.54,20.81,10.08),('P31','Clothing','Wooden picture frame',40.25,8.9,6.74,22.06,24.47),('P310','Electronics','Leather wallet',18.83,75.18,45.94,98.88,91.13),('P311','Clothing','Soft cotton t-shirt',30.82,71.52,85.32,89.93,84.25),('P312','Food & Beverage','Ceramic coffee mug',42.94,75.07,52.47,41.51,47.85),('P313','Beauty','Wooden picture frame',14.06,41.65,41.09,69.57,84.50),('P314','Electronics','Wooden picture frame',31.47,84.09,2.57,34.2,79.96),('P315','Sports & Outdoors','Ceramic coffee mug',44.42,90.2,35.04,9.62,46.30),('P316','Sports & Outdoors','Stainless steel water bottle',1.66,79.86,33.47,6.72,89.62),('P317','Toys','Leather wallet',35.25,80.67,70.9,94.3,11.19),('P318','Sports & Outdoors','Soft cotton t-shirt',41.39,94.39,32.67,6.04,83.10),('P319','Sports & Outdoors','Stainless steel water bottle',1.86,29.14,83.52,55.45,83.92),('P32','Books','Ceramic coffee mug',27.22,40.32,24.58,30.15,70.29),('P320','Clothing','Wooden picture frame',8.53,95.41,34.16,58.85,98.72),('P321','Books','Stainless steel water bottle',26.62,32.68,45.78,69.87,83.71),('P322','Toys','Leather wallet',49.8,28.96,11.13,83.68,22.39),('P323','Beauty','Soft cotton t-shirt',12.95,8.73,67.05,14.69,57.80),('P324','Sports & Outdoors','Wooden picture frame',35.55,8.84,47,7.3,22.86),('P325','Books','Leather wallet',44.9,32.16,82.2,2.77,38.91),('P326','Electronics','Wooden picture frame',15.51,38.17,44.31,51.65,25.95),('P327','Toys','Wooden picture frame',8.56,32.33,21.2,40.72,12.02),('P328','Food & Beverage','Stainless steel water bottle',5.61,45.66,35.35,9.86,80.25),('P329','Clothing','Soft cotton t-shirt',25.68,77.81,96.62,36.38,67.17),('P33','Food & Beverage','Ceramic coffee mug',2.04,78.32,85.33,61.78,94.12),('P330','Clothing','Soft cotton t-shirt',38.95,29.03,98.16,40.01,70.09),('P331','Sports & Outdoors','Ceramic coffee mug',19.89,21.56,61.21,75.28,67.11),('P332','Beauty','Soft cotton t-shirt',20.22,8.64,17.16,84.7,25.25),('P333','Clothing','Wooden picture frame',1.19,13.39,74.93,3.89,22.93),('P334','Toys','Ceramic coffee mug',17.19,20.85,54.77,82.46,37.89),('P335','Sports & Outdoors','Wooden picture frame',37.56,98.04,72.95,53.66,20.66),('P336','Beauty','Leather wallet',11.95,17.48,42.83,5.02,87.66),('P337','Beauty','Leather wallet',20.05,13.02,39.58,88.08,78.28),('P338','Food & Beverage','Ceramic coffee mug',3.7,60.06,18.92,47.99,28.44),('P339','Clothing','Soft cotton t-shirt',32.31,8.9,83.07,44.13,5.37),('P34','Electronics','Wooden picture frame',37.2,20.6,88.95,62.85,39.54),('P340','Food & Beverage','Ceramic coffee mug',40.81,44.41,47.13,81.53,81.59),('P341','Toys','Wooden picture frame',7.25,20.06,15.16,91.77,90.30),('P342','Food & Beverage','Ceramic coffee mug',2.55,2.32,99.96,8.05,7.76),('P343','Books','Stainless steel water bottle',30.62,29.19,2.37,60.38,63.87),('P344','Sports & Outdoors','Stainless steel water bottle',6.38,59.63,73.74,45.83,97.10),('P345','Food & Beverage','Leather wallet',36.64,93.4,56.71,8.66,94.88),('P346','Beauty','Soft cotton t-shirt',44.54,19.43,78.2,21.66,83.11),('P347','Books','Leather wallet',40.18,14.86,44.52,15.5,30.92),('P348','Home Decor','Ceramic coffee mug',26.02,98.38,36.76,19,3.25),('P349','Food & Beverage','Wooden picture frame',2.58,15.42,48.09,55.22,21.49),('P35','Toys','Ceramic coffee mug',40.76,12.09,24.35,56.67,96.72),('P350','Electronics','Ceramic coffee mug',13.27,54.62,78.13,14.59,22.11),('P351','Beauty','Leather wallet',28.93,39.02,62.89,84.88,17.38),('P352','Beauty','Leather wallet',19.93,44.32,79.86,91.03,19.59),('P353','Sports & Outdoors','Wooden picture frame',12.93,47.92,66.59,5.64,44.81),('P354','Home Decor','Stainless steel water bottle',37.85,76.58,33.11,25.27,65.26),('P355','Beauty','Stainless steel water bottle',42.08,8.04,22.58,38.7,91.87),('P356','Food & Beverage','Ceramic coffee mug',47.39,28.03,32.82,18.09,64.60),('P357','Electronics','Soft cotton t-shirt',2.59,53.17,10.59,41.89,46.36),('P358','Beauty','Stainless steel water bottle',2.49,40.11,15.67,44.96,36.99),('P359','Home Decor','Stainless steel water bottle',32.93,13.75,28.43,94.33,44.88),('P36','Toys','Wooden picture frame',27.85,77.27,99.05,84.14,13.45),('P360','Clothing','Wooden picture frame',44.71,84.18,59.07,73.19,30.59),('P361','Toys','Wooden picture frame',5.25,69.17,9.61,50.96,12.60),('P362','Electronics','Ceramic coffee mug',46.16,73.82,48.08,94.81,69.25),('P363','Home Decor','Stainless steel water bottle',43.3,32.4,61.38,17.56,10.45),('P364','Food & Beverage','Wooden picture frame',12.6,67.68,50.59,11.47,41.50),('P365','Books','Soft cotton t-shirt',2.64,54.48,16.05,26.73,76.16),('P366','Beauty','Soft cotton t-shirt',46.99,28.59,11.71,47.27,57.29),('P367','Food & Beverage','Soft cotton t-shirt',24.47,57.03,9.59,25.39,56.99),('P368','Books','Leather wallet',14.37,37.5,30.05,45.41,13.07),('P369','Sports & Outdoors','Stainless steel water bottle',47.33,27.39,8.08,60.01,91.37),('P37','Electronics','Leather wallet',36.83,62.02,68.29,19.2,20.65),('P370','Electronics','Ceramic coffee mug',37.51,72.41,49.66,57.2,26.15),('P371','Home Decor','Ceramic coffee mug',32.21,72.85,66.9,72.12,67.78),('P372','Home Decor','Soft cotton t-shirt',37.35,13.61,61.52,73.79,61.47),('P373','Food & Beverage','Leather wallet',6.5,56.33,77.09,10.43,4.02),('P374','Books','Ceramic coffee mug',33.36,89.54,6.21,92.59,32.67),('P375','Electronics','Ceramic coffee mug',21.27,95.43,16.75,58.73,51.31),('P376','Beauty','Ceramic coffee mug',11.64,67.61,35.1,96.21,58.51),('P377','Home Decor','Ceramic coffee mug',17.31,40.4,48.99,72.84,38.65),('P378','Food & Beverage','Soft cotton t-shirt',6.25,59.06,83.39,57.19,16.71),('P379','Sports & Outdoors','Ceramic coffee mug',2.42,17.39,36.51,80.04,65.59),('P38','Home Decor','Soft cotton t-shirt',10.64,63.74,96.9,22.37,78.84),('P380','Beauty','Leather wallet',42.5,83.92,97.58,55.46,97.40),('P381','Sports & Outdoors','Stainless steel water bottle',2.24,29.35,17.62,17.84,51.50),('P382','Books','Stainless steel water bottle',28.81,99.11,71.07,49.06,63.32),('P383','Sports & Outdoors','Ceramic coffee mug',6.15,6.25,95.34,5.21,62.07),('P384','Books','Ceramic coffee mug',42.32,59.01,22.5,1.68,20.40),('P385','Sports & Outdoors','Stainless steel water bottle',35.05,82.29,33.33,9.86,13.80),('P386','Electronics','Stainless steel water bottle',39.23,19.92,26.05,62.89,6.78),('P387','Food & Beverage','Ceramic coffee mug',22.66,44.12,86.18,15.35,90.50),('P388','Beauty','Soft cotton t-shirt',40.63,2.6,58.52,56.29,35.18),('P389','Beauty','Leather wallet',47.97,25.71,33.5,91.32,2.39),('P39','Books','Leather wallet',27.56,29.91,75.21,57.61,4.39),('P390','Clothing','Wooden picture frame',45.84,35.41,10.03,28.03,13.79),('P391','Sports & Outdoors','Ceramic coffee mug',7.25,55.96,56.23,52.81,54.80),('P392','Clothing','Leather wallet',18.31,47.89,23.5,11.31,33.61),('P393','Sports & Outdoors','Ceramic coffee mug',20.38,40.68,78.87,61.62,2.65),('P394','Books','Ceramic coffee mug',27.67,8.7,68.48,69.57,10.40),('P395','Food & Beverage','Wooden picture frame',22.08,81.92,90.5,25.47,43.08),('P396','Beauty','Wooden picture frame',8.94,54.76,45.83,46.8,84.21),('P397','Electronics','Soft cotton t-shirt',7.22,71.25,78.58,57.1,92.78),('P398','Electronics','Wooden picture frame',21.87,47.59,94.24,6.01,12.28),('P399','Electronics','Wooden picture frame',18.11,32.9,4.43,59.06,79.07),('P4','Food & Beverage','Stainless steel water bottle',7.01,55.25,48.08,75.46,60.52),('P40','Food & Beverage','Ceramic coffee mug',27.66,59.66,19.86,11.02,64.38),('P400','Toys','Stainless steel water bottle',49.63,96.42,45.14,84.21,40.32),('P401','Home Decor','Wooden picture frame',32.74,83.03,80.7,43.73,7.47),('P402','Beauty','Stainless steel water bottle',3.05,99.62,45.86,22.3,14.38),('P403','Clothing','Soft cotton t-shirt',18.56,67.71,61.02,55.52,48.50),('P404','Toys','Leather wallet',27.57,32.64,55.12,8.9,99.36),('P405','Sports & Outdoors','Wooden picture frame',12.41,66,75.02,69.96,53.30),('P406','Food & Beverage','Leather wallet',49.69,25.43,68.65,43.84,66.43),('P407','Clothing','Wooden picture frame',41.11,48.13,12.91,47.28,72.25),('P408','Electronics','Stainless steel water bottle',16.36,31.49,22.72,34.02,61.95),('P409','Beauty','Leather wallet',18.03,17.19,51.72,7.63,92.02),('P41','Food & Beverage','Wooden picture frame',44.59,25.79,47.35,16.8,75.25),('P410','Beauty','Wooden picture frame',2.6,77.84,9.08,17.15,99.18),('P411','Beauty','Wooden picture frame',30.32,28.43,78.72,30.21,71.15),('P412','Toys','Ceramic coffee mug',6.04,29.43,59.12,93.51,57.22),('P413','Home Decor','Soft cotton t-shirt',17.94,41.56,50.74,75.79,71.64),('P414','Clothing','Wooden picture frame',6.53,66.92,47.04,67.44,86.52),('P415','Clothing','Leather wallet',43.74,93.13,34.76,73.07,18.72),('P416','Home Decor','Soft cotton t-shirt',27.73,51.33,75.38,92.65,31.00),('P417','Sports & Outdoors','Soft cotton t-shirt',4.14,99.1,50.56,33.37,97.87),('P418','Clothing','Wooden picture frame',32.25,25.44,90.95,71.34,98.34),('P419','Food & Beverage','Leather wallet',35.33,55.44,85.28,14.13,98.10),('P42','Books','Wooden picture frame',1.54,40.66,22.8,20.46,95.48),('P420','Home Decor','Wooden picture frame',2.97,20.78,88.16,57.34,83.08),('P421','Beauty','Soft cotton t-shirt',42.74,48.68,82.57,41.4,28.99),('P422','Beauty','Wooden picture frame',47.63,20.57,60.04,46.91,92.68),('P423','Electronics','Soft cotton t-shirt',5.54,88.39,10.2,91.76,78.43),('P424','Clothing','Wooden picture frame',23.52,89.29,26.89,34.99,14.12),('P425','Home Decor','Leather wallet',46.95,77.83,54.2,31.98,32.31),('P426','Sports & Outdoors','Ceramic coffee mug',46.31,20.43,61.38,64.92,19.19),('P427','Toys','Wooden picture frame',39.06,16.44,34.53,52.72,97.03),('P428','Food & Beverage','Stainless steel water bottle',29.51,92.71,63.89,60.25,30.56),('P429','Food & Beverage','Leather wallet',37.14,92.04,62.99,23.15,58.71),('P43','Clothing','Ceramic coffee mug',26.99,99.18,27.7,49.4,2.86),('P430','Beauty','Wooden picture frame',0.96,64.11,88.87,18.52,35.18),('P431','Books','Soft cotton t-shirt',10.05,88.53,31.55,86.93,67.31),('P432','Books','Ceramic coffee mug',43.77,69.67,57.11,22.72,32.00),('P433','Home Decor','Stainless steel water bottle',49.39,73.18,1.99,49.31,56.10),('P434','Sports & Outdoors','Wooden picture frame',33.56,4.92,45.19,60.41,84.50),('P435','Books','Soft cotton t-shirt',49.33,5.44,82.32,69.77,55.17),('P436','Toys','Soft cotton t-shirt',18.82,1.62,2.48,70.4,21.37),('P437','Books','Wooden picture frame',44.42,91.88,89.55,38.69,39.34),('P438','Home Decor','Soft cotton t-shirt',33.7,14.27,98.86,1.84,32.57),('P439','Home Decor','Soft cotton t-shirt',16.08,96.11,14.62,99.96,43.84),('P44','Home Decor','Leather wallet',43.78,31.06,47.12,82.15,21.49),('P440','Sports & Outdoors','Ceramic coffee mug',31.64,24.87,83.13,44.81,73.95),('P441','Sports & Outdoors','Wooden picture frame',9.92,62.76,64.67,28.47,7.26),('P442','Beauty','Ceramic coffee mug',24.58,66.37,63.01,23.04,11.44),('P443','Beauty','Stainless steel water bottle',48.53,80.21,11.53,62.05,34.43),('P444','Sports & Outdoors','Stainless steel water bottle',4.92,85.83,83.94,34.31,37.82),('P445','Electronics','Soft cotton t-shirt',10.49,2.26,38.83,70.24,84.81),('P446','Clothing','Wooden picture frame',33,17.8,90.64,5.53,12.60),('P447','Home Decor','Ceramic coffee mug',46.43,20.11,91.21,17.83,5.56),('P448','Clothing','Ceramic coffee mug',35.64,51.84,76.99,27.91,88.01),('P449','Toys','Stainless steel water bottle',9.17,53.07,41.17,25.08,26.37),('P45','Food & Beverage','Ceramic coffee mug',37.97,68.23,63.94,1.81,64.84),('P450','Toys','Soft cotton t-shirt',14.78,58.15,98.22,34.73,46.06),('P451','Clothing','Stainless steel water bottle',11.72,88.21,79.2,42.81,34.80),('P452','Books','Leather wallet',6.97,61.46,69.18,33.04,34.80),('P453','Beauty','Wooden picture frame',5.94,33.38,89.08,97.17,68.59),('P454','Beauty','Wooden picture frame',32.77,67.79,15.34,48.86,39.58),('P455','Toys','Wooden picture frame',3.82,76.17,10.68,56.35,90.13),('P456','Books','Soft cotton t-shirt',34.66,47.94,92.67,18.74,33.89),('P457','Clothing','Leather wallet',7.95,43.17,14.92,90.7,96.08),('P458','Clothing','Wooden picture frame',47.19,59.32,25.09,52.44,80.70),('P459','Books','Soft cotton t-shirt',37.32,51.41,54.26,33.72,15.28),('P46','Electronics','Soft cotton t-shirt',19.01,58.91,3.31,67.24,31.29),('P460','Food & Beverage','Leather wallet',4.28,17,54.64,23.35,10.61),('P461','Sports & Outdoors','Stainless steel water bottle',19.29,77.29,20.05,67.74,57.19),('P462','Electronics','Stainless steel water bottle',5.97,14.97,14.87,64.88,55.12),('P463','Food & Beverage','Stainless steel water bottle',28.97,59.76,10.38,43.22,4.01),('P464','Beauty','Wooden picture frame',35.82,87.98,49.75,77.11,51.69),('P465','Clothing','Leather wallet',6.44,68.71,82.51,2.89,47.43),('P466','Sports & Outdoors','Ceramic coffee mug',2.54,98.66,72.25,53.27,81.06),('P467','Food & Beverage','Wooden picture frame',4.31,72.36,99.36,62.01,64.03),('P468','Clothing','Wooden picture frame',44.73,71.65,37.14,82.91,75.99),('P469','Beauty','Wooden picture frame',29.24,64.75,14.57,45.48,87.82),('P47','Books','Soft cotton t-shirt',0.84,53.9,30.37,20.39,12.16),('P470','Sports & Outdoors','Wooden picture frame',41.74,65.98,35.01,73.76,93.32),('P471','Beauty','Stainless steel water bottle',39.97,30.3,16.84,25.96,33.11),('P472','Home Decor','Ceramic coffee mug',16.79,99.12,96.34,93.39,82.60),('P473','Beauty','Leather wallet',31.57,42.11,75.39,23.13,15.68),('P474','Books','Ceramic coffee mug',32.24,82.69,44.76,76.71,27.60),('P475','Toys','Wooden picture frame',45.95,92.62,33.27,83.75,89.98),('P476','Food & Beverage','Leather wallet',40.07,95.04,41.54,13.73,69.06),('P477','Toys','Leather wallet',24.44,63.42,72.31,61.83,74.39),('P478','Beauty','Soft cotton t-shirt',0.28,46.08,27.53,91.63,64.78),('P479','Books','Ceramic coffee mug',47.94,93.12,61.83,63.38,99.71),('P48','Clothing','Wooden picture frame',31.03,58.14,90.8,42.5,6.23),('P480','Clothing','Leather wallet',11.55,64.76,11.53,95.04,28.00),('P481','Home Decor','Wooden picture frame',21.6,88.15,8.07,20.68,21.34),('P482','Beauty','Stainless steel water bottle',13.32,35.62,18.32,57.84,21.67),('P483','Electronics','Soft cotton t-shirt',24.95,93.57,77.82,72.09,43.34),('P484','Sports & Outdoors','Ceramic coffee mug',37.95,27.91,83.05,41.46,51.68),('P485','Clothing','Soft cotton t-shirt',40.15,99.52,8.98,52.5,28.38),('P486','Food & Beverage','Soft cotton t-shirt',31.2,7.73,59.88,8.16,84.86),('P487','Clothing','Leather wallet',41.75,15.75,40.79,60.15,41.17),('P488','Food & Beverage','Stainless steel water bottle',46.61,79.19,74.32,84.9,49.25),('P489','Clothing','Stainless steel water bottle',10.35,44.63,22.19,13.77,22.73),('P49','Books','Soft cotton t-shirt',23.63,9.62,60.29,44.63,63.92),('P490','Books','Leather wallet',0.46,98.01,36.6,50.61,52.40),('P491','Beauty','Soft cotton t-shirt',48.13,63.01,53.16,24.69,69.23),('P492','Clothing','Soft cotton t-shirt',10.77,14.18,59.45,16.47,88.98),('P493','Electronics','Stainless steel water bottle',25.3,18.65,94.5,19.01,38.20),('P494','Electronics','Wooden picture frame',24.84,89.95,92.43,62.96,22.04),('P495','Electronics','Leather wallet',11.43,72.64,68.28,27.97,93.62),('P496','Beauty','Soft cotton t-shirt',2.28,11.24,34.65,8.35,4.96),('P497','Beauty','Stainless steel water bottle',42.28,77.64,71.49,85.05,39.97),('P498','Sports & Outdoors','Stainless steel water bottle',12.49,77.08,92.72,73.33,84.95),('P499','Clothing','Stainless steel water bottle',31.62,95.8,29.81,61.3,6.83),('P5','Home Decor','Wooden picture frame',2.69,48.52,51.31,16.53,75.30),('P50','Toys','Leather wallet',22.85,36.29,54.37,8.58,58.02),('P500','Books','Ceramic coffee mug',9,98.07,72.39,86.75,63.18),('P501','Beauty','Leather wallet',43,18.31,50.53,7.32,41.85),('P502','Books','Leather wallet',33.14,10.64,77.67,15.52,18.72),('P503','Food & Beverage','Soft cotton t-shirt',21.17,97.8,52.69,79.48,66.04),('P504','Toys','Stainless steel water bottle',38.95,53.01,22.63,35.15,75.06),('P505','Sports & Outdoors','Ceramic coffee mug',4.5,73.48,84.49,35.58,77.16),('P506','Home Decor','Stainless steel water bottle',43.3,53.48,4.18,83.88,60.63),('P507','Toys','Soft cotton t-shirt',37.25,97.74,22.51,4.04,70.65),('P508','Electronics','Wooden picture frame',7.09,85.42,23.27,95.95,71.35),('P509','Sports & Outdoors','Leather wallet',29.12,1.6,79.52,13.57,44.83),('P51','Electronics','Leather wallet',2.9,64.72,12.4,57.25,9.10),('P510','Food & Beverage','Soft cotton t-shirt',49.57,78.52,51.11,96.25,9.00),('P511','Home Decor','Soft cotton t-shirt',20.38,53.56,45.5,62.99,16.70),('P512','Books','Wooden picture frame',48.96,79,73.49,12.06,55.51),('P513','Beauty','Soft cotton t-shirt',14.97,48,36.64,98.6,28.45),('P514','Home Decor','Wooden picture frame',15.55,2.72,39.87,9.61,73.74),('P515','Toys','Wooden picture frame',42.98,99.36,37.22,69.94,84.32),('P516','Books','Stainless steel water bottle',49.95,64.78,16.57,48.22,1.39),('P517','Sports & Outdoors','Soft cotton t-shirt',43.94,62.31,88.72,38.03,49.97),('P518','Toys','Stainless steel water bottle',43.13,95.72,40.44,2.97,46.69),('P519','Books','Soft cotton t-shirt',8.19,5.73,89.57,40.87,82.55),('P52','Food & Beverage','Soft cotton t-shirt',18.42,58.49,64.61,45.58,73.67),('P520','Home Decor','Ceramic coffee mug',37.86,59.96,55.88,9.36,20.71),('P521','Sports & Outdoors','Soft cotton t-shirt',37.48,10.41,42.36,78.93,79.53),('P522','Beauty','Ceramic coffee mug',4.46,28.93,85.87,35.1,37.54),('P523','Food & Beverage','Leather wallet',2.44,67.37,64.67,71.16,47.11),('P524','Clothing','Wooden picture frame',9.07,92.84,31.74,53.4,22.93),('P525','Sports & Outdoors','Leather wallet',34.31,28.96,76.8,6.85,71.30),('P526','Home Decor','Wooden picture frame',36.31,41.73,57.56,72.07,88.72),('P527','Electronics','Ceramic coffee mug',17.07,69.22,47.28,57.35,30.72),('P528','Sports & Outdoors','Stainless steel water bottle',36.3,51.24,87.15,26.86,84.42),('P529','Toys','Stainless steel water bottle',14.98,62.23,34.65,16.23,31.95),('P53','Home Decor','Wooden picture frame',33.46,64.26,18.09,94.42,4.47),('P530','Books','Stainless steel water bottle',37,41.46,1.21,59.55,24.52),('P531','Food & Beverage','Stainless steel water bottle',47.47,32.97,8.04,88.06,9.19),('P532','Electronics','Soft cotton t-shirt',40.58,20.11,29.35,43.28,70.38),('P533','Food & Beverage','Wooden picture frame',20.34,52.53,5.89,85.15,26.32),('P534','Home Decor','Ceramic coffee mug',5.23,3.47,69.28,70.75,18.47),('P535','Home Decor','Soft cotton t-shirt',35.05,34.4,38.62,1.57,12.37),('P536','Food & Beverage','Wooden picture frame',34.63,13.16,21.21,90.11,5.45),('P537','Beauty','Wooden picture frame',5.65,27.09,36.55,1.61,88.14),('P538','Beauty','Soft cotton t-shirt',37.35,88.35,96.41,20.64,27.35),('P539','Sports & Outdoors','Wooden picture frame',24.33,89.71,49.34,4.72,69.31),('P54','Clothing','Ceramic coffee mug',3.79,92.05,54.38,78.54,65.52),('P540','Home Decor','Stainless steel water bottle',36.77,39.51,1.46,20.81,19.66),('P541','Sports & Outdoors','Stainless steel water bottle',13.28,7.96,44.64,31.86,98.76),('P542','Electronics','Stainless steel water bottle',24.79,6.83,6.79,88.07,37.82),('P543','Food & Beverage','Leather wallet',24.12,96,43.9,9.7,89.82),('P544','Clothing','Wooden picture frame',5.29,77.34,12,55.95,37.64),('P545','Sports & Outdoors','Wooden picture frame',24.5,33.88,46.54,15.42,16.74),('P546','Sports & Outdoors','Soft cotton t-shirt',13.6,11.95,96.33,15.86,68.76),('P547','Clothing','Leather wallet',16.81,88.51,69.84,91.19,94.59),('P548','Electronics','Soft cotton t-shirt',35.73,57.68,38.62,42.37,67.66),('P549','Clothing','Soft cotton t-shirt',49.98,96.92,48.09,17.92,53.54),('P55','Home Decor','Soft cotton t-shirt',5.78,16.41,47.87,21.99,63.72),('P550','Beauty','Soft cotton t-shirt',41.33,98.47,14.26,14.8,58.00),('P551','Sports & Outdoors','Wooden picture frame',0.52,19.36,6.1,20.24,97.82),('P552','Clothing','Ceramic coffee mug',34.61,35.8,33.84,79.81,17.10),('P553','Books','Stainless steel water bottle',24.69,56.44,38.03,90.88,88.06),('P554','Home Decor','Soft cotton t-shirt',18.77,54.82,45.73,74.43,90.99),('P555','Clothing','Leather wallet',11.78,98.1,92.78,16.84,90.77),('P556','Beauty','Wooden picture frame',34.72,79.29,50.22,69.9,80.87),('P557','Sports & Outdoors','Stainless steel water bottle',6.78,3.65,92.48,56.91,32.04),('P558','Food & Beverage','Soft cotton t-shirt',44.02,98.45,15.77,22,15.59),('P559','Toys','Wooden picture frame',1.82,99.54,43.81,52.23,79.82),('P56','Toys','Soft cotton t-shirt',25.08,42.88,58.71,57.55,54.32),('P560','Toys','Ceramic coffee mug',33.72,17.24,83.76,84.36,31.16),('P561','Beauty','Stainless steel water bottle',42.8,80.2,58.08,66.3,90.85),('P562','Clothing','Wooden picture frame',47.01,69.09,18.46,72.12,62.76),('P563','Sports & Outdoors','Ceramic coffee mug',20.28,46.19,12.98,11.72,40.24),('P564','Clothing','Wooden picture frame',5.42,84,22.45,67.14,11.91),('P565','Books','Stainless steel water bottle',29.48,10.51,81.7,5.57,36.86),('P566','Clothing','Stainless steel water bottle',33.3,6.78,7.7,49.65,48.54),('P567','Home Decor','Stainless steel water bottle',42.5,62.94,5.71,24.75,32.13),('P568','Clothing','Leather wallet',39.84,64.61,56.05,13.31,14.04),('P569','Sports & Outdoors','Stainless steel water bottle',39.25,54.76,40.41,55.33,71.81),('P57','Toys','Wooden picture frame',39.63,54.33,41.06,46.32,18.92),('P570','Sports & Outdoors','Leather wallet',44.48,75.56,61.74,61.34,76.16),('P571','Books','Stainless steel water bottle',2.38,70.95,41.83,31.1,26.05),('P572','Electronics','Leather wallet',40.33,4.05,84.1,2.35,98.76),('P573','Home Decor','Soft cotton t-shirt',9.42,36,64.93,15.62,18.67),('P574','Beauty','Soft cotton t-shirt',31.65,67.79,74.79,62.04,93.05),('P575','Electronics','Stainless steel water bottle',19.36,19.35,52.03,75.19,12.26),('P576','Books','Wooden picture frame',2.71,22.96,71.13,94.9,78.15),('P577','Food & Beverage','Wooden picture frame',21.32,80.67,35.02,17.79,55.98),('P578','Electronics','Leather wallet',19.08,13.62,68.14,67.9,44.42),('P579','Sports & Outdoors','Wooden picture frame',22.95,65.06,14.8,24.04,53.18),('P58','Books','Stainless steel water bottle',48.34,38.71,49.25,69.04,32.64),('P580','Toys','Ceramic coffee mug',11.62,75.64,12.1,26.54,2.67),('P581','Electronics','Leather wallet',24.1,29.8,28.05,92.53,13.42),('P582','Home Decor','Wooden picture frame',32.19,27.16,22.7,45.77,58.10),('P583','Food & Beverage','Soft cotton t-shirt',42.7,74.62,1.33,62.05,51.25),('P584','Food & Beverage','Stainless steel water bottle',39.5,90.57,52.48,40.63,80.93),('P585','Food & Beverage','Wooden picture frame',17.47,81.64,23.07,26.4,51.92),('P586','Electronics','Stainless steel water bottle',28.27,24.8,20.32,65.16,15.78),('P587','Toys','Wooden picture frame',32.83,12.05,77.93,92.34,21.16),('P588','Toys','Stainless steel water bottle',18.1,28.05,38.23,53.69,57.48),('P589','Sports & Outdoors','Stainless steel water bottle',37.67,99.38,75.19,55.58,24.88),('P59','Clothing','Ceramic coffee mug',23.92,9.67,68.33,49.08,49.99),('P590','Sports & Outdoors','Stainless steel water bottle',3.74,9.19,95.75,33.84,75.31),('P591','Sports & Outdoors','Wooden picture frame',13.91,29.27,7.93,99.04,27.58),('P592','Books','Stainless steel water bottle',45.66,45.96,53.68,87.66,9.95),('P593','Beauty','Leather wallet',18.87,7.04,74.1,42.13,65.00),('P594','Electronics','Soft cotton t-shirt',26.41,8.31,46.33,51.77,96.17),('P595','Electronics','Stainless steel water bottle',40.96,54.7,22.12,51.76,86.86),('P596','Food & Beverage','Ceramic coffee mug',41.23,55.89,98.95,25.96,45.77),('P597','Sports & Outdoors','Leather wallet',41.07,18.85,19.24,21.77,66.28),('P598','Toys','Wooden picture frame',4.31,84.45,41.44,58.25,94.07),('P599','Toys','Ceramic coffee mug',8.22,9.62,78.03,27.22,72.52),('P6','Food & Beverage','Leather wallet',5.02,55.77,26.9,13.37,79.40),('P60','Sports & Outdoors','Ceramic coffee mug',30.29,86.78,57.72,61.01,79.42),('P600','Beauty','Wooden picture frame',9.61,48.19,43.36,51.76,58.89),('P601','Food & Beverage','Soft cotton t-shirt',37.44,91.78,46.78,30.88,55.21),('P602','Food & Beverage','Soft cotton t-shirt',38.76,28.67,73.44,9.13,98.38),('P603','Beauty','Leather wallet',19.75,66.4,33.9,25.77,28.28),('P604','Books','Ceramic coffee mug',28.26,21.65,20.31,74.56,43.26),('P605','Toys','Leather wallet',29.8,77,74.39,98.7,31.46),('P606','Electronics','Leather wallet',26.72,17.92,53.87,57.88,26.50),('P607','Home Decor','Soft cotton t-shirt',9.66,93.66,48.7,29.73,37.12),('P608','Home Decor','Soft cotton t-shirt',37.8,54.43,75.97,54.23,6.12),('P609','Toys','Ceramic coffee mug',23.11,58.71,9.98,62.57,17.23),('P61','Books','Wooden picture frame',0.28,85.62,29.62,48.82,66.78),('P610','Electronics','Wooden picture frame',5.87,56.76,6.34,88.26,83.22),('P611','Food & Beverage','Leather wallet',32.51,24.36,54.67,94.9,16.75),('P612','Sports & Outdoors','Ceramic coffee mug',33.36,27.06,62.9,10.61,31.11),('P613','Books','Ceramic coffee mug',13.88,35.72,17.02,34.6,5.30),('P614','Beauty','Wooden picture frame',40.14,86.94,10.7,17.87,31.17),('P615','Toys','Stainless steel water bottle',2.01,8.38,45.59,46.19,39.93),('P616','Beauty','Wooden picture frame',34.8,92.35,86.74,78.62,6.14),('P617','Books','Wooden picture frame',46.2,80.33,62.3,57.83,8.93),('P618','Electronics','Soft cotton t-shirt',26.07,54.65,4.73,87.65,25.23),('P619','Toys','Soft cotton t-shirt',35.82,62.81,64.88,8.92,98.35),('P62','Toys','Wooden picture frame',0.72,80.16,53.15,91.19,19.06),('P620','Electronics','Leather wallet',42.55,23.41,36.97,23.13,96.24),('P621','Sports & Outdoors','Leather wallet',10.38,72.97,28.8,24.47,27.04),('P622','Toys','Soft cotton t-shirt',40.9,96.4,14.91,55.23,43.47),('P623','Home Decor','Soft cotton t-shirt',30.44,43.07,17.14,54.04,36.24),('P624','Beauty','Ceramic coffee mug',29.6,21.91,6.38,3.1,49.78),('P625','Food & Beverage','Leather wallet',34.24,41.17,44.24,37.76,40.19),('P626','Home Decor','Stainless steel water bottle',44.85,67.91,59.54,14.46,50.62),('P627','Sports & Outdoors','Soft cotton t-shirt',7.87,60.15,6.56,76.25,32.50),('P628','Electronics','Ceramic coffee mug',40.46,87.72,41.43,37.98,9.66),('P629','Food & Beverage','Soft cotton t-shirt',20.67,69.82,62.58,90.27,48.80),('P63','Sports & Outdoors','Leather wallet',18.63,41.38,25.16,18.67,16.03),('P630','Food & Beverage','Soft cotton t-shirt',16.81,90.97,18.8,84.45,31.73),('P631','Home Decor','Soft cotton t-shirt',16.15,65.03,83.64,71.07,10.58),('P632','Sports & Outdoors','Ceramic coffee mug',20.59,75.58,84.31,25.09,55.69),('P633','Sports & Outdoors','Leather wallet',48.9,46.57,11.84,64.87,47.73),('P634','Electronics','Leather wallet',45.14,50.34,82.44,52.44,70.57),('P635','Electronics','Ceramic coffee mug',23.96,31.26,29.51,1.67,10.65),('P636','Home Decor','Ceramic coffee mug',39.53,10.1,67.68,12.77,38.55),('P637','Clothing','Stainless steel water bottle',23.92,20.61,83.42,53.62,60.81),('P638','Electronics','Wooden picture frame',39.38,48.68,14.11,63.49,88.39),('P639','Sports & Outdoors','Ceramic coffee mug',49.52,14.26,9.01,46.53,60.51),('P64','Sports & Outdoors','Soft cotton t-shirt',25.44,84.46,80.7,23.76,36.40),('P640','Beauty','Leather wallet',23.97,10.28,87.83,50.7,98.46),('P641','Food & Beverage','Ceramic coffee mug',41.35,13.09,29.82,38.33,85.09),('P642','Electronics','Leather wallet',11.28,98.83,76.78,11.37,30.08),('P643','Electronics','Stainless steel water bottle',3.29,33.49,55.87,17.28,92.13),('P644','Beauty','Soft cotton t-shirt',14.95,20.99,15.1,5.49,72.40),('P645','Electronics','Leather wallet',41.8,77.17,1.69,38.42,84.60),('P646','Beauty','Ceramic coffee mug',22.68,37.24,75.64,50.08,6.80),('P647','Sports & Outdoors','Wooden picture frame',35.35,15.82,30.25,3.91,76.20),('P648','Electronics','Ceramic coffee mug',45.08,56.71,16.14,55.31,62.63),('P649','Electronics','Stainless steel water bottle',42.83,24.28,60.83,85.53,83.51),('P65','Books','Stainless steel water bottle',2.39,44.61,49.76,39.41,30.69),('P650','Books','Stainless steel water bottle',2.55,21.91,98.17,62.58,99.93),('P651','Beauty','Stainless steel water bottle',35.83,63.18,95.24,37.9,10.55),('P652','Toys','Leather wallet',10.04,58.53,10.54,42.55,48.96),('P653','Toys','Stainless steel water bottle',17.82,48.28,72.08,47.46,14.14),('P654','Home Decor','Stainless steel water bottle',20.95,31.67,14.55,53.98,21.82),('P655','Electronics','Soft cotton t-shirt',0.47,95.47,37.06,54.45,65.69),('P656','Sports & Outdoors','Ceramic coffee mug',40.47,28.37,10.9,84.95,64.00),('P657','Sports & Outdoors','Wooden picture frame',39.89,63.28,15.42,6.58,22.93),('P658','Books','Ceramic coffee mug',2.94,48.56,31.58,54.17,20.66),('P659','Beauty','Stainless steel water bottle',33.65,70.74,28.03,7.39,33.48),('P66','Toys','Soft cotton t-shirt',8.96,94.04,40.83,65.5,5.45),('P660','Electronics','Soft cotton t-shirt',14.06,37.82,13.3,74.69,24.78),('P661','Books','Stainless steel water bottle',7.02,27.99,64.02,61.13,7.55),('P662','Books','Wooden picture frame',16.47,13.89,17.2,17.4,61.43),('P663','Books','Soft cotton t-shirt',21.39,38.03,98.98,19.25,85.50),('P664','Beauty','Soft cotton t-shirt',29.4,78.8,68.47,85.13,44.22),('P665','Clothing','Stainless steel water bottle',32.78,87.29,52.41,52.59,62.58),('P666','Beauty','Stainless steel water bottle',15.48,42.3,86.14,58.73,80.22),('P667','Beauty','Leather wallet',48.5,29.88,99.77,51.62,14.40),('P668','Food & Beverage','Wooden picture frame',33.21,90.14,39.73,23.57,28.32),('P669','Food & Beverage','Stainless steel water bottle',49.7,56.8,53.28,97.15,97.42),('P67','Books','Ceramic coffee mug',18.02,56.94,88.37,6.43,5.15),('P670','Books','Leather wallet',42.07,35.88,57.69,18.31,29.46),('P671','Home Decor','Stainless steel water bottle',19.91,77.06,98.01,32.43,31.86),('P672','Electronics','Leather wallet',26.47,97.48,39.37,57.57,69.93),('P673','Electronics','Stainless steel water bottle',12.73,84.78,42.1,47.07,55.08),('P674','Beauty','Stainless steel water bottle',28.91,53.64,41.67,54.42,64.60),('P675','Food & Beverage','Stainless steel water bottle',28.24,89.08,87.8,20.65,57.77),('P676','Beauty','Leather wallet',11.58,88.88,75.19,55.87,94.02),('P677','Toys','Soft cotton t-shirt',8.42,11.48,61.79,5.92,97.81),('P678','Electronics','Stainless steel water bottle',11.34,63.18,19.58,24.35,7.99),('P679','Electronics','Leather wallet',22.31,9.72,70.65,35.89,42.54),('P68','Food & Beverage','Soft cotton t-shirt',4.82,9.5,96.03,73.37,88.70),('P680','Clothing','Ceramic coffee mug',21.05,80.94,89.3,78.11,17.88),('P681','Books','Soft cotton t-shirt',9.7,50.13,6.64,19.33,20.32),('P682','Electronics','Leather wallet',20.33,52.73,99.87,63.52,46.94),('P683','Books','Soft cotton t-shirt',4.49,97.35,8.01,99.72,73.76),('P684','Electronics','Ceramic coffee mug',37.93,86.03,89.84,10.57,28.96),('P685','Electronics','Leather wallet',19.82,77.43,73.59,25.48,21.52),('P686','Clothing','Ceramic coffee mug',3.65,52.22,57.28,13.64,19.74),('P687','Toys','Leather wallet',47.38,89.98,16.46,85.72,33.13),('P688','Beauty','Ceramic coffee mug',13.45,29.67,58.1,17.59,6.45),('P689','Beauty','Leather wallet',43.42,18.96,45.24,71.76,30.85),('P69','Home Decor','Leather wallet',13.13,65.28,33.69,22.87,34.88),('P690','Food & Beverage','Ceramic coffee mug',41.56,38.12,13.29,40.29,80.87),('P691','Home Decor','Stainless steel water bottle',27.65,95.52,11.39,49.43,1.69),('P692','Electronics','Soft cotton t-shirt',40.14,9.54,4.53,55.42,61.87),('P693','Food & Beverage','Soft cotton t-shirt',38.91,19.8,1.49,32.5,6.25),('P694','Home Decor','Leather wallet',45.67,46.3,58.87,76.71,42.64),('P695','Electronics','Ceramic coffee mug',18.85,93.62,99.08,60.59,94.47),('P696','Sports & Outdoors','Stainless steel water bottle',1.56,69.24,8.68,45.29,46.42),('P697','Home Decor','Wooden picture frame',2.74,19.57,26.54,40.3,46.71),('P698','Sports & Outdoors','Ceramic coffee mug',45.86,28.99,46.02,11.85,93.29),('P699','Clothing','Soft cotton t-shirt',48.5,39.85,97.81,25.19,28.29),('P7','Clothing','Leather wallet',0.67,6.42,24.14,13.14,58.61),('P70','Books','Wooden picture frame',47.89,84.26,56.97,28.87,9.18),('P700','Clothing','Wooden picture frame',22.62,51.36,1.15,98.12,67.08),('P701','Toys','Soft cotton t-shirt',24.38,49.61,48.53,33.65,9.84),('P702','Beauty','Soft cotton t-shirt',19.95,90.63,76.78,87.86,44.95),('P703','Food & Beverage','Soft cotton t-shirt',28.4,69.3,21.28,12.23,95.22),('P704','Food & Beverage','Leather wallet',48.17,89.02,14.64,80.98,43.27),('P705','Clothing','Soft cotton t-shirt',30.23,82.26,10.77,19.09,28.70),('P706','Toys','Stainless steel water bottle',31.24,86.3,79.24,99.13,12.67),('P707','Electronics','Stainless steel water bottle',47.34,4.42,96.82,45.85,75.24),('P708','Toys','Leather wallet',11.41,53.42,94.8,21.35,40.21),('P709','Home Decor','Stainless steel water bottle',35.5,16.76,79.9,47.56,73.32),('P71','Clothing','Leather wallet',31.45,84.7,75.26,65.36,46.99),('P710','Clothing','Wooden picture frame',33.52,14.07,20.19,12.1,13.99),('P711','Beauty','Ceramic coffee mug',33.69,61.5,85.69,70.56,26.95),('P712','Food & Beverage','Leather wallet',43.14,25.79,75.32,87.95,91.80),('P713','Sports & Outdoors','Soft cotton t-shirt',30.96,72.4,67.58,56.77,80.15),('P714','Clothing','Ceramic coffee mug',3.89,65.12,34.28,69.23,25.34),('P715','Home Decor','Ceramic coffee mug',34.39,64.07,53.25,68.94,83.24),('P716','Sports & Outdoors','Stainless steel water bottle',13.34,70.06,16.52,68.77,42.18),('P717','Beauty','Ceramic coffee mug',49.5,96.09,82.8,98.55,59.20),('P718','Books','Soft cotton t-shirt',14.19,24.18,43.58,35.13,69.44),('P719','Home Decor','Stainless steel water bottle',23.94,71.42,40.41,40.03,69.60),('P72','Beauty','Soft cotton t-shirt',43.35,23.99,6.71,26.12,39.68),('P720','Toys','Stainless steel water bottle',40.07,39.54,25.98,39.73,87.61),('P721','Electronics','Wooden picture frame',20.5,78.93,39.25,24.26,20.98),('P722','Home Decor','Wooden picture frame',22.58,13.41,53.09,28.82,39.11),('P723','Electronics','Wooden picture frame',29.12,74.47,61.89,38.22,32.58),('P724','Home Decor','Wooden picture frame',3.01,56.11,56.2,32.91,44.57),('P725','Sports & Outdoors','Ceramic coffee mug',48.63,30.68,70.2,36.77,25.11),('P726','Food & Beverage','Soft cotton t-shirt',13.56,15.93,50.4,64.14,89.83),('P727','Toys','Stainless steel water bottle',26.3,15.55,72.51,53.21,75.85),('P728','Clothing','Wooden picture frame',16.39,81.47,19.12,39.05,9.75),('P729','Books','Wooden picture frame',16.02,63.76,15.76,28.42,18.19),('P73','Books','Stainless steel water bottle',20.27,32.46,31.02,2.71,60.69),('P730','Sports & Outdoors','Soft cotton t-shirt',1.96,44.94,20.23,82.57,49.88),('P731','Beauty','Leather wallet',27.14,14.39,97.93,39.54,66.35),('P732','Clothing','Ceramic coffee mug',48.9,69.66,3.45,78.8,82.09),('P733','Books','Ceramic coffee mug',2.78,25.67,30.29,54.53,12.39),('P734','Toys','Soft cotton t-shirt',42.54,83.89,26.13,25.59,12.71),('P735','Electronics','Ceramic coffee mug',41.14,11.83,33.63,8.42,25.37),('P736','Beauty','Soft cotton t-shirt',38.66,36,78.66,76.83,87.73),('P737','Home Decor','Stainless steel water bottle',32.4,42.49,4.42,13.57,64.53),('P738','Beauty','Ceramic coffee mug',11.04,33.38,26.86,11.05,58.46),('P739','Electronics','Soft cotton t-shirt',33.5,89.85,47.48,26.27,97.72),('P74','Clothing','Wooden picture frame',10.07,17.38,9.32,78.98,15.20),('P740','Home Decor','Ceramic coffee mug',9.54,62.96,14.84,54.31,78.84),('P741','Toys','Leather wallet',2.81,64.37,12.06,88.1,50.62),('P742','Toys','Stainless steel water bottle',14.99,24.69,19.46,53.76,15.58),('P743','Clothing','Wooden picture frame',46.02,47.58,67.11,47.78,24.04),('P744','Toys','Ceramic coffee mug',35.81,72.03,25.73,2.09,72.44),('P745','Toys','Wooden picture frame',35.37,38.34,47.48,43.41,91.09),('P746','Food & Beverage','Soft cotton t-shirt',26.8,2.66,70.04,72.52,39.12),('P747','Home Decor','Stainless steel water bottle',8.61,77.36,4.71,56.1,20.34),('P748','Home Decor','Leather wallet',48.97,53.8,65.98,32.16,82.34),('P749','Toys','Stainless steel water bottle',5.76,32.17,6.16,32.09,52.67),('P75','Home Decor','Leather wallet',13.54,3.35,48.32,48.62,15.32),('P750','Electronics','Leather wallet',1.34,14.99,78.8,59.33,16.60),('P751','Clothing','Stainless steel water bottle',19.05,34.75,66.26,93.3,36.05),('P752','Electronics','Soft cotton t-shirt',47.48,84.72,31.38,52.5,30.45),('P753','Sports & Outdoors','Ceramic coffee mug',43.99,45.95,17.97,52.38,43.10),('P754','Toys','Stainless steel water bottle',3.97,69.8,43,35.65,24.17),('P755','Sports & Outdoors','Ceramic coffee mug',34.76,6.93,22.42,46.27,89.52),('P756','Home Decor','Soft cotton t-shirt',44.02,47.86,39.45,62.59,77.11),('P757','Toys','Ceramic coffee mug',7.24,56.2,71.44,49.32,16.97),('P758','Home Decor','Stainless steel water bottle',44.46,41.34,18.08,81.47,50.55),('P759','Electronics','Stainless steel water bottle',22.83,65.76,25.53,17.86,2.81),('P76','Electronics','Wooden picture frame',31.56,34.43,87.83,68.24,59.40),('P760','Clothing','Stainless steel water bottle',47.02,73.64,19.43,39.21,89.58),('P761','Beauty','Ceramic coffee mug',20.58,69.52,52.14,2.24,70.68),('P762','Beauty','Wooden picture frame',3.69,76.98,84.68,46.9,83.68),('P763','Clothing','Stainless steel water bottle',49.98,63.5,34.18,15.01,7.33),('P764','Home Decor','Ceramic coffee mug',25.19,62.65,50.63,54.64,81.64),('P765','Sports & Outdoors','Wooden picture frame',48.36,27.36,13.92,57.99,88.21),('P766','Home Decor','Leather wallet',28.7,16.99,95.23,48.85,96.13),('P767','Toys','Soft cotton t-shirt',6.18,78.65,89.08,21.01,17.00),('P768','Beauty','Wooden picture frame',9.61,16.82,30.13,14.19,92.61),('P769','Electronics','Ceramic coffee mug',22.71,85.64,9.98,10.48,15.06),('P77','Toys','Wooden picture frame',40.53,39,8.04,80.25,93.45),('P770','Beauty','Stainless steel water bottle',42.77,50.18,86.94,52.93,25.09),('P771','Beauty','Wooden picture frame',39.84,27.43,64.2,79.71,42.11),('P772','Beauty','Wooden picture frame',25.91,47.27,36.93,78.29,35.26),('P773','Electronics','Leather wallet',30.21,84.61,38.97,68.04,49.00),('P774','Toys','Ceramic coffee mug',46.38,7.89,77.84,78.74,39.20),('P775','Clothing','Ceramic coffee mug',25.97,4.17,95.21,60.34,47.98),('P776','Clothing','Stainless steel water bottle',42.92,52.27,33.26,81.54,22.33),('P777','Beauty','Wooden picture frame',34.2,10.97,63.04,45.55,65.68),('P778','Food & Beverage','Ceramic coffee mug',31.72,43.47,62.89,26.7,62.43),('P779','Clothing','Ceramic coffee mug',18.93,93.76,39.39,62.73,15.12),('P78','Sports & Outdoors','Soft cotton t-shirt',30.72,80.14,13.93,58.13,85.29),('P780','Home Decor','Wooden picture frame',7.84,7.99,32.44,36.78,83.09),('P781','Electronics','Leather wallet',7.06,8.32,4.84,86.28,59.60),('P782','Clothing','Soft cotton t-shirt',0.57,89.21,46.96,80.36,47.72),('P783','Toys','Leather wallet',12.8,54.68,5.96,13.09,58.78),('P784','Food & Beverage','Stainless steel water bottle',47.4,41.17,7.25,23.28,50.76),('P785','Home Decor','Wooden picture frame',20.38,41.53,32.1,74.17,76.47),('P786','Electronics','Wooden picture frame',36.9,65.74,31.13,50.43,31.07),('P787','Toys','Ceramic coffee mug',16.21,6.54,10.05,53.34,23.92),('P788','Clothing','Soft cotton t-shirt',41.43,94.8,89.08,73.02,25.40),('P789','Home Decor','Wooden picture frame',29.53,51.42,72.15,1.46,54.24),('P79','Electronics','Leather wallet',17.72,56.06,98.06,58.21,95.00),('P790','Books','Stainless steel water bottle',17.74,75.25,80.32,19.43,14.27),('P791','Sports & Outdoors','Stainless steel water bottle',32.04,75.57,83.26,19.32,82.37),('P792','Home Decor','Soft cotton t-shirt',7.79,87.59,77.56,22.49,71.05),('P793','Sports & Outdoors','Ceramic coffee mug',43.33,24.03,15.63,90.18,8.13),('P794','Food & Beverage','Stainless steel water bottle',40.62,33.91,45.98,86.05,24.48),('P795','Toys','Soft cotton t-shirt',42.85,88.07,90.46,55.02,97.04),('P796','Food & Beverage','Stainless steel water bottle',47,43.12,71.01,3.78,14.74),('P797','Books','Stainless steel water bottle',38.56,45.57,30.77,51.89,78.58),('P798','Electronics','Stainless steel water bottle',5.79,80.03,9.64,62.46,50.67),('P799','Food & Beverage','Leather wallet',37.04,23.91,63.14,24.52,16.60),('P8','Beauty','Wooden picture frame',24.96,34.25,79.14,39.59,29.01),('P80','Home Decor','Soft cotton t-shirt',36.99,69.52,31.42,51.68,94.25),('P800','Clothing','Wooden picture frame',6.01,83.48,61.83,80.49,86.24),('P801','Books','Ceramic coffee mug',44.86,29.72,89.94,11.39,48.42),('P802','Toys','Stainless steel water bottle',6.12,56.6,94.31,47.95,81.41),('P803','Beauty','Soft cotton t-shirt',17.68,17.53,72.3,80.69,62.75),('P804','Books','Leather wallet',19.18,94.14,91.28,26.31,68.56),('P805','Home Decor','Ceramic coffee mug',16.77,20.13,10.85,61.36,54.53),('P806','Electronics','Leather wallet',45.96,52.38,4.28,47.66,65.98),('P807','Home Decor','Soft cotton t-shirt',48.14,35.28,60.01,30.8,66.29),('P808','Home Decor','Leather wallet',48.58,1.24,78.66,97.89,33.53),('P809','Toys','Wooden picture frame',18.48,85.61,11.56,66.54,66.77),('P81','Books','Ceramic coffee mug',16.87,7.11,62.86,1.08,34.25),('P810','Beauty','Wooden picture frame',32.3,30.83,4.84,70.5,68.96),('P811','Home Decor','Ceramic coffee mug',33.49,87.12,50.77,76.32,43.05),('P812','Clothing','Leather wallet',14.26,51.8,36.35,7.79,7.35),('P813','Home Decor','Leather wallet',14.83,65.61,88.31,93.95,5.62),('P814','Food & Beverage','Leather wallet',26.91,61.44,83.38,40.41,5.06),('P815','Beauty','Ceramic coffee mug',21.75,67.63,89.86,7.17,7.44),('P816','Food & Beverage','Ceramic coffee mug',36.41,65.21,3.6,40.2,20.99),('P817','Sports & Outdoors','Ceramic coffee mug',3.8,20.05,34.12,86.15,81.66),('P818','Books','Ceramic coffee mug',5.28,75,17.73,29.77,47.33),('P819','Home Decor','Wooden picture frame',43.95,22.93,23.22,5.44,89.66),('P82','Food & Beverage','Leather wallet',20.75,23.49,11.09,34.43,8.30),('P820','Electronics','Ceramic coffee mug',33.52,29.96,58.1,92.76,68.54),('P821','Beauty','Soft cotton t-shirt',22.85,90.89,45.17,87.05,19.77),('P822','Electronics','Soft cotton t-shirt',43.75,40.31,92.41,32.33,90.26),('P823','Food & Beverage','Leather wallet',21.27,7.26,28.47,19.51,93.96),('P824','Sports & Outdoors','Leather wallet',12.12,35.27,2.47,24.23,99.04),('P825','Books','Wooden picture frame',34.27,46.62,97.43,49.06,14.33),('P826','Home Decor','Stainless steel water bottle',26.79,79.63,33.39,46.28,70.53),('P827','Home Decor','Ceramic coffee mug',12.67,19.5,55.46,38.11,11.65),('P828','Books','Wooden picture frame',10.62,76.78,15.21,88.84,43.68),('P829','Electronics','Soft cotton t-shirt',22.21,93.37,51.18,83.96,83.43),('P83','Beauty','Stainless steel water bottle',10.04,34.69,81.48,35.96,87.12),('P830','Home Decor','Stainless steel water bottle',49.96,36.44,55.04,45.22,85.32),('P831','Toys','Ceramic coffee mug',45.4,79.97,79.23,38.57,65.23),('P832','Clothing','Wooden picture frame',37.56,80.45,56.79,51.77,69.21),('P833','Home Decor','Wooden picture frame',0.58,49.68,6.86,26.62,50.34),('P834','Beauty','Leather wallet',7.51,47.92,9.86,97.61,43.08),('P835','Beauty','Leather wallet',14.25,1.48,35.55,57.46,63.36),('P836','Electronics','Soft cotton t-shirt',31.22,40.21,26.16,80.74,87.59),('P837','Clothing','Wooden picture frame',38.04,11.63,86.31,52.96,48.85),('P838','Electronics','Ceramic coffee mug',23.27,12.56,57.19,68.59,79.48),('P839','Toys','Leather wallet',12.85,98.67,2.29,5.31,51.83),('P84','Sports & Outdoors','Wooden picture frame',37.82,20.26,81.49,64.9,19.75),('P840','Beauty','Leather wallet',26.15,47.12,32.92,13.34,41.22),('P841','Clothing','Leather wallet',48.33,42.83,96.19,76.06,46.88),('P842','Home Decor','Ceramic coffee mug',12.06,59.35,6.9,88.92,10.73),('P843','Food & Beverage','Wooden picture frame',1.43,78.76,41.9,3.93,11.02),('P844','Home Decor','Stainless steel water bottle',40.99,43.93,36.81,43.74,21.92),('P845','Food & Beverage','Ceramic coffee mug',48.67,28.02,60.11,60.32,75.54),('P846','Clothing','Soft cotton t-shirt',25.58,82.59,99.34,13.5,13.94),('P847','Food & Beverage','Ceramic coffee mug',42.94,7.05,33.86,91.04,40.08),('P848','Toys','Leather wallet',40.09,52.75,23.09,79.99,58.57),('P849','Books','Stainless steel water bottle',27.86,47.7,18.97,79.91,72.61),('P85','Sports & Outdoors','Soft cotton t-shirt',26.62,16.08,85.96,94.94,87.35),('P850','Toys','Soft cotton t-shirt',6.09,98.93,54.89,89.2,19.92),('P851','Books','Wooden picture frame',23.62,39.54,63.02,69.83,34.56),('P852','Books','Soft cotton t-shirt',23.59,76.15,14.82,43.67,13.03),('P853','Toys','Wooden picture frame',18.95,31.21,13.87,68.07,59.46),('P854','Sports & Outdoors','Soft cotton t-shirt',37.81,67.66,87.17,51.5,59.20),('P855','Food & Beverage','Leather wallet',47.45,25.47,63.16,74.2,17.62),('P856','Home Decor','Wooden picture frame',47.11,9.35,17.26,46.98,8.52),('P857','Sports & Outdoors','Leather wallet',4.92,31.18,86.04,16.65,87.73),('P858','Sports & Outdoors','Stainless steel water bottle',15.29,45.88,19.31,68.72,16.07),('P859','Sports & Outdoors','Stainless steel water bottle',25.85,74.29,56.64,90.21,14.18),('P86','Clothing','Wooden picture frame',42.17,70.44,96.76,42.97,21.67),('P860','Food & Beverage','Ceramic coffee mug',29.27,5.93,71.72,63.56,64.84),('P861','Sports & Outdoors','Leather wallet',44.04,60.01,5.04,19.46,60.18),('P862','Food & Beverage','Ceramic coffee mug',32.61,93.4,58.09,82.21,6.37),('P863','Electronics','Wooden picture frame',23.26,96.77,89.31,66.19,48.33),('P864','Sports & Outdoors','Leather wallet',27.94,48.68,25.75,57.51,23.52),('P865','Food & Beverage','Stainless steel water bottle',18.64,6.37,90.68,11.69,70.64),('P866','Sports & Outdoors','Soft cotton t-shirt',4.07,71.97,78.92,35.61,83.61),('P867','Sports & Outdoors','Soft cotton t-shirt',8.59,77.95,55.44,46.01,7.14),('P868','Beauty','Ceramic coffee mug',14.51,49.79,25.07,44.71,80.89),('P869','Electronics','Ceramic coffee mug',25.67,55.67,78.87,3.35,85.01),('P87','Beauty','Ceramic coffee mug',34.08,25.6,63.47,13.62,82.37),('P870','Electronics','Leather wallet',39.01,16.98,17.6,14.8,56.84),('P871','Food & Beverage','Ceramic coffee mug',7.09,56.6,22.76,92.41,36.07),('P872','Beauty','Leather wallet',23.66,35.9,92.36,20.15,8.86),('P873','Clothing','Wooden picture frame',41.2,76.93,44.69,82.08,34.07),('P874','Toys','Leather wallet',35.12,95.37,83.71,14.98,43.77),('P875','Toys','Wooden picture frame',44.15,55.53,34.13,11.35,16.63),('P876','Home Decor','Ceramic coffee mug',25.42,29.05,10.17,88.83,49.86),('P877','Food & Beverage','Wooden picture frame',32.09,1.36,15.92,92.86,99.40),('P878','Food & Beverage','Ceramic coffee mug',23.82,3.25,2.15,58.93,49.41),('P879','Electronics','Wooden picture frame',41.88,91.79,83.69,93.39,46.88),('P88','Toys','Ceramic coffee mug',47.96,18.14,55.95,58.47,85.13),('P880','Electronics','Leather wallet',29.43,50.04,20.48,35.3,86.04),('P881','Home Decor','Leather wallet',1.53,55.4,52.99,16.29,74.81),('P882','Books','Leather wallet',20.8,72.4,39.3,52.62,15.94),('P883','Electronics','Wooden picture frame',46.27,53.77,17.46,73.44,52.26),('P884','Books','Soft cotton t-shirt',24.06,14.78,61.45,92.82,14.50),('P885','Food & Beverage','Soft cotton t-shirt',48.59,29.38,84.93,47.39,13.70),('P886','Books','Stainless steel water bottle',27.73,53.27,6.48,30.89,23.99),('P887','Electronics','Wooden picture frame',8.19,13.74,71.63,84.29,77.87),('P888','Electronics','Ceramic coffee mug',16.56,65.2,76.32,28.13,19.36),('P889','Electronics','Ceramic coffee mug',31.66,70.87,99.37,84.51,60.19),('P89','Food & Beverage','Leather wallet',15.49,27.77,43.05,85.12,43.87),('P890','Sports & Outdoors','Wooden picture frame',48.52,10.68,20.5,90.78,37.80),('P891','Clothing','Soft cotton t-shirt',13.71,33.33,33.2,54.42,56.38),('P892','Beauty','Soft cotton t-shirt',26.05,51.41,48.24,13.79,68.51),('P893','Sports & Outdoors','Wooden picture frame',21.15,61.29,51.82,57.65,73.42),('P894','Clothing','Soft cotton t-shirt',3.09,92.32,93.94,7.91,61.58),('P895','Home Decor','Wooden picture frame',6.71,41.27,20.3,62.43,86.60),('P896','Books','Wooden picture frame',11.05,18.29,98,62.7,49.29),('P897','Electronics','Wooden picture frame',27.81,94.68,8.69,24.4,84.65),('P898','Toys','Stainless steel water bottle',48.05,78.16,47.37,29.02,76.35),('P899','Food & Beverage','Soft cotton t-shirt',46.4,8.74,34.2,77.82,27.83),('P9','Clothing','Leather wallet',20.82,10.43,4.85,51,8.11),('P90','Home Decor','Leather wallet',2.22,30.37,8.13,36.81,55.05),('P900','Toys','Leather wallet',6.37,57.03,3.78,28.67,51.92),('P901','Books','Wooden picture frame',36.69,94.5,11.62,76.52,93.44),('P902','Food & Beverage','Wooden picture frame',32.33,7.46,89,64.68,13.46),('P903','Home Decor','Ceramic coffee mug',41.97,88.74,29.92,90.41,82.97),('P904','Beauty','Stainless steel water bottle',17.85,51.75,67.33,42.06,76.47),('P905','Clothing','Ceramic coffee mug',49.73,23.41,26.15,79.02,33.45),('P906','Beauty','Ceramic coffee mug',30.97,38.65,32.21,13.81,35.82),('P907','Books','Wooden picture frame',38.87,48.69,93.23,55.02,77.74),('P908','Clothing','Ceramic coffee mug',26.79,36.49,17.25,27.54,82.26),('P909','Food & Beverage','Soft cotton t-shirt',5.31,50.83,95.93,73.2,78.09),('P91','Clothing','Soft cotton t-shirt',19.78,62.64,25.84,37.95,43.66),('P910','Electronics','Ceramic coffee mug',46.91,36.95,34.62,54.32,82.03),('P911','Beauty','Stainless steel water bottle',22.24,24.95,5.42,22.95,80.19),('P912','Toys','Ceramic coffee mug',38.72,4.69,76.23,55.45,54.85),('P913','Beauty','Ceramic coffee mug',33.31,72.91,8.73,20.66,32.66),('P914','Sports & Outdoors','Stainless steel water bottle',14.01,95.67,76.82,61.07,96.76),('P915','Electronics','Stainless steel water bottle',7.03,47.26,52.85,84.41,87.82),('P916','Toys','Ceramic coffee mug',4.79,92.31,50.31,19.88,48.81),('P917','Food & Beverage','Leather wallet',32.18,71.9,36.23,60.67,78.61),('P918','Electronics','Soft cotton t-shirt',32.11,82.96,16.35,94.56,47.62),('P919','Electronics','Stainless steel water bottle',12.03,84.6,61.24,39.26,1.29),('P92','Home Decor','Ceramic coffee mug',34.96,50.25,24.6,38.28,60.55),('P920','Clothing','Wooden picture frame',18.92,10.21,59.92,23.38,99.90),('P921','Sports & Outdoors','Wooden picture frame',28.99,58.42,84.01,63.55,19.86),('P922','Toys','Ceramic coffee mug',12.13,34.96,91.8,86.87,95.59),('P923','Beauty','Wooden picture frame',14.72,44.33,65.07,4.76,21.38),('P924','Books','Ceramic coffee mug',11.99,1.83,98.91,69.9,17.14),('P925','Toys','Soft cotton t-shirt',40.53,3.46,24.14,14.29,20.53),('P926','Beauty','Ceramic coffee mug',34.5,29.67,14.38,38.4,50.24),('P927','Electronics','Ceramic coffee mug',42.46,71.03,17.9,20.86,89.63),('P928','Food & Beverage','Stainless steel water bottle',46.52,36.61,34.95,59.62,98.42),('P929','Sports & Outdoors','Ceramic coffee mug',7.92,56.71,3.37,13.34,24.21),('P93','Electronics','Leather wallet',41.25,11.49,84.25,90.61,22.79),('P930','Sports & Outdoors','Ceramic coffee mug',42.53,97.41,35.55,25.17,40.30),('P931','Books','Leather wallet',25.76,47.13,80.86,65.42,33.16),('P932','Books','Soft cotton t-shirt',6.81,10.19,64.68,47.91,43.89),('P933','Electronics','Soft cotton t-shirt',3.86,78.49,31.57,99.35,19.95),('P934','Electronics','Stainless steel water bottle',22.31,46.11,32.19,10.37,66.08),('P935','Beauty','Soft cotton t-shirt',18.96,35.81,48.23,96.93,71.57),('P936','Electronics','Soft cotton t-shirt',15.85,33.71,39.38,82,59.61),('P937','Beauty','Soft cotton t-shirt',9.65,37.72,61.51,88.32,82.34),('P938','Electronics','Ceramic coffee mug',35.88,46.62,38.35,15.6,33.87),('P939','Home Decor','Leather wallet',0.22,28.36,86.42,30.35,20.34),('P94','Toys','Ceramic coffee mug',40.52,28.38,54.19,24.03,98.10),('P940','Books','Ceramic coffee mug',45.42,63.88,66.14,86.55,32.46),('P941','Toys','Ceramic coffee mug',48.75,86.14,59.17,56.26,65.03),('P942','Toys','Ceramic coffee mug',39.91,55.3,97.37,68.47,28.73),('P943','Sports & Outdoors','Wooden picture frame',32,12.13,32.93,4.41,46.60),('P944','Books','Wooden picture frame',7.91,67.86,7.44,53.94,46.77),('P945','Sports & Outdoors','Soft cotton t-shirt',16.95,39.19,73.25,83.67,93.07),('P946','Electronics','Wooden picture frame',7.82,6.98,39.2,88.41,27.06),('P947','Food & Beverage','Soft cotton t-shirt',14.27,64.05,6.64,14.44,53.05),('P948','Sports & Outdoors','Stainless steel water bottle',0.97,83.05,51.75,37.03,84.10),('P949','Clothing','Ceramic coffee mug',35.88,5.56,43.99,44.02,62.35),('P95','Books','Stainless steel water bottle',32.2,15.78,5.22,51.54,58.45),('P950','Books','Wooden picture frame',32.87,95.59,61.07,42.36,5.20),('P951','Books','Soft cotton t-shirt',19.92,7.56,35.29,38.98,47.66),('P952','Electronics','Wooden picture frame',29.15,75.14,9.21,23.42,23.70),('P953','Sports & Outdoors','Stainless steel water bottle',35.26,38.99,91.76,86.96,73.53),('P954','Home Decor','Soft cotton t-shirt',32.14,4.94,27.58,50,97.52),('P955','Toys','Leather wallet',18.13,19.45,12.52,10.49,68.02),('P956','Electronics','Stainless steel water bottle',18.66,31.28,6.85,91.51,46.53),('P957','Books','Stainless steel water bottle',22.63,31.39,20.37,24.13,27.61),('P958','Food & Beverage','Soft cotton t-shirt',38.85,60.4,51.92,67.18,96.47),('P959','Clothing','Stainless steel water bottle',44.66,59.79,8.03,12.68,2.51),('P96','Beauty','Leather wallet',29.41,56.55,5.92,67.5,19.13),('P960','Beauty','Stainless steel water bottle',10.64,42.02,63.77,88.31,87.14),('P961','Electronics','Ceramic coffee mug',13.5,54.53,87.5,8.98,80.30),('P962','Electronics','Stainless steel water bottle',44.02,10.47,98.92,69.1,40.08),('P963','Sports & Outdoors','Ceramic coffee mug',10.65,93.1,5.19,31.72,57.51),('P964','Home Decor','Wooden picture frame',28.37,24.63,81.27,49.99,67.32),('P965','Beauty','Soft cotton t-shirt',0.23,81.96,28.57,6.64,64.06),('P966','Books','Leather wallet',17.11,58.24,4.92,45.26,18.34),('P967','Sports & Outdoors','Soft cotton t-shirt',14.44,89.23,59.44,66.63,96.53),('P968','Home Decor','Soft cotton t-shirt',36.88,78.94,38.12,19.84,30.61),('P969','Electronics','Soft cotton t-shirt',48.02,36.62,71.78,68.72,60.46),('P97','Books','Ceramic coffee mug',10.9,57.46,96,38.8,11.49),('P970','Home Decor','Wooden picture frame',36.03,77.79,90.86,33.21,73.07),('P971','Beauty','Soft cotton t-shirt',28.83,61.23,42.78,15.09,32.87),('P972','Clothing','Stainless steel water bottle',23.86,79.22,56.66,20.36,43.16),('P973','Sports & Outdoors','Leather wallet',9.89,68.91,53.51,48.65,17.19),('P974','Electronics','Soft cotton t-shirt',37.28,48.95,98.62,70.55,54.47),('P975','Beauty','Soft cotton t-shirt',8.46,18.93,13.64,87.19,21.79),('P976','Home Decor','Leather wallet',40.37,97.27,29.41,17.89,43.52),('P977','Toys','Wooden picture frame',32.99,93.87,40.57,52.63,52.24),('P978','Beauty','Wooden picture frame',6.78,33.15,89.37,77.55,30.64),('P979','Food & Beverage','Ceramic coffee mug',9.07,67.53,42.52,89.7,94.47),('P98','Home Decor','Wooden picture frame',40.71,3.11,38.64,1.48,82.42),('P980','Sports & Outdoors','Soft cotton t-shirt',3.79,15.56,90.33,89.28,28.72),('P981','Beauty','Stainless steel water bottle',41.55,47.84,31.57,49.16,93.33),('P982','Beauty','Stainless steel water bottle',48.31,75.9,82.21,4.4,82.49),('P983','Beauty','Stainless steel water bottle',26.52,1.73,17.26,76.44,32.44),('P984','Sports & Outdoors','Wooden picture frame',35.99,86.37,16.93,28.33,12.76),('P985','Home Decor','Soft cotton t-shirt',8.86,4.76,2.54,59.7,64.48),('P986','Clothing','Stainless steel water bottle',37.15,44.34,6.98,90.9,85.11),('P987','Electronics','Ceramic coffee mug',14.67,82.8,15.6,27.33,33.09),('P988','Clothing','Leather wallet',5.84,66.65,89.89,39.44,8.15),('P989','Home Decor','Leather wallet',39.59,16.38,84.66,86.14,39.48),('P99','Books','Stainless steel water bottle',11.98,85.64,23.22,79.88,72.94),('P990','Sports & Outdoors','Ceramic coffee mug',40.23,20.03,48.65,44.22,47.28),('P991','Books','Soft cotton t-shirt',4.38,48.43,1.26,61.87,16.57),('P992','Books','Ceramic coffee mug',24.35,29.24,9.43,4.28,39.02),('P993','Electronics','Soft cotton t-shirt',25.8,90.08,66.34,18.98,45.40),('P994','Clothing','Stainless steel water bottle',17.32,97.77,80.84,72.61,9.93),('P995','Electronics','Soft cotton t-shirt',28.36,21.63,64.57,7.85,11.43),('P996','Books','Ceramic coffee mug',43.23,42.27,43.28,64.75,26.38),('P997','Electronics','Soft cotton t-shirt',2.28,33.66,5.52,52.35,96.61),('P998','Toys','Ceramic coffee mug',14.04,67.31,44.86,59.81,6.89),('P999','Beauty','Stainless steel water bottle',42.09,41.12,60.05,38.89,40.63),('S1001','Shoes','Boots',400,40,40,25,65.00);
+INSERT INTO `products` (`product_id`, `product_category`, `product_description`, `product_weight`, `product_length`, `product_height`, `product_width`, `product_price`) VALUES ('P01000','Shoes','Black Boots',500,40,30,25,56.00),('P1','Electronics','Soft cotton t-shirt',8.9,56.85,62.25,77.25,42.25),('P10','Books','Wooden picture frame',25.32,10.19,88.65,72.09,30.31),('P100','Toys','Soft cotton t-shirt',12.54,58.22,64.73,13.21,23.79),('P1000','Clothing','Leather wallet',7.08,40.77,90.06,53.31,27.04),('P1001','Electronics','Smartphone with 64GB storage',0.5,15,8,1,699.99),('P1002','Home Appliances','Vacuum Cleaner 1200W',3,50,20,15,299.99),('P1003','Books','Fictional novel',0.3,22,15,2,19.99),('P101','Sports & Outdoors','Wooden picture frame',22.72,20.81,25.81,29.01,62.83),('P102','Sports & Outdoors','Wooden picture frame',49.01,70.56,52.15,80.12,34.03),('P103','Food & Beverage','Soft cotton t-shirt',47.41,28.33,26.74,14.69,79.65),('P104','Beauty','Wooden picture frame',4.34,1.01,61,20.96,97.15),('P105','Home Decor','Leather wallet',5.57,91.89,78.91,99.45,47.83),('P106','Home Decor','Leather wallet',4.16,36.24,60.1,19.31,45.68),('P107','Electronics','Ceramic coffee mug',40.17,39.01,58.71,87.52,83.90),('P108','Sports & Outdoors','Leather wallet',7.77,95.93,35.22,43.32,83.47),('P109','Sports & Outdoors','Ceramic coffee mug',0.24,93.15,41.16,72.99,65.64),('P11','Home Decor','Wooden picture frame',16.97,78.2,60.43,25,76.82),('P110','Toys','Stainless steel water bottle',15.96,60.18,65.55,75.72,87.15),('P111','Toys','Ceramic coffee mug',9.07,50.98,58.85,30.49,6.31),('P112','Electronics','Stainless steel water bottle',4.3,83.07,15.79,87.35,66.10),('P113','Electronics','Ceramic coffee mug',45.45,42.85,67.35,74.25,13.58),('P114','Sports & Outdoors','Soft cotton t-shirt',39.46,64.35,23.01,58.05,66.58),('P115','Food & Beverage','Soft cotton t-shirt',30.62,81.5,13.8,52.13,93.16),('P116','Sports & Outdoors','Leather wallet',39.39,48.92,52.19,33.83,67.07),('P117','Toys','Leather wallet',19.74,68.67,99.19,73.74,54.85),('P118','Beauty','Soft cotton t-shirt',27.53,79.93,67.4,50.15,72.07),('P119','Clothing','Leather wallet',18.8,25.93,18.64,19.34,95.77),('P12','Home Decor','Ceramic coffee mug',39.72,45.02,89.42,68.97,63.64),('P120','Toys','Ceramic coffee mug',34.67,60.12,38.96,63.27,29.91),('P121','Clothing','Soft cotton t-shirt',25.25,95.2,54.4,52.27,56.62),('P122','Beauty','Soft cotton t-shirt',1.61,16.4,76.56,25.42,93.39),('P123','Home Decor','Stainless steel water bottle',43.48,34.76,38.96,23.51,98.06),('P124','Books','Ceramic coffee mug',16.35,79.84,66.91,88.44,11.15),('P125','Toys','Ceramic coffee mug',31.73,77.52,21.22,53.42,57.55),('P126','Beauty','Stainless steel water bottle',33.97,98.15,45.61,68.61,55.32),('P127','Electronics','Leather wallet',29.9,28.39,6.75,96.06,3.93),('P128','Sports & Outdoors','Ceramic coffee mug',7.09,12.35,22.24,61.6,50.70),('P129','Books','Wooden picture frame',3.98,25.38,47.39,83.77,42.73),('P13','Food & Beverage','Stainless steel water bottle',38.61,40.51,13.26,21.86,60.52),('P130','Books','Wooden picture frame',40.21,16.02,8.51,84.35,74.44),('P131','Food & Beverage','Stainless steel water bottle',14.9,49.33,78.39,22.4,90.63),('P132','Electronics','Soft cotton t-shirt',3.69,60.85,91.09,96.83,30.84),('P133','Home Decor','Soft cotton t-shirt',15.7,49.66,2.35,98.38,79.29),('P134','Food & Beverage','Stainless steel water bottle',0.28,24.15,28.74,99.31,5.92),('P135','Food & Beverage','Wooden picture frame',18.35,75.04,1.42,89.88,87.76),('P136','Clothing','Stainless steel water bottle',35.51,97.37,65.74,81.55,24.01),('P137','Books','Wooden picture frame',8.32,55.55,17.56,23.48,53.79),('P138','Clothing','Stainless steel water bottle',5.66,21.06,15.84,8.9,96.89),('P139','Clothing','Leather wallet',36.86,79.5,14.5,82.88,25.11),('P14','Clothing','Wooden picture frame',33.85,92.96,56.98,97.16,31.89),('P140','Sports & Outdoors','Leather wallet',26.35,1.89,28.89,51.28,83.11),('P141','Sports & Outdoors','Soft cotton t-shirt',39.5,49.13,75.01,79.42,21.86),('P142','Toys','Leather wallet',4.21,12.3,22.02,79.76,56.99),('P143','Sports & Outdoors','Stainless steel water bottle',6.86,33.25,33.95,8.56,20.37),('P144','Electronics','Soft cotton t-shirt',31.23,32.2,13.35,10.79,28.87),('P145','Electronics','Soft cotton t-shirt',15.16,19.52,43.08,92.64,82.25),('P146','Books','Soft cotton t-shirt',1.93,83.09,95.87,58.14,26.65),('P147','Food & Beverage','Soft cotton t-shirt',43.63,84.93,8.92,97.18,83.50),('P148','Home Decor','Soft cotton t-shirt',32.49,8.38,39.14,51.04,39.52),('P149','Books','Ceramic coffee mug',7.45,44.81,57.6,37.4,45.13),('P15','Beauty','Soft cotton t-shirt',10.95,75.22,34.99,39.77,7.10),('P150','Sports & Outdoors','Stainless steel water bottle',17.3,21.11,12.36,44.86,97.08),('P151','Beauty','Soft cotton t-shirt',26.48,20.9,68.94,69.72,67.11),('P152','Beauty','Soft cotton t-shirt',39.83,16.62,22.79,56.34,43.29),('P153','Toys','Wooden picture frame',39.05,76.61,2.02,18.29,14.14),('P154','Beauty','Ceramic coffee mug',17.05,81.52,28.41,91.52,38.85),('P155','Electronics','Soft cotton t-shirt',28.31,69.69,48.75,19.7,51.79),('P156','Electronics','Wooden picture frame',36.16,80.17,47.25,71.39,42.42),('P157','Clothing','Leather wallet',11.66,37.97,98.85,93.86,55.75),('P158','Beauty','Soft cotton t-shirt',10.49,80.61,86.8,20.04,51.47),('P159','Food & Beverage','Ceramic coffee mug',34.01,62.51,88.03,52.27,89.10),('P16','Home Decor','Wooden picture frame',38.99,53.33,53.19,95.49,92.10),('P160','Clothing','Leather wallet',4,73.59,22.42,70.13,93.19),('P161','Toys','Soft cotton t-shirt',48.54,73.28,90.67,78.54,89.67),('P162','Beauty','Leather wallet',3.47,69.63,17.52,73.77,68.75),('P163','Sports & Outdoors','Leather wallet',26.26,50.78,25.83,82.05,73.76),('P164','Electronics','Leather wallet',0.63,58.91,34.12,76.3,62.54),('P165','Beauty','Leather wallet',35.91,16.59,56.78,85.31,90.42),('P166','Home Decor','Wooden picture frame',49.6,23.1,87.11,49.69,65.47),('P167','Toys','Ceramic coffee mug',38.21,41.32,91.73,48.59,55.08),('P168','Books','Wooden picture frame',41.52,16.51,79.1,84.36,78.00),('P169','Home Decor','Wooden picture frame',4.62,38.82,60.5,70.98,25.76),('P17','Sports & Outdoors','Leather wallet',35.12,89.11,6.28,47.89,91.82),('P170','Beauty','Ceramic coffee mug',43.77,17.34,50.72,52.91,83.80),('P171','Books','Soft cotton t-shirt',44.02,18.3,88.92,18.77,43.55),('P172','Toys','Ceramic coffee mug',46.65,71.77,96.49,53.05,64.35),('P173','Toys','Stainless steel water bottle',14.01,97.67,84.07,55.92,91.10),('P174','Toys','Wooden picture frame',8.78,44.75,88.58,96.1,63.43),('P175','Food & Beverage','Wooden picture frame',5.65,72.37,28.94,11.27,42.87),('P176','Sports & Outdoors','Stainless steel water bottle',11.28,34.69,23.55,72.96,23.07),('P177','Books','Soft cotton t-shirt',5.53,2.89,22.63,13.77,84.73),('P178','Books','Ceramic coffee mug',26.36,79.73,15.91,76.18,56.43),('P179','Beauty','Stainless steel water bottle',48,75.49,98.18,49.12,26.98),('P18','Toys','Soft cotton t-shirt',42.34,21.42,89.8,21.03,63.60),('P180','Home Decor','Leather wallet',47.34,1.9,48.83,36.95,38.06),('P181','Toys','Ceramic coffee mug',10.64,22.45,39.69,84.38,97.48),('P182','Electronics','Leather wallet',32.05,82.48,97.58,62.41,75.25),('P183','Books','Stainless steel water bottle',42.52,87.91,79.38,8.8,82.78),('P184','Clothing','Soft cotton t-shirt',47.08,18,54.65,89.76,88.17),('P185','Electronics','Stainless steel water bottle',20.81,53.56,57.87,27.83,92.49),('P186','Books','Wooden picture frame',39.99,95.05,52.75,37.13,97.95),('P187','Clothing','Ceramic coffee mug',35.31,28.05,73.65,64.31,13.26),('P188','Sports & Outdoors','Soft cotton t-shirt',37.44,85.53,59.97,30.15,68.47),('P189','Books','Ceramic coffee mug',38.92,52.3,86.21,97.48,4.58),('P19','Sports & Outdoors','Stainless steel water bottle',14.14,99.65,18.16,42.33,14.50),('P190','Toys','Wooden picture frame',46.41,7.52,51.37,51.96,57.74),('P191','Home Decor','Ceramic coffee mug',36.2,51.9,35.13,86.38,46.21),('P192','Beauty','Leather wallet',40.27,20.75,77.7,11.25,56.84),('P193','Books','Ceramic coffee mug',33.7,41.27,62.76,57.2,45.54),('P194','Toys','Ceramic coffee mug',19.34,62.55,15.98,99.67,56.21),('P195','Home Decor','Soft cotton t-shirt',10.29,24.44,20.35,85.73,44.41),('P196','Home Decor','Wooden picture frame',41.69,39.34,7.84,56.87,52.44),('P197','Home Decor','Ceramic coffee mug',35.41,51.13,86.64,70.97,28.94),('P198','Food & Beverage','Soft cotton t-shirt',24.71,3.5,94.49,14.29,85.41),('P199','Home Decor','Soft cotton t-shirt',7.71,89.61,45.97,60.85,42.23),('P2','Books','Leather wallet',46.25,81.98,19.02,57.61,52.91),('P20','Home Decor','Leather wallet',28.94,100,74.08,81.11,37.87),('P200','Books','Soft cotton t-shirt',28.77,17.83,85.58,21.94,29.63),('P201','Clothing','Wooden picture frame',44.23,1.65,62.6,17.74,33.54),('P202','Sports & Outdoors','Ceramic coffee mug',46.29,17.44,27.96,38.63,77.82),('P203','Food & Beverage','Wooden picture frame',39.24,4.53,45.55,84.38,89.45),('P204','Sports & Outdoors','Soft cotton t-shirt',32.17,26.21,66.76,33.57,14.81),('P205','Home Decor','Soft cotton t-shirt',45.77,87.71,44.94,13.25,2.70),('P206','Electronics','Stainless steel water bottle',12.8,75.24,23.82,64.74,67.05),('P207','Beauty','Soft cotton t-shirt',32.27,36.82,52.2,29.74,29.14),('P208','Home Decor','Wooden picture frame',43.37,91.63,74.84,86.61,42.57),('P209','Beauty','Stainless steel water bottle',27.1,41.27,61.5,78.51,25.44),('P21','Toys','Soft cotton t-shirt',7.91,6.34,19.52,8.42,97.48),('P210','Books','Leather wallet',11.83,12.36,22.25,72.46,14.10),('P211','Electronics','Soft cotton t-shirt',18.92,25.73,31.65,13.38,74.03),('P212','Books','Soft cotton t-shirt',33.03,24.6,15.83,66.27,29.88),('P213','Clothing','Leather wallet',37.23,73.1,14.02,49.32,25.29),('P214','Home Decor','Soft cotton t-shirt',10.39,81.32,38.74,1.9,35.82),('P215','Food & Beverage','Ceramic coffee mug',12.61,69.91,51.55,50.88,3.22),('P216','Home Decor','Stainless steel water bottle',17.32,17.79,40.02,86.9,6.63),('P217','Books','Leather wallet',16.7,68.55,58.5,63.41,22.50),('P218','Beauty','Wooden picture frame',5.84,6.98,21.04,92.14,91.63),('P219','Toys','Wooden picture frame',49.25,66.45,2.81,40.81,92.62),('P22','Electronics','Soft cotton t-shirt',1.65,42.47,73.65,30.84,88.24),('P220','Electronics','Leather wallet',18.5,36.77,73.6,88.81,63.33),('P221','Food & Beverage','Leather wallet',48.2,88.51,75.36,1.6,50.92),('P222','Food & Beverage','Ceramic coffee mug',36.67,76.49,95.54,54.56,63.62),('P223','Sports & Outdoors','Soft cotton t-shirt',24.11,30.19,82.61,81.95,65.33),('P224','Electronics','Ceramic coffee mug',40.72,85.03,12.76,71.16,35.79),('P225','Food & Beverage','Soft cotton t-shirt',18.22,72.48,78.66,7.13,80.95),('P226','Sports & Outdoors','Ceramic coffee mug',9.78,63.33,93.29,48.83,98.38),('P227','Books','Ceramic coffee mug',48.49,13.68,50.04,47.39,50.07),('P228','Clothing','Stainless steel water bottle',12.87,57.84,34.28,53.06,53.19),('P229','Books','Leather wallet',0.38,39.86,1.07,80.22,15.73),('P23','Beauty','Wooden picture frame',34.43,63.03,58.5,48.19,17.11),('P230','Food & Beverage','Ceramic coffee mug',8.24,78.65,39.7,65.7,37.34),('P231','Clothing','Ceramic coffee mug',30.58,97.89,70.07,48.01,35.38),('P232','Sports & Outdoors','Stainless steel water bottle',11.36,96.21,47.64,7.5,63.86),('P233','Sports & Outdoors','Wooden picture frame',16.66,76.29,35.85,52.08,14.17),('P234','Home Decor','Ceramic coffee mug',34.8,58.67,40.43,44.34,76.28),('P235','Clothing','Ceramic coffee mug',2.51,81.55,23.55,67.28,40.90),('P236','Beauty','Soft cotton t-shirt',19.91,61.63,89.68,81.73,73.66),('P237','Clothing','Stainless steel water bottle',23.33,62.48,83.38,14.02,46.58),('P238','Toys','Ceramic coffee mug',42.91,11.49,50.27,47.65,10.91),('P239','Food & Beverage','Wooden picture frame',16.89,7.65,61.29,41.95,12.84),('P24','Clothing','Soft cotton t-shirt',19.74,4.61,9.33,92.54,30.44),('P240','Food & Beverage','Ceramic coffee mug',9.78,18.07,71.97,90.88,13.69),('P241','Clothing','Wooden picture frame',23.98,78.79,6.38,34.36,75.14),('P242','Food & Beverage','Stainless steel water bottle',16.5,55.35,15.02,95.45,36.62),('P243','Food & Beverage','Ceramic coffee mug',17.5,86.79,47.15,92.57,55.70),('P244','Clothing','Stainless steel water bottle',24.91,79.27,18.7,89.47,68.63),('P245','Clothing','Soft cotton t-shirt',30.2,65.82,96.34,95.57,76.04),('P246','Sports & Outdoors','Leather wallet',39.04,29.92,73.62,49.05,74.30),('P247','Home Decor','Stainless steel water bottle',1.28,43.07,72.85,10.79,43.39),('P248','Toys','Wooden picture frame',45.94,21.55,56.16,5.09,92.06),('P249','Beauty','Wooden picture frame',20.19,24.11,73.53,31.45,32.13),('P25','Toys','Wooden picture frame',44.95,38.47,97.46,33.05,81.46),('P250','Toys','Ceramic coffee mug',22.81,52.82,19.98,90.96,12.90),('P251','Toys','Ceramic coffee mug',5.68,80.47,29.39,38.95,17.11),('P252','Clothing','Soft cotton t-shirt',20.01,22.96,93.32,44.47,45.86),('P253','Electronics','Soft cotton t-shirt',11.13,68.92,31.55,2.53,77.99),('P254','Toys','Ceramic coffee mug',46.48,8.25,74.66,66.89,53.37),('P255','Home Decor','Ceramic coffee mug',43.2,51.55,64.87,30.11,31.88),('P256','Books','Leather wallet',14.02,61.11,64.55,3.02,97.29),('P257','Clothing','Leather wallet',5.4,50.55,29.07,69.07,92.82),('P258','Food & Beverage','Stainless steel water bottle',2.33,22.92,21.61,78.37,72.20),('P259','Toys','Wooden picture frame',47.68,80.4,2.64,16.34,81.56),('P26','Food & Beverage','Leather wallet',2.01,55.59,74.7,80.23,91.21),('P260','Home Decor','Soft cotton t-shirt',18.94,96.97,23.18,42.36,12.36),('P261','Beauty','Leather wallet',22.44,61.43,26.48,87.6,84.15),('P262','Beauty','Ceramic coffee mug',32.69,23.97,98.55,28.07,85.69),('P263','Books','Stainless steel water bottle',27.74,49.11,72.6,34.33,75.99),('P264','Sports & Outdoors','Soft cotton t-shirt',37.03,70.56,87.75,45.82,22.89),('P265','Sports & Outdoors','Stainless steel water bottle',45.42,90.12,33.96,77.72,83.46),('P266','Books','Stainless steel water bottle',16.02,1.85,25.9,56.91,50.62),('P267','Food & Beverage','Leather wallet',6.61,68.79,2.7,60.11,1.74),('P268','Home Decor','Wooden picture frame',3.77,32.34,26.39,15.95,53.82),('P269','Toys','Leather wallet',38.43,28.56,45.17,9.29,64.89),('P27','Home Decor','Soft cotton t-shirt',37.21,75.3,35.6,10.63,63.01),('P270','Beauty','Wooden picture frame',37.55,67.11,9.71,68.57,20.36),('P271','Beauty','Stainless steel water bottle',28.1,63.43,51.03,87.05,10.80),('P272','Home Decor','Wooden picture frame',29.78,75.85,24.05,83.98,90.89),('P273','Food & Beverage','Stainless steel water bottle',30.52,78.91,81.1,26.67,25.04),('P274','Books','Ceramic coffee mug',27.67,48.68,56.59,23.45,49.54),('P275','Beauty','Soft cotton t-shirt',21.29,67.58,35.95,47.75,72.59),('P276','Toys','Leather wallet',30.31,92.76,10.47,83.84,15.32),('P277','Electronics','Ceramic coffee mug',3.07,24.24,95.91,97.21,55.85),('P278','Beauty','Leather wallet',13.71,57.27,82.19,79.13,34.27),('P279','Clothing','Wooden picture frame',47.4,39.76,82.57,66.3,2.80),('P28','Toys','Ceramic coffee mug',39.55,65.43,79.47,18.88,9.20),('P280','Toys','Stainless steel water bottle',25.79,20.62,16.31,58.32,36.58),('P281','Sports & Outdoors','Leather wallet',32.19,90.31,77.49,49.17,55.32),('P282','Home Decor','Wooden picture frame',30.91,15,55.04,61.93,66.84),('P283','Books','Soft cotton t-shirt',4,72.3,19.69,24.75,68.23),('P284','Clothing','Stainless steel water bottle',19.59,19.4,62.6,94.96,40.65),('P285','Clothing','Ceramic coffee mug',32.79,51.44,56.21,2.82,96.55),('P286','Food & Beverage','Soft cotton t-shirt',21,30.8,40.33,99.75,62.79),('P287','Food & Beverage','Stainless steel water bottle',33.09,62.03,78.62,52.54,23.31),('P288','Food & Beverage','Stainless steel water bottle',4.46,12.01,89.17,60.25,26.20),('P289','Electronics','Soft cotton t-shirt',11.4,60.96,92.71,5.84,60.04),('P29','Electronics','Stainless steel water bottle',45.46,2.59,60.24,55.33,22.60),('P290','Toys','Wooden picture frame',44.53,16.62,82.08,83.04,30.89),('P291','Clothing','Stainless steel water bottle',13.76,5.55,31.5,1.56,85.66),('P292','Beauty','Leather wallet',7.17,19.29,27.44,38.26,37.61),('P293','Toys','Soft cotton t-shirt',16.12,51.18,61.24,77.43,29.08),('P294','Food & Beverage','Soft cotton t-shirt',14.34,4.17,85.66,4.54,31.55),('P295','Clothing','Soft cotton t-shirt',22.59,59.95,85.75,10.85,69.52),('P296','Food & Beverage','Ceramic coffee mug',30.53,20.89,3.4,49.64,53.95),('P297','Beauty','Stainless steel water bottle',32.73,89.41,94.31,48.09,60.21),('P298','Beauty','Ceramic coffee mug',43.44,58.03,31.31,80.1,39.20),('P299','Toys','Soft cotton t-shirt',3.43,86.35,68.06,41.46,14.36),('P3','Home Decor','Stainless steel water bottle',49.91,87.74,96.41,54.16,52.18),('P30','Books','Stainless steel water bottle',9.19,28.47,14.15,83.9,18.85),('P300','Electronics','Ceramic coffee mug',26.29,46.27,57.03,89.56,35.70),('P301','Toys','Soft cotton t-shirt',12.24,28.66,52.26,46.47,21.96),('P302','Books','Soft cotton t-shirt',48.4,16.5,32.85,93.07,1.71),('P303','Beauty','Ceramic coffee mug',21.27,7.93,12.58,42.69,40.65),('P304','Electronics','Wooden picture frame',8.66,88.5,58.46,25.79,98.11),('P305','Electronics','Soft cotton t-shirt',29.91,11.09,47.69,27.42,70.63),('P306','Books','Wooden picture frame',49.58,51.26,59.91,34.76,57.81),('P307','Books','Ceramic coffee mug',29.92,6.39,15.13,55.11,76.14),('P308','Clothing','Leather wallet',37.14,42.41,5.61,72.09,8.30),('P309','Electronics','Ceramic coffee mug',44.6,91.76,14.54,20.81,10.08),('P31','Clothing','Wooden picture frame',40.25,8.9,6.74,22.06,24.47),('P310','Electronics','Leather wallet',18.83,75.18,45.94,98.88,91.13),('P311','Clothing','Soft cotton t-shirt',30.82,71.52,85.32,89.93,84.25),('P312','Food & Beverage','Ceramic coffee mug',42.94,75.07,52.47,41.51,47.85),('P313','Beauty','Wooden picture frame',14.06,41.65,41.09,69.57,84.50),('P314','Electronics','Wooden picture frame',31.47,84.09,2.57,34.2,79.96),('P315','Sports & Outdoors','Ceramic coffee mug',44.42,90.2,35.04,9.62,46.30),('P316','Sports & Outdoors','Stainless steel water bottle',1.66,79.86,33.47,6.72,89.62),('P317','Toys','Leather wallet',35.25,80.67,70.9,94.3,11.19),('P318','Sports & Outdoors','Soft cotton t-shirt',41.39,94.39,32.67,6.04,83.10),('P319','Sports & Outdoors','Stainless steel water bottle',1.86,29.14,83.52,55.45,83.92),('P32','Books','Ceramic coffee mug',27.22,40.32,24.58,30.15,70.29),('P320','Clothing','Wooden picture frame',8.53,95.41,34.16,58.85,98.72),('P321','Books','Stainless steel water bottle',26.62,32.68,45.78,69.87,83.71),('P322','Toys','Leather wallet',49.8,28.96,11.13,83.68,22.39),('P323','Beauty','Soft cotton t-shirt',12.95,8.73,67.05,14.69,57.80),('P324','Sports & Outdoors','Wooden picture frame',35.55,8.84,47,7.3,22.86),('P325','Books','Leather wallet',44.9,32.16,82.2,2.77,38.91),('P326','Electronics','Wooden picture frame',15.51,38.17,44.31,51.65,25.95),('P327','Toys','Wooden picture frame',8.56,32.33,21.2,40.72,12.02),('P328','Food & Beverage','Stainless steel water bottle',5.61,45.66,35.35,9.86,80.25),('P329','Clothing','Soft cotton t-shirt',25.68,77.81,96.62,36.38,67.17),('P33','Food & Beverage','Ceramic coffee mug',2.04,78.32,85.33,61.78,94.12),('P330','Clothing','Soft cotton t-shirt',38.95,29.03,98.16,40.01,70.09),('P331','Sports & Outdoors','Ceramic coffee mug',19.89,21.56,61.21,75.28,67.11),('P332','Beauty','Soft cotton t-shirt',20.22,8.64,17.16,84.7,25.25),('P333','Clothing','Wooden picture frame',1.19,13.39,74.93,3.89,22.93),('P334','Toys','Ceramic coffee mug',17.19,20.85,54.77,82.46,37.89),('P335','Sports & Outdoors','Wooden picture frame',37.56,98.04,72.95,53.66,20.66),('P336','Beauty','Leather wallet',11.95,17.48,42.83,5.02,87.66),('P337','Beauty','Leather wallet',20.05,13.02,39.58,88.08,78.28),('P338','Food & Beverage','Ceramic coffee mug',3.7,60.06,18.92,47.99,28.44),('P339','Clothing','Soft cotton t-shirt',32.31,8.9,83.07,44.13,5.37),('P34','Electronics','Wooden picture frame',37.2,20.6,88.95,62.85,39.54),('P340','Food & Beverage','Ceramic coffee mug',40.81,44.41,47.13,81.53,81.59),('P341','Toys','Wooden picture frame',7.25,20.06,15.16,91.77,90.30),('P342','Food & Beverage','Ceramic coffee mug',2.55,2.32,99.96,8.05,7.76),('P343','Books','Stainless steel water bottle',30.62,29.19,2.37,60.38,63.87),('P344','Sports & Outdoors','Stainless steel water bottle',6.38,59.63,73.74,45.83,97.10),('P345','Food & Beverage','Leather wallet',36.64,93.4,56.71,8.66,94.88),('P346','Beauty','Soft cotton t-shirt',44.54,19.43,78.2,21.66,83.11),('P347','Books','Leather wallet',40.18,14.86,44.52,15.5,30.92),('P348','Home Decor','Ceramic coffee mug',26.02,98.38,36.76,19,3.25),('P349','Food & Beverage','Wooden picture frame',2.58,15.42,48.09,55.22,21.49),('P35','Toys','Ceramic coffee mug',40.76,12.09,24.35,56.67,96.72),('P350','Electronics','Ceramic coffee mug',13.27,54.62,78.13,14.59,22.11),('P351','Beauty','Leather wallet',28.93,39.02,62.89,84.88,17.38),('P352','Beauty','Leather wallet',19.93,44.32,79.86,91.03,19.59),('P353','Sports & Outdoors','Wooden picture frame',12.93,47.92,66.59,5.64,44.81),('P354','Home Decor','Stainless steel water bottle',37.85,76.58,33.11,25.27,65.26),('P355','Beauty','Stainless steel water bottle',42.08,8.04,22.58,38.7,91.87),('P356','Food & Beverage','Ceramic coffee mug',47.39,28.03,32.82,18.09,64.60),('P357','Electronics','Soft cotton t-shirt',2.59,53.17,10.59,41.89,46.36),('P358','Beauty','Stainless steel water bottle',2.49,40.11,15.67,44.96,36.99),('P359','Home Decor','Stainless steel water bottle',32.93,13.75,28.43,94.33,44.88),('P36','Toys','Wooden picture frame',27.85,77.27,99.05,84.14,13.45),('P360','Clothing','Wooden picture frame',44.71,84.18,59.07,73.19,30.59),('P361','Toys','Wooden picture frame',5.25,69.17,9.61,50.96,12.60),('P362','Electronics','Ceramic coffee mug',46.16,73.82,48.08,94.81,69.25),('P363','Home Decor','Stainless steel water bottle',43.3,32.4,61.38,17.56,10.45),('P364','Food & Beverage','Wooden picture frame',12.6,67.68,50.59,11.47,41.50),('P365','Books','Soft cotton t-shirt',2.64,54.48,16.05,26.73,76.16),('P366','Beauty','Soft cotton t-shirt',46.99,28.59,11.71,47.27,57.29),('P367','Food & Beverage','Soft cotton t-shirt',24.47,57.03,9.59,25.39,56.99),('P368','Books','Leather wallet',14.37,37.5,30.05,45.41,13.07),('P369','Sports & Outdoors','Stainless steel water bottle',47.33,27.39,8.08,60.01,91.37),('P37','Electronics','Leather wallet',36.83,62.02,68.29,19.2,20.65),('P370','Electronics','Ceramic coffee mug',37.51,72.41,49.66,57.2,26.15),('P371','Home Decor','Ceramic coffee mug',32.21,72.85,66.9,72.12,67.78),('P372','Home Decor','Soft cotton t-shirt',37.35,13.61,61.52,73.79,61.47),('P373','Food & Beverage','Leather wallet',6.5,56.33,77.09,10.43,4.02),('P374','Books','Ceramic coffee mug',33.36,89.54,6.21,92.59,32.67),('P375','Electronics','Ceramic coffee mug',21.27,95.43,16.75,58.73,51.31),('P376','Beauty','Ceramic coffee mug',11.64,67.61,35.1,96.21,58.51),('P377','Home Decor','Ceramic coffee mug',17.31,40.4,48.99,72.84,38.65),('P378','Food & Beverage','Soft cotton t-shirt',6.25,59.06,83.39,57.19,16.71),('P379','Sports & Outdoors','Ceramic coffee mug',2.42,17.39,36.51,80.04,65.59),('P38','Home Decor','Soft cotton t-shirt',10.64,63.74,96.9,22.37,78.84),('P380','Beauty','Leather wallet',42.5,83.92,97.58,55.46,97.40),('P381','Sports & Outdoors','Stainless steel water bottle',2.24,29.35,17.62,17.84,51.50),('P382','Books','Stainless steel water bottle',28.81,99.11,71.07,49.06,63.32),('P383','Sports & Outdoors','Ceramic coffee mug',6.15,6.25,95.34,5.21,62.07),('P384','Books','Ceramic coffee mug',42.32,59.01,22.5,1.68,20.40),('P385','Sports & Outdoors','Stainless steel water bottle',35.05,82.29,33.33,9.86,13.80),('P386','Electronics','Stainless steel water bottle',39.23,19.92,26.05,62.89,6.78),('P387','Food & Beverage','Ceramic coffee mug',22.66,44.12,86.18,15.35,90.50),('P388','Beauty','Soft cotton t-shirt',40.63,2.6,58.52,56.29,35.18),('P389','Beauty','Leather wallet',47.97,25.71,33.5,91.32,2.39),('P39','Books','Leather wallet',27.56,29.91,75.21,57.61,4.39),('P390','Clothing','Wooden picture frame',45.84,35.41,10.03,28.03,13.79),('P391','Sports & Outdoors','Ceramic coffee mug',7.25,55.96,56.23,52.81,54.80),('P392','Clothing','Leather wallet',18.31,47.89,23.5,11.31,33.61),('P393','Sports & Outdoors','Ceramic coffee mug',20.38,40.68,78.87,61.62,2.65),('P394','Books','Ceramic coffee mug',27.67,8.7,68.48,69.57,10.40),('P395','Food & Beverage','Wooden picture frame',22.08,81.92,90.5,25.47,43.08),('P396','Beauty','Wooden picture frame',8.94,54.76,45.83,46.8,84.21),('P397','Electronics','Soft cotton t-shirt',7.22,71.25,78.58,57.1,92.78),('P398','Electronics','Wooden picture frame',21.87,47.59,94.24,6.01,12.28),('P399','Electronics','Wooden picture frame',18.11,32.9,4.43,59.06,79.07),('P4','Food & Beverage','Stainless steel water bottle',7.01,55.25,48.08,75.46,60.52),('P40','Food & Beverage','Ceramic coffee mug',27.66,59.66,19.86,11.02,64.38),('P400','Toys','Stainless steel water bottle',49.63,96.42,45.14,84.21,40.32),('P401','Home Decor','Wooden picture frame',32.74,83.03,80.7,43.73,7.47),('P402','Beauty','Stainless steel water bottle',3.05,99.62,45.86,22.3,14.38),('P403','Clothing','Soft cotton t-shirt',18.56,67.71,61.02,55.52,48.50),('P404','Toys','Leather wallet',27.57,32.64,55.12,8.9,99.36),('P405','Sports & Outdoors','Wooden picture frame',12.41,66,75.02,69.96,53.30),('P406','Food & Beverage','Leather wallet',49.69,25.43,68.65,43.84,66.43),('P407','Clothing','Wooden picture frame',41.11,48.13,12.91,47.28,72.25),('P408','Electronics','Stainless steel water bottle',16.36,31.49,22.72,34.02,61.95),('P409','Beauty','Leather wallet',18.03,17.19,51.72,7.63,92.02),('P41','Food & Beverage','Wooden picture frame',44.59,25.79,47.35,16.8,75.25),('P410','Beauty','Wooden picture frame',2.6,77.84,9.08,17.15,99.18),('P411','Beauty','Wooden picture frame',30.32,28.43,78.72,30.21,71.15),('P412','Toys','Ceramic coffee mug',6.04,29.43,59.12,93.51,57.22),('P413','Home Decor','Soft cotton t-shirt',17.94,41.56,50.74,75.79,71.64),('P414','Clothing','Wooden picture frame',6.53,66.92,47.04,67.44,86.52),('P415','Clothing','Leather wallet',43.74,93.13,34.76,73.07,18.72),('P416','Home Decor','Soft cotton t-shirt',27.73,51.33,75.38,92.65,31.00),('P417','Sports & Outdoors','Soft cotton t-shirt',4.14,99.1,50.56,33.37,97.87),('P418','Clothing','Wooden picture frame',32.25,25.44,90.95,71.34,98.34),('P419','Food & Beverage','Leather wallet',35.33,55.44,85.28,14.13,98.10),('P42','Books','Wooden picture frame',1.54,40.66,22.8,20.46,95.48),('P420','Home Decor','Wooden picture frame',2.97,20.78,88.16,57.34,83.08),('P421','Beauty','Soft cotton t-shirt',42.74,48.68,82.57,41.4,28.99),('P422','Beauty','Wooden picture frame',47.63,20.57,60.04,46.91,92.68),('P423','Electronics','Soft cotton t-shirt',5.54,88.39,10.2,91.76,78.43),('P424','Clothing','Wooden picture frame',23.52,89.29,26.89,34.99,14.12),('P425','Home Decor','Leather wallet',46.95,77.83,54.2,31.98,32.31),('P426','Sports & Outdoors','Ceramic coffee mug',46.31,20.43,61.38,64.92,19.19),('P427','Toys','Wooden picture frame',39.06,16.44,34.53,52.72,97.03),('P428','Food & Beverage','Stainless steel water bottle',29.51,92.71,63.89,60.25,30.56),('P429','Food & Beverage','Leather wallet',37.14,92.04,62.99,23.15,58.71),('P43','Clothing','Ceramic coffee mug',26.99,99.18,27.7,49.4,2.86),('P430','Beauty','Wooden picture frame',0.96,64.11,88.87,18.52,35.18),('P431','Books','Soft cotton t-shirt',10.05,88.53,31.55,86.93,67.31),('P432','Books','Ceramic coffee mug',43.77,69.67,57.11,22.72,32.00),('P433','Home Decor','Stainless steel water bottle',49.39,73.18,1.99,49.31,56.10),('P434','Sports & Outdoors','Wooden picture frame',33.56,4.92,45.19,60.41,84.50),('P435','Books','Soft cotton t-shirt',49.33,5.44,82.32,69.77,55.17),('P436','Toys','Soft cotton t-shirt',18.82,1.62,2.48,70.4,21.37),('P437','Books','Wooden picture frame',44.42,91.88,89.55,38.69,39.34),('P438','Home Decor','Soft cotton t-shirt',33.7,14.27,98.86,1.84,32.57),('P439','Home Decor','Soft cotton t-shirt',16.08,96.11,14.62,99.96,43.84),('P44','Home Decor','Leather wallet',43.78,31.06,47.12,82.15,21.49),('P440','Sports & Outdoors','Ceramic coffee mug',31.64,24.87,83.13,44.81,73.95),('P441','Sports & Outdoors','Wooden picture frame',9.92,62.76,64.67,28.47,7.26),('P442','Beauty','Ceramic coffee mug',24.58,66.37,63.01,23.04,11.44),('P443','Beauty','Stainless steel water bottle',48.53,80.21,11.53,62.05,34.43),('P444','Sports & Outdoors','Stainless steel water bottle',4.92,85.83,83.94,34.31,37.82),('P445','Electronics','Soft cotton t-shirt',10.49,2.26,38.83,70.24,84.81),('P446','Clothing','Wooden picture frame',33,17.8,90.64,5.53,12.60),('P447','Home Decor','Ceramic coffee mug',46.43,20.11,91.21,17.83,5.56),('P448','Clothing','Ceramic coffee mug',35.64,51.84,76.99,27.91,88.01),('P449','Toys','Stainless steel water bottle',9.17,53.07,41.17,25.08,26.37),('P45','Food & Beverage','Ceramic coffee mug',37.97,68.23,63.94,1.81,64.84),('P450','Toys','Soft cotton t-shirt',14.78,58.15,98.22,34.73,46.06),('P451','Clothing','Stainless steel water bottle',11.72,88.21,79.2,42.81,34.80),('P452','Books','Leather wallet',6.97,61.46,69.18,33.04,34.80),('P453','Beauty','Wooden picture frame',5.94,33.38,89.08,97.17,68.59),('P454','Beauty','Wooden picture frame',32.77,67.79,15.34,48.86,39.58),('P455','Toys','Wooden picture frame',3.82,76.17,10.68,56.35,90.13),('P456','Books','Soft cotton t-shirt',34.66,47.94,92.67,18.74,33.89),('P457','Clothing','Leather wallet',7.95,43.17,14.92,90.7,96.08),('P458','Clothing','Wooden picture frame',47.19,59.32,25.09,52.44,80.70),('P459','Books','Soft cotton t-shirt',37.32,51.41,54.26,33.72,15.28),('P46','Electronics','Soft cotton t-shirt',19.01,58.91,3.31,67.24,31.29),('P460','Food & Beverage','Leather wallet',4.28,17,54.64,23.35,10.61),('P461','Sports & Outdoors','Stainless steel water bottle',19.29,77.29,20.05,67.74,57.19),('P462','Electronics','Stainless steel water bottle',5.97,14.97,14.87,64.88,55.12),('P463','Food & Beverage','Stainless steel water bottle',28.97,59.76,10.38,43.22,4.01),('P464','Beauty','Wooden picture frame',35.82,87.98,49.75,77.11,51.69),('P465','Clothing','Leather wallet',6.44,68.71,82.51,2.89,47.43),('P466','Sports & Outdoors','Ceramic coffee mug',2.54,98.66,72.25,53.27,81.06),('P467','Food & Beverage','Wooden picture frame',4.31,72.36,99.36,62.01,64.03),('P468','Clothing','Wooden picture frame',44.73,71.65,37.14,82.91,75.99),('P469','Beauty','Wooden picture frame',29.24,64.75,14.57,45.48,87.82),('P47','Books','Soft cotton t-shirt',0.84,53.9,30.37,20.39,12.16),('P470','Sports & Outdoors','Wooden picture frame',41.74,65.98,35.01,73.76,93.32),('P471','Beauty','Stainless steel water bottle',39.97,30.3,16.84,25.96,33.11),('P472','Home Decor','Ceramic coffee mug',16.79,99.12,96.34,93.39,82.60),('P473','Beauty','Leather wallet',31.57,42.11,75.39,23.13,15.68),('P474','Books','Ceramic coffee mug',32.24,82.69,44.76,76.71,27.60),('P475','Toys','Wooden picture frame',45.95,92.62,33.27,83.75,89.98),('P476','Food & Beverage','Leather wallet',40.07,95.04,41.54,13.73,69.06),('P477','Toys','Leather wallet',24.44,63.42,72.31,61.83,74.39),('P478','Beauty','Soft cotton t-shirt',0.28,46.08,27.53,91.63,64.78),('P479','Books','Ceramic coffee mug',47.94,93.12,61.83,63.38,99.71),('P48','Clothing','Wooden picture frame',31.03,58.14,90.8,42.5,6.23),('P480','Clothing','Leather wallet',11.55,64.76,11.53,95.04,28.00),('P481','Home Decor','Wooden picture frame',21.6,88.15,8.07,20.68,21.34),('P482','Beauty','Stainless steel water bottle',13.32,35.62,18.32,57.84,21.67),('P483','Electronics','Soft cotton t-shirt',24.95,93.57,77.82,72.09,43.34),('P484','Sports & Outdoors','Ceramic coffee mug',37.95,27.91,83.05,41.46,51.68),('P485','Clothing','Soft cotton t-shirt',40.15,99.52,8.98,52.5,28.38),('P486','Food & Beverage','Soft cotton t-shirt',31.2,7.73,59.88,8.16,84.86),('P487','Clothing','Leather wallet',41.75,15.75,40.79,60.15,41.17),('P488','Food & Beverage','Stainless steel water bottle',46.61,79.19,74.32,84.9,49.25),('P489','Clothing','Stainless steel water bottle',10.35,44.63,22.19,13.77,22.73),('P49','Books','Soft cotton t-shirt',23.63,9.62,60.29,44.63,63.92),('P490','Books','Leather wallet',0.46,98.01,36.6,50.61,52.40),('P491','Beauty','Soft cotton t-shirt',48.13,63.01,53.16,24.69,69.23),('P492','Clothing','Soft cotton t-shirt',10.77,14.18,59.45,16.47,88.98),('P493','Electronics','Stainless steel water bottle',25.3,18.65,94.5,19.01,38.20),('P494','Electronics','Wooden picture frame',24.84,89.95,92.43,62.96,22.04),('P495','Electronics','Leather wallet',11.43,72.64,68.28,27.97,93.62),('P496','Beauty','Soft cotton t-shirt',2.28,11.24,34.65,8.35,4.96),('P497','Beauty','Stainless steel water bottle',42.28,77.64,71.49,85.05,39.97),('P498','Sports & Outdoors','Stainless steel water bottle',12.49,77.08,92.72,73.33,84.95),('P499','Clothing','Stainless steel water bottle',31.62,95.8,29.81,61.3,6.83),('P5','Home Decor','Wooden picture frame',2.69,48.52,51.31,16.53,75.30),('P50','Toys','Leather wallet',22.85,36.29,54.37,8.58,58.02),('P500','Books','Ceramic coffee mug',9,98.07,72.39,86.75,63.18),('P501','Beauty','Leather wallet',43,18.31,50.53,7.32,41.85),('P502','Books','Leather wallet',33.14,10.64,77.67,15.52,18.72),('P503','Food & Beverage','Soft cotton t-shirt',21.17,97.8,52.69,79.48,66.04),('P504','Toys','Stainless steel water bottle',38.95,53.01,22.63,35.15,75.06),('P505','Sports & Outdoors','Ceramic coffee mug',4.5,73.48,84.49,35.58,77.16),('P506','Home Decor','Stainless steel water bottle',43.3,53.48,4.18,83.88,60.63),('P507','Toys','Soft cotton t-shirt',37.25,97.74,22.51,4.04,70.65),('P508','Electronics','Wooden picture frame',7.09,85.42,23.27,95.95,71.35),('P509','Sports & Outdoors','Leather wallet',29.12,1.6,79.52,13.57,44.83),('P51','Electronics','Leather wallet',2.9,64.72,12.4,57.25,9.10),('P510','Food & Beverage','Soft cotton t-shirt',49.57,78.52,51.11,96.25,9.00),('P511','Home Decor','Soft cotton t-shirt',20.38,53.56,45.5,62.99,16.70),('P512','Books','Wooden picture frame',48.96,79,73.49,12.06,55.51),('P513','Beauty','Soft cotton t-shirt',14.97,48,36.64,98.6,28.45),('P514','Home Decor','Wooden picture frame',15.55,2.72,39.87,9.61,73.74),('P515','Toys','Wooden picture frame',42.98,99.36,37.22,69.94,84.32),('P516','Books','Stainless steel water bottle',49.95,64.78,16.57,48.22,1.39),('P517','Sports & Outdoors','Soft cotton t-shirt',43.94,62.31,88.72,38.03,49.97),('P518','Toys','Stainless steel water bottle',43.13,95.72,40.44,2.97,46.69),('P519','Books','Soft cotton t-shirt',8.19,5.73,89.57,40.87,82.55),('P52','Food & Beverage','Soft cotton t-shirt',18.42,58.49,64.61,45.58,73.67),('P520','Home Decor','Ceramic coffee mug',37.86,59.96,55.88,9.36,20.71),('P521','Sports & Outdoors','Soft cotton t-shirt',37.48,10.41,42.36,78.93,79.53),('P522','Beauty','Ceramic coffee mug',4.46,28.93,85.87,35.1,37.54),('P523','Food & Beverage','Leather wallet',2.44,67.37,64.67,71.16,47.11),('P524','Clothing','Wooden picture frame',9.07,92.84,31.74,53.4,22.93),('P525','Sports & Outdoors','Leather wallet',34.31,28.96,76.8,6.85,71.30),('P526','Home Decor','Wooden picture frame',36.31,41.73,57.56,72.07,88.72),('P527','Electronics','Ceramic coffee mug',17.07,69.22,47.28,57.35,30.72),('P528','Sports & Outdoors','Stainless steel water bottle',36.3,51.24,87.15,26.86,84.42),('P529','Toys','Stainless steel water bottle',14.98,62.23,34.65,16.23,31.95),('P53','Home Decor','Wooden picture frame',33.46,64.26,18.09,94.42,4.47),('P530','Books','Stainless steel water bottle',37,41.46,1.21,59.55,24.52),('P531','Food & Beverage','Stainless steel water bottle',47.47,32.97,8.04,88.06,9.19),('P532','Electronics','Soft cotton t-shirt',40.58,20.11,29.35,43.28,70.38),('P533','Food & Beverage','Wooden picture frame',20.34,52.53,5.89,85.15,26.32),('P534','Home Decor','Ceramic coffee mug',5.23,3.47,69.28,70.75,18.47),('P535','Home Decor','Soft cotton t-shirt',35.05,34.4,38.62,1.57,12.37),('P536','Food & Beverage','Wooden picture frame',34.63,13.16,21.21,90.11,5.45),('P537','Beauty','Wooden picture frame',5.65,27.09,36.55,1.61,88.14),('P538','Beauty','Soft cotton t-shirt',37.35,88.35,96.41,20.64,27.35),('P539','Sports & Outdoors','Wooden picture frame',24.33,89.71,49.34,4.72,69.31),('P54','Clothing','Ceramic coffee mug',3.79,92.05,54.38,78.54,65.52),('P540','Home Decor','Stainless steel water bottle',36.77,39.51,1.46,20.81,19.66),('P541','Sports & Outdoors','Stainless steel water bottle',13.28,7.96,44.64,31.86,98.76),('P542','Electronics','Stainless steel water bottle',24.79,6.83,6.79,88.07,37.82),('P543','Food & Beverage','Leather wallet',24.12,96,43.9,9.7,89.82),('P544','Clothing','Wooden picture frame',5.29,77.34,12,55.95,37.64),('P545','Sports & Outdoors','Wooden picture frame',24.5,33.88,46.54,15.42,16.74),('P546','Sports & Outdoors','Soft cotton t-shirt',13.6,11.95,96.33,15.86,68.76),('P547','Clothing','Leather wallet',16.81,88.51,69.84,91.19,94.59),('P548','Electronics','Soft cotton t-shirt',35.73,57.68,38.62,42.37,67.66),('P549','Clothing','Soft cotton t-shirt',49.98,96.92,48.09,17.92,53.54),('P55','Home Decor','Soft cotton t-shirt',5.78,16.41,47.87,21.99,63.72),('P550','Beauty','Soft cotton t-shirt',41.33,98.47,14.26,14.8,58.00),('P551','Sports & Outdoors','Wooden picture frame',0.52,19.36,6.1,20.24,97.82),('P552','Clothing','Ceramic coffee mug',34.61,35.8,33.84,79.81,17.10),('P553','Books','Stainless steel water bottle',24.69,56.44,38.03,90.88,88.06),('P554','Home Decor','Soft cotton t-shirt',18.77,54.82,45.73,74.43,90.99),('P555','Clothing','Leather wallet',11.78,98.1,92.78,16.84,90.77),('P556','Beauty','Wooden picture frame',34.72,79.29,50.22,69.9,80.87),('P557','Sports & Outdoors','Stainless steel water bottle',6.78,3.65,92.48,56.91,32.04),('P558','Food & Beverage','Soft cotton t-shirt',44.02,98.45,15.77,22,15.59),('P559','Toys','Wooden picture frame',1.82,99.54,43.81,52.23,79.82),('P56','Toys','Soft cotton t-shirt',25.08,42.88,58.71,57.55,54.32),('P560','Toys','Ceramic coffee mug',33.72,17.24,83.76,84.36,31.16),('P561','Beauty','Stainless steel water bottle',42.8,80.2,58.08,66.3,90.85),('P562','Clothing','Wooden picture frame',47.01,69.09,18.46,72.12,62.76),('P563','Sports & Outdoors','Ceramic coffee mug',20.28,46.19,12.98,11.72,40.24),('P564','Clothing','Wooden picture frame',5.42,84,22.45,67.14,11.91),('P565','Books','Stainless steel water bottle',29.48,10.51,81.7,5.57,36.86),('P566','Clothing','Stainless steel water bottle',33.3,6.78,7.7,49.65,48.54),('P567','Home Decor','Stainless steel water bottle',42.5,62.94,5.71,24.75,32.13),('P568','Clothing','Leather wallet',39.84,64.61,56.05,13.31,14.04),('P569','Sports & Outdoors','Stainless steel water bottle',39.25,54.76,40.41,55.33,71.81),('P57','Toys','Wooden picture frame',39.63,54.33,41.06,46.32,18.92),('P570','Sports & Outdoors','Leather wallet',44.48,75.56,61.74,61.34,76.16),('P571','Books','Stainless steel water bottle',2.38,70.95,41.83,31.1,26.05),('P572','Electronics','Leather wallet',40.33,4.05,84.1,2.35,98.76),('P573','Home Decor','Soft cotton t-shirt',9.42,36,64.93,15.62,18.67),('P574','Beauty','Soft cotton t-shirt',31.65,67.79,74.79,62.04,93.05),('P575','Electronics','Stainless steel water bottle',19.36,19.35,52.03,75.19,12.26),('P576','Books','Wooden picture frame',2.71,22.96,71.13,94.9,78.15),('P577','Food & Beverage','Wooden picture frame',21.32,80.67,35.02,17.79,55.98),('P578','Electronics','Leather wallet',19.08,13.62,68.14,67.9,44.42),('P579','Sports & Outdoors','Wooden picture frame',22.95,65.06,14.8,24.04,53.18),('P58','Books','Stainless steel water bottle',48.34,38.71,49.25,69.04,32.64),('P580','Toys','Ceramic coffee mug',11.62,75.64,12.1,26.54,2.67),('P581','Electronics','Leather wallet',24.1,29.8,28.05,92.53,13.42),('P582','Home Decor','Wooden picture frame',32.19,27.16,22.7,45.77,58.10),('P583','Food & Beverage','Soft cotton t-shirt',42.7,74.62,1.33,62.05,51.25),('P584','Food & Beverage','Stainless steel water bottle',39.5,90.57,52.48,40.63,80.93),('P585','Food & Beverage','Wooden picture frame',17.47,81.64,23.07,26.4,51.92),('P586','Electronics','Stainless steel water bottle',28.27,24.8,20.32,65.16,15.78),('P587','Toys','Wooden picture frame',32.83,12.05,77.93,92.34,21.16),('P588','Toys','Stainless steel water bottle',18.1,28.05,38.23,53.69,57.48),('P589','Sports & Outdoors','Stainless steel water bottle',37.67,99.38,75.19,55.58,24.88),('P59','Clothing','Ceramic coffee mug',23.92,9.67,68.33,49.08,49.99),('P590','Sports & Outdoors','Stainless steel water bottle',3.74,9.19,95.75,33.84,75.31),('P591','Sports & Outdoors','Wooden picture frame',13.91,29.27,7.93,99.04,27.58),('P592','Books','Stainless steel water bottle',45.66,45.96,53.68,87.66,9.95),('P593','Beauty','Leather wallet',18.87,7.04,74.1,42.13,65.00),('P594','Electronics','Soft cotton t-shirt',26.41,8.31,46.33,51.77,96.17),('P595','Electronics','Stainless steel water bottle',40.96,54.7,22.12,51.76,86.86),('P596','Food & Beverage','Ceramic coffee mug',41.23,55.89,98.95,25.96,45.77),('P597','Sports & Outdoors','Leather wallet',41.07,18.85,19.24,21.77,66.28),('P598','Toys','Wooden picture frame',4.31,84.45,41.44,58.25,94.07),('P599','Toys','Ceramic coffee mug',8.22,9.62,78.03,27.22,72.52),('P6','Food & Beverage','Leather wallet',5.02,55.77,26.9,13.37,79.40),('P60','Sports & Outdoors','Ceramic coffee mug',30.29,86.78,57.72,61.01,79.42),('P600','Beauty','Wooden picture frame',9.61,48.19,43.36,51.76,58.89),('P601','Food & Beverage','Soft cotton t-shirt',37.44,91.78,46.78,30.88,55.21),('P602','Food & Beverage','Soft cotton t-shirt',38.76,28.67,73.44,9.13,98.38),('P603','Beauty','Leather wallet',19.75,66.4,33.9,25.77,28.28),('P604','Books','Ceramic coffee mug',28.26,21.65,20.31,74.56,43.26),('P605','Toys','Leather wallet',29.8,77,74.39,98.7,31.46),('P606','Electronics','Leather wallet',26.72,17.92,53.87,57.88,26.50),('P607','Home Decor','Soft cotton t-shirt',9.66,93.66,48.7,29.73,37.12),('P608','Home Decor','Soft cotton t-shirt',37.8,54.43,75.97,54.23,6.12),('P609','Toys','Ceramic coffee mug',23.11,58.71,9.98,62.57,17.23),('P61','Books','Wooden picture frame',0.28,85.62,29.62,48.82,66.78),('P610','Electronics','Wooden picture frame',5.87,56.76,6.34,88.26,83.22),('P611','Food & Beverage','Leather wallet',32.51,24.36,54.67,94.9,16.75),('P612','Sports & Outdoors','Ceramic coffee mug',33.36,27.06,62.9,10.61,31.11),('P613','Books','Ceramic coffee mug',13.88,35.72,17.02,34.6,5.30),('P614','Beauty','Wooden picture frame',40.14,86.94,10.7,17.87,31.17),('P615','Toys','Stainless steel water bottle',2.01,8.38,45.59,46.19,39.93),('P616','Beauty','Wooden picture frame',34.8,92.35,86.74,78.62,6.14),('P617','Books','Wooden picture frame',46.2,80.33,62.3,57.83,8.93),('P618','Electronics','Soft cotton t-shirt',26.07,54.65,4.73,87.65,25.23),('P619','Toys','Soft cotton t-shirt',35.82,62.81,64.88,8.92,98.35),('P62','Toys','Wooden picture frame',0.72,80.16,53.15,91.19,19.06),('P620','Electronics','Leather wallet',42.55,23.41,36.97,23.13,96.24),('P621','Sports & Outdoors','Leather wallet',10.38,72.97,28.8,24.47,27.04),('P622','Toys','Soft cotton t-shirt',40.9,96.4,14.91,55.23,43.47),('P623','Home Decor','Soft cotton t-shirt',30.44,43.07,17.14,54.04,36.24),('P624','Beauty','Ceramic coffee mug',29.6,21.91,6.38,3.1,49.78),('P625','Food & Beverage','Leather wallet',34.24,41.17,44.24,37.76,40.19),('P626','Home Decor','Stainless steel water bottle',44.85,67.91,59.54,14.46,50.62),('P627','Sports & Outdoors','Soft cotton t-shirt',7.87,60.15,6.56,76.25,32.50),('P628','Electronics','Ceramic coffee mug',40.46,87.72,41.43,37.98,9.66),('P629','Food & Beverage','Soft cotton t-shirt',20.67,69.82,62.58,90.27,48.80),('P63','Sports & Outdoors','Leather wallet',18.63,41.38,25.16,18.67,16.03),('P630','Food & Beverage','Soft cotton t-shirt',16.81,90.97,18.8,84.45,31.73),('P631','Home Decor','Soft cotton t-shirt',16.15,65.03,83.64,71.07,10.58),('P632','Sports & Outdoors','Ceramic coffee mug',20.59,75.58,84.31,25.09,55.69),('P633','Sports & Outdoors','Leather wallet',48.9,46.57,11.84,64.87,47.73),('P634','Electronics','Leather wallet',45.14,50.34,82.44,52.44,70.57),('P635','Electronics','Ceramic coffee mug',23.96,31.26,29.51,1.67,10.65),('P636','Home Decor','Ceramic coffee mug',39.53,10.1,67.68,12.77,38.55),('P637','Clothing','Stainless steel water bottle',23.92,20.61,83.42,53.62,60.81),('P638','Electronics','Wooden picture frame',39.38,48.68,14.11,63.49,88.39),('P639','Sports & Outdoors','Ceramic coffee mug',49.52,14.26,9.01,46.53,60.51),('P64','Sports & Outdoors','Soft cotton t-shirt',25.44,84.46,80.7,23.76,36.40),('P640','Beauty','Leather wallet',23.97,10.28,87.83,50.7,98.46),('P641','Food & Beverage','Ceramic coffee mug',41.35,13.09,29.82,38.33,85.09),('P642','Electronics','Leather wallet',11.28,98.83,76.78,11.37,30.08),('P643','Electronics','Stainless steel water bottle',3.29,33.49,55.87,17.28,92.13),('P644','Beauty','Soft cotton t-shirt',14.95,20.99,15.1,5.49,72.40),('P645','Electronics','Leather wallet',41.8,77.17,1.69,38.42,84.60),('P646','Beauty','Ceramic coffee mug',22.68,37.24,75.64,50.08,6.80),('P647','Sports & Outdoors','Wooden picture frame',35.35,15.82,30.25,3.91,76.20),('P648','Electronics','Ceramic coffee mug',45.08,56.71,16.14,55.31,62.63),('P649','Electronics','Stainless steel water bottle',42.83,24.28,60.83,85.53,83.51),('P65','Books','Stainless steel water bottle',2.39,44.61,49.76,39.41,30.69),('P650','Books','Stainless steel water bottle',2.55,21.91,98.17,62.58,99.93),('P651','Beauty','Stainless steel water bottle',35.83,63.18,95.24,37.9,10.55),('P652','Toys','Leather wallet',10.04,58.53,10.54,42.55,48.96),('P653','Toys','Stainless steel water bottle',17.82,48.28,72.08,47.46,14.14),('P654','Home Decor','Stainless steel water bottle',20.95,31.67,14.55,53.98,21.82),('P655','Electronics','Soft cotton t-shirt',0.47,95.47,37.06,54.45,65.69),('P656','Sports & Outdoors','Ceramic coffee mug',40.47,28.37,10.9,84.95,64.00),('P657','Sports & Outdoors','Wooden picture frame',39.89,63.28,15.42,6.58,22.93),('P658','Books','Ceramic coffee mug',2.94,48.56,31.58,54.17,20.66),('P659','Beauty','Stainless steel water bottle',33.65,70.74,28.03,7.39,33.48),('P66','Toys','Soft cotton t-shirt',8.96,94.04,40.83,65.5,5.45),('P660','Electronics','Soft cotton t-shirt',14.06,37.82,13.3,74.69,24.78),('P661','Books','Stainless steel water bottle',7.02,27.99,64.02,61.13,7.55),('P662','Books','Wooden picture frame',16.47,13.89,17.2,17.4,61.43),('P663','Books','Soft cotton t-shirt',21.39,38.03,98.98,19.25,85.50),('P664','Beauty','Soft cotton t-shirt',29.4,78.8,68.47,85.13,44.22),('P665','Clothing','Stainless steel water bottle',32.78,87.29,52.41,52.59,62.58),('P666','Beauty','Stainless steel water bottle',15.48,42.3,86.14,58.73,80.22),('P667','Beauty','Leather wallet',48.5,29.88,99.77,51.62,14.40),('P668','Food & Beverage','Wooden picture frame',33.21,90.14,39.73,23.57,28.32),('P669','Food & Beverage','Stainless steel water bottle',49.7,56.8,53.28,97.15,97.42),('P67','Books','Ceramic coffee mug',18.02,56.94,88.37,6.43,5.15),('P670','Books','Leather wallet',42.07,35.88,57.69,18.31,29.46),('P671','Home Decor','Stainless steel water bottle',19.91,77.06,98.01,32.43,31.86),('P672','Electronics','Leather wallet',26.47,97.48,39.37,57.57,69.93),('P673','Electronics','Stainless steel water bottle',12.73,84.78,42.1,47.07,55.08),('P674','Beauty','Stainless steel water bottle',28.91,53.64,41.67,54.42,64.60),('P675','Food & Beverage','Stainless steel water bottle',28.24,89.08,87.8,20.65,57.77),('P676','Beauty','Leather wallet',11.58,88.88,75.19,55.87,94.02),('P677','Toys','Soft cotton t-shirt',8.42,11.48,61.79,5.92,97.81),('P678','Electronics','Stainless steel water bottle',11.34,63.18,19.58,24.35,7.99),('P679','Electronics','Leather wallet',22.31,9.72,70.65,35.89,42.54),('P68','Food & Beverage','Soft cotton t-shirt',4.82,9.5,96.03,73.37,88.70),('P680','Clothing','Ceramic coffee mug',21.05,80.94,89.3,78.11,17.88),('P681','Books','Soft cotton t-shirt',9.7,50.13,6.64,19.33,20.32),('P682','Electronics','Leather wallet',20.33,52.73,99.87,63.52,46.94),('P683','Books','Soft cotton t-shirt',4.49,97.35,8.01,99.72,73.76),('P684','Electronics','Ceramic coffee mug',37.93,86.03,89.84,10.57,28.96),('P685','Electronics','Leather wallet',19.82,77.43,73.59,25.48,21.52),('P686','Clothing','Ceramic coffee mug',3.65,52.22,57.28,13.64,19.74),('P687','Toys','Leather wallet',47.38,89.98,16.46,85.72,33.13),('P688','Beauty','Ceramic coffee mug',13.45,29.67,58.1,17.59,6.45),('P689','Beauty','Leather wallet',43.42,18.96,45.24,71.76,30.85),('P69','Home Decor','Leather wallet',13.13,65.28,33.69,22.87,34.88),('P690','Food & Beverage','Ceramic coffee mug',41.56,38.12,13.29,40.29,80.87),('P691','Home Decor','Stainless steel water bottle',27.65,95.52,11.39,49.43,1.69),('P692','Electronics','Soft cotton t-shirt',40.14,9.54,4.53,55.42,61.87),('P693','Food & Beverage','Soft cotton t-shirt',38.91,19.8,1.49,32.5,6.25),('P694','Home Decor','Leather wallet',45.67,46.3,58.87,76.71,42.64),('P695','Electronics','Ceramic coffee mug',18.85,93.62,99.08,60.59,94.47),('P696','Sports & Outdoors','Stainless steel water bottle',1.56,69.24,8.68,45.29,46.42),('P697','Home Decor','Wooden picture frame',2.74,19.57,26.54,40.3,46.71),('P698','Sports & Outdoors','Ceramic coffee mug',45.86,28.99,46.02,11.85,93.29),('P699','Clothing','Soft cotton t-shirt',48.5,39.85,97.81,25.19,28.29),('P7','Clothing','Leather wallet',0.67,6.42,24.14,13.14,58.61),('P70','Books','Wooden picture frame',47.89,84.26,56.97,28.87,9.18),('P700','Clothing','Wooden picture frame',22.62,51.36,1.15,98.12,67.08),('P701','Toys','Soft cotton t-shirt',24.38,49.61,48.53,33.65,9.84),('P702','Beauty','Soft cotton t-shirt',19.95,90.63,76.78,87.86,44.95),('P703','Food & Beverage','Soft cotton t-shirt',28.4,69.3,21.28,12.23,95.22),('P704','Food & Beverage','Leather wallet',48.17,89.02,14.64,80.98,43.27),('P705','Clothing','Soft cotton t-shirt',30.23,82.26,10.77,19.09,28.70),('P706','Toys','Stainless steel water bottle',31.24,86.3,79.24,99.13,12.67),('P707','Electronics','Stainless steel water bottle',47.34,4.42,96.82,45.85,75.24),('P708','Toys','Leather wallet',11.41,53.42,94.8,21.35,40.21),('P709','Home Decor','Stainless steel water bottle',35.5,16.76,79.9,47.56,73.32),('P71','Clothing','Leather wallet',31.45,84.7,75.26,65.36,46.99),('P710','Clothing','Wooden picture frame',33.52,14.07,20.19,12.1,13.99),('P711','Beauty','Ceramic coffee mug',33.69,61.5,85.69,70.56,26.95),('P712','Food & Beverage','Leather wallet',43.14,25.79,75.32,87.95,91.80),('P713','Sports & Outdoors','Soft cotton t-shirt',30.96,72.4,67.58,56.77,80.15),('P714','Clothing','Ceramic coffee mug',3.89,65.12,34.28,69.23,25.34),('P715','Home Decor','Ceramic coffee mug',34.39,64.07,53.25,68.94,83.24),('P716','Sports & Outdoors','Stainless steel water bottle',13.34,70.06,16.52,68.77,42.18),('P717','Beauty','Ceramic coffee mug',49.5,96.09,82.8,98.55,59.20),('P718','Books','Soft cotton t-shirt',14.19,24.18,43.58,35.13,69.44),('P719','Home Decor','Stainless steel water bottle',23.94,71.42,40.41,40.03,69.60),('P72','Beauty','Soft cotton t-shirt',43.35,23.99,6.71,26.12,39.68),('P720','Toys','Stainless steel water bottle',40.07,39.54,25.98,39.73,87.61),('P721','Electronics','Wooden picture frame',20.5,78.93,39.25,24.26,20.98),('P722','Home Decor','Wooden picture frame',22.58,13.41,53.09,28.82,39.11),('P723','Electronics','Wooden picture frame',29.12,74.47,61.89,38.22,32.58),('P724','Home Decor','Wooden picture frame',3.01,56.11,56.2,32.91,44.57),('P725','Sports & Outdoors','Ceramic coffee mug',48.63,30.68,70.2,36.77,25.11),('P726','Food & Beverage','Soft cotton t-shirt',13.56,15.93,50.4,64.14,89.83),('P727','Toys','Stainless steel water bottle',26.3,15.55,72.51,53.21,75.85),('P728','Clothing','Wooden picture frame',16.39,81.47,19.12,39.05,9.75),('P729','Books','Wooden picture frame',16.02,63.76,15.76,28.42,18.19),('P73','Books','Stainless steel water bottle',20.27,32.46,31.02,2.71,60.69),('P730','Sports & Outdoors','Soft cotton t-shirt',1.96,44.94,20.23,82.57,49.88),('P731','Beauty','Leather wallet',27.14,14.39,97.93,39.54,66.35),('P732','Clothing','Ceramic coffee mug',48.9,69.66,3.45,78.8,82.09),('P733','Books','Ceramic coffee mug',2.78,25.67,30.29,54.53,12.39),('P734','Toys','Soft cotton t-shirt',42.54,83.89,26.13,25.59,12.71),('P735','Electronics','Ceramic coffee mug',41.14,11.83,33.63,8.42,25.37),('P736','Beauty','Soft cotton t-shirt',38.66,36,78.66,76.83,87.73),('P737','Home Decor','Stainless steel water bottle',32.4,42.49,4.42,13.57,64.53),('P738','Beauty','Ceramic coffee mug',11.04,33.38,26.86,11.05,58.46),('P739','Electronics','Soft cotton t-shirt',33.5,89.85,47.48,26.27,97.72),('P74','Clothing','Wooden picture frame',10.07,17.38,9.32,78.98,15.20),('P740','Home Decor','Ceramic coffee mug',9.54,62.96,14.84,54.31,78.84),('P741','Toys','Leather wallet',2.81,64.37,12.06,88.1,50.62),('P742','Toys','Stainless steel water bottle',14.99,24.69,19.46,53.76,15.58),('P743','Clothing','Wooden picture frame',46.02,47.58,67.11,47.78,24.04),('P744','Toys','Ceramic coffee mug',35.81,72.03,25.73,2.09,72.44),('P745','Toys','Wooden picture frame',35.37,38.34,47.48,43.41,91.09),('P746','Food & Beverage','Soft cotton t-shirt',26.8,2.66,70.04,72.52,39.12),('P747','Home Decor','Stainless steel water bottle',8.61,77.36,4.71,56.1,20.34),('P748','Home Decor','Leather wallet',48.97,53.8,65.98,32.16,82.34),('P749','Toys','Stainless steel water bottle',5.76,32.17,6.16,32.09,52.67),('P75','Home Decor','Leather wallet',13.54,3.35,48.32,48.62,15.32),('P750','Electronics','Leather wallet',1.34,14.99,78.8,59.33,16.60),('P751','Clothing','Stainless steel water bottle',19.05,34.75,66.26,93.3,36.05),('P752','Electronics','Soft cotton t-shirt',47.48,84.72,31.38,52.5,30.45),('P753','Sports & Outdoors','Ceramic coffee mug',43.99,45.95,17.97,52.38,43.10),('P754','Toys','Stainless steel water bottle',3.97,69.8,43,35.65,24.17),('P755','Sports & Outdoors','Ceramic coffee mug',34.76,6.93,22.42,46.27,89.52),('P756','Home Decor','Soft cotton t-shirt',44.02,47.86,39.45,62.59,77.11),('P757','Toys','Ceramic coffee mug',7.24,56.2,71.44,49.32,16.97),('P758','Home Decor','Stainless steel water bottle',44.46,41.34,18.08,81.47,50.55),('P759','Electronics','Stainless steel water bottle',22.83,65.76,25.53,17.86,2.81),('P76','Electronics','Wooden picture frame',31.56,34.43,87.83,68.24,59.40),('P760','Clothing','Stainless steel water bottle',47.02,73.64,19.43,39.21,89.58),('P761','Beauty','Ceramic coffee mug',20.58,69.52,52.14,2.24,70.68),('P762','Beauty','Wooden picture frame',3.69,76.98,84.68,46.9,83.68),('P763','Clothing','Stainless steel water bottle',49.98,63.5,34.18,15.01,7.33),('P764','Home Decor','Ceramic coffee mug',25.19,62.65,50.63,54.64,81.64),('P765','Sports & Outdoors','Wooden picture frame',48.36,27.36,13.92,57.99,88.21),('P766','Home Decor','Leather wallet',28.7,16.99,95.23,48.85,96.13),('P767','Toys','Soft cotton t-shirt',6.18,78.65,89.08,21.01,17.00),('P768','Beauty','Wooden picture frame',9.61,16.82,30.13,14.19,92.61),('P769','Electronics','Ceramic coffee mug',22.71,85.64,9.98,10.48,15.06),('P77','Toys','Wooden picture frame',40.53,39,8.04,80.25,93.45),('P770','Beauty','Stainless steel water bottle',42.77,50.18,86.94,52.93,25.09),('P771','Beauty','Wooden picture frame',39.84,27.43,64.2,79.71,42.11),('P772','Beauty','Wooden picture frame',25.91,47.27,36.93,78.29,35.26),('P773','Electronics','Leather wallet',30.21,84.61,38.97,68.04,49.00),('P774','Toys','Ceramic coffee mug',46.38,7.89,77.84,78.74,39.20),('P775','Clothing','Ceramic coffee mug',25.97,4.17,95.21,60.34,47.98),('P776','Clothing','Stainless steel water bottle',42.92,52.27,33.26,81.54,22.33),('P777','Beauty','Wooden picture frame',34.2,10.97,63.04,45.55,65.68),('P778','Food & Beverage','Ceramic coffee mug',31.72,43.47,62.89,26.7,62.43),('P779','Clothing','Ceramic coffee mug',18.93,93.76,39.39,62.73,15.12),('P78','Sports & Outdoors','Soft cotton t-shirt',30.72,80.14,13.93,58.13,85.29),('P780','Home Decor','Wooden picture frame',7.84,7.99,32.44,36.78,83.09),('P781','Electronics','Leather wallet',7.06,8.32,4.84,86.28,59.60),('P782','Clothing','Soft cotton t-shirt',0.57,89.21,46.96,80.36,47.72),('P783','Toys','Leather wallet',12.8,54.68,5.96,13.09,58.78),('P784','Food & Beverage','Stainless steel water bottle',47.4,41.17,7.25,23.28,50.76),('P785','Home Decor','Wooden picture frame',20.38,41.53,32.1,74.17,76.47),('P786','Electronics','Wooden picture frame',36.9,65.74,31.13,50.43,31.07),('P787','Toys','Ceramic coffee mug',16.21,6.54,10.05,53.34,23.92),('P788','Clothing','Soft cotton t-shirt',41.43,94.8,89.08,73.02,25.40),('P789','Home Decor','Wooden picture frame',29.53,51.42,72.15,1.46,54.24),('P79','Electronics','Leather wallet',17.72,56.06,98.06,58.21,95.00),('P790','Books','Stainless steel water bottle',17.74,75.25,80.32,19.43,14.27),('P791','Sports & Outdoors','Stainless steel water bottle',32.04,75.57,83.26,19.32,82.37),('P792','Home Decor','Soft cotton t-shirt',7.79,87.59,77.56,22.49,71.05),('P793','Sports & Outdoors','Ceramic coffee mug',43.33,24.03,15.63,90.18,8.13),('P794','Food & Beverage','Stainless steel water bottle',40.62,33.91,45.98,86.05,24.48),('P795','Toys','Soft cotton t-shirt',42.85,88.07,90.46,55.02,97.04),('P796','Food & Beverage','Stainless steel water bottle',47,43.12,71.01,3.78,14.74),('P797','Books','Stainless steel water bottle',38.56,45.57,30.77,51.89,78.58),('P798','Electronics','Stainless steel water bottle',5.79,80.03,9.64,62.46,50.67),('P799','Food & Beverage','Leather wallet',37.04,23.91,63.14,24.52,16.60),('P8','Beauty','Wooden picture frame',24.96,34.25,79.14,39.59,29.01),('P80','Home Decor','Soft cotton t-shirt',36.99,69.52,31.42,51.68,94.25),('P800','Clothing','Wooden picture frame',6.01,83.48,61.83,80.49,86.24),('P801','Books','Ceramic coffee mug',44.86,29.72,89.94,11.39,48.42),('P802','Toys','Stainless steel water bottle',6.12,56.6,94.31,47.95,81.41),('P803','Beauty','Soft cotton t-shirt',17.68,17.53,72.3,80.69,62.75),('P804','Books','Leather wallet',19.18,94.14,91.28,26.31,68.56),('P805','Home Decor','Ceramic coffee mug',16.77,20.13,10.85,61.36,54.53),('P806','Electronics','Leather wallet',45.96,52.38,4.28,47.66,65.98),('P807','Home Decor','Soft cotton t-shirt',48.14,35.28,60.01,30.8,66.29),('P808','Home Decor','Leather wallet',48.58,1.24,78.66,97.89,33.53),('P809','Toys','Wooden picture frame',18.48,85.61,11.56,66.54,66.77),('P81','Books','Ceramic coffee mug',16.87,7.11,62.86,1.08,34.25),('P810','Beauty','Wooden picture frame',32.3,30.83,4.84,70.5,68.96),('P811','Home Decor','Ceramic coffee mug',33.49,87.12,50.77,76.32,43.05),('P812','Clothing','Leather wallet',14.26,51.8,36.35,7.79,7.35),('P813','Home Decor','Leather wallet',14.83,65.61,88.31,93.95,5.62),('P814','Food & Beverage','Leather wallet',26.91,61.44,83.38,40.41,5.06),('P815','Beauty','Ceramic coffee mug',21.75,67.63,89.86,7.17,7.44),('P816','Food & Beverage','Ceramic coffee mug',36.41,65.21,3.6,40.2,20.99),('P817','Sports & Outdoors','Ceramic coffee mug',3.8,20.05,34.12,86.15,81.66),('P818','Books','Ceramic coffee mug',5.28,75,17.73,29.77,47.33),('P819','Home Decor','Wooden picture frame',43.95,22.93,23.22,5.44,89.66),('P82','Food & Beverage','Leather wallet',20.75,23.49,11.09,34.43,8.30),('P820','Electronics','Ceramic coffee mug',33.52,29.96,58.1,92.76,68.54),('P821','Beauty','Soft cotton t-shirt',22.85,90.89,45.17,87.05,19.77),('P822','Electronics','Soft cotton t-shirt',43.75,40.31,92.41,32.33,90.26),('P823','Food & Beverage','Leather wallet',21.27,7.26,28.47,19.51,93.96),('P824','Sports & Outdoors','Leather wallet',12.12,35.27,2.47,24.23,99.04),('P825','Books','Wooden picture frame',34.27,46.62,97.43,49.06,14.33),('P826','Home Decor','Stainless steel water bottle',26.79,79.63,33.39,46.28,70.53),('P827','Home Decor','Ceramic coffee mug',12.67,19.5,55.46,38.11,11.65),('P828','Books','Wooden picture frame',10.62,76.78,15.21,88.84,43.68),('P829','Electronics','Soft cotton t-shirt',22.21,93.37,51.18,83.96,83.43),('P83','Beauty','Stainless steel water bottle',10.04,34.69,81.48,35.96,87.12),('P830','Home Decor','Stainless steel water bottle',49.96,36.44,55.04,45.22,85.32),('P831','Toys','Ceramic coffee mug',45.4,79.97,79.23,38.57,65.23),('P832','Clothing','Wooden picture frame',37.56,80.45,56.79,51.77,69.21),('P833','Home Decor','Wooden picture frame',0.58,49.68,6.86,26.62,50.34),('P834','Beauty','Leather wallet',7.51,47.92,9.86,97.61,43.08),('P835','Beauty','Leather wallet',14.25,1.48,35.55,57.46,63.36),('P836','Electronics','Soft cotton t-shirt',31.22,40.21,26.16,80.74,87.59),('P837','Clothing','Wooden picture frame',38.04,11.63,86.31,52.96,48.85),('P838','Electronics','Ceramic coffee mug',23.27,12.56,57.19,68.59,79.48),('P839','Toys','Leather wallet',12.85,98.67,2.29,5.31,51.83),('P84','Sports & Outdoors','Wooden picture frame',37.82,20.26,81.49,64.9,19.75),('P840','Beauty','Leather wallet',26.15,47.12,32.92,13.34,41.22),('P841','Clothing','Leather wallet',48.33,42.83,96.19,76.06,46.88),('P842','Home Decor','Ceramic coffee mug',12.06,59.35,6.9,88.92,10.73),('P843','Food & Beverage','Wooden picture frame',1.43,78.76,41.9,3.93,11.02),('P844','Home Decor','Stainless steel water bottle',40.99,43.93,36.81,43.74,21.92),('P845','Food & Beverage','Ceramic coffee mug',48.67,28.02,60.11,60.32,75.54),('P846','Clothing','Soft cotton t-shirt',25.58,82.59,99.34,13.5,13.94),('P847','Food & Beverage','Ceramic coffee mug',42.94,7.05,33.86,91.04,40.08),('P848','Toys','Leather wallet',40.09,52.75,23.09,79.99,58.57),('P849','Books','Stainless steel water bottle',27.86,47.7,18.97,79.91,72.61),('P85','Sports & Outdoors','Soft cotton t-shirt',26.62,16.08,85.96,94.94,87.35),('P850','Toys','Soft cotton t-shirt',6.09,98.93,54.89,89.2,19.92),('P851','Books','Wooden picture frame',23.62,39.54,63.02,69.83,34.56),('P852','Books','Soft cotton t-shirt',23.59,76.15,14.82,43.67,13.03),('P853','Toys','Wooden picture frame',18.95,31.21,13.87,68.07,59.46),('P854','Sports & Outdoors','Soft cotton t-shirt',37.81,67.66,87.17,51.5,59.20),('P855','Food & Beverage','Leather wallet',47.45,25.47,63.16,74.2,17.62),('P856','Home Decor','Wooden picture frame',47.11,9.35,17.26,46.98,8.52),('P857','Sports & Outdoors','Leather wallet',4.92,31.18,86.04,16.65,87.73),('P858','Sports & Outdoors','Stainless steel water bottle',15.29,45.88,19.31,68.72,16.07),('P859','Sports & Outdoors','Stainless steel water bottle',25.85,74.29,56.64,90.21,14.18),('P86','Clothing','Wooden picture frame',42.17,70.44,96.76,42.97,21.67),('P860','Food & Beverage','Ceramic coffee mug',29.27,5.93,71.72,63.56,64.84),('P861','Sports & Outdoors','Leather wallet',44.04,60.01,5.04,19.46,60.18),('P862','Food & Beverage','Ceramic coffee mug',32.61,93.4,58.09,82.21,6.37),('P863','Electronics','Wooden picture frame',23.26,96.77,89.31,66.19,48.33),('P864','Sports & Outdoors','Leather wallet',27.94,48.68,25.75,57.51,23.52),('P865','Food & Beverage','Stainless steel water bottle',18.64,6.37,90.68,11.69,70.64),('P866','Sports & Outdoors','Soft cotton t-shirt',4.07,71.97,78.92,35.61,83.61),('P867','Sports & Outdoors','Soft cotton t-shirt',8.59,77.95,55.44,46.01,7.14),('P868','Beauty','Ceramic coffee mug',14.51,49.79,25.07,44.71,80.89),('P869','Electronics','Ceramic coffee mug',25.67,55.67,78.87,3.35,85.01),('P87','Beauty','Ceramic coffee mug',34.08,25.6,63.47,13.62,82.37),('P870','Electronics','Leather wallet',39.01,16.98,17.6,14.8,56.84),('P871','Food & Beverage','Ceramic coffee mug',7.09,56.6,22.76,92.41,36.07),('P872','Beauty','Leather wallet',23.66,35.9,92.36,20.15,8.86),('P873','Clothing','Wooden picture frame',41.2,76.93,44.69,82.08,34.07),('P874','Toys','Leather wallet',35.12,95.37,83.71,14.98,43.77),('P875','Toys','Wooden picture frame',44.15,55.53,34.13,11.35,16.63),('P876','Home Decor','Ceramic coffee mug',25.42,29.05,10.17,88.83,49.86),('P877','Food & Beverage','Wooden picture frame',32.09,1.36,15.92,92.86,99.40),('P878','Food & Beverage','Ceramic coffee mug',23.82,3.25,2.15,58.93,49.41),('P879','Electronics','Wooden picture frame',41.88,91.79,83.69,93.39,46.88),('P88','Toys','Ceramic coffee mug',47.96,18.14,55.95,58.47,85.13),('P880','Electronics','Leather wallet',29.43,50.04,20.48,35.3,86.04),('P881','Home Decor','Leather wallet',1.53,55.4,52.99,16.29,74.81),('P882','Books','Leather wallet',20.8,72.4,39.3,52.62,15.94),('P883','Electronics','Wooden picture frame',46.27,53.77,17.46,73.44,52.26),('P884','Books','Soft cotton t-shirt',24.06,14.78,61.45,92.82,14.50),('P885','Food & Beverage','Soft cotton t-shirt',48.59,29.38,84.93,47.39,13.70),('P886','Books','Stainless steel water bottle',27.73,53.27,6.48,30.89,23.99),('P887','Electronics','Wooden picture frame',8.19,13.74,71.63,84.29,77.87),('P888','Electronics','Ceramic coffee mug',16.56,65.2,76.32,28.13,19.36),('P889','Electronics','Ceramic coffee mug',31.66,70.87,99.37,84.51,60.19),('P89','Food & Beverage','Leather wallet',15.49,27.77,43.05,85.12,43.87),('P890','Sports & Outdoors','Wooden picture frame',48.52,10.68,20.5,90.78,37.80),('P891','Clothing','Soft cotton t-shirt',13.71,33.33,33.2,54.42,56.38),('P892','Beauty','Soft cotton t-shirt',26.05,51.41,48.24,13.79,68.51),('P893','Sports & Outdoors','Wooden picture frame',21.15,61.29,51.82,57.65,73.42),('P894','Clothing','Soft cotton t-shirt',3.09,92.32,93.94,7.91,61.58),('P895','Home Decor','Wooden picture frame',6.71,41.27,20.3,62.43,86.60),('P896','Books','Wooden picture frame',11.05,18.29,98,62.7,49.29),('P897','Electronics','Wooden picture frame',27.81,94.68,8.69,24.4,84.65),('P898','Toys','Stainless steel water bottle',48.05,78.16,47.37,29.02,76.35),('P899','Food & Beverage','Soft cotton t-shirt',46.4,8.74,34.2,77.82,27.83),('P9','Clothing','Leather wallet',20.82,10.43,4.85,51,8.11),('P90','Home Decor','Leather wallet',2.22,30.37,8.13,36.81,55.05),('P900','Toys','Leather wallet',6.37,57.03,3.78,28.67,51.92),('P901','Books','Wooden picture frame',36.69,94.5,11.62,76.52,93.44),('P902','Food & Beverage','Wooden picture frame',32.33,7.46,89,64.68,13.46),('P903','Home Decor','Ceramic coffee mug',41.97,88.74,29.92,90.41,82.97),('P904','Beauty','Stainless steel water bottle',17.85,51.75,67.33,42.06,76.47),('P905','Clothing','Ceramic coffee mug',49.73,23.41,26.15,79.02,33.45),('P906','Beauty','Ceramic coffee mug',30.97,38.65,32.21,13.81,35.82),('P907','Books','Wooden picture frame',38.87,48.69,93.23,55.02,77.74),('P908','Clothing','Ceramic coffee mug',26.79,36.49,17.25,27.54,82.26),('P909','Food & Beverage','Soft cotton t-shirt',5.31,50.83,95.93,73.2,78.09),('P91','Clothing','Soft cotton t-shirt',19.78,62.64,25.84,37.95,43.66),('P910','Electronics','Ceramic coffee mug',46.91,36.95,34.62,54.32,82.03),('P911','Beauty','Stainless steel water bottle',22.24,24.95,5.42,22.95,80.19),('P912','Toys','Ceramic coffee mug',38.72,4.69,76.23,55.45,54.85),('P913','Beauty','Ceramic coffee mug',33.31,72.91,8.73,20.66,32.66),('P914','Sports & Outdoors','Stainless steel water bottle',14.01,95.67,76.82,61.07,96.76),('P915','Electronics','Stainless steel water bottle',7.03,47.26,52.85,84.41,87.82),('P916','Toys','Ceramic coffee mug',4.79,92.31,50.31,19.88,48.81),('P917','Food & Beverage','Leather wallet',32.18,71.9,36.23,60.67,78.61),('P918','Electronics','Soft cotton t-shirt',32.11,82.96,16.35,94.56,47.62),('P919','Electronics','Stainless steel water bottle',12.03,84.6,61.24,39.26,1.29),('P92','Home Decor','Ceramic coffee mug',34.96,50.25,24.6,38.28,60.55),('P920','Clothing','Wooden picture frame',18.92,10.21,59.92,23.38,99.90),('P921','Sports & Outdoors','Wooden picture frame',28.99,58.42,84.01,63.55,19.86),('P922','Toys','Ceramic coffee mug',12.13,34.96,91.8,86.87,95.59),('P923','Beauty','Wooden picture frame',14.72,44.33,65.07,4.76,21.38),('P924','Books','Ceramic coffee mug',11.99,1.83,98.91,69.9,17.14),('P925','Toys','Soft cotton t-shirt',40.53,3.46,24.14,14.29,20.53),('P926','Beauty','Ceramic coffee mug',34.5,29.67,14.38,38.4,50.24),('P927','Electronics','Ceramic coffee mug',42.46,71.03,17.9,20.86,89.63),('P928','Food & Beverage','Stainless steel water bottle',46.52,36.61,34.95,59.62,98.42),('P929','Sports & Outdoors','Ceramic coffee mug',7.92,56.71,3.37,13.34,24.21),('P93','Electronics','Leather wallet',41.25,11.49,84.25,90.61,22.79),('P930','Sports & Outdoors','Ceramic coffee mug',42.53,97.41,35.55,25.17,40.30),('P931','Books','Leather wallet',25.76,47.13,80.86,65.42,33.16),('P932','Books','Soft cotton t-shirt',6.81,10.19,64.68,47.91,43.89),('P933','Electronics','Soft cotton t-shirt',3.86,78.49,31.57,99.35,19.95),('P934','Electronics','Stainless steel water bottle',22.31,46.11,32.19,10.37,66.08),('P935','Beauty','Soft cotton t-shirt',18.96,35.81,48.23,96.93,71.57),('P936','Electronics','Soft cotton t-shirt',15.85,33.71,39.38,82,59.61),('P937','Beauty','Soft cotton t-shirt',9.65,37.72,61.51,88.32,82.34),('P938','Electronics','Ceramic coffee mug',35.88,46.62,38.35,15.6,33.87),('P939','Home Decor','Leather wallet',0.22,28.36,86.42,30.35,20.34),('P94','Toys','Ceramic coffee mug',40.52,28.38,54.19,24.03,98.10),('P940','Books','Ceramic coffee mug',45.42,63.88,66.14,86.55,32.46),('P941','Toys','Ceramic coffee mug',48.75,86.14,59.17,56.26,65.03),('P942','Toys','Ceramic coffee mug',39.91,55.3,97.37,68.47,28.73),('P943','Sports & Outdoors','Wooden picture frame',32,12.13,32.93,4.41,46.60),('P944','Books','Wooden picture frame',7.91,67.86,7.44,53.94,46.77),('P945','Sports & Outdoors','Soft cotton t-shirt',16.95,39.19,73.25,83.67,93.07),('P946','Electronics','Wooden picture frame',7.82,6.98,39.2,88.41,27.06),('P947','Food & Beverage','Soft cotton t-shirt',14.27,64.05,6.64,14.44,53.05),('P948','Sports & Outdoors','Stainless steel water bottle',0.97,83.05,51.75,37.03,84.10),('P949','Clothing','Ceramic coffee mug',35.88,5.56,43.99,44.02,62.35),('P95','Books','Stainless steel water bottle',32.2,15.78,5.22,51.54,58.45),('P950','Books','Wooden picture frame',32.87,95.59,61.07,42.36,5.20),('P951','Books','Soft cotton t-shirt',19.92,7.56,35.29,38.98,47.66),('P952','Electronics','Wooden picture frame',29.15,75.14,9.21,23.42,23.70),('P953','Sports & Outdoors','Stainless steel water bottle',35.26,38.99,91.76,86.96,73.53),('P954','Home Decor','Soft cotton t-shirt',32.14,4.94,27.58,50,97.52),('P955','Toys','Leather wallet',18.13,19.45,12.52,10.49,68.02),('P956','Electronics','Stainless steel water bottle',18.66,31.28,6.85,91.51,46.53),('P957','Books','Stainless steel water bottle',22.63,31.39,20.37,24.13,27.61),('P958','Food & Beverage','Soft cotton t-shirt',38.85,60.4,51.92,67.18,96.47),('P959','Clothing','Stainless steel water bottle',44.66,59.79,8.03,12.68,2.51),('P96','Beauty','Leather wallet',29.41,56.55,5.92,67.5,19.13),('P960','Beauty','Stainless steel water bottle',10.64,42.02,63.77,88.31,87.14),('P961','Electronics','Ceramic coffee mug',13.5,54.53,87.5,8.98,80.30),('P962','Electronics','Stainless steel water bottle',44.02,10.47,98.92,69.1,40.08),('P963','Sports & Outdoors','Ceramic coffee mug',10.65,93.1,5.19,31.72,57.51),('P964','Home Decor','Wooden picture frame',28.37,24.63,81.27,49.99,67.32),('P965','Beauty','Soft cotton t-shirt',0.23,81.96,28.57,6.64,64.06),('P966','Books','Leather wallet',17.11,58.24,4.92,45.26,18.34),('P967','Sports & Outdoors','Soft cotton t-shirt',14.44,89.23,59.44,66.63,96.53),('P968','Home Decor','Soft cotton t-shirt',36.88,78.94,38.12,19.84,30.61),('P969','Electronics','Soft cotton t-shirt',48.02,36.62,71.78,68.72,60.46),('P97','Books','Ceramic coffee mug',10.9,57.46,96,38.8,11.49),('P970','Home Decor','Wooden picture frame',36.03,77.79,90.86,33.21,73.07),('P971','Beauty','Soft cotton t-shirt',28.83,61.23,42.78,15.09,32.87),('P972','Clothing','Stainless steel water bottle',23.86,79.22,56.66,20.36,43.16),('P973','Sports & Outdoors','Leather wallet',9.89,68.91,53.51,48.65,17.19),('P974','Electronics','Soft cotton t-shirt',37.28,48.95,98.62,70.55,54.47),('P975','Beauty','Soft cotton t-shirt',8.46,18.93,13.64,87.19,21.79),('P976','Home Decor','Leather wallet',40.37,97.27,29.41,17.89,43.52),('P977','Toys','Wooden picture frame',32.99,93.87,40.57,52.63,52.24),('P978','Beauty','Wooden picture frame',6.78,33.15,89.37,77.55,30.64),('P979','Food & Beverage','Ceramic coffee mug',9.07,67.53,42.52,89.7,94.47),('P98','Home Decor','Wooden picture frame',40.71,3.11,38.64,1.48,82.42),('P980','Sports & Outdoors','Soft cotton t-shirt',3.79,15.56,90.33,89.28,28.72),('P981','Beauty','Stainless steel water bottle',41.55,47.84,31.57,49.16,93.33),('P982','Beauty','Stainless steel water bottle',48.31,75.9,82.21,4.4,82.49),('P983','Beauty','Stainless steel water bottle',26.52,1.73,17.26,76.44,32.44),('P984','Sports & Outdoors','Wooden picture frame',35.99,86.37,16.93,28.33,12.76),('P985','Home Decor','Soft cotton t-shirt',8.86,4.76,2.54,59.7,64.48),('P986','Clothing','Stainless steel water bottle',37.15,44.34,6.98,90.9,85.11),('P987','Electronics','Ceramic coffee mug',14.67,82.8,15.6,27.33,33.09),('P988','Clothing','Leather wallet',5.84,66.65,89.89,39.44,8.15),('P989','Home Decor','Leather wallet',39.59,16.38,84.66,86.14,39.48),('P99','Books','Stainless steel water bottle',11.98,85.64,23.22,79.88,72.94),('P990','Sports & Outdoors','Ceramic coffee mug',40.23,20.03,48.65,44.22,47.28),('P991','Books','Soft cotton t-shirt',4.38,48.43,1.26,61.87,16.57),('P992','Books','Ceramic coffee mug',24.35,29.24,9.43,4.28,39.02),('P993','Electronics','Soft cotton t-shirt',25.8,90.08,66.34,18.98,45.40),('P994','Clothing','Stainless steel water bottle',17.32,97.77,80.84,72.61,9.93),('P995','Electronics','Soft cotton t-shirt',28.36,21.63,64.57,7.85,11.43),('P996','Books','Ceramic coffee mug',43.23,42.27,43.28,64.75,26.38),('P997','Electronics','Soft cotton t-shirt',2.28,33.66,5.52,52.35,96.61),('P998','Toys','Ceramic coffee mug',14.04,67.31,44.86,59.81,6.89),('P999','Beauty','Stainless steel water bottle',42.09,41.12,60.05,38.89,40.63),('S1001','Shoes','Boots',400,40,40,25,65.00);
 /*!40000 ALTER TABLE `products` ENABLE KEYS */;
 UNLOCK TABLES;
 
@@ -267,6 +303,7 @@ CREATE TABLE `sellers` (
   `seller_zip_code` int DEFAULT NULL,
   PRIMARY KEY (`seller_id`),
   KEY `seller_fk1_idx` (`seller_zip_code`),
+  KEY `seller_email_idx` (`seller_email`),
   CONSTRAINT `seller_fk1` FOREIGN KEY (`seller_zip_code`) REFERENCES `geolocation` (`geolocation_id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -281,6 +318,40 @@ INSERT INTO `sellers` VALUES ('S1','Daniel','Smith','bhugonnet0@cbsnews.com','62
 /*!40000 ALTER TABLE `sellers` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `stock_holds`
+--
+
+DROP TABLE IF EXISTS `stock_holds`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `stock_holds` (
+  `cart_id` varchar(64) NOT NULL,
+  `product_id` varchar(200) NOT NULL,
+  `seller_id` varchar(200) NOT NULL,
+  `quantity` int NOT NULL,
+  `expires_at` datetime NOT NULL,
+  PRIMARY KEY (`cart_id`,`product_id`,`seller_id`),
+  KEY `stock_holds_product_idx` (`product_id`,`seller_id`,`expires_at`,`quantity`),
+  KEY `stock_holds_expires_idx` (`expires_at`),
+  CONSTRAINT `stock_holds_ibfk_1` FOREIGN KEY (`product_id`, `seller_id`) REFERENCES `product_stock` (`product_id`, `seller_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Table structure for table `user_credentials`
+--
+
+DROP TABLE IF EXISTS `user_credentials`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `user_credentials` (
+  `user_name` varchar(255) NOT NULL,
+  `password_hash` varchar(255) NOT NULL,
+  PRIMARY KEY (`user_name`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `user_portal`
 --
@@ -291,7 +362,8 @@ DROP TABLE IF EXISTS `user_portal`;
 CREATE TABLE `user_portal` (
   `portal` varchar(50) DEFAULT NULL,
   `user_name` varchar(255) DEFAULT NULL,
-  `password` varchar(255) DEFAULT NULL
+  `password` varchar(255) DEFAULT NULL,
+  UNIQUE KEY `user_name_UNIQUE` (`user_name`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -304,6 +376,19 @@ LOCK TABLES `user_portal` WRITE;
 INSERT INTO `user_portal` VALUES ('customer','kmenham0@aol.com','pwd10'),('customer','rheinreich1@sphinn.com','pwd20'),('customer','cmacaindreis2@ibm.com','pwd30'),('customer','abushnell3@123-reg.co.uk','pwd40'),('customer','gkneale4@indiegogo.com','pwd50'),('customer','emandrake5@t-online.de','pwd60'),('customer','adegiorgio6@weibo.com','pwd70'),('customer','dslyford7@livejournal.com','pwd80'),('customer','hdicky8@eventbrite.com','pwd90'),('customer','msneyd9@washingtonpost.com','pwd100'),('customer','bcorreaa@topsy.com','pwd110'),('customer','gvanhalenb@virginia.edu','pwd120'),('customer','ldroverc@mit.edu','pwd130'),('customer','jbeddoesd@ow.ly','pwd140'),('customer','sgammonse@patch.com','pwd150'),('customer','crysdalef@wordpress.com','pwd160'),('customer','mbuckleighg@simplemachines.org','pwd170'),('customer','jshipstonh@admin.ch','pwd180'),('customer','ddibsoni@ed.gov','pwd190'),('customer','mmuffenj@slate.com','pwd200'),('customer','scorzonk@livejournal.com','pwd210'),('customer','deastcourtl@t.co','pwd220'),('customer','emercerm@hubpages.com','pwd230'),('customer','shuxhamn@furl.net','pwd240'),('customer','zovershotto@spiegel.de','pwd250'),('customer','ggubbinp@qq.com','pwd260'),('customer','clarrawayq@cdbaby.com','pwd270'),('customer','rbibbier@stanford.edu','pwd280'),('customer','lgilkss@google.co.uk','pwd290'),('customer','atofanellit@behance.net','pwd300'),('customer','arainfordu@cam.ac.uk','pwd310'),('customer','aasifv@hp.com','pwd320'),('customer','eswainw@wordpress.com','pwd330'),('customer','bistonx@google.pl','pwd340'),('customer','swrangley@craigslist.org','pwd350'),('customer','yrippingalez@paginegialle.it','pwd360'),('customer','erowntree10@nsw.gov.au','pwd370'),('customer','cmountain11@techcrunch.com','pwd380'),('customer','bgadson12@mapquest.com','pwd390'),('customer','bjelk13@hostgator.com','pwd400'),('customer','heddies14@ucoz.ru','pwd410'),('customer','tnunan15@wisc.edu','pwd420'),('customer','sknowlton16@bigcartel.com','pwd430'),('customer','mbayldon17@example.com','pwd440'),('customer','eandreucci18@sogou.com','pwd450'),('customer','mberisford19@loc.gov','pwd460'),('customer','eengall1a@arstechnica.com','pwd470'),('customer','sfinnemore1b@biglobe.ne.jp','pwd480'),('customer','adudeney1c@paypal.com','pwd490'),('customer','jjeffcock1d@storify.com','pwd500'),('customer','ecolton1e@geocities.com','pwd510'),('customer','adixie1f@ebay.co.uk','pwd520'),('customer','aovitz1g@jigsy.com','pwd530'),('customer','ksahnow1h@gnu.org','pwd540'),('customer','ddrysdall1i@yahoo.com','pwd550'),('customer','fmcilraith1j@mayoclinic.com','pwd560'),('customer','rkuschke1k@ted.com','pwd570'),('customer','hrudram1l@intel.com','pwd580'),('customer','dnanninini1m@icq.com','pwd590'),('customer','calston1n@nbcnews.com','pwd600'),('customer','cgoreisr1o@discovery.com','pwd610'),('customer','zriceards1p@hugedomains.com','pwd620'),('customer','jrobardey1q@macromedia.com','pwd630'),('customer','crooms1r@europa.eu','pwd640'),('customer','enealon1s@harvard.edu','pwd650'),('customer','ewindus1t@e-recht24.de','pwd660'),('customer','mcopner1u@sciencedirect.com','pwd670'),('customer','sterrans1v@hubpages.com','pwd680'),('customer','ccammidge1w@thetimes.co.uk','pwd690'),('customer','dkleinstub1x@freewebs.com','pwd700'),('customer','bfrier1y@deliciousdays.com','pwd710'),('customer','vmcleary1z@ca.gov','pwd720'),('customer','eguillotin20@linkedin.com','pwd730'),('customer','ebacop21@sina.com.cn','pwd740'),('customer','tvisick22@xing.com','pwd750'),('customer','gatlee23@yahoo.com','pwd760'),('customer','estruis24@usda.gov','pwd770'),('customer','pdockwray25@imdb.com','pwd780'),('customer','cdonneely26@chronoengine.com','pwd790'),('customer','hcastelain27@epa.gov','pwd800'),('customer','cdevereux28@plala.or.jp','pwd810'),('customer','khuggen29@taobao.com','pwd820'),('customer','obarday2a@imdb.com','pwd830'),('customer','imelledy2b@independent.co.uk','pwd840'),('customer','sfeye2c@histats.com','pwd850'),('customer','agilson2d@reddit.com','pwd860'),('customer','dstjohn2e@nydailynews.com','pwd870'),('customer','cdeortega2f@nasa.gov','pwd880'),('customer','ebreadon2g@ezinearticles.com','pwd890'),('customer','lmellem2h@adobe.com','pwd900'),('customer','cchallin2i@shinystat.com','pwd910'),('customer','vratnege2j@google.de','pwd920'),('customer','bquantrill2k@bloglines.com','pwd930'),('customer','rlockhurst2l@marketwatch.com','pwd940'),('customer','wdacke2m@bravesites.com','pwd950'),('customer','mlivingstone2n@mediafire.com','pwd960'),('customer','ccuardall2o@barnesandnoble.com','pwd970'),('customer','kscranney2p@wiley.com','pwd980'),('customer','lmundford2q@hao123.com','pwd990'),('customer','amyton2r@etsy.com','pwd1000'),('customer','hbartolomeu2s@fema.gov','pwd1010'),('customer','mcolton2t@yahoo.co.jp','pwd1020'),('customer','twasmer2u@domainmarket.com','pwd1030'),('customer','hezzell2v@google.de','pwd1040'),('customer','gsexton2w@google.com','pwd1050'),('customer','bashbee2x@nsw.gov.au','pwd1060'),('customer','obruty2y@mozilla.com','pwd1070'),('customer','lahlf2z@1und1.de','pwd1080'),('customer','ghurley30@europa.eu','pwd1090'),('customer','aarchbould31@zdnet.com','pwd1100'),('customer','ksalsbury32@gravatar.com','pwd1110'),('customer','bleigh33@nydailynews.com','pwd1120'),('customer','ladie34@nymag.com','pwd1130'),('customer','gdowne35@e-recht24.de','pwd1140'),('customer','hcrallan36@ifeng.com','pwd1150'),('customer','cveschambre37@sohu.com','pwd1160'),('customer','dtrippett38@printfriendly.com','pwd1170'),('customer','fberrick39@gizmodo.com','pwd1180'),('customer','gsummerly3a@fc2.com','pwd1190'),('customer','arahl3b@dot.gov','pwd1200'),('customer','jcresser3c@com.com','pwd1210'),('customer','kcusiter3d@drupal.org','pwd1220'),('customer','vshouler3e@mashable.com','pwd1230'),('customer','lroussel3f@linkedin.com','pwd1240'),('customer','apuxley3g@xinhuanet.com','pwd1250'),('customer','jhorley3h@stanford.edu','pwd1260'),('customer','hbonsale3i@usda.gov','pwd1270'),('customer','fgoldston3j@friendfeed.com','pwd1280'),('customer','mmitkin3k@webs.com','pwd1290'),('customer','cmccook3l@howstuffworks.com','pwd1300'),('customer','hroblou3m@dyndns.org','pwd1310'),('customer','thartrick3n@umich.edu','pwd1320'),('customer','stwyning3o@techcrunch.com','pwd1330'),('customer','opengelley3p@yellowbook.com','pwd1340'),('customer','ksemered3q@youtu.be','pwd1350'),('customer','llochet3r@foxnews.com','pwd1360'),('customer','amesser3s@nps.gov','pwd1370'),('customer','omacculloch3t@theglobeandmail.com','pwd1380'),('customer','dcarroll3u@tripadvisor.com','pwd1390'),('customer','lhedingham3v@artisteer.com','pwd1400'),('customer','cgulvin3w@jalbum.net','pwd1410'),('customer','tshorey3x@tiny.cc','pwd1420'),('customer','cfanton3y@ox.ac.uk','pwd1430'),('customer','slilley3z@sciencedirect.com','pwd1440'),('customer','rdeere40@google.com.hk','pwd1450'),('customer','ajohnston41@51.la','pwd1460'),('customer','tbooeln42@moonfruit.com','pwd1470'),('customer','omilhench43@free.fr','pwd1480'),('customer','apile44@cornell.edu','pwd1490'),('customer','cpeet45@berkeley.edu','pwd1500'),('customer','mkerswill46@ovh.net','pwd1510'),('customer','sfilipiak47@de.vu','pwd1520'),('customer','yjerche48@123-reg.co.uk','pwd1530'),('customer','cadriani49@yolasite.com','pwd1540'),('customer','aprodrick4a@etsy.com','pwd1550'),('customer','nmussetti4b@xrea.com','pwd1560'),('customer','krothery4c@technorati.com','pwd1570'),('customer','lastbery4d@last.fm','pwd1580'),('customer','qbisp4e@yellowpages.com','pwd1590'),('customer','fkupka4f@cnbc.com','pwd1600'),('customer','mdrillot4g@stanford.edu','pwd1610'),('customer','mkeedwell4h@istockphoto.com','pwd1620'),('customer','ewilcher4i@alexa.com','pwd1630'),('customer','dfinnemore4j@desdev.cn','pwd1640'),('customer','kphythean4k@nba.com','pwd1650'),('customer','mrollin4l@census.gov','pwd1660'),('customer','seakin4m@nature.com','pwd1670'),('customer','dnasey4n@sfgate.com','pwd1680'),('customer','zscotchforth4o@latimes.com','pwd1690'),('customer','mgoodere4p@zdnet.com','pwd1700'),('customer','pmcartan4q@bbc.co.uk','pwd1710'),('customer','rgrouse4r@cisco.com','pwd1720'),('customer','lgloy4s@npr.org','pwd1730'),('customer','apluthero4t@woothemes.com','pwd1740'),('customer','mluca4u@fda.gov','pwd1750'),('customer','cmckellen4v@tmall.com','pwd1760'),('customer','alinzee4w@scribd.com','pwd1770'),('customer','emacrae4x@symantec.com','pwd1780'),('customer','tkolak4y@miibeian.gov.cn','pwd1790'),('customer','chandrock4z@admin.ch','pwd1800'),('customer','amatejic50@engadget.com','pwd1810'),('customer','egrieveson51@hhs.gov','pwd1820'),('customer','mhalfhide52@adobe.com','pwd1830'),('customer','mskydall53@gmpg.org','pwd1840'),('customer','lbonhome54@mediafire.com','pwd1850'),('customer','zpardey55@eventbrite.com','pwd1860'),('customer','tmityukov56@sina.com.cn','pwd1870'),('customer','gdower57@who.int','pwd1880'),('customer','alawless58@umich.edu','pwd1890'),('customer','adoe59@topsy.com','pwd1900'),('customer','dguerrazzi5a@hao123.com','pwd1910'),('customer','karchbold5b@rakuten.co.jp','pwd1920'),('customer','irickhuss5c@github.io','pwd1930'),('customer','llewknor5d@fastcompany.com','pwd1940'),('customer','ecortese5e@discovery.com','pwd1950'),('customer','sditer5f@cbslocal.com','pwd1960'),('customer','ibortoloni5g@usatoday.com','pwd1970'),('customer','sfronek5h@usnews.com','pwd1980'),('customer','thuyton5i@flavors.me','pwd1990'),('customer','dstenners5j@omniture.com','pwd2000'),('customer','fstace5k@shinystat.com','pwd2010'),('customer','lhuttley5l@vistaprint.com','pwd2020'),('customer','afeasby5m@cam.ac.uk','pwd2030'),('customer','rditchfield5n@nhs.uk','pwd2040'),('customer','ldufray5o@theglobeandmail.com','pwd2050'),('customer','dalesio5p@scientificamerican.com','pwd2060'),('customer','mdaintrey5q@bloomberg.com','pwd2070'),('customer','cesseby5r@yellowpages.com','pwd2080'),('customer','rgregorowicz5s@ovh.net','pwd2090'),('customer','wtreadaway5t@ycombinator.com','pwd2100'),('customer','oammer5u@cargocollective.com','pwd2110'),('customer','jhammerman5v@naver.com','pwd2120'),('customer','rlowrey5w@apple.com','pwd2130'),('customer','fcornwell5x@youtu.be','pwd2140'),('customer','mkisar5y@howstuffworks.com','pwd2150'),('customer','mburwood5z@moonfruit.com','pwd2160'),('customer','npickerill60@webeden.co.uk','pwd2170'),('customer','abampton61@ucoz.com','pwd2180'),('customer','qbenardette62@imgur.com','pwd2190'),('customer','sslaight63@last.fm','pwd2200'),('customer','gdudney64@twitpic.com','pwd2210'),('customer','lkoppel65@macromedia.com','pwd2220'),('customer','shunnicot66@nature.com','pwd2230'),('customer','jgiamelli67@arizona.edu','pwd2240'),('customer','lfinnigan68@wikimedia.org','pwd2250'),('customer','lthorndycraft69@bloomberg.com','pwd2260'),('customer','neuston6a@twitpic.com','pwd2270'),('customer','aschwand6b@meetup.com','pwd2280'),('customer','cnilles6c@imageshack.us','pwd2290'),('customer','fjosefsen6d@nhs.uk','pwd2300'),('customer','flough6e@slideshare.net','pwd2310'),('customer','mmeany6f@howstuffworks.com','pwd2320'),('customer','awards6g@yahoo.com','pwd2330'),('customer','cswadling6h@live.com','pwd2340'),('customer','treadings6i@rambler.ru','pwd2350'),('customer','rbrigginshaw6j@wikimedia.org','pwd2360'),('customer','gdickson6k@wordpress.org','pwd2370'),('customer','jferres6l@issuu.com','pwd2380'),('customer','cwill6m@google.cn','pwd2390'),('customer','ocanty6n@mozilla.com','pwd2400'),('customer','dmedd6o@comsenz.com','pwd2410'),('customer','bdelicate6p@nps.gov','pwd2420'),('customer','hodonnell6q@eepurl.com','pwd2430'),('customer','jdeplacido6r@yandex.ru','pwd2440'),('customer','rfeldmann6s@ucoz.com','pwd2450'),('customer','fborrows6t@nydailynews.com','pwd2460'),('customer','ablance6u@omniture.com','pwd2470'),('customer','gprodrick6v@craigslist.org','pwd2480'),('customer','odickerline6w@senate.gov','pwd2490'),('customer','rbartolommeo6x@globo.com','pwd2500'),('customer','gchettoe6y@163.com','pwd2510'),('customer','mellicock6z@ucsd.edu','pwd2520'),('customer','pvedekhin70@wired.com','pwd2530'),('customer','ffolbige71@example.com','pwd2540'),('customer','bwoollacott72@icq.com','pwd2550'),('customer','stuhy73@barnesandnoble.com','pwd2560'),('customer','nlangthorn74@canalblog.com','pwd2570'),('customer','jadrien75@hostgator.com','pwd2580'),('customer','enolan76@about.me','pwd2590'),('customer','adearnly77@123-reg.co.uk','pwd2600'),('customer','gkeyden78@npr.org','pwd2610'),('customer','cgofton79@clickbank.net','pwd2620'),('customer','ssecretan7a@google.fr','pwd2630'),('customer','tpendry7b@nifty.com','pwd2640'),('customer','vstimpson7c@loc.gov','pwd2650'),('customer','rblackborne7d@indiegogo.com','pwd2660'),('customer','epaggitt7e@omniture.com','pwd2670'),('customer','abeardwell7f@mit.edu','pwd2680'),('customer','dmatzen7g@privacy.gov.au','pwd2690'),('customer','aruoff7h@yellowpages.com','pwd2700'),('customer','jnoar7i@wordpress.com','pwd2710'),('customer','adenerley7j@weather.com','pwd2720'),('customer','gwaltho7k@hud.gov','pwd2730'),('customer','aisaksen7l@tripadvisor.com','pwd2740'),('customer','dbaggally7m@ning.com','pwd2750'),('customer','rhuffadine7n@gmpg.org','pwd2760'),('customer','kgiacobbo7o@ifeng.com','pwd2770'),('customer','gdignall7p@tripod.com','pwd2780'),('customer','myoungs7q@bandcamp.com','pwd2790'),('customer','jmaykin7r@examiner.com','pwd2800'),('customer','khanrahan7s@hp.com','pwd2810'),('customer','njovicic7t@slideshare.net','pwd2820'),('customer','acasaletto7u@harvard.edu','pwd2830'),('customer','wpartkya7v@elegantthemes.com','pwd2840'),('customer','amcsweeney7w@indiatimes.com','pwd2850'),('customer','ffilyaev7x@networkadvertising.org','pwd2860'),('customer','aextance7y@webmd.com','pwd2870'),('customer','aohaire7z@comsenz.com','pwd2880'),('customer','gpettyfer80@yellowpages.com','pwd2890'),('customer','kbryceson81@woothemes.com','pwd2900'),('customer','kravenscroft82@goo.ne.jp','pwd2910'),('customer','ccoghill83@php.net','pwd2920'),('customer','lwakerley84@ebay.co.uk','pwd2930'),('customer','csmale85@wsj.com','pwd2940'),('customer','bmoodie86@princeton.edu','pwd2950'),('customer','rreignolds87@mozilla.com','pwd2960'),('customer','stingly88@creativecommons.org','pwd2970'),('customer','etourner89@facebook.com','pwd2980'),('customer','pgreenhouse8a@scientificamerican.com','pwd2990'),('customer','twulfinger8b@paginegialle.it','pwd3000'),('customer','dcorneljes8c@xrea.com','pwd3010'),('customer','rpeschmann8d@bravesites.com','pwd3020'),('customer','jedler8e@who.int','pwd3030'),('customer','sbrissenden8f@51.la','pwd3040'),('customer','mdelamaine8g@army.mil','pwd3050'),('customer','cmarquess8h@stanford.edu','pwd3060'),('customer','xschankel8i@psu.edu','pwd3070'),('customer','tblagdon8j@vk.com','pwd3080'),('customer','lcomrie8k@ehow.com','pwd3090'),('customer','hhaydney8l@macromedia.com','pwd3100'),('customer','cpadson8m@barnesandnoble.com','pwd3110'),('customer','tfeirn8n@goo.gl','pwd3120'),('customer','ieffaunt8o@ehow.com','pwd3130'),('customer','mhuskisson8p@independent.co.uk','pwd3140'),('customer','afarreil8q@opera.com','pwd3150'),('customer','dlawrance8r@google.cn','pwd3160'),('customer','ebrophy8s@shareasale.com','pwd3170'),('customer','amcelrea8t@answers.com','pwd3180'),('customer','adarter8u@google.de','pwd3190'),('customer','bion8v@businesswire.com','pwd3200'),('customer','smcfadyen8w@jalbum.net','pwd3210'),('customer','aburdytt8x@a8.net','pwd3220'),('customer','vtitchmarsh8y@earthlink.net','pwd3230'),('customer','ahavik8z@ustream.tv','pwd3240'),('customer','pdorian90@de.vu','pwd3250'),('customer','twabe91@xrea.com','pwd3260'),('customer','lbuick92@google.de','pwd3270'),('customer','bbruckent93@nba.com','pwd3280'),('customer','kbillson94@comcast.net','pwd3290'),('customer','zlindholm95@google.de','pwd3300'),('customer','dgaynor96@ted.com','pwd3310'),('customer','tgandy97@i2i.jp','pwd3320'),('customer','lpoxon98@diigo.com','pwd3330'),('customer','wjasper99@tamu.edu','pwd3340'),('customer','gblindmann9a@goo.gl','pwd3350'),('customer','ahinks9b@cmu.edu','pwd3360'),('customer','gbeaufoy9c@sourceforge.net','pwd3370'),('customer','fbasil9d@shareasale.com','pwd3380'),('customer','breyne9e@weebly.com','pwd3390'),('customer','amasedon9f@admin.ch','pwd3400'),('customer','gtrippick9g@nydailynews.com','pwd3410'),('customer','gudy9h@dedecms.com','pwd3420'),('customer','fribbon9i@constantcontact.com','pwd3430'),('customer','dstickland9j@1688.com','pwd3440'),('customer','dauguste9k@mac.com','pwd3450'),('customer','sjacobs9l@skyrock.com','pwd3460'),('customer','naudrey9m@bandcamp.com','pwd3470'),('customer','jgrimestone9n@dailymail.co.uk','pwd3480'),('customer','lcaville9o@nytimes.com','pwd3490'),('customer','scraven9p@google.com','pwd3500'),('customer','gdandrea9q@tiny.cc','pwd3510'),('customer','eyeell9r@edublogs.org','pwd3520'),('customer','rtomlin9s@amazon.de','pwd3530'),('customer','vpolgreen9t@squarespace.com','pwd3540'),('customer','bbrownill9u@woothemes.com','pwd3550'),('customer','sbarnes9v@google.com.hk','pwd3560'),('customer','mmclurg9w@bigcartel.com','pwd3570'),('customer','rpitkeathley9x@google.com','pwd3580'),('customer','abaildon9y@economist.com','pwd3590'),('customer','rhugland9z@smugmug.com','pwd3600'),('customer','htribbecka0@apple.com','pwd3610'),('customer','lduffielda1@cbc.ca','pwd3620'),('customer','jklimczaka2@mozilla.com','pwd3630'),('customer','epopleea3@phoca.cz','pwd3640'),('customer','dtewkesberrya4@yolasite.com','pwd3650'),('customer','afinlasona5@ucla.edu','pwd3660'),('customer','fimpletona6@toplist.cz','pwd3670'),('customer','dsibbalda7@wikia.com','pwd3680'),('customer','bscuttera8@bigcartel.com','pwd3690'),('customer','mwinterbottoma9@friendfeed.com','pwd3700'),('customer','mjowleaa@nymag.com','pwd3710'),('customer','csiemonsab@vistaprint.com','pwd3720'),('customer','dmargachac@tinypic.com','pwd3730'),('customer','bdaulbyad@istockphoto.com','pwd3740'),('customer','agoudyae@dyndns.org','pwd3750'),('customer','eskeermoraf@weather.com','pwd3760'),('customer','eripingag@nsw.gov.au','pwd3770'),('customer','gbeurichah@blinklist.com','pwd3780'),('customer','rsudlowai@fc2.com','pwd3790'),('customer','lfortescueaj@prweb.com','pwd3800'),('customer','ntweedyak@feedburner.com','pwd3810'),('customer','kvanschafflaeral@mysql.com','pwd3820'),('customer','kbaskervilleam@usa.gov','pwd3830'),('customer','ihannantan@noaa.gov','pwd3840'),('customer','cshoebottomao@toplist.cz','pwd3850'),('customer','rborlandap@livejournal.com','pwd3860'),('customer','amcbainaq@studiopress.com','pwd3870'),('customer','ddurdyar@myspace.com','pwd3880'),('customer','jtusonas@weibo.com','pwd3890'),('customer','mknyvettat@bbc.co.uk','pwd3900'),('customer','schedgeyau@twitpic.com','pwd3910'),('customer','scostarav@dailymail.co.uk','pwd3920'),('customer','acorrinaw@mashable.com','pwd3930'),('customer','jdroganax@theatlantic.com','pwd3940'),('customer','sdiehnay@nytimes.com','pwd3950'),('customer','vsynkeaz@addtoany.com','pwd3960'),('customer','kmatyjab0@nasa.gov','pwd3970'),('customer','wmcmenamyb1@ezinearticles.com','pwd3980'),('customer','pizattb2@bigcartel.com','pwd3990'),('customer','klinehamb3@msn.com','pwd4000'),('customer','msearb4@alibaba.com','pwd4010'),('customer','jmarshalb5@nydailynews.com','pwd4020'),('customer','mmarderb6@ask.com','pwd4030'),('customer','jburdassb7@springer.com','pwd4040'),('customer','sbowickb8@deviantart.com','pwd4050'),('customer','cchasteneyb9@addthis.com','pwd4060'),('customer','amccriskenba@pinterest.com','pwd4070'),('customer','aalcockbb@exblog.jp','pwd4080'),('customer','mbaccupbc@last.fm','pwd4090'),('customer','btongebd@hexun.com','pwd4100'),('customer','ltourbe@opera.com','pwd4110'),('customer','mcambdenbf@lulu.com','pwd4120'),('customer','apennaccibg@scientificamerican.com','pwd4130'),('customer','djacquemotbh@biglobe.ne.jp','pwd4140'),('customer','aleybi@japanpost.jp','pwd4150'),('customer','sariesbj@java.com','pwd4160'),('customer','edanilewiczbk@yellowpages.com','pwd4170'),('customer','lsivillsbl@zimbio.com','pwd4180'),('customer','dblaxleybm@soundcloud.com','pwd4190'),('customer','pvliesbn@example.com','pwd4200'),('customer','kcayleybo@yahoo.com','pwd4210'),('customer','chalahanbp@nih.gov','pwd4220'),('customer','lgoodbarrbq@so-net.ne.jp','pwd4230'),('customer','wcainbr@reddit.com','pwd4240'),('customer','kbalassabs@amazon.co.uk','pwd4250'),('customer','lrichmondbt@soundcloud.com','pwd4260'),('customer','olumsdenbu@apple.com','pwd4270'),('customer','fcradickbv@vinaora.com','pwd4280'),('customer','rcowbw@sakura.ne.jp','pwd4290'),('customer','epenlingtonbx@woothemes.com','pwd4300'),('customer','lgoreyby@reddit.com','pwd4310'),('customer','bdursleybz@paypal.com','pwd4320'),('customer','nmaciunasc0@nps.gov','pwd4330'),('customer','jgiacomonic1@chicagotribune.com','pwd4340'),('customer','gfosterc2@chron.com','pwd4350'),('customer','ghoulisonc3@cbsnews.com','pwd4360'),('customer','psuttabyc4@theguardian.com','pwd4370'),('customer','bprycec5@census.gov','pwd4380'),('customer','ipremblec6@hc360.com','pwd4390'),('customer','cluxfordc7@geocities.com','pwd4400'),('customer','dehlerdingc8@ed.gov','pwd4410'),('customer','efarnorthc9@gnu.org','pwd4420'),('customer','jtwinberrowca@hao123.com','pwd4430'),('customer','clorandcb@jiathis.com','pwd4440'),('customer','clindemanncc@ocn.ne.jp','pwd4450'),('customer','ehearlecd@nymag.com','pwd4460'),('customer','bmenaulce@nature.com','pwd4470'),('customer','rolohancf@xinhuanet.com','pwd4480'),('customer','aauchterlonycg@xing.com','pwd4490'),('customer','gbauduccioch@cisco.com','pwd4500'),('customer','ncarreyetteci@freewebs.com','pwd4510'),('customer','cbafordcj@cornell.edu','pwd4520'),('customer','rcolecroughck@ca.gov','pwd4530'),('customer','tmenichinocl@geocities.com','pwd4540'),('customer','rchampneycm@lycos.com','pwd4550'),('customer','kbarthelmescn@github.com','pwd4560'),('customer','tecclesco@washington.edu','pwd4570'),('customer','mabrehartcp@skyrock.com','pwd4580'),('customer','rpoveycq@networksolutions.com','pwd4590'),('customer','fgirardetcr@mayoclinic.com','pwd4600'),('customer','qstrodercs@4shared.com','pwd4610'),('customer','vspeachleyct@exblog.jp','pwd4620'),('customer','tthairscu@miibeian.gov.cn','pwd4630'),('customer','rdegiorgiscv@cargocollective.com','pwd4640'),('customer','cspillmancw@ftc.gov','pwd4650'),('customer','wfaulkscx@arstechnica.com','pwd4660'),('customer','hspaceycy@tinyurl.com','pwd4670'),('customer','pstiveycz@dropbox.com','pwd4680'),('customer','lpillerd0@symantec.com','pwd4690'),('customer','cbuzined1@businessinsider.com','pwd4700'),('customer','nsciacovellid2@issuu.com','pwd4710'),('customer','bfenningd3@etsy.com','pwd4720'),('customer','jbeavingtond4@apple.com','pwd4730'),('customer','oaslied5@google.co.uk','pwd4740'),('customer','kcryselld6@dailymail.co.uk','pwd4750'),('customer','draggettd7@census.gov','pwd4760'),('customer','hgillottd8@qq.com','pwd4770'),('customer','gbygravesd9@so-net.ne.jp','pwd4780'),('customer','jlindmanda@cyberchimps.com','pwd4790'),('customer','gbeglindb@shutterfly.com','pwd4800'),('customer','gaseldc@opera.com','pwd4810'),('customer','adallingdd@ted.com','pwd4820'),('customer','ggoudmande@miibeian.gov.cn','pwd4830'),('customer','asoldidf@deliciousdays.com','pwd4840'),('customer','gburminghamdg@bing.com','pwd4850'),('customer','amacturloughdh@t.co','pwd4860'),('customer','hgronaverdi@plala.or.jp','pwd4870'),('customer','mlongfellowdj@goo.ne.jp','pwd4880'),('customer','cvlasenkovdk@sfgate.com','pwd4890'),('customer','tcasirolidl@harvard.edu','pwd4900'),('customer','swoosterdm@paginegialle.it','pwd4910'),('customer','bchevindn@google.co.uk','pwd4920'),('customer','akolakowskido@marketwatch.com','pwd4930'),('customer','vjaandp@springer.com','pwd4940'),('customer','bprettidq@infoseek.co.jp','pwd4950'),('customer','wchristiensendr@hao123.com','pwd4960'),('customer','wpetcheyds@clickbank.net','pwd4970'),('customer','kputtendt@discovery.com','pwd4980'),('customer','dfeldbaudu@loc.gov','pwd4990'),('customer','nethridgedv@google.com.br','pwd5000'),('customer','emackinderdw@istockphoto.com','pwd5010'),('customer','gmaffuccidx@weebly.com','pwd5020'),('customer','aburnessdy@live.com','pwd5030'),('customer','fsennettdz@theglobeandmail.com','pwd5040'),('customer','lklimshuke0@github.io','pwd5050'),('customer','czoephele1@ed.gov','pwd5060'),('customer','lronaldsone2@smugmug.com','pwd5070'),('customer','scancellere3@springer.com','pwd5080'),('customer','sjereatte4@hao123.com','pwd5090'),('customer','rfearnsidese5@answers.com','pwd5100'),('customer','dyorkstone6@cbslocal.com','pwd5110'),('customer','oetocke7@amazon.de','pwd5120'),('customer','bnisete8@smugmug.com','pwd5130'),('customer','elibermoree9@jalbum.net','pwd5140'),('customer','zkopischea@dyndns.org','pwd5150'),('customer','csmouteneb@amazon.co.uk','pwd5160'),('customer','qheatonec@wikispaces.com','pwd5170'),('customer','jwinched@dmoz.org','pwd5180'),('customer','gnavarreee@google.pl','pwd5190'),('customer','hsallingsef@dot.gov','pwd5200'),('customer','wtomaszekeg@paginegialle.it','pwd5210'),('customer','tcolleymoreeh@tumblr.com','pwd5220'),('customer','lcastanaei@mozilla.com','pwd5230'),('customer','hreddinej@discuz.net','pwd5240'),('customer','cbengeek@is.gd','pwd5250'),('customer','lhaugehel@marriott.com','pwd5260'),('customer','cstuckem@seattletimes.com','pwd5270'),('customer','dkalderonen@google.nl','pwd5280'),('customer','ebavidgeeo@ebay.com','pwd5290'),('customer','mnoltonep@china.com.cn','pwd5300'),('customer','econoreq@globo.com','pwd5310'),('customer','rcarper@123-reg.co.uk','pwd5320'),('customer','redensores@reverbnation.com','pwd5330'),('customer','dmacalindenet@bandcamp.com','pwd5340'),('customer','zottewilleu@cnn.com','pwd5350'),('customer','gwardeev@alibaba.com','pwd5360'),('customer','aevershedew@ning.com','pwd5370'),('customer','nmundieex@dion.ne.jp','pwd5380'),('customer','cmaccumiskeyey@discovery.com','pwd5390'),('customer','ncochraneez@sogou.com','pwd5400'),('customer','wkanef0@discovery.com','pwd5410'),('customer','tbalstonf1@zdnet.com','pwd5420'),('customer','fblockleyf2@flickr.com','pwd5430'),('customer','eoertzenf3@google.ru','pwd5440'),('customer','aaleninf4@army.mil','pwd5450'),('customer','mnobletf5@paypal.com','pwd5460'),('customer','mcarradicef6@ocn.ne.jp','pwd5470'),('customer','ckynmanf7@cpanel.net','pwd5480'),('customer','htudballf8@sakura.ne.jp','pwd5490'),('customer','daggottf9@webs.com','pwd5500'),('customer','tsorrillfa@blogger.com','pwd5510'),('customer','btimminsfb@usgs.gov','pwd5520'),('customer','bdeyefc@ucoz.ru','pwd5530'),('customer','hnoarfd@networksolutions.com','pwd5540'),('customer','kroganfe@instagram.com','pwd5550'),('customer','bstokerff@icq.com','pwd5560'),('customer','vtootingfg@admin.ch','pwd5570'),('customer','fmackonochiefh@google.com.hk','pwd5580'),('customer','cbucknallfi@bizjournals.com','pwd5590'),('customer','sbuddingfj@joomla.org','pwd5600'),('customer','ecridlanfk@nytimes.com','pwd5610'),('customer','bgrewarfl@goo.gl','pwd5620'),('customer','ndoddemeadefm@springer.com','pwd5630'),('customer','gheggmanfn@smugmug.com','pwd5640'),('customer','bwandrackfo@shop-pro.jp','pwd5650'),('customer','jbambridgefp@seesaa.net','pwd5660'),('customer','gqualtroughfq@bandcamp.com','pwd5670'),('customer','rfrankowskifr@tiny.cc','pwd5680'),('customer','hrambergfs@gravatar.com','pwd5690'),('customer','shoulaghanft@vinaora.com','pwd5700'),('customer','lkippingfu@nih.gov','pwd5710'),('customer','slyverfv@hc360.com','pwd5720'),('customer','wortmannfw@prlog.org','pwd5730'),('customer','smattausfx@elpais.com','pwd5740'),('customer','vtwopennyfy@hostgator.com','pwd5750'),('customer','dsiviorfz@example.com','pwd5760'),('customer','skingzettg0@state.gov','pwd5770'),('customer','lrasmusg1@ask.com','pwd5780'),('customer','sbutteg2@webeden.co.uk','pwd5790'),('customer','dketteridgeg3@i2i.jp','pwd5800'),('customer','ctrippettg4@nymag.com','pwd5810'),('customer','vlightfootg5@google.it','pwd5820'),('customer','mambrogionig6@a8.net','pwd5830'),('customer','emessierg7@ocn.ne.jp','pwd5840'),('customer','jbestwerthickg8@google.co.jp','pwd5850'),('customer','mhowsang9@yolasite.com','pwd5860'),('customer','dmoncurga@netscape.com','pwd5870'),('customer','tflecknessgb@nationalgeographic.com','pwd5880'),('customer','clemmergc@dell.com','pwd5890'),('customer','csentgd@shop-pro.jp','pwd5900'),('customer','ocellage@photobucket.com','pwd5910'),('customer','afontenotgf@topsy.com','pwd5920'),('customer','dgowrichgg@springer.com','pwd5930'),('customer','kposselowgh@cnn.com','pwd5940'),('customer','mcuvleygi@people.com.cn','pwd5950'),('customer','ezimekgj@dailymail.co.uk','pwd5960'),('customer','bkalinskygk@pcworld.com','pwd5970'),('customer','moxxgl@cdc.gov','pwd5980'),('customer','mbricknallgm@yellowbook.com','pwd5990'),('customer','maubertgn@istockphoto.com','pwd6000'),('customer','itebbettgo@economist.com','pwd6010'),('customer','ofurmagiergp@patch.com','pwd6020'),('customer','dcregingq@accuweather.com','pwd6030'),('customer','djurischgr@soundcloud.com','pwd6040'),('customer','mbecksgs@jiathis.com','pwd6050'),('customer','klhommeaugt@ebay.co.uk','pwd6060'),('customer','bkailgu@nydailynews.com','pwd6070'),('customer','sbastablegv@stumbleupon.com','pwd6080'),('customer','ymuddicliffegw@pagesperso-orange.fr','pwd6090'),('customer','emebsgx@blogspot.com','pwd6100'),('customer','bcooringtongy@google.pl','pwd6110'),('customer','ssoitouxgz@nyu.edu','pwd6120'),('customer','cmebesh0@techcrunch.com','pwd6130'),('customer','jlibermoreh1@blogspot.com','pwd6140'),('customer','skalinskyh2@theglobeandmail.com','pwd6150'),('customer','sarghenth3@yellowbook.com','pwd6160'),('customer','gfarnfieldh4@facebook.com','pwd6170'),('customer','cdreinanh5@51.la','pwd6180'),('customer','mlougheadh6@clickbank.net','pwd6190'),('customer','mellamh7@wp.com','pwd6200'),('customer','thalkyardh8@senate.gov','pwd6210'),('customer','plangloish9@behance.net','pwd6220'),('customer','oscanterburyha@deviantart.com','pwd6230'),('customer','hkapiloffhb@amazonaws.com','pwd6240'),('customer','cheartfieldhc@who.int','pwd6250'),('customer','dfetherstonhd@cnn.com','pwd6260'),('customer','omantlehe@vimeo.com','pwd6270'),('customer','mpereshf@ted.com','pwd6280'),('customer','kloffelhg@mozilla.com','pwd6290'),('customer','seringeyhh@mlb.com','pwd6300'),('customer','smasarrathi@abc.net.au','pwd6310'),('customer','llatliffhj@printfriendly.com','pwd6320'),('customer','hvelldenhk@storify.com','pwd6330'),('customer','dvaudinhl@unc.edu','pwd6340'),('customer','apicktonhm@abc.net.au','pwd6350'),('customer','efileshn@cpanel.net','pwd6360'),('customer','sjanuarystho@macromedia.com','pwd6370'),('customer','bhrishanokhp@flickr.com','pwd6380'),('customer','rkonkehq@jalbum.net','pwd6390'),('customer','brossettihr@meetup.com','pwd6400'),('customer','kmakenhs@canalblog.com','pwd6410'),('customer','bhallsht@ucla.edu','pwd6420'),('customer','kfrichleyhu@unc.edu','pwd6430'),('customer','tgoulbornehv@skyrock.com','pwd6440'),('customer','gfilisovhw@feedburner.com','pwd6450'),('customer','kmorinhx@who.int','pwd6460'),('customer','bcottisfordhy@google.it','pwd6470'),('customer','tduffynhz@msn.com','pwd6480'),('customer','myekeli0@reuters.com','pwd6490'),('customer','jshallcrossi1@loc.gov','pwd6500'),('customer','ibenfelli2@nature.com','pwd6510'),('customer','yhowisoni3@com.com','pwd6520'),('customer','hnolii4@chronoengine.com','pwd6530'),('customer','abenasiki5@com.com','pwd6540'),('customer','amussettii6@yale.edu','pwd6550'),('customer','oyarnleyi7@ted.com','pwd6560'),('customer','gkenracki8@sciencedirect.com','pwd6570'),('customer','emaxweelli9@bloglines.com','pwd6580'),('customer','aselloria@cnbc.com','pwd6590'),('customer','eswainsburyib@topsy.com','pwd6600'),('customer','gblackwayic@cloudflare.com','pwd6610'),('customer','dhussellid@homestead.com','pwd6620'),('customer','ppaszekie@hc360.com','pwd6630'),('customer','hhightonif@newyorker.com','pwd6640'),('customer','bipplettig@ning.com','pwd6650'),('customer','rchalkeih@patch.com','pwd6660'),('customer','hsaltersii@a8.net','pwd6670'),('customer','kadnamsij@examiner.com','pwd6680'),('customer','pemanulssonik@arstechnica.com','pwd6690'),('customer','gganningil@foxnews.com','pwd6700'),('customer','htawseim@artisteer.com','pwd6710'),('customer','ymeldrumin@godaddy.com','pwd6720'),('customer','kbutteio@constantcontact.com','pwd6730'),('customer','gridingip@wikimedia.org','pwd6740'),('customer','sharvattiq@blinklist.com','pwd6750'),('customer','kbrownir@latimes.com','pwd6760'),('customer','nwoodyeareis@go.com','pwd6770'),('customer','ptommeiit@gov.uk','pwd6780'),('customer','bpowlingiu@constantcontact.com','pwd6790'),('customer','rshaeferiv@weather.com','pwd6800'),('customer','rjellmaniw@mail.ru','pwd6810'),('customer','kdantonix@histats.com','pwd6820'),('customer','gferfulleiy@amazon.co.jp','pwd6830'),('customer','ogrameriz@miibeian.gov.cn','pwd6840'),('customer','sgarlickej0@cargocollective.com','pwd6850'),('customer','predmirej1@360.cn','pwd6860'),('customer','lpearsallj2@about.me','pwd6870'),('customer','fthorpj3@discuz.net','pwd6880'),('customer','ebrookesbiej4@apple.com','pwd6890'),('customer','xloynesj5@fotki.com','pwd6900'),('customer','emckeej6@cbslocal.com','pwd6910'),('customer','jstraceyj7@51.la','pwd6920'),('customer','greddingj8@wunderground.com','pwd6930'),('customer','cbeynkej9@aboutads.info','pwd6940'),('customer','qstruttja@vk.com','pwd6950'),('customer','mmuzzijb@theguardian.com','pwd6960'),('customer','mduchateljc@redcross.org','pwd6970'),('customer','mmcgarrahanjd@de.vu','pwd6980'),('customer','ddevoyje@nydailynews.com','pwd6990'),('customer','blessliejf@house.gov','pwd7000'),('customer','tpohlsjg@reverbnation.com','pwd7010'),('customer','kchilcottjh@comsenz.com','pwd7020'),('customer','gbrogiji@exblog.jp','pwd7030'),('customer','dgrierjj@stumbleupon.com','pwd7040'),('customer','akneeshawjk@t-online.de','pwd7050'),('customer','dmoylejl@163.com','pwd7060'),('customer','smunneryjm@desdev.cn','pwd7070'),('customer','pgeaterjn@sitemeter.com','pwd7080'),('customer','orolandjo@rambler.ru','pwd7090'),('customer','ejarredjp@ifeng.com','pwd7100'),('customer','irohfsenjq@blogspot.com','pwd7110'),('customer','rbeilbyjr@de.vu','pwd7120'),('customer','mtattersalljs@oaic.gov.au','pwd7130'),('customer','gdegregolijt@tinypic.com','pwd7140'),('customer','cventumju@taobao.com','pwd7150'),('customer','kgirauxjv@xinhuanet.com','pwd7160'),('customer','kkissockjw@dagondesign.com','pwd7170'),('customer','sberdalejx@howstuffworks.com','pwd7180'),('customer','hmcelrathjy@cocolog-nifty.com','pwd7190'),('customer','mlawliejz@ox.ac.uk','pwd7200'),('customer','mmorefieldk0@last.fm','pwd7210'),('customer','sbeazleighk1@google.pl','pwd7220'),('customer','gasipenkok2@pbs.org','pwd7230'),('customer','ccurwenk3@barnesandnoble.com','pwd7240'),('customer','agrutk4@google.com.au','pwd7250'),('customer','afrostk5@histats.com','pwd7260'),('customer','sberthk6@elpais.com','pwd7270'),('customer','jgallihaulkk7@craigslist.org','pwd7280'),('customer','mmehmetk8@slate.com','pwd7290'),('customer','tmccoskerk9@unesco.org','pwd7300'),('customer','jmackellenka@parallels.com','pwd7310'),('customer','sbernardeskb@samsung.com','pwd7320'),('customer','jebournekc@multiply.com','pwd7330'),('customer','smacanekd@washington.edu','pwd7340'),('customer','aalsfordke@hp.com','pwd7350'),('customer','cfurneauxkf@google.cn','pwd7360'),('customer','boppykg@topsy.com','pwd7370'),('customer','dlabellkh@bloomberg.com','pwd7380'),('customer','skershowki@mysql.com','pwd7390'),('customer','dpappikj@discovery.com','pwd7400'),('customer','cmulhollandkk@nsw.gov.au','pwd7410'),('customer','gbiskupskikl@unblog.fr','pwd7420'),('customer','hshillamkm@wikispaces.com','pwd7430'),('customer','studgekn@guardian.co.uk','pwd7440'),('customer','mmathewsko@dailymotion.com','pwd7450'),('customer','mgherardinikp@stanford.edu','pwd7460'),('customer','tcottiekq@bandcamp.com','pwd7470'),('customer','lharbinkr@aol.com','pwd7480'),('customer','adargueks@nationalgeographic.com','pwd7490'),('customer','tstourtonkt@cocolog-nifty.com','pwd7500'),('customer','scarletku@storify.com','pwd7510'),('customer','vhickinbottomkv@noaa.gov','pwd7520'),('customer','jtrustriekw@tumblr.com','pwd7530'),('customer','pstiantkx@fastcompany.com','pwd7540'),('customer','aboverky@tripod.com','pwd7550'),('customer','bsaleskz@nytimes.com','pwd7560'),('customer','carrl0@wikia.com','pwd7570'),('customer','lkofaxl1@bbb.org','pwd7580'),('customer','wmuatl2@networkadvertising.org','pwd7590'),('customer','asteuartl3@ovh.net','pwd7600'),('customer','rgregrl4@discovery.com','pwd7610'),('customer','eshottinl5@google.it','pwd7620'),('customer','dwakesl6@creativecommons.org','pwd7630'),('customer','lmaundl7@linkedin.com','pwd7640'),('customer','dkollachl8@nytimes.com','pwd7650'),('customer','ccrippenl9@nhs.uk','pwd7660'),('customer','ahallyburtonla@omniture.com','pwd7670'),('customer','nscneiderlb@nationalgeographic.com','pwd7680'),('customer','msellstromlc@google.ru','pwd7690'),('customer','gbarenskild@smugmug.com','pwd7700'),('customer','sstatefieldle@netscape.com','pwd7710'),('customer','btouhiglf@telegraph.co.uk','pwd7720'),('customer','athickenslg@sfgate.com','pwd7730'),('customer','aszymanskilh@sphinn.com','pwd7740'),('customer','rdefilippisli@google.pl','pwd7750'),('customer','jmateulj@sphinn.com','pwd7760'),('customer','rjaillerlk@buzzfeed.com','pwd7770'),('customer','lbidgoodll@berkeley.edu','pwd7780'),('customer','slittlejohnlm@hibu.com','pwd7790'),('customer','khenrichsln@hhs.gov','pwd7800'),('customer','bstrottonlo@businesswire.com','pwd7810'),('customer','rlifflp@cmu.edu','pwd7820'),('customer','kparysownalq@joomla.org','pwd7830'),('customer','hmichelottilr@bbc.co.uk','pwd7840'),('customer','akeuntjels@bloglovin.com','pwd7850'),('customer','mkleynlt@yelp.com','pwd7860'),('customer','jbastonlu@apple.com','pwd7870'),('customer','hfluinlv@huffingtonpost.com','pwd7880'),('customer','cvasilchikovlw@china.com.cn','pwd7890'),('customer','wdobbylx@deliciousdays.com','pwd7900'),('customer','bcubbinly@vistaprint.com','pwd7910'),('customer','ncockramlz@t.co','pwd7920'),('customer','dcallfm0@shareasale.com','pwd7930'),('customer','wjosuweitm1@marriott.com','pwd7940'),('customer','ntennockm2@paginegialle.it','pwd7950'),('customer','ppickrillm3@com.com','pwd7960'),('customer','kwoodbridgem4@lulu.com','pwd7970'),('customer','qghiriardellim5@umn.edu','pwd7980'),('customer','acooganm6@bloglines.com','pwd7990'),('customer','jborleacem7@netvibes.com','pwd8000'),('customer','amcgrillm8@epa.gov','pwd8010'),('customer','gaultm9@github.com','pwd8020'),('customer','spalekma@mtv.com','pwd8030'),('customer','fkohnmb@domainmarket.com','pwd8040'),('customer','mhutcheonsmc@bbb.org','pwd8050'),('customer','bshalcrasmd@accuweather.com','pwd8060'),('customer','rsurridgeme@slideshare.net','pwd8070'),('customer','tcosslettmf@netlog.com','pwd8080'),('customer','loreganmg@salon.com','pwd8090'),('customer','ccochranmh@dion.ne.jp','pwd8100'),('customer','gcavanmi@thetimes.co.uk','pwd8110'),('customer','swoofindenmj@java.com','pwd8120'),('customer','tattwellmk@ucsd.edu','pwd8130'),('customer','fdowsingml@fotki.com','pwd8140'),('customer','akiesselmm@bbb.org','pwd8150'),('customer','gespinetmn@mac.com','pwd8160'),('customer','mhaldenbymo@cpanel.net','pwd8170'),('customer','briddmp@newsvine.com','pwd8180'),('customer','tlowenmq@pen.io','pwd8190'),('customer','caugurmr@free.fr','pwd8200'),('customer','astockinms@xrea.com','pwd8210'),('customer','fmandremt@gov.uk','pwd8220'),('customer','stookeymu@blogtalkradio.com','pwd8230'),('customer','gmcmeekanmv@ow.ly','pwd8240'),('customer','crottemw@nhs.uk','pwd8250'),('customer','fheinsiusmx@about.com','pwd8260'),('customer','fgreatbatchmy@com.com','pwd8270'),('customer','avidgenmz@360.cn','pwd8280'),('customer','shessenthalern0@discovery.com','pwd8290'),('customer','aredsulln1@newsvine.com','pwd8300'),('customer','kcardenasn2@ameblo.jp','pwd8310'),('customer','vhann3@microsoft.com','pwd8320'),('customer','jwallbridgen4@dailymotion.com','pwd8330'),('customer','ipettusn5@ucoz.ru','pwd8340'),('customer','gbartoleynn6@amazon.de','pwd8350'),('customer','nbaystonn7@jigsy.com','pwd8360'),('customer','mrawlesn8@instagram.com','pwd8370'),('customer','pdallaghann9@cmu.edu','pwd8380'),('customer','ralbrookna@upenn.edu','pwd8390'),('customer','jrufflesnb@dell.com','pwd8400'),('customer','pbradennc@comcast.net','pwd8410'),('customer','bnealynd@amazonaws.com','pwd8420'),('customer','sbodellne@flickr.com','pwd8430'),('customer','ksentonnf@naver.com','pwd8440'),('customer','japtedng@mashable.com','pwd8450'),('customer','bmcsharrynh@blogtalkradio.com','pwd8460'),('customer','awelfareni@msn.com','pwd8470'),('customer','nmerklenj@nih.gov','pwd8480'),('customer','cackermannk@zimbio.com','pwd8490'),('customer','lrubkenl@networksolutions.com','pwd8500'),('customer','bmintonm@1688.com','pwd8510'),('customer','uwalkeynn@usgs.gov','pwd8520'),('customer','rteesno@icio.us','pwd8530'),('customer','cvanderlindenp@csmonitor.com','pwd8540'),('customer','dkytleynq@slideshare.net','pwd8550'),('customer','dkaesmakersnr@tripod.com','pwd8560'),('customer','tmulderrigns@jimdo.com','pwd8570'),('customer','bethertonnt@nationalgeographic.com','pwd8580'),('customer','amushetnu@discuz.net','pwd8590'),('customer','aanfreynv@tiny.cc','pwd8600'),('customer','shrinishinnw@trellian.com','pwd8610'),('customer','eyouensnx@tinyurl.com','pwd8620'),('customer','lthirwellny@tuttocitta.it','pwd8630'),('customer','rbeentjesnz@irs.gov','pwd8640'),('customer','ohareo0@sohu.com','pwd8650'),('customer','gaberkirdoo1@blogger.com','pwd8660'),('customer','mportmano2@dagondesign.com','pwd8670'),('customer','zthowo3@mediafire.com','pwd8680'),('customer','glepiscopio4@cbc.ca','pwd8690'),('customer','truckhardo5@networksolutions.com','pwd8700'),('customer','wgrayshono6@ifeng.com','pwd8710'),('customer','smizeno7@friendfeed.com','pwd8720'),('customer','akitchinghano8@reuters.com','pwd8730'),('customer','mmccooleo9@woothemes.com','pwd8740'),('customer','kosheerinoa@qq.com','pwd8750'),('customer','tmartinovskyob@state.gov','pwd8760'),('customer','lcoldicottoc@businessinsider.com','pwd8770'),('customer','sendicottod@wordpress.org','pwd8780'),('customer','vtwamleyoe@purevolume.com','pwd8790'),('customer','rtabardof@arstechnica.com','pwd8800'),('customer','sjovicicog@aboutads.info','pwd8810'),('customer','ryudeoh@last.fm','pwd8820'),('customer','pmangionoi@si.edu','pwd8830'),('customer','gcalowoj@answers.com','pwd8840'),('customer','mtuhyok@a8.net','pwd8850'),('customer','rgaskingol@vk.com','pwd8860'),('customer','iswatmanom@time.com','pwd8870'),('customer','cguddon@gov.uk','pwd8880'),('customer','bitzkovwichoo@chronoengine.com','pwd8890'),('customer','nogleasaneop@tmall.com','pwd8900'),('customer','tbonickoq@elegantthemes.com','pwd8910'),('customer','gbrunsenor@google.com.hk','pwd8920'),('customer','vmcgonnellos@europa.eu','pwd8930'),('customer','ihealingsot@cnn.com','pwd8940'),('customer','mcushou@discovery.com','pwd8950'),('customer','vendov@digg.com','pwd8960'),('customer','bgrabbanow@de.vu','pwd8970'),('customer','astowersox@hao123.com','pwd8980'),('customer','agaukrogeroy@xinhuanet.com','pwd8990'),('customer','earnaldooz@blinklist.com','pwd9000'),('customer','lbollomp0@forbes.com','pwd9010'),('customer','astratiffp1@yelp.com','pwd9020'),('customer','csworderp2@forbes.com','pwd9030'),('customer','emccullenp3@tumblr.com','pwd9040'),('customer','jgilbankp4@whitehouse.gov','pwd9050'),('customer','vcrannachp5@fema.gov','pwd9060'),('customer','lvossep6@behance.net','pwd9070'),('customer','nkellerp7@washingtonpost.com','pwd9080'),('customer','apillerp8@dmoz.org','pwd9090'),('customer','lwildep9@usgs.gov','pwd9100'),('customer','ssacazepa@bbb.org','pwd9110'),('customer','vbruntpb@vistaprint.com','pwd9120'),('customer','secclestonepc@paginegialle.it','pwd9130'),('customer','vburlpd@exblog.jp','pwd9140'),('customer','ktrewinnardpe@princeton.edu','pwd9150'),('customer','lsadlierpf@jugem.jp','pwd9160'),('customer','kravenscrofttpg@earthlink.net','pwd9170'),('customer','mmelinph@blogs.com','pwd9180'),('customer','grobisonpi@example.com','pwd9190'),('customer','kmosdillpj@adobe.com','pwd9200'),('customer','skenewellpk@hp.com','pwd9210'),('customer','dyushachkovpl@about.me','pwd9220'),('customer','gstyantpm@icio.us','pwd9230'),('customer','slomispn@msn.com','pwd9240'),('customer','jkiledalpo@unc.edu','pwd9250'),('customer','ygannawaypp@chronoengine.com','pwd9260'),('customer','apassmorepq@last.fm','pwd9270'),('customer','tforespr@techcrunch.com','pwd9280'),('customer','ktolleps@go.com','pwd9290'),('customer','hjocelynpt@youku.com','pwd9300'),('customer','amoylespu@sun.com','pwd9310'),('customer','jbrupv@parallels.com','pwd9320'),('customer','mdrowsfieldpw@tiny.cc','pwd9330'),('customer','bschulkenpx@devhub.com','pwd9340'),('customer','alaffoleylanepy@baidu.com','pwd9350'),('customer','nharpinpz@samsung.com','pwd9360'),('customer','edownesq0@microsoft.com','pwd9370'),('customer','lfenckq1@over-blog.com','pwd9380'),('customer','pellingtonq2@naver.com','pwd9390'),('customer','mrohloffq3@businesswire.com','pwd9400'),('customer','kferraronq4@marketwatch.com','pwd9410'),('customer','cloosq5@gizmodo.com','pwd9420'),('customer','kberryq6@va.gov','pwd9430'),('customer','mkeedyq7@bbb.org','pwd9440'),('customer','ashoemarkq8@zimbio.com','pwd9450'),('customer','btyzackq9@who.int','pwd9460'),('customer','amuldoonqa@desdev.cn','pwd9470'),('customer','mroukeqb@flavors.me','pwd9480'),('customer','wluetchfordqc@washington.edu','pwd9490'),('customer','mbateupqd@wikispaces.com','pwd9500'),('customer','mmesnardqe@yolasite.com','pwd9510'),('customer','gyaakovqf@flavors.me','pwd9520'),('customer','zlowinqg@surveymonkey.com','pwd9530'),('customer','lbonafantqh@csmonitor.com','pwd9540'),('customer','tmerkelqi@naver.com','pwd9550'),('customer','cfazackerleyqj@state.tx.us','pwd9560'),('customer','mlepperqk@disqus.com','pwd9570'),('customer','fbreeql@tuttocitta.it','pwd9580'),('customer','cwolfartqm@chicagotribune.com','pwd9590'),('customer','dkybertqn@facebook.com','pwd9600'),('customer','bgarrettqo@over-blog.com','pwd9610'),('customer','jmartuginqp@canalblog.com','pwd9620'),('customer','rbibeyqq@mapquest.com','pwd9630'),('customer','pcaslettqr@google.nl','pwd9640'),('customer','amcmeekinqs@sakura.ne.jp','pwd9650'),('customer','abosseqt@friendfeed.com','pwd9660'),('customer','ahurdmanqu@merriam-webster.com','pwd9670'),('customer','ahouchinqv@gnu.org','pwd9680'),('customer','krawlingsonqw@jimdo.com','pwd9690'),('customer','candreevqx@arizona.edu','pwd9700'),('customer','pcoupmanqy@google.com.au','pwd9710'),('customer','bbracknallqz@patch.com','pwd9720'),('customer','sbirtr0@vk.com','pwd9730'),('customer','wgandleyr1@tamu.edu','pwd9740'),('customer','jbrazierr2@github.io','pwd9750'),('customer','fdivinar3@mlb.com','pwd9760'),('customer','abangler4@4shared.com','pwd9770'),('customer','rputtnamr5@examiner.com','pwd9780'),('customer','gdiceyr6@blinklist.com','pwd9790'),('customer','yandreir7@purevolume.com','pwd9800'),('customer','dfadellr8@acquirethisname.com','pwd9810'),('customer','shammerstoner9@state.tx.us','pwd9820'),('customer','lqueyosra@google.it','pwd9830'),('customer','jbearnerb@huffingtonpost.com','pwd9840'),('customer','jgyngellrc@plala.or.jp','pwd9850'),('customer','flackyrd@t-online.de','pwd9860'),('customer','ldobbsonre@bizjournals.com','pwd9870'),('customer','rthornewillrf@google.co.jp','pwd9880'),('customer','jwaldenrg@studiopress.com','pwd9890'),('customer','avernazzarh@google.co.uk','pwd9900'),('customer','fdowngateri@bloglines.com','pwd9910'),('customer','mgonzalorj@opensource.org','pwd9920'),('customer','gcollymorerk@quantcast.com','pwd9930'),('customer','imarcomberl@cloudflare.com','pwd9940'),('customer','bmacclanceyrm@typepad.com','pwd9950'),('customer','meckhrn@wikimedia.org','pwd9960'),('customer','oaiskriggro@reddit.com','pwd9970'),('customer','sivanyutinrp@salon.com','pwd9980'),('customer','csaturleyrq@dmoz.org','pwd9990'),('customer','fshillitoerr@sakura.ne.jp','pwd10000'),('customer','shao-yu.huang@sjsu.edu','demo1234'),('seller','lam.n.tran@sjsu.edu','employee1234'),('manager','khacminhdai.vo@sjsu.edu','manager1234'),('customer','sandyhsy@gmail.com','sandy0318'),('customer','aidan.chi@sjsu.edu','demo5678'),('customer','demo.hi@gamil.com','demodemo');
 /*!40000 ALTER TABLE `user_portal` ENABLE KEYS */;
 UNLOCK TABLES;
+
+--
+-- Final view structure for view `product_stock_totals`
+--
+
+DROP VIEW IF EXISTS `product_stock_totals`;
+CREATE VIEW `product_stock_totals` AS
+SELECT ps.product_id, ps.seller_id,
+       COALESCE(ps.stock, 0) + COALESCE(SUM(sh.stock), 0) AS stock,
+       COUNT(sh.shard) AS shards
+FROM product_stock ps
+LEFT JOIN product_stock_shards sh ON sh.product_id = ps.product_id AND sh.seller_id = ps.seller_id
+GROUP BY ps.product_id, ps.seller_id, ps.stock;
 /*!40103 SET TIME_ZONE=@OLD_TIME_ZONE */;
 
 /*!40101 SET SQL_MODE=@OLD_SQL_MODE */;
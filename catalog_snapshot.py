@@ -0,0 +1,274 @@
+'''
+This module keeps a copy of the Customer Portal's product catalog on disk, so
+that a new window can show the catalog without downloading every product, and
+keeps a running window's catalog current.
+
+A snapshot file holds the catalog column by column, together with its search
+index and price order, stamped with the data version of the products table it
+was read at (the latest product_updated_at):
+
+    magic (8 bytes) | header length (4 bytes) | JSON header | sections
+
+Each section is a raw array (strings as one UTF-8 blob plus an offset array),
+8-byte aligned at an offset listed in the header. The file is memory-mapped
+when it is opened and the sections are copied into the catalog's arrays
+without parsing them value by value.
+
+open_catalog() loads the snapshot, or the whole products table if there is no
+usable snapshot. fetch_catalog_changes() then reads only the products changed
+since the catalog's version; MySQL maintains product_updated_at on every
+update. A deleted product changes the row count, and the catalog is then
+loaded again in full.
+
+File: catalog_snapshot.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+'''
+
+import os
+import json
+import mmap
+import struct
+from array import array
+from datetime import datetime, timedelta
+from data201 import read_config, pooled_read_connection
+from product_catalog import ProductCatalog, PRODUCTS_SQL
+
+MAGIC = b'DWCATLG1'
+FORMAT = 1
+
+# Rows changed this long before the catalog's version are read again, so that a
+# change committed late with an earlier timestamp is not missed. Applying a row
+# twice is harmless.
+CHANGE_OVERLAP = timedelta(seconds=60)
+
+VERSION_SQL = "SELECT COUNT(*), MAX(product_updated_at) FROM products"
+
+CHANGES_SQL = """
+    SELECT product_id, product_category, product_description, product_price
+    FROM products
+    WHERE product_updated_at >= %s
+"""
+
+def database_source(config_file = 'config.ini', section = 'mysql'):
+    """
+    Return a string naming the database of the configuration, so that
+    a snapshot of one database is never used for another.
+    """
+    config = read_config(config_file, section)
+    return '/'.join(str(config.get(key, '')) for key in ('host', 'port', 'database'))
+
+def _as_datetime(value):
+    # SQLite returns MAX() of a timestamp column as text
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+#---------------------------#
+# Snapshot file             #
+#---------------------------#
+
+def _pack_strings(values):
+    """
+    Return the values as one UTF-8 blob, the int64 offsets of each value
+    in it, and a byte per value that is 1 for None.
+    """
+    encoded = [b'' if value is None else str(value).encode('utf-8') for value in values]
+    offsets = array('q', [0])
+    total = 0
+    for data in encoded:
+        total += len(data)
+        offsets.append(total)
+    nulls = bytes(value is None for value in values)
+    return b''.join(encoded), offsets, nulls
+
+def _unpack_strings(blob, offsets, nulls):
+    return [None if nulls[i] else blob[offsets[i]:offsets[i + 1]].decode('utf-8')
+            for i in range(len(nulls))]
+
+def save_snapshot(catalog, path, source):
+    """
+    Write the catalog to the snapshot file at path, replacing it only
+    once the new file is complete.
+    """
+    category_names = sorted({category for category in catalog.categories if category is not None})
+    category_codes = {name: code for code, name in enumerate(category_names)}
+    category_codes[None] = -1
+
+    trigrams = sorted(catalog.search_index.postings)
+    posting_offsets = array('q', [0])
+    postings = array('i')
+    for trigram in trigrams:
+        postings.extend(catalog.search_index.postings[trigram])
+        posting_offsets.append(len(postings))
+
+    ids_blob, ids_offsets, ids_nulls = _pack_strings(catalog.product_ids)
+    descriptions_blob, descriptions_offsets, descriptions_nulls = _pack_strings(catalog.descriptions)
+    trigrams_blob, trigrams_offsets, _ = _pack_strings(trigrams)
+
+    sections = {
+        'ids': ids_blob, 'ids_offsets': ids_offsets, 'ids_nulls': ids_nulls,
+        'descriptions': descriptions_blob, 'descriptions_offsets': descriptions_offsets,
+        'descriptions_nulls': descriptions_nulls,
+        'categories': array('i', [category_codes[category] for category in catalog.categories]),
+        'prices': catalog.prices,
+        'price_nulls': bytes(label is None for label in catalog.price_labels),
+        'ascending': catalog.price_order[0],
+        'trigrams': trigrams_blob, 'trigrams_offsets': trigrams_offsets,
+        'posting_offsets': posting_offsets, 'postings': postings,
+    }
+
+    # Lay the sections out 8-byte aligned after the header
+    layout = {}
+    offset = 0
+    for name, data in sections.items():
+        size = len(data) * (data.itemsize if isinstance(data, array) else 1)
+        typecode = data.typecode if isinstance(data, array) else 'B'
+        layout[name] = [offset, size, typecode]
+        offset += (size + 7) // 8 * 8
+
+    version = catalog.version
+    header = json.dumps({
+        'format': FORMAT, 'source': source, 'count': len(catalog),
+        'version': version.isoformat(sep=' ') if version is not None else None,
+        'categories': category_names, 'sections': layout,
+        'itemsizes': {code: array(code).itemsize for code in 'iqd'},
+    }).encode('utf-8')
+    start = (len(MAGIC) + 4 + len(header) + 7) // 8 * 8
+
+    temporary = f'{path}.tmp'
+    with open(temporary, 'wb') as file:
+        file.write(MAGIC + struct.pack('<I', len(header)) + header)
+        for name, data in sections.items():
+            file.seek(start + layout[name][0])
+            file.write(data.tobytes() if isinstance(data, array) else data)
+    os.replace(temporary, path)
+
+def load_snapshot(path, source):
+    """
+    Return the catalog stored in the snapshot file at path, or None
+    if there is no snapshot of the database named source.
+    """
+    try:
+        with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped[:len(MAGIC)] != MAGIC:
+                return None
+            (length,) = struct.unpack_from('<I', mapped, len(MAGIC))
+            header = json.loads(mapped[len(MAGIC) + 4:len(MAGIC) + 4 + length])
+            if header['format'] != FORMAT or header['source'] != source or \
+                    any(array(code).itemsize != size for code, size in header['itemsizes'].items()):
+                return None
+            start = (len(MAGIC) + 4 + length + 7) // 8 * 8
+
+            def section(name):
+                offset, size, typecode = header['sections'][name]
+                data = mapped[start + offset:start + offset + size]
+                if typecode == 'B':
+                    return data
+                values = array(typecode)
+                values.frombytes(data)
+                return values
+
+            product_ids = _unpack_strings(section('ids'), section('ids_offsets'), section('ids_nulls'))
+            descriptions = _unpack_strings(section('descriptions'), section('descriptions_offsets'),
+                                           section('descriptions_nulls'))
+            category_names = header['categories']
+            categories = [category_names[code] if code >= 0 else None for code in section('categories')]
+            prices = section('prices')
+            price_labels = [None if null else f"${price:,.2f}"
+                            for price, null in zip(prices, section('price_nulls'))]
+
+            trigrams = _unpack_strings(section('trigrams'), section('trigrams_offsets'),
+                                       bytes(len(section('trigrams_offsets')) - 1))
+            posting_offsets = section('posting_offsets')
+            all_postings = section('postings')
+            postings = {trigram: all_postings[posting_offsets[i]:posting_offsets[i + 1]]
+                        for i, trigram in enumerate(trigrams)}
+
+            version = header['version']
+            return ProductCatalog.from_columns(
+                product_ids, categories, descriptions, prices, price_labels, postings,
+                section('ascending'), version=_as_datetime(version) if version else None)
+    except (OSError, ValueError, KeyError, IndexError, struct.error):
+        # Missing, truncated or unreadable: load the catalog from the database instead
+        return None
+
+#---------------------------#
+# Loading and refreshing    #
+#---------------------------#
+
+def _table_version(conn):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(VERSION_SQL)
+        count, version = cursor.fetchone()
+        return count, _as_datetime(version)
+    finally:
+        cursor.close()
+
+def load_full_catalog(config_file = 'config.ini', section = 'mysql'):
+    """
+    Load every product into a new catalog stamped with the table's data version.
+    The version is read first, so a change made during the load is read again
+    by the next refresh.
+    """
+    with pooled_read_connection(config_file, section) as conn:
+        _, version = _table_version(conn)
+        cursor = conn.cursor()
+        try:
+            cursor.execute(PRODUCTS_SQL)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+    return ProductCatalog(rows, version=version)
+
+def open_catalog(snapshot_path = None, config_file = 'config.ini', section = 'mysql', reload = False):
+    """
+    Return the catalog from the snapshot file, or load it from the
+    database and save a new snapshot if there is no usable snapshot
+    or reload is true. Runs on a QueryRunner thread.
+
+    Output:
+        - (ProductCatalog, bool): The catalog and whether it came from the snapshot,
+          in which case the changes since its version still have to be fetched.
+    """
+    source = database_source(config_file, section)
+    if snapshot_path and not reload:
+        catalog = load_snapshot(snapshot_path, source)
+        if catalog is not None:
+            return catalog, True
+
+    catalog = load_full_catalog(config_file, section)
+    if snapshot_path:
+        try:
+            save_snapshot(catalog, snapshot_path, source)
+        except OSError as e:
+            print(f"Could not save the catalog snapshot: {e}")
+    return catalog, False
+
+def fetch_catalog_changes(version, config_file = 'config.ini', section = 'mysql'):
+    """
+    Read the products changed since the data version. Runs on a QueryRunner thread.
+
+    Output:
+        - (int, datetime, list): The number of products in the table, its current
+          data version, and the changed rows shaped like PRODUCTS_SQL rows.
+    """
+    with pooled_read_connection(config_file, section) as conn:
+        count, current = _table_version(conn)
+        if version is None or current is None or current < version:
+            # No stamp to compare with: every row counts as changed
+            since = datetime.min
+        elif current == version:
+            return count, current, []
+        else:
+            since = version - CHANGE_OVERLAP
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(CHANGES_SQL, (since,))
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+    return count, current, rows
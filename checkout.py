@@ -0,0 +1,560 @@
+'''
+This module places the Customer Portal's orders.
+
+place_order() writes an order with a fixed number of statements however many
+lines the cart has:
+
+    1. INSERT the order
+    2. SELECT the seller and stock of every product, locking their rows
+    3. SELECT the units of those rows held by other carts
+    4. INSERT all order items (one multi-row insert)
+    5. UPDATE the stock of all products (one CASE expression)
+    6. DELETE the cart's stock holds
+    7. INSERT the payment
+
+The portal used to run a stock lookup, a stock update, a seller lookup and an
+insert for each line, so a 200-line order made about 800 round trips while it
+held its row locks. The stock rows are locked in product order, so two orders
+that share products wait for each other instead of deadlocking.
+
+Each product is sold by the first of its sellers with enough stock, and only
+that seller's product_stock row is decremented, in the database and only if
+it still has the stock (stock >= quantity). An order that cannot be filled
+raises an OutOfStockError and writes nothing. Hot products whose stock is
+split into shards (see stock_shards.py) are taken from one of their shards
+instead, without locking their product_stock rows. If the database still
+reports a deadlock or a lock wait timeout, the transaction is rolled back and
+run again after a randomized, growing pause ([checkout] max_attempts and
+backoff_ms).
+
+The benchmark places orders of growing size both ways and rolls them back.
+--rtt adds a simulated network round trip to every statement, e.g. to see what
+a remote server costs when the database is the embedded one:
+
+    python checkout.py benchmark sqlproject.ini [--rtt MS] [LINES...]
+
+The load test runs concurrent checkout workers against a few products with a
+known stock and reports orders per second, the retry rate and any units sold
+beyond the stock. The products' stock and the test orders are restored and
+removed afterwards. --per-line runs the former read-then-write checkout, and
+--shards splits the stock of each product into that many shards (see
+stock_shards.py), e.g. to compare one hot product with and without them:
+
+    python checkout.py loadtest sqlproject.ini [--workers N] [--orders N] [--per-line]
+    python checkout.py loadtest sqlproject.ini --products 1 --stock 100000 [--shards 8]
+
+File: checkout.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+'''
+
+import sys
+import time
+import random
+import threading
+from configparser import ConfigParser
+from datetime import datetime, timedelta
+from decimal import Decimal
+from mysql.connector import Error
+from data201 import pooled_connection
+from id_allocator import next_id
+from stock_shards import get_sharded_stock, take_sharded_stock, shard_stock
+
+# Days until the sellers must ship an order's items.
+SHIPPING_DAYS = 7
+
+# Optional section of the configuration file that sets how
+# often a checkout that hits a deadlock is tried.
+CHECKOUT_SECTION = 'checkout'
+
+CHECKOUT_DEFAULTS = {
+    'max_attempts': 5,      # tries of a transaction that deadlocks or times out waiting for a lock
+    'backoff_ms': 20.0,     # mean pause before the first retry; doubled for each further one
+}
+
+# MySQL errors after which the rolled-back transaction can be run again:
+# ER_LOCK_DEADLOCK and ER_LOCK_WAIT_TIMEOUT.
+RETRYABLE_ERRORS = {1213, 1205}
+
+ORDER_SQL = """
+    INSERT INTO orders (order_id, customer_id, order_status, order_purchase_timestamp, order_approved_at,
+                        order_delivered_carrier_date, order_delivered_customer_date, order_estimated_delivery_date)
+    VALUES (%s, %s, %s, %s, NULL, NULL, NULL, NULL)
+"""
+ORDER_ITEM_SQL = """
+    INSERT INTO order_items (order_id, product_id, seller_id, shipping_limit_date, freight_value, quantity)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+PAYMENT_SQL = """
+    INSERT INTO order_payments (order_id, payment_type, payment_installments, payment_value)
+    VALUES (%s, %s, %s, %s)
+"""
+
+class CheckoutError(Exception):
+    """
+    An order that cannot be placed, e.g. because the cart is empty.
+    """
+
+class OutOfStockError(CheckoutError):
+    """
+    An order with products that no seller has enough stock of.
+    products lists their product IDs.
+    """
+    def __init__(self, products):
+        super().__init__(f"Not enough stock of: {', '.join(products)}")
+        self.products = products
+
+def read_checkout_config(config_file = 'config.ini'):
+    """
+    Read the optional [checkout] section of the configuration file
+    config_file and return its settings as a dictionary, using the
+    defaults for any setting that is not given.
+    """
+    settings = dict(CHECKOUT_DEFAULTS)
+    parser = ConfigParser()
+    parser.read(config_file)
+
+    if parser.has_section(CHECKOUT_SECTION):
+        for key, value in parser.items(CHECKOUT_SECTION):
+            if key in settings:
+                settings[key] = type(CHECKOUT_DEFAULTS[key])(value)
+
+    return settings
+
+_stats = {'orders': 0, 'attempts': 0, 'retries': 0, 'out_of_stock': 0}
+_stats_lock = threading.Lock()
+
+def _count(**counts):
+    with _stats_lock:
+        for name, count in counts.items():
+            _stats[name] += count
+
+def checkout_stats():
+    """
+    Return how many orders this process placed, how many transactions
+    it ran for them, how many of those were retries, and how many
+    orders were rejected for lack of stock.
+    """
+    with _stats_lock:
+        return dict(_stats)
+
+def _placeholders(count, group = '%s'):
+    return ', '.join([group] * count)
+
+def _merge_lines(lines):
+    """
+    Return the lines as {product_id: [quantity, unit price]}, adding
+    up the quantities of a product that appears more than once.
+    """
+    merged = {}
+    for product_id, quantity, unit_price in lines:
+        if product_id in merged:
+            merged[product_id][0] += quantity
+        else:
+            merged[product_id] = [quantity, Decimal(unit_price)]
+    return merged
+
+def _write_order(conn, order_id, customer_id, lines, payment_type = 'credit_card', now = None, sharded = None,
+                 cart_id = None):
+    """
+    Execute the statements of a new order on conn without committing.
+    sharded is {product_id: {seller_id: number of shards}} of the products
+    whose stock is sharded; those are taken from their shards instead of
+    their product_stock rows, and only from their sharded sellers. The
+    units held by other carts are not sold; those held by cart_id are,
+    and its holds are released. Return the order's total.
+    """
+    merged = _merge_lines(lines)
+    if not merged:
+        raise CheckoutError("Your cart is empty. Please add items before checking out.")
+    sharded = sharded or {}
+    product_ids = sorted(merged)
+    locked_ids = [product_id for product_id in product_ids if product_id not in sharded]
+    now = now or datetime.now()
+    shipping_date = now + timedelta(days=SHIPPING_DAYS)
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute(ORDER_SQL, (order_id, customer_id, 'in progress', now.strftime('%Y-%m-%d %H:%M:%S')))
+
+        # Lock the stock rows in product order; each product is sold by
+        # the first seller that has enough of it.
+        sellers = {}
+        if locked_ids:
+            cursor.execute(f"""
+                SELECT product_id, seller_id, stock
+                FROM product_stock
+                WHERE product_id IN ({_placeholders(len(locked_ids))})
+                ORDER BY product_id, seller_id
+                FOR UPDATE
+            """, locked_ids)
+            stocks = cursor.fetchall()
+
+            # Holds are placed only on locked rows, so the rows' held units are settled now
+            cursor.execute(f"""
+                SELECT product_id, seller_id, SUM(quantity)
+                FROM stock_holds
+                WHERE product_id IN ({_placeholders(len(locked_ids))}) AND expires_at > %s AND cart_id <> %s
+                GROUP BY product_id, seller_id
+            """, [*locked_ids, now.strftime('%Y-%m-%d %H:%M:%S'), cart_id or ''])
+            held = {(product_id, seller_id): int(units) for product_id, seller_id, units in cursor.fetchall()}
+
+            for product_id, seller_id, stock in stocks:
+                available = (stock or 0) - held.get((product_id, seller_id), 0)
+                if product_id not in sellers and available >= merged[product_id][0]:
+                    sellers[product_id] = seller_id
+
+        # Hot products leave their product_stock rows unlocked and take one of their shards
+        for product_id in product_ids:
+            if product_id in sharded:
+                seller_id = take_sharded_stock(cursor, product_id, sharded[product_id], merged[product_id][0])
+                if seller_id is not None:
+                    sellers[product_id] = seller_id
+
+        missing = [product_id for product_id in product_ids if product_id not in sellers]
+        if missing:
+            raise OutOfStockError(missing)
+
+        cursor.executemany(ORDER_ITEM_SQL, [
+            (order_id, product_id, sellers[product_id], shipping_date, 0.0, merged[product_id][0])
+            for product_id in product_ids])
+
+        # Decrement in the database and only rows that still have the stock,
+        # so that no concurrent order's decrement is overwritten or oversold
+        if locked_ids:
+            quantities = f"CASE product_id {' '.join(['WHEN %s THEN %s'] * len(locked_ids))} END"
+            case_params = [value for product_id in locked_ids for value in (product_id, merged[product_id][0])]
+            row_params = [value for product_id in locked_ids for value in (product_id, sellers[product_id])]
+            cursor.execute(f"""
+                UPDATE product_stock
+                SET stock = stock - {quantities}
+                WHERE (product_id, seller_id) IN ({_placeholders(len(locked_ids), '(%s, %s)')})
+                  AND stock >= {quantities}
+            """, case_params + row_params + case_params)
+            if cursor.rowcount != len(locked_ids):
+                # Only possible if the rows were not locked, e.g. by a backend without FOR UPDATE
+                raise OutOfStockError(locked_ids)
+
+        if cart_id:
+            # The cart's held units are now sold
+            cursor.execute("DELETE FROM stock_holds WHERE cart_id = %s", (cart_id,))
+
+        total = sum(quantity * unit_price for quantity, unit_price in merged.values())
+        cursor.execute(PAYMENT_SQL, (order_id, payment_type, 1, total))
+    finally:
+        cursor.close()
+
+    return total
+
+def _is_retryable(error):
+    return isinstance(error, Error) and error.errno in RETRYABLE_ERRORS
+
+def _run_order(write, customer_id, lines, config_file, section, settings = None):
+    """
+    Write an order with write(conn, order_id, customer_id, lines) in a
+    transaction, running it again after a deadlock or lock wait timeout.
+    Return the order ID and what write returned.
+    """
+    settings = settings or read_checkout_config(config_file)
+    lines = list(lines)
+    order_id = next_id('orders', config_file=config_file, section=section)
+
+    with pooled_connection(config_file, section) as conn:
+        attempt = 1
+        while True:
+            _count(attempts=1)
+            try:
+                result = write(conn, order_id, customer_id, lines)
+                conn.commit()
+                break
+            except Exception as e:
+                conn.rollback()
+                if isinstance(e, OutOfStockError):
+                    _count(out_of_stock=1)
+                if not _is_retryable(e) or attempt >= settings['max_attempts']:
+                    raise
+            # Back off for a random time around backoff_ms * 2^(attempt - 1), so that
+            # the transactions that collided do not collide again
+            time.sleep(settings['backoff_ms'] / 1000 * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+            attempt += 1
+            _count(retries=1)
+
+    _count(orders=1)
+    return order_id, result
+
+def place_order(customer_id, lines, config_file = 'config.ini', section = 'mysql', payment_type = 'credit_card',
+                cart_id = None):
+    """
+    Place an order in one transaction and return its order ID and total.
+    lines is an iterable of (product_id, quantity, unit price), and cart_id
+    the cart whose stock holds (see stock_holds.py) the order uses. A
+    CheckoutError is raised if the cart is empty, an OutOfStockError
+    if no seller has enough of a product; nothing is written then.
+    """
+    sharded = get_sharded_stock(config_file, section).products()
+
+    def write(conn, order_id, customer_id, lines):
+        return _write_order(conn, order_id, customer_id, lines, payment_type, sharded=sharded, cart_id=cart_id)
+
+    return _run_order(write, customer_id, lines, config_file, section)
+
+#---------------------------#
+# Benchmark                 #
+#---------------------------#
+
+def _write_order_per_line(conn, order_id, customer_id, lines):
+    """
+    Execute the statements of a new order the way the portal used to,
+    with four statements per line.
+    """
+    now = datetime.now()
+    shipping_date = now + timedelta(days=SHIPPING_DAYS)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(ORDER_SQL, (order_id, customer_id, 'in progress', now.strftime('%Y-%m-%d %H:%M:%S')))
+        total = 0
+        for product_id, quantity, unit_price in lines:
+            total += float(unit_price) * quantity
+            cursor.execute("SELECT stock FROM product_stock WHERE product_id = %s", (product_id,))
+            stock = cursor.fetchall()[0][0]
+            cursor.execute("UPDATE product_stock SET stock = %s WHERE product_id = %s",
+                           (stock - quantity, product_id))
+            cursor.execute("SELECT seller_id FROM product_stock WHERE product_id = %s", (product_id,))
+            seller_id = cursor.fetchall()[0][0]
+            cursor.execute(ORDER_ITEM_SQL, (order_id, product_id, seller_id, shipping_date, 0.0, quantity))
+        cursor.execute(PAYMENT_SQL, (order_id, 'credit_card', 1, total))
+    finally:
+        cursor.close()
+
+class _DelayedCursor:
+    """
+    A cursor that counts its statements and waits rtt seconds
+    before each one, like a client far from its server.
+    """
+    def __init__(self, cursor, rtt, counter):
+        self._cursor = cursor
+        self._rtt = rtt
+        self._counter = counter
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def execute(self, *args, **kwargs):
+        self._counter[0] += 1
+        time.sleep(self._rtt)
+        return self._cursor.execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        # The driver sends an INSERT's rows as one multi-row statement
+        self._counter[0] += 1
+        time.sleep(self._rtt)
+        return self._cursor.executemany(*args, **kwargs)
+
+class _DelayedConnection:
+    def __init__(self, conn, rtt):
+        self._conn = conn
+        self._rtt = rtt
+        self.statements = [0]
+
+    def cursor(self, *args, **kwargs):
+        return _DelayedCursor(self._conn.cursor(*args, **kwargs), self._rtt, self.statements)
+
+def benchmark_checkout(config_file = 'config.ini', lines = (1, 10, 50, 200), rtt_ms = 0.0,
+                       repeats = 3, section = 'mysql'):
+    """
+    Write orders of each number of lines per line and set-based, rolling
+    every order back. Return a list of (lines, per-line statements, per-line
+    ms, set-based statements, set-based ms) with the best of repeats runs.
+    """
+    with pooled_connection(config_file, section) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT DISTINCT product_id FROM product_stock ORDER BY product_id")
+        product_ids = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT MIN(customer_id) FROM customers")
+        customer_id = cursor.fetchone()[0]
+        cursor.close()
+        if len(product_ids) < max(lines):
+            raise Exception(f'Only {len(product_ids)} products have stock; cannot fill {max(lines)} lines.')
+
+        results = []
+        for size in lines:
+            cart = [(product_id, 1, Decimal('9.99')) for product_id in product_ids[:size]]
+            timings = {}
+            for name, write in (('per_line', _write_order_per_line), ('set_based', _write_order)):
+                best = None
+                for _ in range(repeats):
+                    delayed = _DelayedConnection(conn, rtt_ms / 1000)
+                    order_id = next_id('orders', config_file=config_file, section=section)
+                    started = time.perf_counter()
+                    try:
+                        write(delayed, order_id, customer_id, cart)
+                    finally:
+                        conn.rollback()
+                    elapsed = (time.perf_counter() - started) * 1000
+                    best = elapsed if best is None else min(best, elapsed)
+                timings[name] = (delayed.statements[0], best)
+            results.append((size, *timings['per_line'], *timings['set_based']))
+    return results
+
+#---------------------------#
+# Load test                 #
+#---------------------------#
+
+def _place_order_per_line(customer_id, lines, config_file = 'config.ini', section = 'mysql'):
+    """
+    Place an order with the former read-then-write checkout, for comparison.
+    """
+    def write(conn, order_id, customer_id, lines):
+        return _write_order_per_line(conn, order_id, customer_id, lines)
+
+    return _run_order(write, customer_id, lines, config_file, section)
+
+def _delete_orders(cursor, order_ids, chunk_size = 500):
+    for start in range(0, len(order_ids), chunk_size):
+        chunk = order_ids[start:start + chunk_size]
+        for table in ('order_items', 'order_payments', 'orders'):
+            cursor.execute(f"DELETE FROM {table} WHERE order_id IN ({_placeholders(len(chunk))})", chunk)
+
+def load_test(config_file = 'config.ini', workers = 8, orders = 50, products = 5, stock = 100,
+              per_line = False, shards = 0, section = 'mysql', seed = 201):
+    """
+    Run workers threads that each try to place orders orders of 1 to 3 of the
+    first products products with stock units each, split into shards shards
+    if shards is given, then check the stock against the order items that were
+    sold. Return a dictionary with the orders placed and rejected, orders per
+    second, the retry rate, the units sold beyond the stock, and the stock rows
+    that do not match their sales. The stock is restored and the test's orders
+    deleted afterwards.
+    """
+    if per_line and shards:
+        raise ValueError('The per-line checkout does not take stock from shards.')
+
+    with pooled_connection(config_file, section) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT DISTINCT product_id FROM product_stock ORDER BY product_id")
+        product_ids = [row[0] for row in cursor.fetchall()][:products]
+        in_products = f"product_id IN ({_placeholders(len(product_ids))})"
+        cursor.execute(f"SELECT product_id, seller_id, stock FROM product_stock WHERE {in_products}", product_ids)
+        saved = cursor.fetchall()
+        cursor.execute(f"SELECT product_id, seller_id, shard, stock FROM product_stock_shards WHERE {in_products}",
+                       product_ids)
+        saved_shards = cursor.fetchall()
+        cursor.execute("SELECT MIN(customer_id) FROM customers")
+        customer_id = cursor.fetchone()[0]
+        cursor.execute(f"DELETE FROM product_stock_shards WHERE {in_products}", product_ids)
+        cursor.execute(f"UPDATE product_stock SET stock = %s WHERE {in_products}", [stock, *product_ids])
+        conn.commit()
+        cursor.close()
+
+    if shards:
+        for product_id, seller_id, _ in saved:
+            shard_stock(product_id, seller_id, shards, config_file=config_file, section=section)
+    get_sharded_stock(config_file, section).refresh()
+
+    place = _place_order_per_line if per_line else place_order
+    placed = []     # order IDs, appended by every worker
+    failures = []
+    start = threading.Barrier(workers)
+
+    def work(worker):
+        generator = random.Random(seed + worker)
+        start.wait()
+        for _ in range(orders):
+            chosen = generator.sample(product_ids, generator.randint(1, min(3, len(product_ids))))
+            cart = [(product_id, generator.randint(1, 3), Decimal('9.99')) for product_id in chosen]
+            try:
+                order_id, _ = place(customer_id, cart, config_file=config_file, section=section)
+                placed.append(order_id)
+            except OutOfStockError:
+                pass
+            except Exception as e:
+                failures.append(str(e))
+
+    before = checkout_stats()
+    started = time.perf_counter()
+    threads = [threading.Thread(target=work, args=(worker,)) for worker in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    after = checkout_stats()
+
+    with pooled_connection(config_file, section) as conn:
+        cursor = conn.cursor()
+        try:
+            sold = {}
+            for chunk_start in range(0, len(placed), 500):
+                chunk = placed[chunk_start:chunk_start + 500]
+                cursor.execute(f"""
+                    SELECT product_id, seller_id, SUM(quantity) FROM order_items
+                    WHERE order_id IN ({_placeholders(len(chunk))})
+                    GROUP BY product_id, seller_id
+                """, chunk)
+                for product_id, seller_id, quantity in cursor.fetchall():
+                    sold[(product_id, seller_id)] = sold.get((product_id, seller_id), 0) + int(quantity)
+            cursor.execute(f"SELECT product_id, seller_id, stock FROM product_stock_totals WHERE {in_products}",
+                           product_ids)
+            final = {(product_id, seller_id): left for product_id, seller_id, left in cursor.fetchall()}
+        finally:
+            # Remove the test's orders and put the stock and any shards back
+            _delete_orders(cursor, placed)
+            cursor.execute(f"DELETE FROM product_stock_shards WHERE {in_products}", product_ids)
+            cursor.executemany("UPDATE product_stock SET stock = %s WHERE product_id = %s AND seller_id = %s",
+                               [(left, product_id, seller_id) for product_id, seller_id, left in saved])
+            if saved_shards:
+                cursor.executemany("INSERT INTO product_stock_shards (product_id, seller_id, shard, stock) "
+                                   "VALUES (%s, %s, %s, %s)", saved_shards)
+            conn.commit()
+            cursor.close()
+    get_sharded_stock(config_file, section).refresh()
+
+    attempts = after['attempts'] - before['attempts']
+    retries = after['retries'] - before['retries']
+    return {
+        'orders': len(placed), 'tried': workers * orders,
+        'out_of_stock': after['out_of_stock'] - before['out_of_stock'],
+        'failed': len(failures), 'errors': sorted(set(failures))[:5],
+        'seconds': elapsed, 'per_second': len(placed) / elapsed if elapsed else 0.0,
+        'retries': retries, 'retry_rate': retries / attempts if attempts else 0.0,
+        'oversold': sum(max(0, quantity - stock) for quantity in sold.values()),
+        'mismatched_rows': sum(1 for row, left in final.items() if left != stock - sold.get(row, 0)),
+    }
+
+if __name__ == '__main__':
+    arguments = sys.argv[1:]
+    if len(arguments) >= 2 and arguments[0] == 'benchmark':
+        config_file = arguments[1]
+        rtt_ms = 0.0
+        if '--rtt' in arguments:
+            i = arguments.index('--rtt')
+            rtt_ms = float(arguments[i + 1])
+            del arguments[i:i + 2]
+        sizes = [int(size) for size in arguments[2:]] or [1, 10, 50, 200]
+
+        print(f"Simulated round trip: {rtt_ms:g} ms")
+        print(f"{'Lines':>6} {'Per-line stmts':>15} {'Per-line ms':>12} {'Set stmts':>10} {'Set ms':>8}")
+        for size, line_statements, line_ms, set_statements, set_ms in benchmark_checkout(config_file, sizes, rtt_ms):
+            print(f"{size:>6} {line_statements:>15} {line_ms:>12.1f} {set_statements:>10} {set_ms:>8.1f}")
+    elif len(arguments) >= 2 and arguments[0] == 'loadtest':
+        options = {'workers': 8, 'orders': 50, 'products': 5, 'stock': 100, 'shards': 0}
+        for name in options:
+            if f'--{name}' in arguments:
+                options[name] = int(arguments[arguments.index(f'--{name}') + 1])
+        result = load_test(arguments[1], per_line='--per-line' in arguments, **options)
+
+        print(f"{result['orders']} of {result['tried']} orders placed in {result['seconds']:.2f} s "
+              f"({result['per_second']:.0f} orders/s), {result['out_of_stock']} rejected out of stock, "
+              f"{result['failed']} failed")
+        print(f"Retries: {result['retries']} ({result['retry_rate']:.1%} of transactions)")
+        print(f"Oversold units: {result['oversold']}, stock rows that do not match their sales: "
+              f"{result['mismatched_rows']}")
+        for error in result['errors']:
+            print(f"Error: {error}")
+        sys.exit(1 if result['oversold'] or result['mismatched_rows'] else 0)
+
+    else:
+        print('Usage: python checkout.py benchmark CONFIG_FILE [--rtt MS] [LINES...]')
+        print('       python checkout.py loadtest CONFIG_FILE [--workers N] [--orders N] [--products N]')
+        print('                                   [--stock N] [--shards N] [--per-line]')
@@ -0,0 +1,277 @@
+'''
+This module contains the credential store that logins are checked against.
+
+Passwords are kept in the user_credentials table, keyed by user name, as
+salted PBKDF2-SHA256 hashes encoded as
+
+    pbkdf2_sha256$<iterations>$<salt>$<hash>
+
+The work factor (the number of iterations) comes from the optional
+[credentials] section of the configuration file. A hash made with fewer
+iterations than configured is replaced the next time its user logs in.
+
+Accounts created before the store existed keep a plaintext password in
+user_portal. migrate_passwords() moves all of them into the store once;
+until it has run, authenticate() migrates each user as they log in.
+
+    python credentials.py migrate sqlproject.ini
+    python credentials.py benchmark
+
+File: credentials.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+'''
+
+import os
+import sys
+import hmac
+import time
+import base64
+import random
+import sqlite3
+import hashlib
+import secrets
+from functools import lru_cache
+from configparser import ConfigParser
+from concurrent.futures import ThreadPoolExecutor
+from data201 import pooled_connection, register_statement, execute_named
+
+# Optional section of the configuration file that sets the
+# work factor of new password hashes.
+CREDENTIALS_SECTION = 'credentials'
+
+CREDENTIALS_DEFAULTS = {
+    'iterations': 320000,   # PBKDF2 iterations of a new hash
+}
+
+ALGORITHM = 'pbkdf2_sha256'
+SALT_BYTES = 16
+
+# The user's role, customer or seller id and stored credentials in one
+# round trip: a point lookup on the unique index of user_portal.user_name
+# and one on the primary key of user_credentials.
+LOOKUP_USER = register_statement('lookup_user', """
+    SELECT u.user_name, u.portal, c.customer_id, s.seller_id,
+           k.password_hash, u.password
+    FROM user_portal u
+    LEFT JOIN user_credentials k ON k.user_name = u.user_name
+    LEFT JOIN customers c ON u.portal = 'customer' AND c.customer_email = u.user_name
+    LEFT JOIN sellers s ON u.portal = 'seller' AND s.seller_email = u.user_name
+    WHERE u.user_name = %s
+    LIMIT 1
+""")
+
+STORE_HASH = register_statement('store_password_hash', """
+    REPLACE INTO user_credentials (user_name, password_hash) VALUES (%s, %s)
+""")
+
+CLEAR_PLAINTEXT = register_statement('clear_plaintext_password', """
+    UPDATE user_portal SET password = NULL WHERE user_name = %s
+""")
+
+def read_credentials_config(config_file = 'config.ini'):
+    """
+    Read the optional [credentials] section of the configuration file
+    config_file and return its settings as a dictionary, using the
+    defaults for any setting that is not given.
+    """
+    settings = dict(CREDENTIALS_DEFAULTS)
+    parser = ConfigParser()
+    parser.read(config_file)
+
+    if parser.has_section(CREDENTIALS_SECTION):
+        for key, value in parser.items(CREDENTIALS_SECTION):
+            if key in settings:
+                settings[key] = type(CREDENTIALS_DEFAULTS[key])(value)
+
+    return settings
+
+def _encode(data):
+    return base64.b64encode(data).decode('ascii').rstrip('=')
+
+def _decode(text):
+    return base64.b64decode(text + '=' * (-len(text) % 4))
+
+def _split_hash(encoded):
+    """
+    Return the iterations, salt and digest of an encoded hash.
+    """
+    algorithm, iterations, salt, digest = encoded.split('$')
+    if algorithm != ALGORITHM:
+        raise Exception(f'Unknown password hash algorithm {algorithm}.')
+    return int(iterations), _decode(salt), _decode(digest)
+
+def hash_password(password, iterations = CREDENTIALS_DEFAULTS['iterations'], salt = None):
+    """
+    Return the encoded PBKDF2-SHA256 hash of the password with
+    the given number of iterations and a new random salt.
+    """
+    if salt is None:
+        salt = secrets.token_bytes(SALT_BYTES)
+    digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+    return '$'.join([ALGORITHM, str(iterations), _encode(salt), _encode(digest)])
+
+def verify_password(password, encoded):
+    """
+    Return whether the password matches the encoded hash.
+    The digests are compared in constant time.
+    """
+    iterations, salt, digest = _split_hash(encoded)
+    candidate = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+    return hmac.compare_digest(candidate, digest)
+
+def needs_rehash(encoded, iterations):
+    """
+    Return whether the encoded hash was made with fewer iterations
+    than the current work factor.
+    """
+    return _split_hash(encoded)[0] < iterations
+
+@lru_cache(maxsize=None)
+def _unknown_user_hash(iterations):
+    # Verified against when the user name is unknown, so that a wrong
+    # user name takes as long to reject as a wrong password.
+    return hash_password(secrets.token_hex(16), iterations)
+
+def store_password(conn, user_name, password, config_file = 'config.ini'):
+    """
+    Store a new hash of the password of user_name on the pooled
+    connection conn and clear any plaintext password left in
+    user_portal. The caller commits.
+    """
+    iterations = read_credentials_config(config_file)['iterations']
+    execute_named(conn, STORE_HASH, (user_name, hash_password(password, iterations)))
+    execute_named(conn, CLEAR_PLAINTEXT, (user_name,))
+
+def authenticate(user_name, password, config_file = 'config.ini', section = 'mysql'):
+    """
+    Check the password of user_name with one indexed lookup. Return the
+    user's (portal, customer_id, seller_id), or None if the user name or
+    the password is wrong. A plaintext password that has not been migrated
+    yet, or a hash made with a smaller work factor, is replaced by a new hash.
+    """
+    iterations = read_credentials_config(config_file)['iterations']
+
+    with pooled_connection(config_file, section) as conn:
+        rows = execute_named(conn, LOOKUP_USER, (user_name,))
+        if not rows:
+            verify_password(password, _unknown_user_hash(iterations))
+            return None
+
+        stored_name, portal, customer_id, seller_id, password_hash, plaintext = rows[0]
+
+        if password_hash is not None:
+            if not verify_password(password, password_hash):
+                return None
+            upgrade = needs_rehash(password_hash, iterations)
+        elif plaintext is not None and hmac.compare_digest(plaintext.encode('utf-8'),
+                                                           password.encode('utf-8')):
+            upgrade = True
+        else:
+            return None
+
+        if upgrade:
+            store_password(conn, stored_name, password, config_file)
+            conn.commit()
+
+    return portal, customer_id, seller_id
+
+def migrate_passwords(config_file = 'config.ini', section = 'mysql', workers = None):
+    """
+    Move every plaintext password left in user_portal into the credential
+    store as a salted hash and clear the plaintext, in one transaction.
+    The hashes are computed on worker threads, since hashlib releases
+    the GIL while hashing. Return the number of users migrated.
+    """
+    iterations = read_credentials_config(config_file)['iterations']
+
+    with pooled_connection(config_file, section) as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT user_name, password FROM user_portal WHERE password IS NOT NULL")
+            users = cursor.fetchall()
+
+            with ThreadPoolExecutor(workers or os.cpu_count()) as executor:
+                hashes = list(executor.map(lambda user: hash_password(user[1], iterations), users))
+
+            cursor.executemany("REPLACE INTO user_credentials (user_name, password_hash) VALUES (%s, %s)",
+                               [(user[0], encoded) for user, encoded in zip(users, hashes)])
+            cursor.executemany("UPDATE user_portal SET password = NULL WHERE user_name = %s",
+                               [(user[0],) for user in users])
+            conn.commit()
+        finally:
+            cursor.close()
+
+    return len(users)
+
+#---------------------------#
+# Benchmark                 #
+#---------------------------#
+
+def _median_ms(run, arguments):
+    times = []
+    for argument in arguments:
+        started = time.perf_counter()
+        run(argument)
+        times.append((time.perf_counter() - started) * 1000)
+    times.sort()
+    return times[len(times) // 2]
+
+def benchmark_login(sizes = (1000, 10000, 100000), lookups = 200,
+                    iterations = CREDENTIALS_DEFAULTS['iterations']):
+    """
+    Compare the login lookup before and after the credential store
+    for user tables of the given sizes, on in-memory SQLite databases.
+    The old lookup compares the plaintext password on a table without
+    an index; the new one is an indexed point lookup followed by one
+    hash verification, whose cost does not depend on the table size.
+    Return a list of (size, old lookup ms, new lookup ms, verify ms)
+    with the median of the given number of lookups.
+    """
+    encoded = hash_password('password', iterations)
+    verify_ms = _median_ms(lambda _: verify_password('password', encoded), range(5))
+    results = []
+
+    for size in sizes:
+        db = sqlite3.connect(':memory:')
+        db.execute("CREATE TABLE plain_portal (portal TEXT, user_name TEXT, password TEXT)")
+        db.execute("CREATE TABLE user_portal (portal TEXT, user_name TEXT, password TEXT)")
+        db.execute("CREATE UNIQUE INDEX user_name_UNIQUE ON user_portal (user_name)")
+        db.execute("CREATE TABLE user_credentials (user_name TEXT PRIMARY KEY, password_hash TEXT)")
+
+        names = [f'user{i}@example.com' for i in range(size)]
+        db.executemany("INSERT INTO plain_portal VALUES ('customer', ?, 'pwd')", [(n,) for n in names])
+        db.executemany("INSERT INTO user_portal VALUES ('customer', ?, NULL)", [(n,) for n in names])
+        db.executemany("INSERT INTO user_credentials VALUES (?, ?)", [(n, encoded) for n in names])
+
+        sample = random.sample(names, min(lookups, size))
+        old_ms = _median_ms(lambda name: db.execute(
+            "SELECT portal, user_name FROM plain_portal WHERE user_name = ? AND password = ?",
+            (name, 'pwd')).fetchall(), sample)
+        new_ms = _median_ms(lambda name: db.execute(
+            "SELECT u.portal, k.password_hash FROM user_portal u "
+            "LEFT JOIN user_credentials k ON k.user_name = u.user_name "
+            "WHERE u.user_name = ?", (name,)).fetchall(), sample)
+
+        results.append((size, old_ms, new_ms, verify_ms))
+        db.close()
+
+    return results
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+
+    if command == 'migrate' and len(sys.argv) == 3:
+        print(f'Migrated {migrate_passwords(sys.argv[2])} passwords.')
+
+    elif command == 'benchmark':
+        print(f"{'users':>8} {'plaintext scan':>15} {'indexed lookup':>15} "
+              f"{'hash verify':>12} {'new login':>10}")
+        for size, old_ms, new_ms, verify_ms in benchmark_login():
+            print(f'{size:>8} {old_ms:>12.3f} ms {new_ms:>12.3f} ms '
+                  f'{verify_ms:>9.1f} ms {new_ms + verify_ms:>7.1f} ms')
+
+    else:
+        print('Usage: python credentials.py migrate CONFIG_FILE')
+        print('       python credentials.py benchmark')
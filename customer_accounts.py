@@ -0,0 +1,236 @@
+'''
+This module contains the sign-up logic for customer accounts: validating a
+new customer and creating their customers, user_portal and credential rows.
+
+sign_up_customer() creates one account, as the SignUpPage does.
+bulk_sign_up() onboards many customers at once, e.g. a partner's customer
+base read with read_customers_csv(). It loads the taken email addresses and
+the valid zip codes once, checks every customer against them in memory, and
+inserts the accepted customers chunk by chunk with multi-row inserts and one
+transaction per chunk.
+
+    python customer_accounts.py import customers.csv sqlproject.ini
+
+The CSV file needs the columns first_name, last_name, phone, zip_code,
+email and password.
+
+File: customer_accounts.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+'''
+
+import os
+import csv
+import sys
+import time
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from data201 import pooled_connection
+from credentials import hash_password, read_credentials_config, store_password
+from id_allocator import get_allocator
+from geo_index import get_geo_index
+
+CUSTOMER_FIELDS = ('first_name', 'last_name', 'phone', 'zip_code', 'email', 'password')
+
+# Customers inserted per transaction by bulk_sign_up().
+DEFAULT_CHUNK_SIZE = 1000
+
+INSERT_CUSTOMER = """
+    INSERT INTO customers (customer_id, customer_first_name, customer_last_name,
+                           customer_email, customer_phone, customer_zip_code)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+INSERT_USER = "INSERT INTO user_portal (portal, user_name, password) VALUES (%s, %s, %s)"
+INSERT_CREDENTIALS = "INSERT INTO user_credentials (user_name, password_hash) VALUES (%s, %s)"
+
+
+class SignUpError(Exception):
+    """
+    A customer that cannot be signed up. title is a short
+    heading for the message, e.g. for a message box.
+    """
+    def __init__(self, title, message):
+        super().__init__(message)
+        self.title = title
+
+
+def check_fields(customer):
+    """
+    Check that a customer (a dictionary with the CUSTOMER_FIELDS) has every
+    field filled in and a plausible email address. Return the customer with
+    its fields stripped of spaces and its zip code as an integer, or raise
+    a SignUpError.
+    """
+    customer = {field: str(customer.get(field) or '').strip() for field in CUSTOMER_FIELDS}
+
+    if not all(customer.values()):
+        raise SignUpError("Input Error", "All fields must be filled!")
+
+    email = customer['email']
+    if "@" not in email or "." not in email:
+        raise SignUpError("Invalid Email", "Enter a valid email address.")
+
+    try:
+        customer['zip_code'] = int(customer['zip_code'])
+    except ValueError:
+        raise SignUpError("Invalid Zip Code", "The provided zip code is invalid.") from None
+
+    return customer
+
+
+def sign_up_customer(customer, config_file='config.ini', section='mysql'):
+    """
+    Create the account of one new customer in a single transaction.
+
+    Input:
+        - customer (dict): The CUSTOMER_FIELDS of the new customer.
+
+    Output:
+        - int: The new customer's ID. A SignUpError is raised if the customer
+          is invalid or the email address is already registered.
+    """
+    customer = check_fields(customer)
+
+    with pooled_connection(config_file, section) as conn:
+        cursor = conn.cursor()
+        try:
+            # Check if the email already exists in the customers table
+            cursor.execute("SELECT COUNT(*) FROM customers WHERE customer_email = %s", (customer['email'],))
+            if cursor.fetchone()[0] > 0:
+                raise SignUpError("Email Already Taken",
+                                  "This email is already registered. Please use a different email.")
+
+            # Check if the zip code exists in the geolocation index
+            if not get_geo_index(config_file, section).has_zip(customer['zip_code']):
+                raise SignUpError("Invalid Zip Code", "The provided zip code is invalid.")
+
+            customer_id = get_allocator(config_file, section).allocate('customers')
+            cursor.execute(INSERT_CUSTOMER, (customer_id, customer['first_name'], customer['last_name'],
+                                             customer['email'], customer['phone'], customer['zip_code']))
+
+            # The password is kept only as a hash in the credential store
+            cursor.execute(INSERT_USER, ("customer", customer['email'], None))
+            store_password(conn, customer['email'], customer['password'], config_file)
+            conn.commit()
+        finally:
+            cursor.close()
+
+    return customer_id
+
+
+def read_customers_csv(path):
+    """
+    Yield the customers of a CSV file with a header row naming
+    the CUSTOMER_FIELDS as dictionaries.
+    """
+    with open(path, newline='', encoding='utf-8') as file:
+        yield from csv.DictReader(file)
+
+
+def _load_taken_emails(conn):
+    """
+    Return the set of email addresses already in use, lowercased,
+    with one query.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT customer_email FROM customers UNION SELECT user_name FROM user_portal")
+        return {row[0].lower() for row in cursor.fetchall() if row[0]}
+    finally:
+        cursor.close()
+
+
+def bulk_sign_up(customers, config_file='config.ini', section='mysql',
+                 chunk_size=DEFAULT_CHUNK_SIZE, hash_workers=None):
+    """
+    Create the accounts of many new customers.
+
+    Input:
+        - customers (iterable of dict): The customers, each with the CUSTOMER_FIELDS.
+        - chunk_size (int): Customers inserted per transaction.
+        - hash_workers (int): Threads that hash passwords; hashlib releases the GIL.
+
+    Output:
+        - dict: The counts of customers read, created and rejected, the elapsed
+          seconds, customers created per second, and a list of the rejected
+          customers as (position in the input, email, reason).
+    """
+    started = time.perf_counter()
+    iterations = read_credentials_config(config_file)['iterations']
+    allocator = get_allocator(config_file, section)
+    report = {'read': 0, 'created': 0, 'rejected': []}
+    position = 0
+
+    with pooled_connection(config_file, section) as conn, \
+         ThreadPoolExecutor(hash_workers or os.cpu_count()) as executor:
+        emails = _load_taken_emails(conn)
+        geo_index = get_geo_index(config_file, section)  # The valid zip codes, loaded with one query
+        customers = iter(customers)
+
+        while True:
+            chunk = list(islice(customers, chunk_size))
+            if not chunk:
+                break
+
+            # Validate the chunk in memory
+            accepted = []
+            for customer in chunk:
+                position += 1
+                email = str(customer.get('email') or '').strip()
+                try:
+                    customer = check_fields(customer)
+                    if email.lower() in emails:
+                        raise SignUpError("Email Already Taken", "This email is already registered.")
+                    if not geo_index.has_zip(customer['zip_code']):
+                        raise SignUpError("Invalid Zip Code", "The provided zip code is invalid.")
+                except SignUpError as e:
+                    report['rejected'].append((position, email, str(e)))
+                    continue
+
+                emails.add(email.lower())
+                accepted.append((position, customer))
+
+            report['read'] += len(chunk)
+            if not accepted:
+                continue
+
+            # Insert the accepted customers with one transaction for the chunk
+            ids = allocator.allocate_many('customers', len(accepted))
+            hashes = list(executor.map(lambda item: hash_password(item[1]['password'], iterations), accepted))
+
+            cursor = conn.cursor()
+            try:
+                cursor.executemany(INSERT_CUSTOMER, [
+                    (customer_id, c['first_name'], c['last_name'], c['email'], c['phone'], c['zip_code'])
+                    for customer_id, (_, c) in zip(ids, accepted)])
+                cursor.executemany(INSERT_USER, [("customer", c['email'], None) for _, c in accepted])
+                cursor.executemany(INSERT_CREDENTIALS, [
+                    (c['email'], encoded) for (_, c), encoded in zip(accepted, hashes)])
+                conn.commit()
+                report['created'] += len(accepted)
+            except Exception as e:
+                conn.rollback()
+                report['rejected'].extend((pos, c['email'], f'Chunk failed: {e}') for pos, c in accepted)
+            finally:
+                cursor.close()
+
+    report['seconds'] = time.perf_counter() - started
+    report['per_second'] = report['created'] / report['seconds'] if report['seconds'] else 0.0
+    return report
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4 and sys.argv[1] == 'import':
+        report = bulk_sign_up(read_customers_csv(sys.argv[2]), config_file=sys.argv[3])
+
+        for position, email, reason in report['rejected'][:20]:
+            print(f"Row {position} ({email}): {reason}")
+        if len(report['rejected']) > 20:
+            print(f"... and {len(report['rejected']) - 20} more rejected rows")
+
+        print(f"Read {report['read']} customers: created {report['created']}, "
+              f"rejected {len(report['rejected'])} in {report['seconds']:.1f} s "
+              f"({report['per_second']:.0f} customers/s)")
+    else:
+        print("Usage: python customer_accounts.py import CUSTOMERS_CSV CONFIG_FILE")
@@ -4,6 +4,7 @@ The Portal has the following functionalities:
 
 - View and manage customer orders (view order history, track order status, etc.)
 - Add items to the shopping cart.
+- Hold the stock of the items in the cart for a while, so checkout does not run out of it.
 - Browse and filter products by category.
 - Apply sorting and search filters to product listings.
 - Proceed to checkout and place orders.
@@ -21,18 +22,25 @@ Course: DATA 201
 from PyQt5.QtWidgets import (
     QMainWindow, QApplication, QTableWidget, QTableWidgetItem,
     QPushButton, QLineEdit, QComboBox, QMenu, QAction, QToolButton, QDialog, QVBoxLayout,
-    QHBoxLayout, QSpinBox, QLabel, QFormLayout, QMessageBox, QWidget, QSizePolicy, QHeaderView, QFrame, 
+    QHBoxLayout, QSpinBox, QLabel, QFormLayout, QMessageBox, QSizePolicy, QHeaderView, QFrame, 
 )
-from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtCore import QSize, Qt, QTimer
+from PyQt5.QtWidgets import QTableView
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5 import uic
 import mysql.connector
 import sys  
 from customer_review_window import OrderWindow  
-from data201 import make_connection
+from data201 import cached_query
+from query_runner import QueryRunner
+from checkout import place_order, OutOfStockError
+from shopping_cart import Cart
+from stock_holds import hold_stock, release_holds
+from product_catalog import (read_catalog_config, ProductTableModel, PagedProductTableModel,
+                             AddToCartDelegate, ADD_TO_CART_COLUMN)
+from catalog_snapshot import open_catalog, fetch_catalog_changes, save_snapshot, database_source
 import os
 from shared import open_login_portal
-from datetime import datetime, timedelta
 
 
 class CheckoutWindow(QDialog):
@@ -100,12 +108,7 @@ class CartWindow(QDialog):
     checking out, updating quantities, and closing the cart window.
     
     Input:
-        - cart_items (list): A list of cart items, where each item is a tuple containing:
-            - product_id (int)
-            - category (str)
-            - description (str)
-            - price (str, includes '$' symbol)
-            - quantity (int)
+        - cart (Cart): The customer's cart, keyed by product ID, with Decimal unit prices.
         - customer_id (int): The ID of the customer viewing the cart.
         - main_window (QMainWindow): The main window from which the cart window is opened.
     
@@ -114,9 +117,9 @@ class CartWindow(QDialog):
           proceed to checkout, and close the cart.
     """
     
-    def __init__(self, cart_items, customer_id, main_window):
+    def __init__(self, cart, customer_id, main_window):
         super().__init__()
-        self.cart_items = cart_items  # List of cart items
+        self.cart = cart  # The cart, shared with the main window
         self.main_window = main_window  # Main window reference
         self.customer_id = customer_id  # Customer ID
         self.resize(800, 600)  # Set the default size for the CartWindow
@@ -221,12 +224,7 @@ class CartWindow(QDialog):
         
         Input:
             - layout (QVBoxLayout): The layout to which the cart table and buttons will be added.
-            - cart_items (list): A list of cart items, where each item is a list or tuple containing:
-                - Product ID (str or int)
-                - Category (str)
-                - Description (str)
-                - Price (float or int)
-                - Quantity (int)
+            - cart (Cart): The cart lines to show.
             
         Output:
             - QTableWidget: Displays cart items with columns for Product ID, Category, Description, Price, Quantity, and Delete.
@@ -261,24 +259,27 @@ class CartWindow(QDialog):
         self.table.setColumnWidth(5, 100)  # Set width for Delete column
 
         # Populate the table with cart items
-        self.table.setRowCount(len(self.cart_items))  # Set the number of rows based on the cart items
+        self.table.setRowCount(len(self.cart))  # Set the number of rows based on the cart lines
         self.spin_boxes = []  # List to store spin boxes for quantity updates
-        for row_index, item in enumerate(self.cart_items):  # Loop through each item in the cart
+        self.row_ids = []  # The product ID shown in each row
+        for row_index, line in enumerate(self.cart):  # Loop through each line in the cart
             # Set item details in the respective columns
-            for col_index, value in enumerate(item[:4]):
+            for col_index, value in enumerate((line.product_id, line.category, line.description, line.price_label)):
                 self.table.setItem(row_index, col_index, QTableWidgetItem(str(value)))  # Set value in first four columns
 
             # Create a QSpinBox for the quantity and set it in the Quantity column
             spin_box = QSpinBox()
             spin_box.setMinimum(1)  # Set the minimum quantity to 1
-            spin_box.setValue(item[4] if len(item) > 4 else 1)  # Set initial value based on item quantity
-            spin_box.valueChanged.connect(lambda value, r=row_index: self.update_quantity(r, value))  # Connect the quantity change event to update_quantity method
+            spin_box.setValue(line.quantity)  # Set initial value based on item quantity
+            # The handlers are bound to the product, so they stay right when rows above are deleted
+            spin_box.valueChanged.connect(lambda value, p=line.product_id: self.update_quantity(p, value))
             self.table.setCellWidget(row_index, 4, spin_box)  # Place the spin box in the Quantity column
             self.spin_boxes.append(spin_box)  # Store spin box for future reference
+            self.row_ids.append(line.product_id)
 
             # Create a Delete button and connect it to the delete_item method
             delete_button = QPushButton("Delete")
-            delete_button.clicked.connect(lambda _, r=row_index: self.delete_item(r))  # Connect delete event to delete_item method
+            delete_button.clicked.connect(lambda _, p=line.product_id: self.delete_item(p))  # Connect delete event to delete_item method
             self.table.setCellWidget(row_index, 5, delete_button)  # Place the Delete button in the last column
 
         # Create a layout for buttons (Total Price, Check Out, Save, Close)
@@ -314,21 +315,15 @@ class CartWindow(QDialog):
         """Update the total price label with the sum of all items in the cart.
         
         Input:
-            - cart_items (list): A list of cart items, where each item is expected to be a list or tuple containing:
-                - Product ID (str or int)
-                - Category (str)
-                - Description (str)
-                - Price (str, including '$' symbol)
-                - Quantity (int)
+            - cart (Cart): The cart, which keeps its subtotal as lines change.
 
         Output:
-            - The total price is calculated by summing the product of price and quantity for each item.
-            - The total price label is updated to reflect the calculated value.
+            - The total price label is updated to reflect the cart's subtotal.
             - The label's text color is set to dark pink and font size to 16px.
         """
         
-        # Calculate the total price by summing the price multiplied by quantity for each item
-        total_price = sum(float(item[3].replace('$', '')) * item[4] for item in self.cart_items)
+        # The cart keeps its subtotal current
+        total_price = self.cart.subtotal
         
         # Update the total price label with the formatted value
         self.total_label.setText(f"Total Price: ${total_price:.2f}")
@@ -342,73 +337,98 @@ class CartWindow(QDialog):
         self.setMinimumSize(700, 500) # Set the minimum window size to 700x500 pixels
 
 
-    def update_quantity(self, row_index, value):
+    def update_quantity(self, product_id, value):
         """
         Update the quantity of an item in the cart and recalculate the total price.
         
         Input:
-            - row_index (int): The index of the cart item whose quantity is being updated.
-            - value (int): The new quantity value to set for the item at the specified row_index.
+            - product_id (str): The product whose quantity is being updated.
+            - value (int): The new quantity of the product.
         
         Output:
-            - cart_items (list): The cart item at row_index is updated with the new quantity value.
-            - Total Price (float): The total price of the cart is recalculated and updated.
-            - Error message (str, if applicable): If row_index is out of range, an error message is printed.
+            - cart (Cart): The product's line is updated with the new quantity value.
+            - Total Price (Decimal): The cart's subtotal is adjusted and shown.
+            - Error message (str, if applicable): If the product is not in the cart, an error message is printed.
         """
         
-        if 0 <= row_index < len(self.cart_items):  # Check if the row_index is within the valid range
-            self.cart_items[row_index] = (*self.cart_items[row_index][:4], value)  # Update the quantity of the item at the given row index
-            self.update_total_price()  # Recalculate and update the total price after the quantity change
+        if product_id in self.cart:  # Check that the product is still in the cart
+            self.cart.set_quantity(product_id, value)  # Update the quantity; the cart adjusts its totals
+            self.update_total_price()  # Show the new total price after the quantity change
+            self.main_window.hold_cart_line(product_id)  # Hold the new quantity of the product
         else:
-            print(f"Error: row_index {row_index} is out of range.")  # Print an error message if the row_index is out of range
+            print(f"Error: product {product_id} is not in the cart.")  # Print an error message if the product is gone
 
-    def delete_item(self, row_index):
+    def delete_item(self, product_id):
         """
         Delete an item from the cart and update the cart display and total price.
         
         Input:
-            - row_index (int): The index of the cart item to be deleted.
+            - product_id (str): The product to be deleted.
         
         Output:
-            - cart_items (list): The cart item at row_index is removed from the cart.
+            - cart (Cart): The product's line is removed from the cart.
             - Table Row (QTableWidget): The row corresponding to the deleted item is removed from the table.
             - spin_boxes (list): The spin box corresponding to the deleted item is removed from the list.
             - Cart Count and Total Price: The cart item count and total price are updated.
             - Console Output (str): A message is printed showing the deleted item and the updated cart.
         """
         
-        if row_index < len(self.cart_items):  # Check if the row_index is valid
-            del self.cart_items[row_index]   # Remove the item from the cart
+        if product_id in self.cart:  # Check that the product is still in the cart
+            row_index = self.row_ids.index(product_id)  # The product's row in the table
+            line = self.cart.remove(product_id)   # Remove the item from the cart
             self.table.removeRow(row_index)  # Remove the corresponding row from the table
             del self.spin_boxes[row_index]  # Remove the corresponding spin box
+            del self.row_ids[row_index]
             self.update_cart_count()        # Update the cart item count
-            self.update_total_price()       # Recalculate and update the total price
-            print(f"Deleted item at row {row_index}. Updated cart: {self.cart_items}")  # Print the updated cart
+            self.update_total_price()       # Show the new total price
+            self.main_window.hold_cart_line(product_id)  # Release the product's hold
+            print(f"Deleted {line}. Updated cart: {self.cart}")  # Print the updated cart
 
 
+    def show_quantity(self, product_id):
+        """
+        Show the cart's quantity of a product after it was changed elsewhere, e.g.
+        lowered to the units that could be held.
+
+        Input:
+            - product_id (str): The product whose quantity changed.
+
+        Output:
+            - Table Row (QTableWidget): The product's spin box shows its quantity, or its row is
+              removed if it is no longer in the cart.
+            - Total Price: The total price label is updated.
+        """
+        if product_id not in self.row_ids:
+            return
+        row_index = self.row_ids.index(product_id)
+        line = self.cart.get(product_id)
+        if line is None:
+            self.table.removeRow(row_index)
+            del self.spin_boxes[row_index]
+            del self.row_ids[row_index]
+        else:
+            spin_box = self.spin_boxes[row_index]
+            spin_box.blockSignals(True)  # The cart already has the quantity; do not hold it again
+            spin_box.setValue(line.quantity)
+            spin_box.blockSignals(False)
+        self.update_total_price()
+
     def update_cart_count(self):
         """
         Update the cart count and the cart button text based on the total quantity of items in the cart.
         
         Input:
-            - cart_items (list): A list of cart items, where each item is expected to be a list or tuple containing:
-                - Product ID (str or int)
-                - Category (str)
-                - Description (str)
-                - Price (float or int)
-                - Quantity (int)
+            - cart (Cart): The cart, which keeps its item count as lines change.
         
         Output:
-            - cart_count (int): The total number of items in the cart (sum of quantities).
             - Cart Button Text: The cart button text is updated to show the current item count.
             - Console Output (str): A message is printed showing the updated cart item count.
         """
         
-        # Calculate the total quantity of items in the cart by summing the quantity of each item
-        total_items = sum(item[4] for item in self.cart_items)
+        # The total quantity of items in the cart
+        total_items = self.cart.count
         
-        # Update the cart count in the main window and update the cart button text
-        self.main_window.cart_count = total_items  # Update the cart count in the main window
+        # Update the cart button text in the main window
         self.main_window.cart_button.setText(f"Cart ({total_items})")  # Update the cart button's label
         
         print(f"Cart updated to {total_items} items.") # Print the updated cart count to the console
@@ -419,22 +439,17 @@ class CartWindow(QDialog):
         Update the total price label based on the items in the cart.
         
         Input:
-            - cart_items (list): A list of cart items, where each item is expected to be a list or tuple containing:
-                - Product ID (str or int)
-                - Category (str)
-                - Description (str)
-                - Price (str) (includes the '$' symbol)
-                - Quantity (int)
+            - cart (Cart): The cart, which keeps its subtotal as lines change.
         
         Output:
-            - total_price (float): The total price of all items in the cart (calculated as the sum of price * quantity for each item).
-            - Total Price Label: The total price label (`self.total_label`) is updated with the calculated total price, formatted to two decimal places.
+            - total_price (Decimal): The total price of all items in the cart (the sum of price * quantity for each item).
+            - Total Price Label: The total price label (`self.total_label`) is updated with the total price, formatted to two decimal places.
             - Console Output (str, if applicable): If an error occurs, an error message is printed, and the label is updated with the calculated value (if possible).
         """
         
         try:
-            # Calculate the total price by summing the product of price (after removing '$') and quantity for each item
-            total_price = sum(float(item[3].replace('$', '')) * item[4] for item in self.cart_items)
+            # The cart keeps its subtotal current, so no line is added up again
+            total_price = self.cart.subtotal
             
             # Update the total price label with the formatted value
             self.total_label.setText(f"Total: ${total_price:.2f}")
@@ -451,134 +466,55 @@ class CartWindow(QDialog):
         
         Input:
             - spin_boxes (list): A list of QSpinBox widgets used for updating the quantity of items in the cart.
-            - cart_items (list): A list of cart items, where each item is expected to be a list or tuple containing:
-                - Product ID (str or int)
-                - Category (str)
-                - Description (str)
-                - Price (float or int)
-                - Quantity (int)
+            - cart (Cart): The cart shared with the main window.
         
         Output:
-            - cart_items (list): The cart items are updated with the new quantities from the spin boxes.
-            - cart_count (int): The cart item count is updated.
-            - Console Output (str): A message is printed showing the updated cart items.
-            - Cart Data: The updated cart items are saved in the `main_window.cart_items`.
+            - cart (Cart): The cart lines are updated with the quantities from the spin boxes.
+            - Cart Button Text: The cart item count is updated.
+            - Console Output (str): A message is printed showing the updated cart.
             - Window Closure: The current window is closed after saving the changes.
         """
         
-        # Loop through each spin box to update the quantity for each cart item
-        for i, spin_box in enumerate(self.spin_boxes):
-            quantity = spin_box.value()  # Get the new quantity from the spin box
-            self.cart_items[i] = (*self.cart_items[i][:4], quantity)  # Update the cart item with the new quantity
+        # Loop through each spin box to update the quantity for each cart line
+        for product_id, spin_box in zip(self.row_ids, self.spin_boxes):
+            if self.cart.get(product_id).quantity != spin_box.value():
+                self.cart.set_quantity(product_id, spin_box.value())  # Update the cart line with the new quantity
+                self.main_window.hold_cart_line(product_id)  # Hold the new quantity of the product
 
-        self.main_window.cart_items = self.cart_items # Save the updated cart items to the main window
         self.update_cart_count()  # Update the cart count to reflect the changes
-        print(f"Saved updated cart items: {self.cart_items}") # Print the updated cart items to the console for verification
+        print(f"Saved updated cart: {self.cart}") # Print the updated cart to the console for verification
         self.close()
 
 
-    def get_seller_id(self, product_id):
-        """
-        Retrieve seller_id for a given product_id from the database.
-        
-        Input:
-            - product_id (int or str): The product ID for which the seller ID needs to be retrieved.
-        
-        Output:
-            - seller_id (int or None): The seller ID associated with the given product ID, or None if no seller is found.
-            - Console Output (str, if applicable): If an error occurs, an error message is printed to the console.
-        """
-        
-        try:
-            # SQL query to retrieve the seller_id from the product_stock table using product_id
-            query = """
-                SELECT seller_id FROM product_stock WHERE product_id = %s
-            """
-            self.cursor.execute(query, (product_id,)) # Execute the query with the given product_id
-            result = self.cursor.fetchone() # Fetch the result (if any)
-            return result[0] if result else None  # Return the seller_id if found, otherwise return None
-        
-        except Exception as e:
-            # Print an error message if an exception occurs
-            print(f"Error retrieving seller_id for product_id {product_id}: {e}")
-            return None
-
-
     def check_out(self):
         """
-        Process the checkout, insert the order into the database, update the stock, and handle the payment.
+        Place the order: insert it into the database, update the stock, and record the payment.
         
         Input:
-            - cart_items (list): A list of cart items, where each item is a tuple containing:
-                - product_id (int)
-                - category (str)
-                - description (str)
-                - price (str, includes '$' symbol)
-                - quantity (int)
+            - cart (Cart): The cart lines (product, Decimal unit price, quantity) and their subtotal.
             - customer_id (int): The ID of the customer placing the order.
         
         Output:
             - order_id (int): A new order ID is generated and used to insert a new order.
-            - Database Changes: New records are inserted into `orders`, `order_items`, and `order_payments` tables.
+            - Database Changes: New records are inserted into `orders`, `order_items`, and `order_payments` tables
+              and the stock is decremented, with the same few statements for any number of lines.
             - Cart Update: Cart is cleared after the order is placed.
             - QMessageBox: A confirmation message is displayed, or an error message is shown if something goes wrong.
         """
         
-        # Establish a connection to the database and create a cursor
-        self.connection = make_connection(config_file='sqlproject.ini')
-        self.cursor = self.connection.cursor()
         print(f"Customer ID passed through: {self.customer_id}")
 
+        # Check if cart is empty
+        if not self.cart:  # If the cart is empty, show a warning and return
+            QMessageBox.warning(self, "Empty Cart", "Your cart is empty. Please add items before checking out.")
+            return
+
         try:
-            # Get today's date and calculate the shipping limit date
-            today = datetime.now()  # Get the current date and time
-            shipping_date = today + timedelta(days=7)  # Calculate the shipping limit date (7 days from today)
-
-            # Retrieve the current maximum order_id and generate a new order_id
-            order_id_query = "SELECT MAX(order_id) FROM orders"  # Query to get the highest order_id
-            self.cursor.execute(order_id_query)
-            max_order_id = self.cursor.fetchone()[0]  # Fetch the result of the query
-            new_order_id = (max_order_id + 1) if max_order_id else 1  # If there's an order already, increment; otherwise, start from 1
-
-            # Insert the order into the orders table
-            order_query = """
-                INSERT INTO orders (order_id, customer_id, order_status, order_purchase_timestamp, order_approved_at, 
-                                    order_delivered_carrier_date, order_delivered_customer_date, order_estimated_delivery_date)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            self.cursor.execute(order_query, (new_order_id, self.customer_id, 'in progress',
-                                            today.strftime('%Y-%m-%d %H:%M:%S'), None, None, None, None))
-            
-            total_price = 0 # Initialize total_price
-
-            # Check if cart is empty
-            if not self.cart_items:  # If the cart is empty, show a warning and return
-                QMessageBox.warning(self, "Empty Cart", "Your cart is empty. Please add items before checking out.")
-                return
-
-            # Insert order items into the order_items table
-            for item in self.cart_items:
-                product_id, category, description, price, quantity = item
-
-                # Calculate total price for the order
-                total_price += float(price.replace('$', '')) * quantity  # Remove the '$' symbol and calculate total price
-
-                # Update stock and insert order items
-                self.update_stock_quantity(product_id, self.get_stock_quantity(product_id) - quantity)  # Update stock after the order
-                seller_id = self.get_seller_id(product_id)  # Retrieve the seller ID for the product
-                query = """
-                    INSERT INTO order_items (order_id, product_id, seller_id, shipping_limit_date, freight_value, quantity)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """
-                self.cursor.execute(query, (new_order_id, product_id, seller_id, shipping_date, 0.0, quantity))
-
-            # Insert payment information into the order_payments table
-            payment_query = """
-                INSERT INTO order_payments (order_id, payment_type, payment_installments, payment_value)
-                VALUES (%s, %s, %s, %s)
-            """
-            self.cursor.execute(payment_query, (new_order_id, 'credit_card', 1, total_price))  # Assume payment is by credit card
-            self.connection.commit() 
+            # One transaction writes the order, its items, the stock and the payment
+            # The units the cart holds are counted as available to it, and its holds are released
+            new_order_id, total_price = place_order(
+                self.customer_id, [(line.product_id, line.quantity, line.unit_price) for line in self.cart],
+                config_file='sqlproject.ini', cart_id=self.cart.cart_id)
 
             # Clear the cart and notify the user
             self.clear_cart()  # Clear the cart after the order is placed
@@ -588,86 +524,37 @@ class CartWindow(QDialog):
             if self.main_window.order_window and self.main_window.order_window.isVisible():
                 self.main_window.order_window.populate_orders()
 
+        except OutOfStockError as e:
+            # Nothing was written; the customer can lower the quantities and try again
+            QMessageBox.warning(self, "Out of Stock", f"{e}. Please lower the quantity or remove the product.")
+
         except Exception as e:
-            # Rollback the transaction if an error occurs and display an error message
-            self.connection.rollback()
+            # Nothing was written; display an error message
             print(f"Error during checkout: {e}")
             QMessageBox.critical(self, "Error", f"Failed to place order: {e}")
 
-        finally:
-            self.cursor.close()
-            self.connection.close()
-
-
-    def get_stock_quantity(self, product_id):
-        """
-        Retrieve the available stock quantity for a given product_id from the database.
-        
-        Input:
-            - product_id (int or str): The product ID for which the stock quantity is needed.
-        
-        Output:
-            - stock_quantity (int or None): The available stock quantity for the given product ID, or None if not found.
-            - Console Output (str, if applicable): If an error occurs, an error message is printed to the console.
-        """
-        
-        try:
-            # SQL query to retrieve the stock quantity from the product_stock table using product_id
-            query = """
-                SELECT stock FROM product_stock WHERE product_id = %s
-            """
-            self.cursor.execute(query, (product_id,))  # Execute the query with the given product_id
-            result = self.cursor.fetchone() # Fetch the result of the query (stock quantity)
-            return result[0] if result else None # Return the stock quantity if found, otherwise return None
-        
-        except Exception as e:
-            print(f"Error retrieving stock quantity for product_id {product_id}: {e}")
-            return None
-
-
-    def update_stock_quantity(self, product_id, new_quantity):
-        """
-        Update the stock quantity for a given product_id after the order is placed.
-        
-        Input:
-            - product_id (int or str): The product ID for which the stock quantity needs to be updated.
-            - new_quantity (int): The new stock quantity for the product after the update.
-        
-        Output:
-            - Database Update: The stock quantity for the given product_id is updated in the database.
-            - Console Output (str, if applicable): If an error occurs, an error message is printed to the console.
-        """
-        
-        try:
-            # SQL query to update the stock quantity for the given product_id
-            query = """
-                UPDATE product_stock
-                SET stock = %s
-                WHERE product_id = %s
-            """
-            self.cursor.execute(query, (new_quantity, product_id)) # Execute the query with the new stock quantity and product_id
-        
-        except Exception as e:
-            print(f"Error updating stock quantity for product_id {product_id}: {e}")
-            raise 
 
     def clear_cart(self):
         """
         Clear all items from the cart, reset the cart table, and update the cart count and total price.
         
         Input:
-            - cart_items (list): A list of cart items that will be cleared.
+            - cart (Cart): The cart that will be cleared.
             - table (QTableWidget): The table displaying the cart items, which will be reset.
         
         Output:
-            - cart_items (list): The cart is cleared (emptied).
+            - cart (Cart): The cart is cleared (emptied).
             - table (QTableWidget): The cart table row count is set to 0, effectively clearing it.
-            - cart_count (int): The cart count is updated to reflect the empty cart.
-            - total_price (float): The total price label is updated to reflect the cleared cart.
+            - Cart Button Text: The cart count is updated to reflect the empty cart.
+            - total_price (Decimal): The total price label is updated to reflect the cleared cart.
             - Console Output (str): A message is printed to the console indicating that the cart has been cleared.
         """
-        self.cart_items.clear()  # Empty the cart_items list
+        # Stock holds not yet placed are dropped; one already running expires after its ttl
+        self.main_window.query_runner.cancel_all(prefix="hold:")
+        self.cart.clear()  # Empty the cart, under a new cart ID
         self.table.setRowCount(0)  # Reset the cart table by setting the row count to 0 (removes all displayed rows)
+        self.spin_boxes.clear()
+        self.row_ids.clear()
         self.update_cart_count()  # Update the cart count to 0
         self.update_total_price()  # Update the total price label to reflect the empty cart
      
@@ -702,8 +589,25 @@ class CustomerHome(QMainWindow):
         uic.loadUi("customer_home.ui", self)
         
         self.customer_id = customer_id
-        # Cache data
-        self.cached_data = []
+        # Runs the product load off the GUI thread
+        self.query_runner = QueryRunner(self)
+        # Cache data; the table model shows the filtered rows of the catalog.
+        # Large catalogs are paged from the server instead of cached whole.
+        self.cached_data = None
+        catalog_settings = read_catalog_config('sqlproject.ini')
+        self.paged_catalog = catalog_settings['mode'] == 'paged'
+        if self.paged_catalog:
+            self.product_model = PagedProductTableModel(
+                self.query_runner, 'sqlproject.ini', page_size=catalog_settings['page_size'],
+                cache_pages=catalog_settings['cache_pages'], parent=self)
+        else:
+            self.product_model = ProductTableModel(self)
+        # The cached catalog is kept in a snapshot file between runs and
+        # brought up to date with the changed products every sync_interval seconds.
+        self.catalog_snapshot = catalog_settings['snapshot']
+        self.catalog_sync_timer = QTimer(self)
+        self.catalog_sync_timer.setInterval(catalog_settings['sync_interval'] * 1000)
+        self.catalog_sync_timer.timeout.connect(self.sync_catalog)
         # Load data into cache
         self.load_data()
 
@@ -718,7 +622,7 @@ class CustomerHome(QMainWindow):
         self.adjustSize()
 
         # Access widgets
-        self.table_view = self.findChild(QTableWidget, "tableView")
+        self.table_view = self.findChild(QTableView, "tableView")
         self.sort_combo = self.findChild(QComboBox, "comboBox")
         self.category_combo = self.findChild(QComboBox, "comboBox_2")
         self.search_bar = self.findChild(QLineEdit, "lineEdit")
@@ -742,8 +646,7 @@ class CustomerHome(QMainWindow):
         if not self.user_button:
             raise RuntimeError("The User button (toolButton) was not found in the UI file.")
 
-        self.cart_items = []  # Initialize cart items
-        self.cart_count = 0  # Initialize cart count
+        self.cart = Cart()  # Cart lines keyed by product ID, with a running subtotal and item count
 
         # Populate sorting options
         self.sort_combo.addItems(["Price: High to Low", "Price: Low to High"])
@@ -774,34 +677,83 @@ class CustomerHome(QMainWindow):
         self.order_window = None  # Track the order window
 
 
-    def load_data(self):
+    def load_data(self, reload = False):
         """
-        Load data from the database into a local cache.
+        Load data from the snapshot file or the database into a local cache.
+        The loading and the building of the search index run in the background;
+        the table is refreshed when the catalog arrives.
 
         Input:
-            - None (fetches data from the database to load into the cache)
+            - reload (bool): Load the whole catalog from the database even if there is a snapshot.
 
         Output:
-            - cached_data (list): A list of tuples containing the product data (product_id, product_category, product_description, product_price).
+            - cached_data (ProductCatalog): The product data (product_id, product_category, product_description, product_price) and its search index.
+              In paged mode nothing is cached here; the table model fetches pages as they are shown.
             - Console Output (str, if applicable): If a database error occurs, an error message is printed to the console.
         """
-        try:
-            # Establish a connection to the database using the provided configuration file
-            conn = make_connection(config_file='sqlproject.ini')
-            cursor = conn.cursor()
-
-            # SQL query to fetch product data (product_id, product_category, product_description, product_price)
-            query = """
-                SELECT product_id, product_category, product_description, CONCAT('$', FORMAT(product_price, 2)) AS product_price
-                FROM products
-            """
-            cursor.execute(query)  
-            self.cached_data = cursor.fetchall()
-            cursor.close()
-            conn.close()
+        if self.paged_catalog:
+            return
+
+        self.query_runner.submit(
+            "products", open_catalog, self.catalog_snapshot, config_file='sqlproject.ini', reload=reload,
+            on_result=self._on_products_loaded,
+            on_error=lambda err: print(f"Database error: {err}")
+        )
+
+    def _on_products_loaded(self, result):
+        """Store the loaded catalog in the cache, redraw the table and start syncing it."""
+        catalog, from_snapshot = result
+        self.cached_data = catalog
+        self.product_model.set_catalog(catalog)
+        self.apply_filters()
+
+        if from_snapshot:
+            # The snapshot may be behind the database
+            self.sync_catalog()
+        if self.catalog_sync_timer.interval() > 0:
+            self.catalog_sync_timer.start()
+
+    def sync_catalog(self):
+        """
+        Fetch the products changed since the cached catalog's version in the background.
 
-        except mysql.connector.Error as err:
-            print(f"Database error: {err}")
+        Output:
+            - The changes are applied to the cache by _on_catalog_changes.
+        """
+        if self.cached_data is None or self.query_runner.is_pending("products"):
+            return
+
+        self.query_runner.submit(
+            "catalog_changes", fetch_catalog_changes, self.cached_data.version, config_file='sqlproject.ini',
+            on_result=self._on_catalog_changes,
+            on_error=lambda err: print(f"Database error: {err}")
+        )
+
+    def _on_catalog_changes(self, result):
+        """
+        Apply the changed products to the cached catalog and redraw the table.
+
+        Input:
+            - result (tuple): The number of products in the database, its data version and the changed rows.
+        """
+        count, version, rows = result
+        if self.cached_data.apply_changes(rows, version):
+            self.apply_filters()
+
+        # A count that differs from the cache's means that products were deleted,
+        # which leaves no timestamp behind, so the whole catalog is loaded again.
+        if count != len(self.cached_data):
+            self.load_data(reload=True)
+
+    def save_catalog_snapshot(self):
+        """Save the cached catalog to the snapshot file if changes were applied to it since it was loaded."""
+        if self.cached_data is None or not self.cached_data.changed or not self.catalog_snapshot:
+            return
+        try:
+            save_snapshot(self.cached_data, self.catalog_snapshot, database_source('sqlproject.ini'))
+            self.cached_data.changed = False
+        except OSError as e:
+            print(f"Could not save the catalog snapshot: {e}")
 
     def refresh_order_history(self):
         """Refresh the order history in the order window."""
@@ -846,12 +798,16 @@ class CustomerHome(QMainWindow):
         # Disable user adjustments for column resizing
         header.setSectionsClickable(False)
 
-        # Set the number of rows in the table to 0 (initially empty)
-        self.table_view.setRowCount(0)
+        # Show the product model; the "Add to Cart" column is painted by a delegate
+        self.table_view.setModel(self.product_model)
+        self.add_to_cart_delegate = AddToCartDelegate(self.table_view)
+        self.add_to_cart_delegate.add_clicked.connect(self.add_to_cart)
+        self.table_view.setItemDelegateForColumn(ADD_TO_CART_COLUMN, self.add_to_cart_delegate)
+        self.table_view.setMouseTracking(True)  # Repaint the button under the mouse
 
-        # Set column headers
-        self.table_view.setColumnCount(5)  # Define 5 columns for the table
-        self.table_view.setHorizontalHeaderLabels(["Product ID", "Category", "Description", "Price", "Add to Cart"])
+        # Every row has the height of the button plus a 10 pixel buffer, so no row needs measuring
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(AddToCartDelegate.BUTTON_SIZE + 20)
 
         # Explicitly set the width of each column
         self.table_view.setColumnWidth(0, 100)  # Set width for Product ID column
@@ -959,16 +915,11 @@ class CustomerHome(QMainWindow):
         """
         
         try:
-            conn = make_connection(config_file='sqlproject.ini')
-            cursor = conn.cursor()
-
             # SQL query to fetch distinct product categories from the products table
             query = "SELECT DISTINCT product_category FROM products"
 
-            cursor.execute(query)  
-            categories = cursor.fetchall() 
-            cursor.close()
-            conn.close()
+            # The category list rarely changes, so serve it from the query cache
+            categories = cached_query(query, ttl=300, config_file='sqlproject.ini')
 
             self.category_combo.addItem("All Categories") # Add a default item "All Categories" to the combo box
             
@@ -981,92 +932,19 @@ class CustomerHome(QMainWindow):
 
 
     def populate_table_view(self, order_by="DESC", category=None, search_query=None):
-        """Populate the table view using cached data."""
-        
-        # Initialize layout for the table view
-        layout = QVBoxLayout(self)
-        results = self.cached_data  # Use the cached data to populate the table
-        button_height = 30  # Height of the button (same as set for the button)
-        
-        # Loop through the data and insert rows into the table
-        for row_index, row_data in enumerate(results):
-            self.table_view.insertRow(row_index)  # Insert a new row at the given index
-            
-            # Populate the row with data from cached_data
-            for col_index, value in enumerate(row_data):
-                self.table_view.setItem(row_index, col_index, QTableWidgetItem(str(value)))  # Set cell data
-        
-        # Apply category filter (if specified)
-        if category and category != "All Categories":
-            results = [row for row in results if row[1] == category]  # Filter by category
-        
-        # Apply search query filter (if specified)
-        if search_query:
-            search_query = search_query.lower()  # Convert search query to lowercase for case-insensitive comparison
-            results = [
-                row for row in results if
-                search_query in str(row[0]).lower() or
-                search_query in str(row[1]).lower() or
-                search_query in str(row[2]).lower() or
-                search_query in str(row[3]).lower()
-            ]
-
-        # Sort results based on price (column 3) in the specified order (ascending or descending)
-        reverse = order_by == "DESC"
-        results.sort(key=lambda x: x[3], reverse=reverse)  # Sort by price (column 3)
-
-        # Reset the table and repopulate it with the filtered and sorted data
-        self.table_view.setRowCount(0)  # Clear the existing rows
-        for row_index, row_data in enumerate(results):
-            self.table_view.insertRow(row_index)  # Insert a new row
-            
-            # Populate each row with the filtered and sorted data
-            for col_index, value in enumerate(row_data):
-                self.table_view.setItem(row_index, col_index, QTableWidgetItem(str(value)))  # Set the table cell value
-
-            # Create the "Add to Cart" button for the current row
-            add_to_cart_button = QPushButton("+")
-            add_to_cart_button.setFixedSize(20, 20)  # Adjust button size
-            add_to_cart_button.setToolTip("Add to Cart")  # Tooltip for the button
-            # Apply the button's style
-            add_to_cart_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #FFC0CB;  /* Pink background */
-                    color: white;
-                    font-weight: bold;
-                    border: 1px solid #FF69B4; /* Hot pink border */
-                    border-radius: 5px;
-                    padding: 0 5px;
-                }
-                QPushButton:hover {
-                    background-color: #FF69B4;  /* Darker pink on hover */
-                }
-                QPushButton:pressed {
-                    background-color: #FF69B4;  /* Hot pink when pressed */
-                    border: 1px solid #FF69B4;
-                }
-                QPushButton:focus {
-                    outline: none;  /* Remove blue focus outline */
-                }
-            """)
-            add_to_cart_button.clicked.connect(lambda _, r=row_data, button=add_to_cart_button: self.add_to_cart(r, button))
-            
-            # Create a layout to center the button
-            button_layout = QHBoxLayout()
-            button_layout.setAlignment(Qt.AlignCenter)  # Center the button within the cell
-            button_layout.addWidget(add_to_cart_button)
-
-            # Create a QWidget to hold the button layout and set it in the table cell
-            button_widget = QWidget()
-            button_widget.setLayout(button_layout)
-
-            # Set the button widget in the 5th column (index 4) of the current row
-            self.table_view.setCellWidget(row_index, 4, button_widget)
+        """
+        Show the cached products that match the filters, ordered by price.
 
-            # Set row height to fit the button (button_height or slightly larger)
-            self.table_view.setRowHeight(row_index, button_height + 10)  # Adding 10 pixels as buffer for the button height
+        Input:
+            - order_by (str): "DESC" for high to low prices, "ASC" for low to high.
+            - category (str): The selected category, or "All Categories".
+            - search_query (str): Text that a product's fields must contain.
 
-        layout.addWidget(self.table_view)  # Add the table view to the layout
+        Output:
+            - product_model (ProductTableModel): Shows the matching rows; the view
+              only creates and paints the rows that are visible.
+        """
+        self.product_model.apply_filter(category, search_query, descending=(order_by == "DESC"))
 
 
     def apply_filters(self):
@@ -1081,71 +959,82 @@ class CustomerHome(QMainWindow):
         self.populate_table_view(order_by=order_by, category=selected_category, search_query=search_query)
 
 
-    def add_to_cart(self, row_data, button):
+    def add_to_cart(self, row):
         """
         Add an item to the cart or update its quantity if it's already in the cart.
         
         Input:
-            - row_data (tuple): The data for the product being added (product_id, category, description, price).
-            - button (QPushButton): The "Add to Cart" button associated with the product.
+            - row (int): The table row whose "Add to Cart" button was clicked.
         
         Output:
-            - cart_items (list): The cart items are updated with the new or modified item.
-            - cart_count (int): The total number of items in the cart is updated.
+            - cart (Cart): The product's line is added, or its quantity increased by 1.
             - cart_button (QPushButton): The cart button's label is updated to reflect the total number of items.
-            - Console Output (str): The cart contents are printed to the console.
-            - Button Style Update: The button's color toggles between pink and hot pink.
+            - Console Output (str): The product's cart line is printed to the console.
+            - Button Style Update: The row's button is painted hot pink once its product is in the cart.
         """
-        
-        # Check if the item is already in the cart
-        for i, item in enumerate(self.cart_items):
-            if item[:4] == row_data:  # If the item is already in the cart, update its quantity
-                self.cart_items[i] = (*item[:4], item[4] + 1)  # Increment the quantity by 1
-                print(f"Updated quantity for item: {self.cart_items[i]}")  # Log the updated item
-                break
-        else:
-            # If the item is not in the cart, add it with an initial quantity of 1
-            self.cart_items.append((*row_data, 1))
-            print(f"Added new item to cart: {row_data}")  # Log the added item
-
-        # Update the cart count by summing the quantities of all items
-        self.cart_count = sum(item[4] for item in self.cart_items)
-        self.cart_button.setText(f"({self.cart_count})")  # Update the cart button label
-        print(f"Current cart items: {self.cart_items}")  # Log the current cart contents
-
-        # Toggle the button's color between pink and hot pink based on its current state
-        current_style = button.styleSheet()
-
-        # If the button is currently pink, change it to hot pink (indicating it's been clicked)
-        if "background-color: #FFC0CB" in current_style:  # If the button is pink
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #FFC0CB; /* Pink button */
-                    color: white;
-                    font-weight: bold;
-                    border: 1px solid #FF69B4; /* Hot pink border */
-                    border-radius: 5px;
-                    padding: 0 5px;
-                }
-                QPushButton:hover {
-                    background-color: #FF69B4; /* Hot pink on hover */
-                }
-            """)  # Reset to normal pink with hover effect
-        else:
-            # Change it to a darker hot pink when clicked
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #FF69B4; /* Hot pink button */
-                    color: white;
-                    font-weight: bold;
-                    border: 1px solid #FF69B4; /* Hot pink border */
-                    border-radius: 5px;
-                    padding: 0 5px;
-                }
-                QPushButton:hover {
-                    background-color: #FF69B4;  /* Hot pink on hover */
-                }
-            """)  # Change to hot pink with hover effect
+        # The data for the product being added (product_id, category, description, price)
+        row_data = self.product_model.product(row)
+        if row_data is None:
+            return  # The row's page was evicted and is being fetched again
+
+        # Add the product, or increase its quantity by 1 if it is already in the cart
+        line = self.cart.add(*row_data)
+        print(f"Cart line: {line}")  # Log the added or updated line
+
+        # The cart keeps its item count current
+        self.cart_button.setText(f"({self.cart.count})")  # Update the cart button label
+        print(f"Current cart: {self.cart}")  # Log the cart's totals
+
+        # Paint the row's button hot pink to show that the product is in the cart
+        self.product_model.mark_in_cart(row)
+
+        # Hold the product's units for the cart
+        self.hold_cart_line(line.product_id)
+
+    def hold_cart_line(self, product_id):
+        """
+        Hold the cart's quantity of a product in the background, or release its hold
+        if the product is no longer in the cart.
+
+        Input:
+            - product_id (str): The product that was added, changed or removed.
+
+        Output:
+            - The held quantity is checked by _on_stock_held.
+        """
+        line = self.cart.get(product_id)
+        quantity = line.quantity if line else 0
+        # A newer change of the same product supersedes this one
+        self.query_runner.submit(
+            f"hold:{product_id}", hold_stock, self.cart.cart_id, product_id, quantity, config_file='sqlproject.ini',
+            on_result=lambda result: self._on_stock_held(product_id, quantity, result),
+            on_error=lambda err: print(f"Could not hold stock of {product_id}: {err}")
+        )
+
+    def _on_stock_held(self, product_id, quantity, result):
+        """
+        Lower the cart's quantity of a product to the units that could be held for it.
+
+        Input:
+            - product_id (str): The product that was held.
+            - quantity (int): The quantity that was asked for.
+            - result (tuple): The units held, the most units available, and when the hold expires.
+
+        Output:
+            - cart (Cart): The product's quantity is lowered, or the product removed, if fewer units were held.
+            - QMessageBox: A warning tells the customer how many units are left.
+        """
+        held, available, expires_at = result
+        line = self.cart.get(product_id)
+        if held >= quantity or line is None or line.quantity != quantity:
+            return  # Held, or changed again since
+
+        self.cart.set_quantity(product_id, held)  # A quantity of 0 removes the product
+        self.cart_button.setText(f"({self.cart.count})")
+        if self.cart_window and self.cart_window.isVisible():
+            self.cart_window.show_quantity(product_id)
+        QMessageBox.warning(self, "Out of Stock",
+                            f"Only {available} of {line.description} left. Your cart holds {held}.")
 
 
     def closeEvent(self, event):
@@ -1159,6 +1048,18 @@ class CustomerHome(QMainWindow):
             - Closes child windows (cart and order windows) if they are open and visible.
             - Prints a message indicating the closure of the main window and child windows.
         """
+        # Keep the catalog's changes for the next start
+        self.catalog_sync_timer.stop()
+        self.save_catalog_snapshot()
+
+        # Give the units held for the cart back to other customers; an emptied
+        # cart may still have holds that were placed after its last change
+        self.query_runner.cancel_all(prefix="hold:")
+        try:
+            release_holds(self.cart.cart_id, config_file='sqlproject.ini')
+        except Exception as e:
+            print(f"Could not release the cart's stock holds: {e}")
+
         # Check if the cart window exists and is visible, then close it
         if self.cart_window and self.cart_window.isVisible():
             self.cart_window.close()
@@ -1185,7 +1086,7 @@ class CustomerHome(QMainWindow):
             - Creates and shows the cart window, passing the cart items and customer ID to it.
         """
         # Create an instance of the CartWindow and pass the required data (cart items and customer ID)
-        self.cart_window = CartWindow(self.cart_items, self.customer_id, self)
+        self.cart_window = CartWindow(self.cart, self.customer_id, self)
         
         # Show the cart window
         self.cart_window.show()
@@ -1202,10 +1103,10 @@ class CustomerHome(QMainWindow):
             - Populates the cart table with spin boxes for each item in the cart, allowing quantity changes.
         """
         # Loop through each item in the cart and add a spin box for quantity adjustment
-        for row_index, item in enumerate(self.cart_items):
+        for row_index, line in enumerate(self.cart):
             spin_box = QSpinBox()  # Create a spin box for quantity
-            spin_box.setValue(item[4])  # Set the initial value to the item's quantity
-            spin_box.valueChanged.connect(lambda value, r=row_index: self.update_quantity(r, value))  # Connect the spin box to the update_quantity method
+            spin_box.setValue(line.quantity)  # Set the initial value to the item's quantity
+            spin_box.valueChanged.connect(lambda value, p=line.product_id: self.update_quantity(p, value))  # Connect the spin box to the update_quantity method
             
             # Set the spin box in the 5th column (index 4) of the current row
             self.cart_table.setCellWidget(row_index, 4, spin_box)
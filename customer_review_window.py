@@ -14,10 +14,34 @@ Course: DATA 201
 
 from PyQt5.QtWidgets import QMainWindow, QApplication, QTableWidget, QTableWidgetItem, QPushButton, QPlainTextEdit, QLabel, QComboBox, QMessageBox, QHeaderView, QLineEdit, QVBoxLayout, QWidget
 from PyQt5 import uic
-from data201 import make_connection
-from data201 import make_connection
+from data201 import make_connection, query_rows, register_statement, query_named
+from query_runner import QueryRunner
 import mysql.connector
 
+# Looked up each time an order is selected; prepared once per pooled connection.
+ORDER_PRODUCTS = register_statement('order_products', """
+    SELECT 
+        oi.product_id,
+        p.product_description AS product_name,
+        CONCAT('$', FORMAT(p.product_price, 2)) AS unit_price,
+        oi.quantity
+    FROM 
+        order_items oi
+    JOIN 
+        products p ON oi.product_id = p.product_id
+    WHERE 
+        oi.order_id = %s
+""")
+ORDER_REVIEW = register_statement('order_review', """
+    SELECT 
+        COALESCE(orv.review_score, 'No Review') AS review_score,
+        COALESCE(orv.comment_message, 'No Comments') AS review_comment
+    FROM 
+        order_reviews orv
+    WHERE 
+        orv.order_id = %s
+""")
+
 
 class ReviewWindow(QMainWindow):
     """
@@ -145,6 +169,10 @@ class OrderWindow(QMainWindow):
 
         self.customer_id = customer_id
         self.main_window = main_window
+        self.orders_data = []
+
+        # Runs the order history query off the GUI thread
+        self.query_runner = QueryRunner(self)
 
         # Access widgets
         self.table_orders = self.findChild(QTableWidget, "table_orders")
@@ -241,35 +269,38 @@ class OrderWindow(QMainWindow):
 
     def populate_orders(self):
         """Populate the orders table with data from the database."""
-        try:
-            # Establish the database connection
-            conn = make_connection(config_file='sqlproject.ini')
-            cursor = conn.cursor()
+        # Query to fetch orders based on the customer_id
+        query = """
+            SELECT 
+                o.order_id,
+                o.order_status,
+                o.order_purchase_timestamp,
+                o.order_estimated_delivery_date,
+                CONCAT('$', FORMAT(COALESCE(SUM(op.payment_value), 0), 2)) AS total
+            FROM order_items oi
+            JOIN orders o ON oi.order_id = o.order_id
+            LEFT JOIN order_payments op ON o.order_id = op.order_id
+            WHERE o.customer_id = %s
+            GROUP BY 
+                o.order_id, 
+                o.order_status, 
+                o.order_purchase_timestamp, 
+                o.order_estimated_delivery_date
+            ORDER BY o.order_purchase_timestamp DESC
+        """
 
-            # Query to fetch orders based on the customer_id
-            query = """
-                SELECT 
-                    o.order_id,
-                    o.order_status,
-                    o.order_purchase_timestamp,
-                    o.order_estimated_delivery_date,
-                    CONCAT('$', FORMAT(COALESCE(SUM(op.payment_value), 0), 2)) AS total
-                FROM order_items oi
-                JOIN orders o ON oi.order_id = o.order_id
-                LEFT JOIN order_payments op ON o.order_id = op.order_id
-                WHERE o.customer_id = %s
-                GROUP BY 
-                    o.order_id, 
-                    o.order_status, 
-                    o.order_purchase_timestamp, 
-                    o.order_estimated_delivery_date
-                ORDER BY o.order_purchase_timestamp DESC
-            """
+        # Execute the query with the provided customer_id
+        print(f"Fetching orders for customer_id: {self.customer_id}")
+        self.query_runner.submit(
+            "orders", query_rows, query, (self.customer_id,), config_file='sqlproject.ini',
+            on_result=self._show_orders,
+            on_error=self._show_orders_error
+        )
 
-            # Execute the query with the provided customer_id
-            print(f"Fetching orders for customer_id: {self.customer_id}")
-            cursor.execute(query, (self.customer_id,))
-            self.orders_data = cursor.fetchall()
+    def _show_orders(self, orders_data):
+        """Fill the orders table with the fetched orders."""
+        try:
+            self.orders_data = orders_data
 
             print(f"Orders fetched: {self.orders_data}")
 
@@ -287,21 +318,19 @@ class OrderWindow(QMainWindow):
 
             # Connect cell click event to populate order details
             self.table_orders.cellClicked.connect(self.populate_order_details)
-            cursor.close()
-            conn.close()
 
             print("Order history populated successfully.")
 
-        except mysql.connector.Error as err:
-            # Log and display database errors
-            print(f"Database error: {err}")
-            QMessageBox.critical(self, "Database Error", f"Failed to fetch orders: {err}")
-
         except Exception as e:
             # Handle unexpected errors
             print(f"Unexpected error: {e}")
             QMessageBox.critical(self, "Error", f"An unexpected error occurred: {e}")
 
+    def _show_orders_error(self, err):
+        """Log and display a failed order history query."""
+        print(f"Database error: {err}")
+        QMessageBox.critical(self, "Database Error", f"Failed to fetch orders: {err}")
+
 
     def filter_orders(self):
         """Filter orders based on search input."""
@@ -332,60 +361,10 @@ class OrderWindow(QMainWindow):
             selected_order_id = self.table_orders.item(row, 0).text()
 
             # --- Fetch product details ---
-            product_results = []
-            try:
-                conn_products = make_connection(config_file='sqlproject.ini')
-                cursor_products = conn_products.cursor()
-
-                query_products = """
-                    SELECT 
-                        oi.product_id,
-                        p.product_description AS product_name,
-                        CONCAT('$', FORMAT(p.product_price, 2)) AS unit_price,
-                        oi.quantity
-                    FROM 
-                        order_items oi
-                    JOIN 
-                        products p ON oi.product_id = p.product_id
-                    WHERE 
-                        oi.order_id = %s
-                """
-                cursor_products.execute(query_products, (selected_order_id,))
-                product_results = cursor_products.fetchall()
-
-                # Ensure all results are consumed
-                while cursor_products.nextset():
-                    pass
-
-            finally:
-                cursor_products.close()
-                conn_products.close()
+            product_results = query_named(ORDER_PRODUCTS, (selected_order_id,), config_file='sqlproject.ini')
 
             # --- Fetch review details ---
-            review_results = []
-            try:
-                conn_review = make_connection(config_file='sqlproject.ini')
-                cursor_review = conn_review.cursor()
-
-                query_review = """
-                    SELECT 
-                        COALESCE(orv.review_score, 'No Review') AS review_score,
-                        COALESCE(orv.comment_message, 'No Comments') AS review_comment
-                    FROM 
-                        order_reviews orv
-                    WHERE 
-                        orv.order_id = %s
-                """
-                cursor_review.execute(query_review, (selected_order_id,))
-                review_results = cursor_review.fetchall()
-
-                # Ensure all results are consumed
-                while cursor_review.nextset():
-                    pass
-
-            finally:
-                cursor_review.close()
-                conn_review.close()
+            review_results = query_named(ORDER_REVIEW, (selected_order_id,), config_file='sqlproject.ini')
 
             # --- Populate the order details table ---
             self.table_order_details.setRowCount(0)  
@@ -3,11 +3,39 @@
 #--------------------------------#
 
 import os
+import re
+import sys
+import math
+import time
+import atexit
+import logging
+import threading
 import warnings
-import pandas as pd
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from functools import lru_cache
+from logging.handlers import RotatingFileHandler
 from configparser import ConfigParser
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal, ROUND_HALF_UP
 from mysql.connector import MySQLConnection, Error
 
+# numpy and pandas are imported by the functions that use them,
+# so that the login window does not wait for them at startup.
+
+# Optional section of the configuration file that sizes the
+# connection pool. It is never passed to the database driver.
+POOL_SECTION = 'pool'
+
+POOL_DEFAULTS = {
+    'min_size': 1,
+    'max_size': 5,
+    'idle_timeout': 300,           # seconds before a spare idle connection is closed
+    'borrow_timeout': 10,          # seconds to wait for a free connection
+    'health_check_interval': 30,   # ping connections idle longer than this on borrow
+}
+
 def read_config(config_file = 'config.ini', section = 'mysql'):
     """
     Read the configuration file config_file with the given section.
@@ -39,39 +67,1823 @@ def read_config(config_file = 'config.ini', section = 'mysql'):
     
     return config
 
-def make_connection(config_file = 'config.ini', section = 'mysql'):
+def read_pool_config(config_file = 'config.ini'):
     """
-    Make a database connection with the configuration file config_file
-    with the given section. If successful, return the connection,
-    else raise an exception.
+    Read the optional [pool] section of the configuration file
+    config_file and return the pool settings as a dictionary,
+    using the defaults for any setting that is not given.
+    """
+    settings = dict(POOL_DEFAULTS)
+    parser = ConfigParser()
+    parser.read(config_file)
+
+    if parser.has_section(POOL_SECTION):
+        for key, value in parser.items(POOL_SECTION):
+            if key in settings:
+                settings[key] = type(POOL_DEFAULTS[key])(value)
+
+    return settings
+
+def _open_connection(config_file, section):
+    """
+    Open a new, unpooled database connection with the configuration
+    file config_file and the given section. The section's optional
+    backend setting selects the database engine: mysql (the default)
+    or sqlite for the embedded backend in embedded_db.py.
     """
     try:
         db_config = read_config(config_file, section)
+        backend = db_config.pop('backend', 'mysql').strip().lower()
+
+        if backend == 'sqlite':
+            from embedded_db import connect_embedded
+            return connect_embedded(**db_config)
+        elif backend != 'mysql':
+            raise Exception(f"Unknown database backend '{backend}' "
+                            f'in section [{section}] of {config_file}')
+
         conn = MySQLConnection(**db_config)
 
-        if conn.is_connected():
-            return conn
+        if not conn.is_connected():
+            raise Exception(f'Connection failed: no connection to section [{section}] of {config_file}')
+        return conn
 
     except Error as e:
         raise Exception(f'Connection failed: {e}')
 
-from pandas import DataFrame
+#---------------------------#
+# Connection pool           #
+#---------------------------#
+
+class PooledConnection:
+    """
+    A connection borrowed from a ConnectionPool. It behaves like the
+    underlying database connection, except that close() returns the
+    connection to its pool instead of closing it. wait_time is how
+    long the borrower waited for the connection.
+    """
+    def __init__(self, pool, conn, wait_time = 0.0):
+        self._pool = pool
+        self._conn = conn
+        self._written_tables = set()
+        self._wait_time = wait_time
+
+    def _driver(self):
+        if self._conn is None:
+            raise Exception('Connection has been returned to the pool.')
+        return self._conn
+
+    def __getattr__(self, name):
+        return getattr(self._driver(), name)
+
+    def is_connected(self):
+        return self._conn is not None and self._conn.is_connected()
+
+    def cursor(self, *args, **kwargs):
+        return PooledCursor(self, self._driver().cursor(*args, **kwargs))
+
+    def prepared_cursor(self, name):
+        """
+        Return this connection's prepared cursor for the named statement
+        wrapped for tracing, and whether the statement is prepared anew.
+        """
+        cursor, new = self._pool.statement_cursor(self._driver(), name)
+        return PooledCursor(self, cursor), new
+
+    def forget_statement(self, name):
+        self._pool.forget_statement(self._driver(), name)
+
+    def _take_wait_time(self):
+        """
+        Return the time spent waiting for this connection the first
+        time it is asked for, and 0 afterwards, so that the wait is
+        charged to the first statement executed on the connection.
+        """
+        wait_time, self._wait_time = self._wait_time, 0.0
+        return wait_time
+
+    def _check_statement(self, sql):
+        """
+        Refuse a write statement on a connection to a read replica.
+        """
+        if self._pool.read_only and is_write_statement(sql):
+            raise Exception('Write statement sent to read replica '
+                            f'[{self._pool.section}]: {normalize_sql(sql)[:80]}')
+
+    def _note_statement(self, sql):
+        """
+        Invalidate cached queries on the tables that a write statement
+        touches. They are invalidated again on commit, so that a read
+        between the write and the commit cannot keep stale rows cached.
+        """
+        if is_write_statement(sql):
+            tables = referenced_tables(sql)
+            self._written_tables |= tables
+            query_cache.invalidate_tables(tables)
+
+    def commit(self):
+        self._driver().commit()
+        if self._written_tables:
+            query_cache.invalidate_tables(self._written_tables)
+            self._written_tables = set()
+            note_primary_write(self._pool.config_file, self._pool.section)
+
+    def rollback(self):
+        self._driver().rollback()
+        self._written_tables = set()
+
+    def close(self):
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._written_tables = set()
+            self._pool.release(conn)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        # A caller that forgets to close() must not leak a pool slot.
+        try:
+            self.close()
+        except Exception:
+            pass
+
+class PooledCursor:
+    """
+    A cursor of a PooledConnection. Statements executed through it
+    are seen by the data layer, which traces their timing and the
+    rows they fetch; everything else is passed through to the
+    driver's cursor.
+    """
+    def __init__(self, conn, cursor):
+        self._conn = conn
+        self._cursor = cursor
+        self._trace = None
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        row = self.fetchone()
+        while row is not None:
+            yield row
+            row = self.fetchone()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _begin_trace(self, operation):
+        self._end_trace()
+        if query_tracer.enabled:
+            self._trace = query_tracer.begin(operation, self._conn._take_wait_time())
+
+    def _end_trace(self):
+        if self._trace is not None:
+            trace, self._trace = self._trace, None
+            query_tracer.finish(trace)
+
+    def _run(self, method, operation, *args, **kwargs):
+        """
+        Execute a statement with the driver's cursor method and trace it.
+        A statement without a result set is finished right away; one with
+        rows is finished once they have all been fetched.
+        """
+        self._conn._check_statement(operation)
+        self._begin_trace(operation)
+        started = time.perf_counter()
+        try:
+            result = method(operation, *args, **kwargs)
+        except Exception:
+            if self._trace is not None:
+                self._trace.failed = True
+                self._trace.elapsed += time.perf_counter() - started
+                self._end_trace()
+            raise
+
+        if self._trace is not None:
+            self._trace.elapsed += time.perf_counter() - started
+            if not getattr(self._cursor, 'with_rows', True):
+                self._trace.rows = max(self._cursor.rowcount, 0)
+                self._end_trace()
+
+        self._conn._note_statement(operation)
+        return result
+
+    def _fetched(self, started, rows, done):
+        if self._trace is not None:
+            self._trace.elapsed += time.perf_counter() - started
+            self._trace.rows += len(rows)
+            self._trace.bytes += _payload_size(rows)
+            if done:
+                self._end_trace()
+
+    def execute(self, operation, params = None, *args, **kwargs):
+        return self._run(self._cursor.execute, operation, params, *args, **kwargs)
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        return self._run(self._cursor.executemany, operation, seq_params, *args, **kwargs)
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._fetched(started, [row] if row is not None else [], row is None)
+        return row
+
+    def fetchmany(self, size = None):
+        started = time.perf_counter()
+        if size is None:
+            rows = self._cursor.fetchmany()
+        else:
+            rows = self._cursor.fetchmany(size)
+        self._fetched(started, rows, not rows)
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._fetched(started, rows, True)
+        return rows
+
+    def close(self):
+        self._end_trace()
+        return self._cursor.close()
+
+class ConnectionPool:
+    """
+    A thread-safe pool of database connections for one section of
+    one configuration file. Between min_size and max_size connections
+    are kept open; prewarm() opens the first min_size up front. A
+    connection that has been idle longer than health_check_interval
+    seconds is pinged before it is handed out, and spare connections
+    idle longer than idle_timeout are closed.
+    The connections of a read_only pool refuse write statements.
+    """
+    def __init__(self, config_file = 'config.ini', section = 'mysql',
+                 min_size = 1, max_size = 5, idle_timeout = 300,
+                 borrow_timeout = 10, health_check_interval = 30,
+                 read_only = False):
+        self.config_file = config_file
+        self.section = section
+        self.read_only = read_only
+        self.min_size = min_size
+        self.max_size = max(max_size, 1)
+        self.idle_timeout = idle_timeout
+        self.borrow_timeout = borrow_timeout
+        self.health_check_interval = health_check_interval
+
+        self._idle = []        # list of (connection, time returned)
+        self._in_use = 0
+        self._opening = 0      # connections prewarm() is opening
+        self._statements = {}  # id(connection) -> {statement name: prepared cursor}
+        self._cond = threading.Condition()
+        self._stats = {'borrows': 0, 'waits': 0, 'wait_time': 0.0,
+                       'creates': 0, 'closes': 0, 'evictions': 0,
+                       'health_failures': 0}
+
+    def _discard(self, conn):
+        self._stats['closes'] += 1
+        self._statements.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _evict_idle(self):
+        """
+        Close spare connections that have been idle too long.
+        The caller must hold the pool lock.
+        """
+        now = time.monotonic()
+        keep = []
+
+        for conn, since in self._idle:
+            total = len(keep) + self._in_use
+            if now - since > self.idle_timeout and total >= self.min_size:
+                self._stats['evictions'] += 1
+                self._discard(conn)
+            else:
+                keep.append((conn, since))
+
+        self._idle = keep
+
+    def _healthy(self, conn, since):
+        """
+        Return whether an idle connection can be handed out.
+        """
+        if time.monotonic() - since < self.health_check_interval:
+            return True
+        try:
+            return conn.is_connected()
+        except Exception:
+            return False
+
+    def acquire(self):
+        """
+        Borrow a raw connection from the pool, waiting up to
+        borrow_timeout seconds if all max_size connections are
+        in use. The connection must be given back with release().
+        """
+        deadline = time.monotonic() + self.borrow_timeout
+        waited = False
+        started = time.monotonic()
+
+        with self._cond:
+            self._stats['borrows'] += 1
+            self._evict_idle()
+
+            while True:
+                # Reuse the most recently returned healthy connection.
+                while self._idle:
+                    conn, since = self._idle.pop()
+                    if self._healthy(conn, since):
+                        self._in_use += 1
+                        self._record_wait(waited, started)
+                        return conn
+                    self._stats['health_failures'] += 1
+                    self._discard(conn)
+
+                if self._in_use + self._opening < self.max_size:
+                    self._in_use += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Exception('Connection failed: timed out waiting '
+                                    f'for a pooled connection to {self.section}')
+                if not waited:
+                    waited = True
+                    self._stats['waits'] += 1
+                self._cond.wait(remaining)
+
+        # Open the new connection outside the lock.
+        try:
+            conn = _open_connection(self.config_file, self.section)
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._stats['creates'] += 1
+            self._record_wait(waited, started)
+        return conn
+
+    def prewarm(self):
+        """
+        Open idle connections until min_size connections are open, so
+        that the first borrowers do not wait for a connect. Return the
+        number of connections opened.
+        """
+        opened = 0
+        while True:
+            with self._cond:
+                if self._in_use + len(self._idle) + self._opening >= min(self.min_size, self.max_size):
+                    return opened
+                self._opening += 1
+
+            try:
+                conn = _open_connection(self.config_file, self.section)
+            except Exception:
+                with self._cond:
+                    self._opening -= 1
+                    self._cond.notify()
+                raise
+
+            with self._cond:
+                self._opening -= 1
+                self._stats['creates'] += 1
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+            opened += 1
+
+    def _record_wait(self, waited, started):
+        if waited:
+            self._stats['wait_time'] += time.monotonic() - started
+
+    def release(self, conn):
+        """
+        Return a connection to the pool. Any uncommitted work is
+        rolled back so the next borrower starts with a clean session.
+        """
+        try:
+            if conn.unread_result:
+                conn.consume_results()
+            conn.rollback()
+            healthy = True
+        except Exception:
+            healthy = False
+
+        with self._cond:
+            self._in_use -= 1
+            if healthy:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                self._stats['health_failures'] += 1
+                self._discard(conn)
+            self._cond.notify()
+
+    def connection(self):
+        """
+        Borrow a connection that is returned to the pool when it is
+        closed or when its with block exits.
+        """
+        started = time.perf_counter()
+        conn = self.acquire()
+        return PooledConnection(self, conn, time.perf_counter() - started)
+
+    def statement_cursor(self, conn, name):
+        """
+        Return the prepared cursor that the raw connection conn keeps
+        for the named statement, creating it on first use, and whether
+        it was just created. A prepared cursor stays with its connection
+        while the connection is in the pool.
+        """
+        with self._cond:
+            cursors = self._statements.setdefault(id(conn), {})
+            cursor = cursors.get(name)
+        if cursor is not None:
+            return cursor, False
+
+        cursor = conn.cursor(prepared=True)
+        with self._cond:
+            cursors[name] = cursor
+        return cursor, True
+
+    def forget_statement(self, conn, name):
+        """
+        Drop the prepared cursor of the named statement from the raw
+        connection conn, so that the statement is prepared again.
+        """
+        with self._cond:
+            cursor = self._statements.get(id(conn), {}).pop(name, None)
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+    def close_all(self):
+        """
+        Close every idle connection in the pool.
+        """
+        with self._cond:
+            for conn, _ in self._idle:
+                self._discard(conn)
+            self._idle = []
+
+    def stats(self):
+        """
+        Return a dictionary of pool counters for sizing the pool.
+        """
+        with self._cond:
+            stats = dict(self._stats)
+            stats['in_use'] = self._in_use
+            stats['idle'] = len(self._idle)
+            stats['max_size'] = self.max_size
+            return stats
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def _prewarm(pool):
+    try:
+        pool.prewarm()
+    except Exception:
+        pass  # The first borrower opens its own connection and gets the error
+
+_tracing_configured = False
+
+def get_pool(config_file = 'config.ini', section = 'mysql', read_only = False,
+             prewarm = False):
+    """
+    Return the connection pool for the configuration file config_file
+    with the given section, creating it on first use. Replica pools are
+    read_only. With prewarm, the pool opens its min_size connections in
+    the background. The first primary pool of the process applies the
+    tracing settings of its configuration file.
+    """
+    global _tracing_configured
+    key = (os.path.abspath(config_file), section)
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(config_file, section, read_only=read_only,
+                                  **read_pool_config(config_file))
+            _pools[key] = pool
+            if not read_only and not _tracing_configured:
+                _tracing_configured = True
+                configure_tracing(config_file)
+
+    if prewarm:
+        threading.Thread(target=_prewarm, args=(pool,), name='PoolPrewarm', daemon=True).start()
+    return pool
+
+def pool_stats():
+    """
+    Return the statistics of every connection pool, keyed by
+    (configuration file, section).
+    """
+    with _pools_lock:
+        pools = dict(_pools)
+    return {key: pool.stats() for key, pool in pools.items()}
+
+def close_pools():
+    """
+    Close the idle connections of every pool.
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_all()
+
+@contextmanager
+def pooled_connection(config_file = 'config.ini', section = 'mysql'):
+    """
+    Borrow a pooled connection for the duration of a with block.
+    """
+    conn = get_pool(config_file, section).connection()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+def make_connection(config_file = 'config.ini', section = 'mysql'):
+    """
+    Make a database connection with the configuration file config_file
+    with the given section. If successful, return the connection,
+    else raise an exception. The connection is drawn from a pool,
+    and closing it returns it to the pool.
+    """
+    return get_pool(config_file, section).connection()
+
+#---------------------------#
+# Read replicas             #
+#---------------------------#
+
+# Optional section of the configuration file that controls how
+# reads are routed to the [<section>_replica...] sections.
+REPLICATION_SECTION = 'replication'
+
+REPLICATION_DEFAULTS = {
+    'max_lag': 5.0,               # seconds a replica may lag; 0 skips the lag check
+    'lag_check_interval': 10.0,   # seconds between lag checks of a replica
+    'read_your_writes': 5.0,      # seconds reads stay on the primary after a commit
+}
+
+def read_replication_config(config_file = 'config.ini'):
+    """
+    Read the optional [replication] section of the configuration file
+    config_file and return the settings as a dictionary, using the
+    defaults for any setting that is not given.
+    """
+    settings = dict(REPLICATION_DEFAULTS)
+    parser = ConfigParser()
+    parser.read(config_file)
+
+    if parser.has_section(REPLICATION_SECTION):
+        for key, value in parser.items(REPLICATION_SECTION):
+            if key in settings:
+                settings[key] = type(REPLICATION_DEFAULTS[key])(value)
+
+    return settings
+
+def replica_sections(config_file = 'config.ini', section = 'mysql'):
+    """
+    Return the names of the replica sections of the primary section,
+    i.e. [mysql_replica], [mysql_replica2], ... for [mysql].
+    """
+    parser = ConfigParser()
+    parser.read(config_file)
+    prefix = f'{section}_replica'
+    return sorted(name for name in parser.sections() if name.startswith(prefix))
+
+_primary_local = threading.local()
+
+@contextmanager
+def primary_reads():
+    """
+    Send every read this thread makes inside a with block to the
+    primary, for a session that must read its own writes at once.
+    """
+    previous = getattr(_primary_local, 'active', False)
+    _primary_local.active = True
+    try:
+        yield
+    finally:
+        _primary_local.active = previous
+
+class ReplicaRouter:
+    """
+    Chooses the server for the read-only queries of one primary
+    section. Replicas are taken round-robin, skipping any that lag
+    more than max_lag seconds or cannot be reached. Reads go to the
+    primary when there is no usable replica, for read_your_writes
+    seconds after a commit on the primary, and inside primary_reads().
+    """
+    def __init__(self, config_file = 'config.ini', section = 'mysql',
+                 replicas = (), max_lag = 5.0, lag_check_interval = 10.0,
+                 read_your_writes = 5.0):
+        self.config_file = config_file
+        self.section = section
+        self.replicas = list(replicas)
+        self.max_lag = max_lag
+        self.lag_check_interval = lag_check_interval
+        self.read_your_writes = read_your_writes
+
+        self._next = 0
+        self._last_write = None
+        self._lag = {}        # replica section -> (lag in seconds or None, time checked)
+        self._lock = threading.Lock()
+        self._stats = {'primary_reads': 0, 'replica_reads': 0,
+                       'fallbacks': 0, 'lagging': 0}
+
+    def note_write(self):
+        """
+        Record a commit on the primary, starting a read-your-writes window.
+        """
+        self._last_write = time.monotonic()
+
+    def _measure_lag(self, replica):
+        """
+        Return how many seconds the replica is behind its source,
+        0 for a server that is not replicating, or None if it is
+        unreachable or its replication is stopped.
+        """
+        try:
+            with get_pool(self.config_file, replica, read_only=True).connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                try:
+                    try:
+                        cursor.execute('SHOW REPLICA STATUS')
+                    except Exception:
+                        cursor.execute('SHOW SLAVE STATUS')   # MySQL before 8.0.22
+                    rows = cursor.fetchall()
+                finally:
+                    cursor.close()
+        except Exception:
+            return None
+
+        if not rows:
+            return 0.0
+        lag = rows[0].get('Seconds_Behind_Source', rows[0].get('Seconds_Behind_Master'))
+        return None if lag is None else float(lag)
+
+    def replica_lag(self, replica):
+        """
+        Return the replica's lag, measuring it at most once every
+        lag_check_interval seconds.
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._lag.get(replica)
+        if cached is not None and now - cached[1] < self.lag_check_interval:
+            return cached[0]
+
+        lag = self._measure_lag(replica)
+        with self._lock:
+            self._lag[replica] = (lag, now)
+        return lag
+
+    def mark_unreachable(self, replica):
+        with self._lock:
+            self._lag[replica] = (None, time.monotonic())
+
+    def _usable(self, replica):
+        if self.max_lag > 0:
+            lag = self.replica_lag(replica)
+            return lag is not None and lag <= self.max_lag
+
+        # Without lag checks, skip only a replica that was just unreachable.
+        with self._lock:
+            cached = self._lag.get(replica)
+        return (cached is None or cached[0] is not None or
+                time.monotonic() - cached[1] >= self.lag_check_interval)
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def choose(self):
+        """
+        Return the section to send the next read-only query to.
+        """
+        recent_write = (self._last_write is not None and
+                        time.monotonic() - self._last_write < self.read_your_writes)
+
+        if self.replicas and not recent_write and not getattr(_primary_local, 'active', False):
+            with self._lock:
+                start = self._next
+                self._next = (self._next + 1) % len(self.replicas)
+
+            for i in range(len(self.replicas)):
+                replica = self.replicas[(start + i) % len(self.replicas)]
+                if self._usable(replica):
+                    self._count('replica_reads')
+                    return replica
+                self._count('lagging')
+
+            self._count('fallbacks')
+
+        self._count('primary_reads')
+        return self.section
 
-def dataframe_query(conn, sql):
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['lag'] = {replica: lag for replica, (lag, _) in self._lag.items()}
+            return stats
+
+_routers = {}
+
+def get_router(config_file = 'config.ini', section = 'mysql'):
+    """
+    Return the replica router of the primary section of the
+    configuration file config_file, creating it on first use.
+    """
+    key = (os.path.abspath(config_file), section)
+
+    with _pools_lock:
+        router = _routers.get(key)
+        if router is None:
+            router = ReplicaRouter(config_file, section,
+                                   replica_sections(config_file, section),
+                                   **read_replication_config(config_file))
+            _routers[key] = router
+
+    return router
+
+def note_primary_write(config_file = 'config.ini', section = 'mysql'):
+    """
+    Keep the reads of the primary section on the primary for a
+    while after a commit, so that they see the committed rows.
+    """
+    key = (os.path.abspath(config_file), section)
+    router = _routers.get(key)
+    if router is not None:
+        router.note_write()
+
+def read_connection(config_file = 'config.ini', section = 'mysql'):
+    """
+    Borrow a connection for read-only queries: from a replica of the
+    section if one is usable, else from the primary. The connection
+    refuses write statements when it comes from a replica.
+    """
+    router = get_router(config_file, section)
+    target = router.choose()
+
+    if target != section:
+        try:
+            return get_pool(config_file, target, read_only=True).connection()
+        except Exception:
+            router.mark_unreachable(target)
+
+    return get_pool(config_file, section).connection()
+
+@contextmanager
+def pooled_read_connection(config_file = 'config.ini', section = 'mysql'):
+    """
+    Borrow a read connection for the duration of a with block.
+    """
+    conn = read_connection(config_file, section)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+def replica_stats():
+    """
+    Return the routing counters and last measured replica lags of
+    every primary section, keyed by (configuration file, section).
+    """
+    with _pools_lock:
+        routers = dict(_routers)
+    return {key: router.stats() for key, router in routers.items()}
+
+def dataframe_query(conn, sql, params = None):
     """
     Use the database connection conn to execute
-    the SQL code. Return the resulting row count
+    the SQL code with the optional query parameters
+    params. Return the resulting row count
     and the rows as a dataframe or (0, None) 
     if there were no rows. If the query failed,
     raise an exception.
     """
+    import pandas as pd
     warnings.simplefilter(action='ignore', category=UserWarning)
     
     try:
-        df = pd.read_sql_query(sql, conn)
+        df = pd.read_sql_query(sql, conn, params=params)
         count = len(df)
         return count, df        
     except Error as e:
         raise Exception(f'Query failed: {e}')
 
+def query_rows(sql, params = None, config_file = 'config.ini', section = 'mysql'):
+    """
+    Execute the SQL query on a pooled connection and return
+    all of its rows as a list of tuples. If the query failed,
+    raise an exception. Safe to call from worker threads. Read-only
+    queries may be sent to a replica of the section.
+    """
+    connect = pooled_connection if is_write_statement(sql) else pooled_read_connection
+    with connect(config_file, section) as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+        except Error as e:
+            raise Exception(f'Query failed: {e}')
+        finally:
+            cursor.close()
+
+def query_dataframe(sql, params = None, config_file = 'config.ini', section = 'mysql'):
+    """
+    Execute the SQL query on a pooled connection and return
+    its rows as a dataframe. Safe to call from worker threads.
+    The query may be sent to a replica of the section.
+    """
+    with pooled_read_connection(config_file, section) as conn:
+        count, df = dataframe_query(conn, sql, params)
+        return df
+
+#---------------------------#
+# Streaming queries         #
+#---------------------------#
+
+DEFAULT_CHUNK_SIZE = 10000
+
+def iter_query_batches(conn, sql, params = None, batch_size = DEFAULT_CHUNK_SIZE):
+    """
+    Use the database connection conn to execute the SQL code with
+    an unbuffered cursor, so that rows stay on the server until
+    they are fetched. Yield (column names, list of row tuples)
+    with at most batch_size rows per batch. If the query failed,
+    raise an exception.
+    """
+    cursor = conn.cursor(buffered=False)
+
+    try:
+        cursor.execute(sql, params)
+        columns = [desc[0] for desc in cursor.description]
+
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield columns, rows
+
+    except Error as e:
+        raise Exception(f'Query failed: {e}')
+    finally:
+        # An abandoned generator must not leave unread rows behind.
+        try:
+            if conn.unread_result:
+                conn.consume_results()
+        except Exception:
+            pass
+        cursor.close()
+
+def dataframe_query_chunks(conn, sql, params = None, chunk_size = DEFAULT_CHUNK_SIZE):
+    """
+    Streaming variant of dataframe_query. Yield the rows of the
+    SQL query as dataframes of at most chunk_size rows each, so that
+    the whole result set is never held in memory at once.
+    """
+    from pandas import DataFrame
+    for columns, rows in iter_query_batches(conn, sql, params, chunk_size):
+        yield DataFrame.from_records(rows, columns=columns)
+
+# How each aggregate is folded across chunks: the partial results
+# of each chunk are combined with the second function.
+_CHUNK_AGGREGATES = {
+    'sum':   ('sum', 'sum'),
+    'count': ('count', 'sum'),
+    'size':  ('size', 'sum'),
+    'min':   ('min', 'min'),
+    'max':   ('max', 'max'),
+}
+
+def aggregate_chunks(chunks, by, aggregations):
+    """
+    Fold an iterable of dataframe chunks into group-by aggregates
+    incrementally, keeping only one chunk and the running partial
+    aggregates in memory. by is a column name or list of column names,
+    and aggregations maps each output column to (input column, function)
+    with function one of sum, count, size, min, max or mean.
+    Return the aggregates as a dataframe indexed by the group columns.
+
+    Example:
+        chunks = dataframe_query_chunks(conn, sql)
+        df = aggregate_chunks(chunks, 'payment_type',
+                              {'total': ('payment_value', 'sum'),
+                               'average': ('payment_value', 'mean')})
+    """
+    import pandas as pd
+    by = [by] if isinstance(by, str) else list(by)
+
+    # Expand each mean into a running sum and count.
+    partial_specs = {}
+    for name, (column, func) in aggregations.items():
+        if func == 'mean':
+            partial_specs[f'{name}__sum'] = (column, 'sum')
+            partial_specs[f'{name}__count'] = (column, 'count')
+        elif func in _CHUNK_AGGREGATES:
+            partial_specs[name] = (column, func)
+        else:
+            raise Exception(f"Unsupported chunk aggregate '{func}'")
+
+    chunk_specs = {name: (column, _CHUNK_AGGREGATES[func][0])
+                   for name, (column, func) in partial_specs.items()}
+    fold_specs = {name: _CHUNK_AGGREGATES[func][1]
+                  for name, (column, func) in partial_specs.items()}
+
+    running = None
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        part = chunk.groupby(by, sort=False).agg(**chunk_specs)
+        if running is None:
+            running = part
+        else:
+            running = pd.concat([running, part]).groupby(level=by, sort=False).agg(fold_specs)
+
+    if running is None:
+        index = pd.MultiIndex.from_tuples([], names=by) if len(by) > 1 else pd.Index([], name=by[0])
+        return pd.DataFrame(columns=list(aggregations), index=index)
+
+    result = pd.DataFrame(index=running.index)
+    for name, (column, func) in aggregations.items():
+        if func == 'mean':
+            result[name] = running[f'{name}__sum'] / running[f'{name}__count']
+        else:
+            result[name] = running[name]
+
+    return result.sort_index()
+
+#---------------------------#
+# Typed, columnar fetch     #
+#---------------------------#
+
+# String columns that are fetched as categoricals unless a schema says otherwise.
+CATEGORY_COLUMNS = {'product_category', 'order_status', 'payment_type'}
+
+# Text formatted by CONCAT('$', FORMAT(...)), e.g. $1,234.50
+_MONEY_PATTERN = re.compile(r'^-?\$-?[\d,]+(?:\.\d+)?$')
+
+def _money_value(value):
+    if isinstance(value, str):
+        value = value.replace('$', '').replace(',', '')
+    return float(value)
+
+def _infer_column_type(name, value):
+    """
+    Return the typed-fetch type of a column from its name and its
+    first non-null value.
+    """
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, int):
+        return 'int'
+    if isinstance(value, (float, Decimal)):
+        return 'float'
+    if isinstance(value, (datetime, date)):
+        return 'datetime'
+    if isinstance(value, str):
+        if name in CATEGORY_COLUMNS:
+            return 'category'
+        if _MONEY_PATTERN.match(value):
+            return 'money'
+    return 'object'
+
+def _smallest_int_array(values):
+    """
+    Downcast an int64 array, or a nullable Int64 array with nulls,
+    to the smallest integer type that holds its values.
+    """
+    import numpy as np
+    import pandas as pd
+    if not values.isna().any():
+        return pd.to_numeric(values.to_numpy('int64'), downcast='integer')
+
+    low, high = values.min(), values.max()
+    for dtype in ('Int8', 'Int16', 'Int32'):
+        info = np.iinfo(dtype.lower())
+        if info.min <= low and high <= info.max:
+            return values.astype(dtype)
+    return values
+
+class _TypedColumn:
+    """
+    One column of a typed fetch, converted batch by batch so that
+    only one batch of Python objects is alive at a time.
+    """
+    def __init__(self, name, kind = None):
+        self.name = name
+        self.kind = kind
+        self.parts = []
+        self.pending = []      # raw batches seen before the type is known
+        self.categories = {}   # category value -> code
+
+    def add(self, values):
+        if self.kind is None:
+            first = next((value for value in values if value is not None), None)
+            if first is None:
+                self.pending.append(values)
+                return
+            self.kind = _infer_column_type(self.name, first)
+            for pending in self.pending:
+                self.parts.append(self._convert(pending))
+            self.pending = []
+
+        self.parts.append(self._convert(values))
+
+    def _convert(self, values):
+        import numpy as np
+        import pandas as pd
+
+        kind = self.kind
+
+        if kind == 'category':
+            codes = self.categories
+            return np.fromiter((-1 if value is None else codes.setdefault(value, len(codes))
+                                for value in values), dtype=np.int32, count=len(values))
+        if kind == 'int':
+            return pd.array(values, dtype='Int64')
+        if kind in ('float', 'float64', 'float32'):
+            return np.array([np.nan if value is None else float(value) for value in values],
+                            dtype=np.float32 if kind == 'float32' else np.float64)
+        if kind == 'money':
+            return np.array([np.nan if value is None else _money_value(value) for value in values],
+                            dtype=np.float64)
+        if kind == 'cents':
+            return pd.array([None if value is None else
+                             int((Decimal(str(_money_value(value))) * 100).to_integral_value(ROUND_HALF_UP))
+                             for value in values], dtype='Int64')
+        if kind == 'datetime':
+            return pd.to_datetime(pd.Series(values, dtype=object)).to_numpy()
+        if kind == 'string':
+            return pd.array(values, dtype='string')
+        if kind == 'object':
+            return np.array(values, dtype=object)
+
+        # Any other NumPy dtype, e.g. int16 or bool.
+        return np.array(values).astype(kind)
+
+    def finish(self):
+        """
+        Return the whole column as a NumPy array, or as a pandas array
+        for categoricals and integers with nulls.
+        """
+        import numpy as np
+        import pandas as pd
+        if self.kind is None:
+            return np.full(sum(len(part) for part in self.pending), None, dtype=object)
+
+        if self.kind == 'category':
+            codes = np.concatenate(self.parts) if self.parts else np.array([], dtype=np.int32)
+            return pd.Categorical.from_codes(codes, categories=list(self.categories))
+
+        if self.kind in ('int', 'cents', 'string'):
+            if self.parts:
+                values = pd.concat([pd.Series(part) for part in self.parts], ignore_index=True)
+            else:
+                values = pd.Series([], dtype='string' if self.kind == 'string' else 'Int64')
+            if self.kind == 'int':
+                return _smallest_int_array(values)
+            if self.kind == 'cents' and not values.isna().any():
+                return values.to_numpy('int64')
+            return values.array
+
+        if not self.parts:
+            return np.array([], dtype='datetime64[ns]' if self.kind == 'datetime' else object)
+        return np.concatenate(self.parts)
+
+def fetch_typed_columns(conn, sql, params = None, schema = None,
+                        batch_size = DEFAULT_CHUNK_SIZE):
+    """
+    Use the database connection conn to execute the SQL code and
+    return its result as a dictionary of column name to array, in
+    column order. Rows are fetched batch_size at a time with an
+    unbuffered cursor and converted to compact column types:
+
+        category   categorical codes (default for CATEGORY_COLUMNS)
+        int        the smallest integer type that holds the values
+        float      float64 (default for DECIMAL and DOUBLE columns)
+        money      float64 parsed from text such as $1,234.50
+        cents      int64 cents parsed from money text or decimals
+        datetime   datetime64
+        string     pandas string array
+        object     Python objects, unconverted
+
+    or any NumPy dtype name such as float32. schema maps column names
+    to these types; the types of the other columns are inferred from
+    their values. If the query failed, raise an exception.
+    """
+    schema = schema or {}
+    cursor = conn.cursor(buffered=False)
+
+    try:
+        cursor.execute(sql, params)
+        names = [desc[0] for desc in cursor.description]
+        columns = [_TypedColumn(name, schema.get(name, 'category' if name in CATEGORY_COLUMNS else None))
+                   for name in names]
+
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for column, values in zip(columns, zip(*rows)):
+                column.add(values)
+
+    except Error as e:
+        raise Exception(f'Query failed: {e}')
+    finally:
+        try:
+            if conn.unread_result:
+                conn.consume_results()
+        except Exception:
+            pass
+        cursor.close()
+
+    return {column.name: column.finish() for column in columns}
+
+def typed_dataframe_query(conn, sql, params = None, schema = None,
+                          batch_size = DEFAULT_CHUNK_SIZE):
+    """
+    Memory-compact variant of dataframe_query. Return the row count
+    and the rows as a dataframe with the column types described in
+    fetch_typed_columns, where schema can declare the type of any
+    column. If the query failed, raise an exception.
+    """
+    from pandas import DataFrame
+    columns = fetch_typed_columns(conn, sql, params, schema, batch_size)
+    df = DataFrame(columns)
+    return len(df), df
+
+def query_typed(sql, params = None, schema = None,
+                config_file = 'config.ini', section = 'mysql'):
+    """
+    Execute the SQL query on a pooled read connection and return its
+    rows as a typed dataframe. Safe to call from worker threads.
+    """
+    with pooled_read_connection(config_file, section) as conn:
+        count, df = typed_dataframe_query(conn, sql, params, schema)
+        return df
+
+#---------------------------#
+# Query result cache        #
+#---------------------------#
+
+_WRITE_KEYWORDS = ('insert', 'update', 'delete', 'replace',
+                   'alter', 'drop', 'truncate', 'create', 'call')
+
+# A table name with an optional alias, and a comma-separated list of them
+# after a keyword, as in FROM a, b AS c or UPDATE a, b.
+_NOT_ALIAS = (r'(?!(?:join|inner|left|right|cross|natural|straight_join|on|using|where|'
+              r'group|order|having|limit|set|values?|select|union|for|lock|partition|'
+              r'force|use|ignore)\b)')
+_TABLE_REF = r'`?\w+`?(?:\s+(?:as\s+)?' + _NOT_ALIAS + r'`?\w+`?)?'
+_TABLE_PATTERN = re.compile(r'\b(?:from|join|into|update|table)\s+(' + _TABLE_REF +
+                            r'(?:\s*,\s*' + _TABLE_REF + r')*)', re.IGNORECASE)
+
+# A derived table in a FROM list, e.g. FROM (SELECT ...) d, b. Tables joined
+# after it with a comma are not found, so such a query counts as reading all.
+_DERIVED_TABLE_PATTERN = re.compile(r'\b(?:from|join)\s*\(', re.IGNORECASE)
+
+# Stands for every table in a set of referenced tables.
+ALL_TABLES = '*'
+
+def normalize_sql(sql):
+    """
+    Return the SQL code with runs of whitespace collapsed and any
+    trailing semicolon removed, so that the same query written with
+    different indentation has the same cache key.
+    """
+    return ' '.join(sql.split()).rstrip(';').strip()
+
+def is_write_statement(sql):
+    """
+    Return whether the SQL code modifies the database.
+    """
+    words = sql.lstrip(' \t\r\n(').split(None, 1)
+    return bool(words) and words[0].lower() in _WRITE_KEYWORDS
+
+def referenced_tables(sql):
+    """
+    Return the set of lower-case table names that the SQL code
+    reads from or writes to. The set holds ALL_TABLES if the tables
+    cannot all be found, i.e. the FROM list has a derived table.
+    """
+    tables = {ref.split()[0].strip('`').lower()
+              for table_list in _TABLE_PATTERN.findall(sql)
+              for ref in table_list.split(',')}
+    if _DERIVED_TABLE_PATTERN.search(sql):
+        tables.add(ALL_TABLES)
+    return tables
+
+def _estimate_size(rows):
+    """
+    Roughly estimate the memory held by a list of row tuples.
+    """
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row)
+        for value in row:
+            size += sys.getsizeof(value)
+    return size
+
+class QueryCache:
+    """
+    An LRU cache of read-only query results bounded by an estimate of
+    the memory they hold. Each entry expires after its time to live,
+    and is dropped as soon as a write through the data layer touches
+    one of the tables its query reads.
+    """
+    def __init__(self, max_bytes = 32 * 1024 * 1024, default_ttl = 60):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+
+        self._entries = OrderedDict()   # key -> (rows, expires, tables, size)
+        self._bytes = 0
+        self._generation = 0            # bumped by every invalidation
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'expirations': 0,
+                       'evictions': 0, 'invalidations': 0}
+
+    def _remove(self, key):
+        rows, expires, tables, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key):
+        """
+        Return the cached rows for the key, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+
+            if entry[1] < time.monotonic():
+                self._remove(key)
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry[0]
+
+    def generation(self):
+        """
+        Return a counter that changes whenever entries are invalidated.
+        """
+        with self._lock:
+            return self._generation
+
+    def put(self, key, rows, tables, ttl = None, generation = None):
+        """
+        Cache the rows for the key. Results larger than the whole
+        cache are not cached, and neither are results read before an
+        invalidation that happened since generation was taken.
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        size = _estimate_size(rows)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (rows, time.monotonic() + ttl, frozenset(tables), size)
+            self._bytes += size
+
+            # Evict least recently used entries until the cache fits.
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats['evictions'] += 1
+
+    def invalidate_tables(self, tables):
+        """
+        Drop every cached result whose query reads one of the tables.
+        ALL_TABLES, in the tables or in what a query reads, matches
+        any table.
+        """
+        tables = {table.lower() for table in tables}
+        if not tables:
+            return
+
+        with self._lock:
+            self._generation += 1
+            stale = [key for key, entry in self._entries.items()
+                     if entry[2] & tables or ALL_TABLES in entry[2] or ALL_TABLES in tables]
+            for key in stale:
+                self._remove(key)
+            self._stats['invalidations'] += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        Return a dictionary of cache counters.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._bytes
+            return stats
+
+# The process-wide cache used by cached_query().
+query_cache = QueryCache()
+
+def cached_query(sql, params = None, ttl = None,
+                 config_file = 'config.ini', section = 'mysql'):
+    """
+    Execute a read-only SQL query through the query cache and return
+    its rows as a list of tuples. The rows are cached for ttl seconds
+    (or the cache's default) keyed by the normalized SQL code and the
+    parameters. Callers must not modify the returned rows.
+    """
+    sql = normalize_sql(sql)
+    if isinstance(params, Mapping):
+        key_params = tuple(sorted(params.items()))    # Values too, not only the names
+    else:
+        key_params = tuple(params) if params is not None else None
+    key = (os.path.abspath(config_file), section, sql, key_params)
+
+    rows = query_cache.get(key)
+    if rows is not None:
+        return rows
+
+    generation = query_cache.generation()
+    rows = query_rows(sql, params, config_file, section)
+    query_cache.put(key, rows, referenced_tables(sql), ttl, generation)
+    return rows
+
+def cache_stats():
+    """
+    Return the hit, miss, eviction and invalidation counters of
+    the query cache.
+    """
+    return query_cache.stats()
+
+#---------------------------#
+# Prepared statements       #
+#---------------------------#
+
+class StatementRegistry:
+    """
+    Named parameterized statements that are prepared on the server
+    once per pooled connection and then executed with new parameters
+    over the binary protocol. Counts how often each statement was
+    prepared and how often a prepared statement was reused.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._statements = {}  # name -> SQL code
+        self._stats = {}       # name -> {'prepares': n, 'executions': n}
+
+    def register(self, name, sql):
+        """
+        Register the SQL code under name and return the name. Registering
+        the same statement again is harmless; registering different code
+        under a name already in use raises an exception.
+        """
+        sql = normalize_sql(sql)
+        with self._lock:
+            registered = self._statements.get(name)
+            if registered is None:
+                self._statements[name] = sql
+                self._stats[name] = {'prepares': 0, 'executions': 0}
+            elif registered != sql:
+                raise Exception(f'Statement {name} is already registered '
+                                'with different SQL code.')
+        return name
+
+    def sql(self, name):
+        """
+        Return the SQL code registered under name. The same string
+        object is returned every time, which is how the driver's
+        prepared cursor recognizes a statement it already prepared.
+        """
+        try:
+            return self._statements[name]
+        except KeyError:
+            raise Exception(f'No statement is registered as {name}.') from None
+
+    def count(self, name, prepared):
+        with self._lock:
+            stats = self._stats[name]
+            stats['executions'] += 1
+            if prepared:
+                stats['prepares'] += 1
+
+    def stats(self):
+        """
+        Return the prepare, execution and reuse counts of each statement.
+        """
+        with self._lock:
+            return {name: {'prepares': counts['prepares'],
+                           'executions': counts['executions'],
+                           'reuses': counts['executions'] - counts['prepares']}
+                    for name, counts in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            for counts in self._stats.values():
+                counts['prepares'] = counts['executions'] = 0
+
+# The process-wide registry used by execute_named() and query_named().
+statement_registry = StatementRegistry()
+
+def register_statement(name, sql):
+    """
+    Register a parameterized statement under name so that it can be
+    executed with execute_named() or query_named(). Return the name.
+    """
+    return statement_registry.register(name, sql)
+
+def execute_named(conn, name, params = None):
+    """
+    Execute the statement registered as name with the query parameters
+    params on the pooled connection conn and return its rows as a list
+    of tuples (empty for a statement without a result set). The
+    statement is prepared the first time it runs on the underlying
+    connection and reused after that.
+    """
+    sql = statement_registry.sql(name)
+    cursor, prepared = conn.prepared_cursor(name)
+
+    try:
+        cursor.execute(sql, tuple(params) if params is not None else ())
+        rows = cursor.fetchall() if cursor.with_rows else []
+    except Error as e:
+        conn.forget_statement(name)
+        raise Exception(f'Query failed: {e}')
+    except Exception:
+        conn.forget_statement(name)
+        raise
+    finally:
+        cursor._end_trace()  # The prepared cursor itself stays open
+
+    statement_registry.count(name, prepared)
+    return rows
+
+def query_named(name, params = None, config_file = 'config.ini', section = 'mysql'):
+    """
+    Execute the statement registered as name on a pooled connection
+    and return its rows as a list of tuples. Safe to call from worker
+    threads. Read-only statements may be sent to a replica; a write
+    statement is committed.
+    """
+    sql = statement_registry.sql(name)
+    connect = pooled_connection if is_write_statement(sql) else pooled_read_connection
+    with connect(config_file, section) as conn:
+        rows = execute_named(conn, name, params)
+        if is_write_statement(sql):
+            conn.commit()
+        return rows
+
+def statement_stats():
+    """
+    Return how often each registered statement was prepared,
+    executed, and reused from an earlier prepare.
+    """
+    return statement_registry.stats()
+
+#---------------------------#
+# Query tracing             #
+#---------------------------#
+
+# Optional section of the configuration file that controls query
+# tracing and the slow-query log. It is never passed to the driver.
+TRACE_SECTION = 'trace'
+
+TRACE_DEFAULTS = {
+    'enabled': True,
+    'slow_query_ms': 500.0,               # log statements slower than this
+    'slow_log_file': 'slow_queries.log',  # relative to the configuration file
+    'slow_log_max_bytes': 1024 * 1024,    # rotate the log at this size
+    'slow_log_backups': 3,                # rotated logs to keep
+    'samples_per_query': 1000,            # recent timings kept per fingerprint
+    'report_on_exit': False,              # print the summary report on exit
+}
+
+_LITERAL_PATTERN = re.compile(r"""'(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*"|\b\d+(?:\.\d+)?\b""")
+_LITERAL_LIST_PATTERN = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+
+def read_trace_config(config_file = 'config.ini'):
+    """
+    Read the optional [trace] section of the configuration file
+    config_file. Return the tracing settings as a dictionary, using
+    the defaults for any setting that is not given, or None if the
+    file has no [trace] section. A relative slow_log_file is placed
+    in the directory of the configuration file.
+    """
+    parser = ConfigParser()
+    parser.read(config_file)
+
+    if not parser.has_section(TRACE_SECTION):
+        return None
+
+    settings = dict(TRACE_DEFAULTS)
+    for key, value in parser.items(TRACE_SECTION):
+        if key not in settings:
+            continue
+        if isinstance(TRACE_DEFAULTS[key], bool):
+            settings[key] = parser.getboolean(TRACE_SECTION, key)
+        else:
+            settings[key] = type(TRACE_DEFAULTS[key])(value)
+
+    if settings['slow_log_file']:
+        settings['slow_log_file'] = _beside_config(config_file, settings['slow_log_file'])
+    return settings
+
+def _beside_config(config_file, path):
+    """
+    Return the path resolved against the directory of config_file.
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(config_file)), path)
+
+@lru_cache(maxsize = 1024)
+def query_fingerprint(sql):
+    """
+    Return the normalized SQL code with its literals replaced by ?
+    and lists of literals collapsed to (?), so that statements that
+    differ only in their values share a fingerprint.
+    """
+    sql = _LITERAL_PATTERN.sub('?', normalize_sql(sql))
+    return _LITERAL_LIST_PATTERN.sub('(?)', sql)
+
+def _payload_size(rows):
+    """
+    Approximate the bytes of row data fetched: the length of each
+    text or binary value, and 8 bytes for any other non-null value.
+    """
+    size = 0
+    for row in rows:
+        values = row.values() if isinstance(row, dict) else row
+        for value in values:
+            if value is None:
+                continue
+            if isinstance(value, (str, bytes, bytearray)):
+                size += len(value)
+            else:
+                size += 8
+    return size
+
+def _percentile(ordered, percent):
+    """
+    Return the nearest-rank percentile of a sorted list of numbers.
+    """
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+_trace_local = threading.local()
+
+# Frames in these modules are skipped when looking for the caller
+# of a statement.
+_TRACE_SKIP_MODULES = ('data201', 'query_runner', 'pandas', 'mysql',
+                       'contextlib', 'threading')
+
+def calling_site():
+    """
+    Return the name of the portal function that issued the current
+    statement, as module.Class.method, skipping the data layer and
+    the libraries it calls through.
+    """
+    caller = getattr(_trace_local, 'caller', None)
+    if caller:
+        return caller
+
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module.split('.')[0] not in _TRACE_SKIP_MODULES:
+            code = frame.f_code
+            return f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+        frame = frame.f_back
+
+    return 'unknown'
+
+@contextmanager
+def trace_caller(caller):
+    """
+    Attribute the statements this thread executes in a with block
+    to caller. The query runner uses this so that statements run on
+    its worker threads are charged to the method that submitted them.
+    """
+    previous = getattr(_trace_local, 'caller', None)
+    _trace_local.caller = caller
+    try:
+        yield
+    finally:
+        _trace_local.caller = previous
+
+class QueryTrace:
+    """
+    The measurements of one statement: wall time spent executing it
+    and fetching its rows, the rows and bytes fetched, and the time
+    spent waiting for the connection it ran on.
+    """
+    __slots__ = ('sql', 'caller', 'wait_time', 'elapsed', 'rows',
+                 'bytes', 'failed')
+
+    def __init__(self, sql, caller, wait_time = 0.0):
+        self.sql = sql
+        self.caller = caller
+        self.wait_time = wait_time
+        self.elapsed = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.failed = False
+
+class QueryTracer:
+    """
+    Collects the traces of every statement executed through the data
+    layer, keyed by query fingerprint, and writes statements slower
+    than slow_query_ms to a rotating slow-query log.
+    """
+    def __init__(self, **settings):
+        self._lock = threading.Lock()
+        self._queries = {}     # fingerprint -> dictionary of totals
+        self._logger = logging.getLogger('data201.slow_queries')
+        self._logger.propagate = False
+        self._handler = None
+        self._exit_report = False
+        self.configure(**dict(TRACE_DEFAULTS, **settings))
+
+    def configure(self, enabled = True, slow_query_ms = 500.0,
+                  slow_log_file = 'slow_queries.log',
+                  slow_log_max_bytes = 1024 * 1024, slow_log_backups = 3,
+                  samples_per_query = 1000, report_on_exit = False):
+        """
+        Apply the tracing settings. See TRACE_DEFAULTS.
+        """
+        with self._lock:
+            self.enabled = enabled
+            self.slow_query_ms = slow_query_ms
+            self.samples_per_query = samples_per_query
+
+            if self._handler is not None:
+                self._logger.removeHandler(self._handler)
+                self._handler.close()
+                self._handler = None
+
+            if slow_log_file:
+                # The log file is not created until the first slow query.
+                self._handler = RotatingFileHandler(slow_log_file,
+                                                    maxBytes=slow_log_max_bytes,
+                                                    backupCount=slow_log_backups,
+                                                    delay=True)
+                self._handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+                self._logger.addHandler(self._handler)
+                self._logger.setLevel(logging.WARNING)
+
+            if report_on_exit and not self._exit_report:
+                self._exit_report = True
+                atexit.register(lambda: print(format_trace_report()))
+
+    def begin(self, sql, wait_time = 0.0):
+        """
+        Start the trace of a statement issued by the current caller.
+        """
+        return QueryTrace(sql, calling_site(), wait_time)
+
+    def finish(self, trace):
+        """
+        Add a finished trace to the totals of its query fingerprint,
+        and log it if it was slow.
+        """
+        fingerprint = query_fingerprint(trace.sql)
+
+        with self._lock:
+            totals = self._queries.get(fingerprint)
+            if totals is None:
+                totals = {'calls': 0, 'failures': 0, 'time': 0.0,
+                          'max_time': 0.0, 'rows': 0, 'bytes': 0,
+                          'wait_time': 0.0, 'callers': set(),
+                          'samples': deque(maxlen=self.samples_per_query)}
+                self._queries[fingerprint] = totals
+
+            totals['calls'] += 1
+            totals['failures'] += trace.failed
+            totals['time'] += trace.elapsed
+            totals['max_time'] = max(totals['max_time'], trace.elapsed)
+            totals['rows'] += trace.rows
+            totals['bytes'] += trace.bytes
+            totals['wait_time'] += trace.wait_time
+            totals['callers'].add(trace.caller)
+            totals['samples'].append(trace.elapsed)
+
+        if trace.elapsed * 1000 >= self.slow_query_ms and self._handler is not None:
+            self._logger.warning(
+                f'{trace.elapsed * 1000:.1f} ms rows={trace.rows} '
+                f'bytes={trace.bytes} wait={trace.wait_time * 1000:.1f} ms '
+                f"caller={trace.caller}{' FAILED' if trace.failed else ''} "
+                f'sql={normalize_sql(trace.sql)}')
+
+    def report(self):
+        """
+        Return the summary of every traced query fingerprint as a
+        dataframe sorted by total time, slowest first. Times are in
+        milliseconds; the percentiles are taken over the most recent
+        samples_per_query executions.
+        """
+        from pandas import DataFrame
+        with self._lock:
+            queries = {fingerprint: dict(totals, samples=sorted(totals['samples']),
+                                         callers=sorted(totals['callers']))
+                       for fingerprint, totals in self._queries.items()}
+
+        records = []
+        for fingerprint, totals in queries.items():
+            samples = totals['samples']
+            records.append({
+                'fingerprint': fingerprint,
+                'calls': totals['calls'],
+                'failures': totals['failures'],
+                'p50_ms': _percentile(samples, 50) * 1000,
+                'p95_ms': _percentile(samples, 95) * 1000,
+                'p99_ms': _percentile(samples, 99) * 1000,
+                'max_ms': totals['max_time'] * 1000,
+                'total_ms': totals['time'] * 1000,
+                'rows': totals['rows'],
+                'bytes': totals['bytes'],
+                'wait_ms': totals['wait_time'] * 1000,
+                'callers': ', '.join(totals['callers']),
+            })
+
+        columns = ['fingerprint', 'calls', 'failures', 'p50_ms', 'p95_ms',
+                   'p99_ms', 'max_ms', 'total_ms', 'rows', 'bytes',
+                   'wait_ms', 'callers']
+        df = DataFrame(records, columns=columns)
+        return df.sort_values('total_ms', ascending=False, ignore_index=True)
+
+    def reset(self):
+        with self._lock:
+            self._queries.clear()
+
+# The process-wide tracer of statements executed through pooled cursors.
+query_tracer = QueryTracer()
+
+def configure_tracing(config_file = 'config.ini'):
+    """
+    Apply the [trace] section of the configuration file config_file
+    to the query tracer, or the defaults if the file has none, so
+    that the slow-query log is written next to the configuration file
+    rather than into the working directory.
+    """
+    settings = read_trace_config(config_file)
+    if settings is None:
+        settings = dict(TRACE_DEFAULTS,
+                        slow_log_file=_beside_config(config_file, TRACE_DEFAULTS['slow_log_file']))
+    query_tracer.configure(**settings)
+
+def trace_report():
+    """
+    Return the per-fingerprint query summary as a dataframe.
+    """
+    return query_tracer.report()
+
+def format_trace_report(limit = 20, width = 100):
+    """
+    Return the summary of the limit queries with the most total time
+    as printable text, with each fingerprint cut to width characters.
+    """
+    df = trace_report().head(limit)
+    if df.empty:
+        return 'No queries have been traced.'
+
+    lines = [f'{"calls":>7} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} '
+             f'{"total ms":>10} {"rows":>9} {"bytes":>11} {"wait ms":>9}  query / callers']
+    for _, row in df.iterrows():
+        fingerprint = row['fingerprint']
+        if len(fingerprint) > width:
+            fingerprint = fingerprint[:width - 3] + '...'
+        lines.append(f"{row['calls']:>7} {row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} "
+                     f"{row['p99_ms']:>9.1f} {row['total_ms']:>10.1f} {row['rows']:>9} "
+                     f"{row['bytes']:>11} {row['wait_ms']:>9.1f}  {fingerprint}")
+        lines.append(f"{'':>80}  <- {row['callers']}")
+
+    return '\n'.join(lines)
+
 # Copyright (c) 2024 by Ronald Mak
\ No newline at end of file
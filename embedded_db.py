@@ -0,0 +1,565 @@
+'''
+This module contains the embedded database backend, which runs the project's
+MySQL schemas on SQLite so the portals can be run, benchmarked and tested
+without the remote database server.
+
+The backend is selected in a configuration file section:
+
+    [mysql]
+    backend = sqlite
+    database = asqlmaster_local.db
+    schema = asqlmaster.sql
+
+database is the SQLite database file (or :memory: for a private in-memory
+database shared by the connections of the pool), and schema is an optional
+mysqldump file that is loaded when the database is still empty. Any other
+settings, such as host or user, are ignored.
+
+Connections and cursors mimic the parts of mysql-connector that the project
+uses: %s parameters, buffered and dictionary cursors, with_rows, rowcount,
+lastrowid, and rows with datetime and Decimal values. A dialect shim rewrites
+the MySQL-isms in the project's SQL and provides DATE_FORMAT, FORMAT, CONCAT,
+REGEXP, DATEDIFF, MONTH, YEAR, DAY, NOW and CURDATE as SQLite functions.
+Text columns compare case-insensitively, like MySQL's default collation.
+
+File: embedded_db.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+'''
+
+import os
+import re
+import sys
+import sqlite3
+import threading
+from datetime import date, datetime
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+
+#---------------------------#
+# Type conversions          #
+#---------------------------#
+
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+
+# Declared column types are converted back to the types mysql-connector returns.
+sqlite3.register_converter('DECIMAL', lambda value: Decimal(value.decode()))
+sqlite3.register_converter('DATETIME', lambda value: datetime.fromisoformat(value.decode()))
+sqlite3.register_converter('TIMESTAMP', lambda value: datetime.fromisoformat(value.decode()))
+sqlite3.register_converter('DATE', lambda value: date.fromisoformat(value.decode()[:10]))
+
+def _to_datetime(value):
+    """
+    Convert a stored date or datetime value to a datetime,
+    or return None if it is null or not a date.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    try:
+        return datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        return None
+
+#---------------------------#
+# MySQL functions           #
+#---------------------------#
+
+# MySQL DATE_FORMAT specifiers that differ from strftime.
+_DATE_FORMAT_SPECIFIERS = {
+    'i': lambda d: f'{d.minute:02d}',
+    's': lambda d: f'{d.second:02d}',
+    'S': lambda d: f'{d.second:02d}',
+    'M': lambda d: d.strftime('%B'),
+    'W': lambda d: d.strftime('%A'),
+    'c': lambda d: str(d.month),
+    'e': lambda d: str(d.day),
+    'k': lambda d: str(d.hour),
+    'l': lambda d: str(d.hour % 12 or 12),
+    'h': lambda d: d.strftime('%I'),
+    'T': lambda d: d.strftime('%H:%M:%S'),
+    'r': lambda d: d.strftime('%I:%M:%S %p'),
+    'f': lambda d: f'{d.microsecond:06d}',
+}
+
+def mysql_date_format(value, fmt):
+    """
+    MySQL DATE_FORMAT(date, format).
+    """
+    d = _to_datetime(value)
+    if d is None or fmt is None:
+        return None
+
+    out = []
+    i = 0
+    while i < len(fmt):
+        ch = fmt[i]
+        if ch == '%' and i + 1 < len(fmt):
+            spec = fmt[i + 1]
+            if spec in _DATE_FORMAT_SPECIFIERS:
+                out.append(_DATE_FORMAT_SPECIFIERS[spec](d))
+            elif spec in 'YymdHIpjbaU':
+                out.append(d.strftime('%' + spec))
+            else:
+                out.append(spec)
+            i += 2
+        else:
+            out.append(ch)
+            i += 1
+
+    return ''.join(out)
+
+def mysql_format(value, decimals = 0):
+    """
+    MySQL FORMAT(number, decimals): round half up and group thousands.
+    """
+    if value is None or decimals is None:
+        return None
+    decimals = max(int(decimals), 0)
+    number = Decimal(str(value)).quantize(Decimal(1).scaleb(-decimals), ROUND_HALF_UP)
+    return f'{number:,.{decimals}f}'
+
+def mysql_concat(*values):
+    """
+    MySQL CONCAT(...): null if any argument is null.
+    """
+    if any(value is None for value in values):
+        return None
+    return ''.join(str(value) for value in values)
+
+def mysql_regexp(pattern, value):
+    """
+    SQLite calls regexp(pattern, value) for value REGEXP pattern.
+    """
+    if pattern is None or value is None:
+        return None
+    return re.search(pattern, str(value)) is not None
+
+def mysql_datediff(first, second):
+    """
+    MySQL DATEDIFF(first, second) in days.
+    """
+    first, second = _to_datetime(first), _to_datetime(second)
+    if first is None or second is None:
+        return None
+    return (first.date() - second.date()).days
+
+def _date_part(name):
+    def part(value):
+        d = _to_datetime(value)
+        return None if d is None else getattr(d, name)
+    return part
+
+def _register_functions(conn):
+    conn.create_function('DATE_FORMAT', 2, mysql_date_format, deterministic=True)
+    conn.create_function('FORMAT', 2, mysql_format, deterministic=True)
+    conn.create_function('CONCAT', -1, mysql_concat, deterministic=True)
+    conn.create_function('REGEXP', 2, mysql_regexp, deterministic=True)
+    conn.create_function('DATEDIFF', 2, mysql_datediff, deterministic=True)
+    conn.create_function('YEAR', 1, _date_part('year'), deterministic=True)
+    conn.create_function('MONTH', 1, _date_part('month'), deterministic=True)
+    conn.create_function('DAY', 1, _date_part('day'), deterministic=True)
+    conn.create_function('NOW', 0, lambda: datetime.now().isoformat(' ', 'seconds'))
+    conn.create_function('CURDATE', 0, lambda: date.today().isoformat())
+
+#---------------------------#
+# Dialect shim              #
+#---------------------------#
+
+# String literals, quoted identifiers and comments, which are never rewritten.
+_SQL_TOKEN_PATTERN = re.compile(r"""
+      '(?:[^'\\]|\\.|'')*'
+    | "(?:[^"\\]|\\.|"")*"
+    | `[^`]*`
+    | --[^\n]*
+    | /\*.*?\*/
+    """, re.VERBOSE | re.DOTALL)
+
+_STATEMENT_REWRITES = [
+    (re.compile(r'%\((\w+)\)s'), r':\1'),                                  # %(name)s parameters
+    (re.compile(r'%s'), '?'),                                              # %s parameters
+    (re.compile(r'%%'), '%'),
+    (re.compile(r'\bINSERT\s+IGNORE\b', re.IGNORECASE), 'INSERT OR IGNORE'),
+    (re.compile(r'\s+FOR\s+UPDATE\b|\s+LOCK\s+IN\s+SHARE\s+MODE\b', re.IGNORECASE), ''),
+]
+
+def _split_literals(sql):
+    """
+    Split the SQL code into alternating code and literal pieces.
+    """
+    pieces = []
+    position = 0
+    for match in _SQL_TOKEN_PATTERN.finditer(sql):
+        pieces.append((False, sql[position:match.start()]))
+        pieces.append((True, match.group()))
+        position = match.end()
+    pieces.append((False, sql[position:]))
+    return pieces
+
+_STRING_ESCAPES = {'0': '', 'n': '\n', 'r': '\r', 't': '\t', 'Z': '\x1a'}
+
+def _mysql_string_to_sqlite(literal):
+    """
+    Convert a MySQL string literal, which may use backslash escapes
+    and double quotes, to a single-quoted SQLite string literal.
+    """
+    quote, body = literal[0], literal[1:-1]
+    unescape = re.compile(r'\\(.)|' + quote * 2, re.DOTALL)
+    body = unescape.sub(lambda m: _STRING_ESCAPES.get(m.group(1), m.group(1))
+                        if m.group(1) is not None else quote, body)
+    return "'" + body.replace("'", "''") + "'"
+
+@lru_cache(maxsize = 512)
+def translate_sql(sql):
+    """
+    Rewrite a MySQL statement for SQLite: %s and %(name)s parameters
+    become ? and :name, backslash escapes in string literals are
+    converted, INSERT IGNORE becomes INSERT OR IGNORE, and row locking
+    clauses are dropped (SQLite locks the whole database on write).
+    """
+    out = []
+    for is_literal, piece in _split_literals(sql):
+        if is_literal:
+            if piece[0] == '"' or (piece[0] == "'" and '\\' in piece):
+                piece = _mysql_string_to_sqlite(piece)
+            out.append(piece)
+        else:
+            for pattern, replacement in _STATEMENT_REWRITES:
+                piece = pattern.sub(replacement, piece)
+            out.append(piece)
+    return ''.join(out)
+
+#---------------------------#
+# Schema loading            #
+#---------------------------#
+
+_COLUMN_CLEANUPS = [
+    (re.compile(r'\bAUTO_INCREMENT\b', re.IGNORECASE), ''),
+    (re.compile(r'\bunsigned\b', re.IGNORECASE), ''),
+    (re.compile(r'\bCHARACTER\s+SET\s+\w+', re.IGNORECASE), ''),
+    (re.compile(r'\bCOLLATE\s+\w+', re.IGNORECASE), ''),
+    (re.compile(r'\bON\s+UPDATE\s+CURRENT_TIMESTAMP\b', re.IGNORECASE), ''),
+    (re.compile(r'\b(?:tiny|small|medium|big)?int\b(?:\(\d+\))?', re.IGNORECASE), 'INTEGER'),
+    (re.compile(r'\benum\([^)]*\)', re.IGNORECASE), 'TEXT'),
+    (re.compile(r'\bCOMMENT\s+\'(?:[^\'\\]|\\.)*\'', re.IGNORECASE), ''),
+]
+
+_ON_UPDATE_PATTERN = re.compile(r'^`(\w+)`.*\bON\s+UPDATE\s+CURRENT_TIMESTAMP\b', re.IGNORECASE)
+_TEXT_TYPE_PATTERN = re.compile(r'\b(?:var)?char\(\d+\)|\b(?:tiny|medium|long)?text\b', re.IGNORECASE)
+_KEY_PATTERN = re.compile(r'^(UNIQUE\s+)?(?:KEY|INDEX)\s+`?(\w+)`?\s*\((.*)\)$', re.IGNORECASE)
+_CREATE_TABLE_PATTERN = re.compile(r'^CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?(\w+)`?', re.IGNORECASE)
+
+def translate_create_table(sql):
+    """
+    Translate a MySQL CREATE TABLE statement to SQLite. Return the
+    CREATE TABLE statement followed by CREATE INDEX statements for
+    its secondary keys and a trigger for each column that MySQL sets
+    ON UPDATE CURRENT_TIMESTAMP.
+    """
+    table = _CREATE_TABLE_PATTERN.match(sql).group(1)
+    head, body = sql.split('(', 1)
+    body = body[:body.rstrip().rstrip(';').rstrip().rfind(')')]   # drop the table options
+
+    definitions = []
+    indexes = []
+    triggers = []
+    for line in body.split('\n'):
+        line = line.strip().rstrip(',')
+        if not line:
+            continue
+
+        key = _KEY_PATTERN.match(line)
+        if key:
+            unique, name, columns = key.groups()
+            indexes.append(f'CREATE {"UNIQUE " if unique else ""}INDEX IF NOT EXISTS '
+                           f'`{table}_{name}` ON `{table}` ({columns})')
+            continue
+
+        if line.startswith('`'):
+            on_update = _ON_UPDATE_PATTERN.match(line)
+            if on_update:
+                # Stamp the row unless the update set the column itself.
+                column = on_update.group(1)
+                triggers.append(f'CREATE TRIGGER IF NOT EXISTS `{table}_{column}_on_update` '
+                                f'AFTER UPDATE ON `{table}` FOR EACH ROW '
+                                f'WHEN NEW.`{column}` IS OLD.`{column}` BEGIN '
+                                f'UPDATE `{table}` SET `{column}` = CURRENT_TIMESTAMP '
+                                f'WHERE rowid = NEW.rowid; END')
+            for pattern, replacement in _COLUMN_CLEANUPS:
+                line = pattern.sub(replacement, line)
+            # Compare text case-insensitively like utf8mb4_0900_ai_ci.
+            line = _TEXT_TYPE_PATTERN.sub(lambda m: m.group() + ' COLLATE NOCASE', line, count=1)
+            line = ' '.join(line.split())
+        definitions.append(line)
+
+    create = f'{head.strip()} (\n  ' + ',\n  '.join(definitions) + '\n)'
+    return [create] + indexes + triggers
+
+def split_statements(script):
+    """
+    Split an SQL script into statements on the semicolons that are
+    outside string literals and comments. Comments are dropped.
+    """
+    statements = []
+    current = []
+    for is_literal, piece in _split_literals(script):
+        if is_literal:
+            if piece.startswith(('--', '/*')):
+                continue
+            current.append(piece)
+            continue
+        parts = piece.split(';')
+        for part in parts[:-1]:
+            current.append(part)
+            statement = ''.join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+        current.append(parts[-1])
+
+    statement = ''.join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+_SKIPPED_STATEMENTS = ('set ', 'lock ', 'unlock ', 'use ', 'create database', 'create schema')
+
+def _has_tables(raw):
+    return raw.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'").fetchone()[0] > 0
+
+def load_mysql_dump(conn, path, if_empty = False):
+    """
+    Load a mysqldump file into the SQLite connection conn, translating
+    its table definitions and string literals. Statements that only
+    matter to a MySQL server (SET, LOCK TABLES, USE) are skipped.
+
+    The whole dump is loaded in one transaction, so a failed load leaves
+    no tables behind. It begins with BEGIN IMMEDIATE, which waits for
+    any other connection, in this process or another, that is writing.
+    If if_empty is true the dump is only loaded if the database still
+    has no tables once the transaction has begun. Return the number of
+    statements executed.
+    """
+    with open(path, encoding='utf-8') as file:
+        script = file.read()
+
+    raw = conn._raw if isinstance(conn, EmbeddedConnection) else conn
+    count = 0
+
+    raw.execute('PRAGMA foreign_keys = OFF')   # has no effect inside a transaction
+    try:
+        raw.execute('BEGIN IMMEDIATE')
+        try:
+            if if_empty and _has_tables(raw):
+                raw.rollback()
+                return 0
+            for statement in split_statements(script):
+                lowered = statement.lower()
+                if lowered.startswith(_SKIPPED_STATEMENTS):
+                    continue
+                if _CREATE_TABLE_PATTERN.match(statement):
+                    for translated in translate_create_table(statement):
+                        raw.execute(translated)
+                        count += 1
+                else:
+                    raw.execute(translate_sql(statement))
+                    count += 1
+            raw.commit()
+        except Exception:
+            raw.rollback()
+            raise
+    finally:
+        raw.execute('PRAGMA foreign_keys = ON')
+
+    return count
+
+#---------------------------#
+# Connections and cursors   #
+#---------------------------#
+
+class EmbeddedCursor:
+    """
+    A cursor that accepts MySQL statements and behaves like a
+    buffered mysql-connector cursor.
+    """
+    def __init__(self, conn, dictionary = False):
+        self._conn = conn
+        self._cursor = conn._raw.cursor()
+        self._dictionary = dictionary
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def column_names(self):
+        description = self._cursor.description
+        return tuple(column[0] for column in description) if description else ()
+
+    @property
+    def with_rows(self):
+        return self._cursor.description is not None
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    def _convert(self, rows):
+        if not self._dictionary:
+            return rows
+        names = self.column_names
+        return [dict(zip(names, row)) for row in rows]
+
+    def execute(self, operation, params = None, multi = False):
+        sql = translate_sql(operation)
+        try:
+            if params is None:
+                self._cursor.execute(sql)
+            else:
+                self._cursor.execute(sql, params)
+        except sqlite3.Error as e:
+            raise _driver_error(e)
+
+    def executemany(self, operation, seq_params):
+        try:
+            self._cursor.executemany(translate_sql(operation), seq_params)
+        except sqlite3.Error as e:
+            raise _driver_error(e)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is None:
+            return None
+        return self._convert([row])[0]
+
+    def fetchmany(self, size = 1):
+        return self._convert(self._cursor.fetchmany(size))
+
+    def fetchall(self):
+        return self._convert(self._cursor.fetchall())
+
+    def __iter__(self):
+        row = self.fetchone()
+        while row is not None:
+            yield row
+            row = self.fetchone()
+
+    def close(self):
+        self._cursor.close()
+        return True
+
+def _driver_error(e):
+    """
+    Wrap an SQLite error in mysql-connector's Error, so that the
+    portals' existing error handling catches it.
+    """
+    try:
+        from mysql.connector import Error
+    except ImportError:
+        return e
+    if isinstance(e, sqlite3.OperationalError) and 'locked' in str(e):
+        # The busy timeout ran out: report it as MySQL's lock wait timeout
+        return Error(msg=str(e), errno=1205)
+    return Error(msg=str(e))
+
+class EmbeddedConnection:
+    """
+    An SQLite connection that behaves like a MySQLConnection.
+    """
+    def __init__(self, raw):
+        self._raw = raw
+
+    def cursor(self, buffered = None, dictionary = None, prepared = None, **kwargs):
+        return EmbeddedCursor(self, dictionary=bool(dictionary))
+
+    @property
+    def unread_result(self):
+        return False
+
+    def consume_results(self):
+        pass
+
+    def start_transaction(self, **kwargs):
+        if not self._raw.in_transaction:
+            self._raw.execute('BEGIN')
+
+    @property
+    def in_transaction(self):
+        return self._raw.in_transaction
+
+    def commit(self):
+        self._raw.commit()
+
+    def rollback(self):
+        self._raw.rollback()
+
+    def is_connected(self):
+        try:
+            self._raw.execute('SELECT 1')
+            return True
+        except sqlite3.Error:
+            return False
+
+    def ping(self, reconnect = False, attempts = 1, delay = 0):
+        if not self.is_connected():
+            raise _driver_error(sqlite3.OperationalError('Connection is closed.'))
+
+    def close(self):
+        self._raw.close()
+
+_schema_lock = threading.Lock()
+
+def connect_embedded(database = ':memory:', schema = None, timeout = 10, **ignored):
+    """
+    Open an embedded SQLite connection to database. An in-memory
+    database is shared by every connection opened with the same
+    schema while any of them is open. If schema names a mysqldump
+    file and the database has no tables yet, the dump is loaded; of
+    several threads or processes connecting to a new database at once,
+    only the first loads it and the others wait for it to finish.
+    Other settings of the configuration section are ignored.
+    """
+    if database == ':memory:':
+        name = os.path.splitext(os.path.basename(schema))[0] if schema else 'embedded'
+        target, uri = f'file:{name}?mode=memory&cache=shared', True
+    else:
+        target, uri = database, False
+
+    raw = sqlite3.connect(target, uri=uri, timeout=float(timeout),
+                          detect_types=sqlite3.PARSE_DECLTYPES,
+                          check_same_thread=False)   # the pool hands connections to worker threads
+    _register_functions(raw)
+    raw.execute('PRAGMA foreign_keys = ON')
+    if not uri:
+        raw.execute('PRAGMA journal_mode = WAL')   # readers do not block the writer
+
+    conn = EmbeddedConnection(raw)
+    if schema:
+        # The lock serializes this process's threads, and load_mysql_dump
+        # checks again for tables once it holds the database's write lock.
+        with _schema_lock:
+            if not _has_tables(raw):
+                load_mysql_dump(conn, schema, if_empty=True)
+    return conn
+
+if __name__ == '__main__':
+    # Build a local database file from a mysqldump file, e.g.
+    #     python embedded_db.py asqlmaster.sql asqlmaster_local.db
+    if len(sys.argv) != 3:
+        print('Usage: python embedded_db.py <dump.sql> <database.db>')
+        sys.exit(1)
+
+    dump, database = sys.argv[1], sys.argv[2]
+    conn = connect_embedded(database)
+    print(f'Loaded {load_mysql_dump(conn, dump)} statements from {dump} into {database}')
+    conn.close()
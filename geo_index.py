@@ -0,0 +1,217 @@
+'''
+This module contains the GeolocationIndex, a process-wide, in-memory copy of
+the nearly static geolocation table.
+
+The index is loaded with one query the first time it is used and answers the
+lookups that the portals used to send to the database:
+
+    - zip code -> (city, state, lat, lng)
+    - state -> its cities, sorted
+    - (city, state) -> zip code
+
+The rows are held in compact arrays sorted by zip code, with every city and
+state name stored once. Every check_interval seconds the next lookup compares
+a cheap version of the table (row count and checksums) with the version that
+was loaded, and reloads the index only if the table has changed.
+
+File: geo_index.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+'''
+
+import os
+import time
+import threading
+from array import array
+from bisect import bisect_left
+from data201 import pooled_read_connection
+
+# Seconds between checks of whether the geolocation table has changed.
+DEFAULT_CHECK_INTERVAL = 600
+
+LOAD_SQL = """
+    SELECT geolocation_id, lat, lng, city, state_name
+    FROM geolocation
+    ORDER BY geolocation_id
+"""
+
+# Changes whenever a row is added, removed or edited.
+VERSION_SQL = """
+    SELECT COUNT(*), COALESCE(SUM(geolocation_id), 0),
+           COALESCE(ROUND(SUM(lat + lng), 3), 0),
+           COALESCE(SUM(LENGTH(city) + LENGTH(state_name)), 0)
+    FROM geolocation
+"""
+
+class _GeolocationData:
+    """
+    One loaded copy of the geolocation table. It is never modified,
+    so lookups can use it while a refresh builds its replacement.
+    """
+    def __init__(self, rows, version):
+        self.version = version
+        self.zip_codes = array('i')
+        self.lats = array('d')
+        self.lngs = array('d')
+        self.city_numbers = array('i')
+        self.state_numbers = array('i')
+        self.names = []        # city and state names, each stored once
+        name_numbers = {}
+        self.zip_by_place = {}  # (city, state) -> lowest zip code
+
+        def number(name):
+            if name not in name_numbers:
+                name_numbers[name] = len(self.names)
+                self.names.append(name)
+            return name_numbers[name]
+
+        cities_by_state = {}
+
+        for zip_code, lat, lng, city, state in rows:
+            self.zip_codes.append(zip_code)
+            self.lats.append(float('nan') if lat is None else float(lat))
+            self.lngs.append(float('nan') if lng is None else float(lng))
+            self.city_numbers.append(number(city))
+            self.state_numbers.append(number(state))
+            self.zip_by_place.setdefault((city, state), zip_code)
+            cities_by_state.setdefault(state, set()).add(city)
+
+        self.cities_by_state = {state: sorted(city for city in cities if city is not None)
+                                for state, cities in cities_by_state.items()}
+        self.states = sorted(state for state in cities_by_state if state is not None)
+        self.cities = sorted({city for (city, _) in self.zip_by_place if city is not None})
+
+    def position(self, zip_code):
+        """
+        Return the position of the zip code in the arrays, or -1.
+        """
+        try:
+            zip_code = int(zip_code)
+        except (TypeError, ValueError):
+            return -1
+        i = bisect_left(self.zip_codes, zip_code)
+        return i if i < len(self.zip_codes) and self.zip_codes[i] == zip_code else -1
+
+class GeolocationIndex:
+    """
+    The in-memory geolocation index of one database. Safe to use from
+    several threads.
+    """
+    def __init__(self, config_file = 'config.ini', section = 'mysql',
+                 check_interval = DEFAULT_CHECK_INTERVAL):
+        self.config_file = config_file
+        self.section = section
+        self.check_interval = check_interval
+
+        self._data = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'loads': 0, 'version_checks': 0, 'lookups': 0}
+
+    def _query(self, sql):
+        with pooled_read_connection(self.config_file, self.section) as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(sql)
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def _version(self):
+        return tuple(str(value) for value in self._query(VERSION_SQL)[0])
+
+    def refresh(self, force = False):
+        """
+        Reload the index if the geolocation table has changed since it
+        was loaded, or unconditionally if force is true. Return whether
+        the index was reloaded.
+        """
+        with self._lock:
+            self._checked = time.monotonic()
+            version = self._version()
+            self._stats['version_checks'] += 1
+
+            if not force and self._data is not None and self._data.version == version:
+                return False
+
+            self._data = _GeolocationData(self._query(LOAD_SQL), version)
+            self._stats['loads'] += 1
+            return True
+
+    def _current(self):
+        """
+        Return the loaded data, loading it on first use and checking
+        its version once every check_interval seconds.
+        """
+        if self._data is None or time.monotonic() - self._checked > self.check_interval:
+            self.refresh()
+        self._stats['lookups'] += 1
+        return self._data
+
+    def has_zip(self, zip_code):
+        """
+        Return whether the zip code is in the geolocation table.
+        """
+        return self._current().position(zip_code) >= 0
+
+    def location(self, zip_code):
+        """
+        Return the (city, state, lat, lng) of the zip code,
+        or None if it is unknown.
+        """
+        data = self._current()
+        i = data.position(zip_code)
+        if i < 0:
+            return None
+        return (data.names[data.city_numbers[i]], data.names[data.state_numbers[i]],
+                data.lats[i], data.lngs[i])
+
+    def zip_for(self, city, state):
+        """
+        Return the lowest zip code of the city in the state,
+        or None if there is no such place.
+        """
+        return self._current().zip_by_place.get((city, state))
+
+    def states(self):
+        """
+        Return the sorted list of distinct state names.
+        """
+        return list(self._current().states)
+
+    def cities(self, state = None):
+        """
+        Return the sorted list of distinct city names of the
+        state, or of all states if state is None.
+        """
+        data = self._current()
+        if state is None:
+            return list(data.cities)
+        return list(data.cities_by_state.get(state, []))
+
+    def stats(self):
+        """
+        Return the number of rows, loads, version checks and lookups.
+        """
+        stats = dict(self._stats)
+        stats['rows'] = len(self._data.zip_codes) if self._data is not None else 0
+        return stats
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+def get_geo_index(config_file = 'config.ini', section = 'mysql'):
+    """
+    Return the geolocation index for the configuration file
+    config_file with the given section, creating it on first use.
+    It is loaded on its first lookup.
+    """
+    key = (os.path.abspath(config_file), section)
+
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = GeolocationIndex(config_file, section)
+
+    return index
@@ -0,0 +1,262 @@
+'''
+This module contains the IdAllocator, which hands out new order, customer
+and seller IDs.
+
+Every sequence has a row in the id_sequences table holding its next free ID.
+A process reserves a block of IDs with one short transaction that moves
+next_id past the block, and then hands the IDs out from memory. Concurrent
+checkouts therefore never pick the same ID, and most IDs cost no round trip.
+IDs of a block that a process does not use are skipped, so sequences can
+have gaps.
+
+A sequence's row is created on first use, starting after the largest ID
+already in its table.
+
+    new_order_id = next_id('orders', config_file='sqlproject.ini')
+
+The concurrency test drives parallel allocations from several processes and
+checks that no ID is handed out twice. With the embedded backend the
+database file need not exist yet; the first process to connect builds it:
+
+    python id_allocator.py stress sqlproject.ini
+
+File: id_allocator.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+'''
+
+import os
+import sys
+import json
+import time
+import threading
+import subprocess
+from configparser import ConfigParser
+from data201 import pooled_connection
+
+# Optional section of the configuration file that sets how many
+# IDs a process reserves at a time.
+ALLOCATOR_SECTION = 'id_allocator'
+
+ALLOCATOR_DEFAULTS = {
+    'block_size': 20,
+}
+
+# The query that finds the first free ID of each sequence
+# when the sequence's row is created.
+SEQUENCE_SEEDS = {
+    'orders': "SELECT COALESCE(MAX(order_id), 0) + 1 FROM orders",
+    'customers': "SELECT COALESCE(MAX(customer_id), 1000) + 1 FROM customers",
+    'sellers': "SELECT COALESCE(MAX(CAST(SUBSTRING(seller_id, 2) AS UNSIGNED)), 1000) + 1 "
+               "FROM sellers WHERE seller_id REGEXP '^S[0-9]+$'",
+}
+
+def read_allocator_config(config_file = 'config.ini'):
+    """
+    Read the optional [id_allocator] section of the configuration file
+    config_file and return its settings as a dictionary, using the
+    defaults for any setting that is not given.
+    """
+    settings = dict(ALLOCATOR_DEFAULTS)
+    parser = ConfigParser()
+    parser.read(config_file)
+
+    if parser.has_section(ALLOCATOR_SECTION):
+        for key, value in parser.items(ALLOCATOR_SECTION):
+            if key in settings:
+                settings[key] = type(ALLOCATOR_DEFAULTS[key])(value)
+
+    return settings
+
+class IdAllocator:
+    """
+    Hands out the IDs of named sequences of one database, reserving
+    block_size IDs at a time. Safe to use from several threads.
+    """
+    def __init__(self, config_file = 'config.ini', section = 'mysql', block_size = None):
+        self.config_file = config_file
+        self.section = section
+        self.block_size = block_size or read_allocator_config(config_file)['block_size']
+
+        self._lock = threading.Lock()
+        self._blocks = {}   # sequence -> [next ID, end of the block]
+        self._stats = {'allocations': 0, 'reservations': 0}
+
+    def _seed(self, conn, sequence):
+        """
+        Create the sequence's row, starting after the largest ID in its
+        table. If another process creates it first, its row is kept.
+        """
+        cursor = conn.cursor()
+        try:
+            cursor.execute(SEQUENCE_SEEDS.get(sequence, 'SELECT 1'))
+            first = cursor.fetchone()[0]
+            cursor.execute("INSERT IGNORE INTO id_sequences (name, next_id) VALUES (%s, %s)",
+                           (sequence, int(first)))
+            conn.commit()
+        finally:
+            cursor.close()
+
+    def reserve(self, sequence, count):
+        """
+        Reserve count consecutive IDs of the sequence in the database
+        and return the first. The update holds the sequence's row only
+        until the reservation commits.
+        """
+        with pooled_connection(self.config_file, self.section) as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("UPDATE id_sequences SET next_id = next_id + %s WHERE name = %s",
+                               (count, sequence))
+                if cursor.rowcount == 0:
+                    conn.rollback()
+                    self._seed(conn, sequence)
+                    cursor.execute("UPDATE id_sequences SET next_id = next_id + %s WHERE name = %s",
+                                   (count, sequence))
+
+                cursor.execute("SELECT next_id FROM id_sequences WHERE name = %s", (sequence,))
+                end = int(cursor.fetchone()[0])
+                conn.commit()
+            finally:
+                cursor.close()
+
+        return end - count
+
+    def allocate(self, sequence):
+        """
+        Return a new ID of the sequence, reserving a new block
+        when this process has used up its current one.
+        """
+        with self._lock:
+            block = self._blocks.get(sequence)
+            if block is None or block[0] >= block[1]:
+                # Reserve under the lock so that threads share one new block.
+                first = self.reserve(sequence, self.block_size)
+                block = self._blocks[sequence] = [first, first + self.block_size]
+                self._stats['reservations'] += 1
+
+            new_id = block[0]
+            block[0] += 1
+            self._stats['allocations'] += 1
+            return new_id
+
+    def allocate_many(self, sequence, count):
+        """
+        Return a list of count new IDs of the sequence, reserved
+        with one round trip outside the process's block.
+        """
+        first = self.reserve(sequence, count)
+        with self._lock:
+            self._stats['allocations'] += count
+            self._stats['reservations'] += 1
+        return list(range(first, first + count))
+
+    def stats(self):
+        """
+        Return how many IDs were allocated and how many
+        round trips reserved them.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+_allocators = {}
+_allocators_lock = threading.Lock()
+
+def get_allocator(config_file = 'config.ini', section = 'mysql'):
+    """
+    Return the ID allocator for the configuration file config_file
+    with the given section, creating it on first use.
+    """
+    key = (os.path.abspath(config_file), section)
+
+    with _allocators_lock:
+        allocator = _allocators.get(key)
+        if allocator is None:
+            allocator = _allocators[key] = IdAllocator(config_file, section)
+
+    return allocator
+
+def next_id(sequence, config_file = 'config.ini', section = 'mysql'):
+    """
+    Return a new ID of the sequence: orders, customers or sellers.
+    """
+    return get_allocator(config_file, section).allocate(sequence)
+
+#---------------------------#
+# Concurrency test          #
+#---------------------------#
+
+STRESS_SEQUENCE = 'stress_test'
+
+def _allocate_in_threads(config_file, threads, allocations):
+    """
+    Allocate IDs of the stress-test sequence from several threads
+    at once and return them all.
+    """
+    allocator = get_allocator(config_file)
+    start = threading.Barrier(threads)
+    results = [[] for _ in range(threads)]
+
+    def work(ids):
+        start.wait()
+        for _ in range(allocations):
+            ids.append(allocator.allocate(STRESS_SEQUENCE))
+
+    workers = [threading.Thread(target=work, args=(ids,)) for ids in results]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return [new_id for ids in results for new_id in ids], allocator.stats()
+
+def stress_test(config_file, processes = 4, threads = 8, allocations = 50):
+    """
+    Allocate IDs of a scratch sequence from processes x threads
+    workers in parallel and check that every ID is unique. Return a
+    dictionary with the number of IDs, duplicates and reservations
+    and the elapsed time. The scratch sequence's row is removed.
+    """
+    started = time.perf_counter()
+    command = [sys.executable, __file__, 'allocate', config_file, str(threads), str(allocations)]
+    children = [subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+                for _ in range(processes)]
+
+    ids = []
+    reservations = 0
+    for child in children:
+        output, _ = child.communicate()
+        if child.returncode != 0:
+            raise Exception(f'Allocation process failed with exit code {child.returncode}.')
+        result = json.loads(output.strip().splitlines()[-1])
+        ids.extend(result['ids'])
+        reservations += result['stats']['reservations']
+    elapsed = time.perf_counter() - started
+
+    with pooled_connection(config_file) as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM id_sequences WHERE name = %s", (STRESS_SEQUENCE,))
+        conn.commit()
+        cursor.close()
+
+    return {'ids': len(ids), 'expected': processes * threads * allocations,
+            'duplicates': len(ids) - len(set(ids)),
+            'reservations': reservations, 'seconds': elapsed}
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+
+    if command == 'allocate' and len(sys.argv) == 5:
+        ids, stats = _allocate_in_threads(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
+        print(json.dumps({'ids': ids, 'stats': stats}))
+
+    elif command == 'stress' and len(sys.argv) == 3:
+        result = stress_test(sys.argv[2])
+        print(f"{result['ids']} of {result['expected']} IDs allocated in "
+              f"{result['seconds']:.2f} s with {result['reservations']} reservations, "
+              f"{result['duplicates']} duplicates")
+        sys.exit(1 if result['duplicates'] or result['ids'] != result['expected'] else 0)
+
+    else:
+        print('Usage: python id_allocator.py stress CONFIG_FILE')
@@ -15,16 +15,37 @@ Course: DATA 201
 '''
 
 import sys
+import importlib
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtWidgets import QMessageBox, QApplication, QDialog
-import mysql.connector
-from customer_home import CustomerHome  # Import customer portal
-from seller_portal import SellerPortal  # Import seller portal
-from manager_portal import ManagerPortal  # Import manager portal
 from shared import open_signup_portal  # Use shared function to open the SignUpPortal
-from data201 import make_connection  # Database connection utility
+from credentials import authenticate  # Password check against the credential store
+from data201 import get_pool  # Pooled connections, opened while the user types
 import os
 
+# The module and window class of each portal. A portal and its heavy
+# dependencies (pandas, matplotlib, seaborn) are imported only once
+# the user's role is known, so the login window appears right away.
+PORTALS = {
+    "customer": ("customer_home", "CustomerHome"),
+    "seller": ("seller_portal", "SellerPortal"),
+    "manager": ("manager_portal", "ManagerPortal"),
+}
+
+
+def load_portal(portal):
+    """
+    Import the portal's module on first use and return its window class.
+
+    Input:
+        - portal (str): The user's role: customer, seller or manager.
+
+    Output:
+        - The window class of the portal.
+    """
+    module_name, class_name = PORTALS[portal]
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 class LoginPage(QDialog):
     def __init__(self):
@@ -39,6 +60,10 @@ class LoginPage(QDialog):
         self.setFont(font)
         self.setWindowTitle("Login Portal")
 
+        # Create the connection pool now: it opens its first connections
+        # in the background, so the login query does not wait for them
+        get_pool('sqlproject.ini', prewarm=True)
+
         # Layouts for UI elements
         self.verticalLayout = QtWidgets.QVBoxLayout(self)
         self.horizontalLayoutLogo = QtWidgets.QHBoxLayout()
@@ -150,58 +175,81 @@ class LoginPage(QDialog):
             return
 
         try:
-            conn = make_connection(config_file='sqlproject.ini')
-            cursor = conn.cursor()
-
-            # Query to check user credentials and retrieve role and customer_id
-            query = "SELECT portal, user_name FROM user_portal WHERE user_name = %s AND password = %s"
-            cursor.execute(query, (username, password))
-            user = cursor.fetchone()
-
-            cursor.close()
-            conn.close()
-
-            if user:
-                portal, customer_id = user
-                username_display = username.split('@')[0]
-                QMessageBox.information(self, "Login Successful", f"Welcome {portal} {username_display}!")
-                self.open_main_window(portal, customer_id)
-            else:
-                QMessageBox.warning(self, "Login Failed", "Invalid username or password.")
-
-        except mysql.connector.Error as err:
+            # One indexed lookup returns the role and the customer or seller id
+            user = authenticate(username, password, config_file='sqlproject.ini')
+        except Exception as err:
             QMessageBox.critical(self, "Database Error", f"Failed to connect to the database: {err}")
-    
-    def open_main_window(self, portal, username):
+            return
+
+        if user is None:
+            QMessageBox.warning(self, "Login Failed", "Invalid username or password.")
+            return
+
+        portal, customer_id, seller_id = user
+
+        if portal not in PORTALS:
+            QMessageBox.warning(self, "Login Error", "Unknown role. Please contact support.")
+            return
+        if portal == "customer" and customer_id is None:
+            QMessageBox.warning(self, "Login Error", "Customer not found. Please contact support.")
+            return
+
+        # Create the portal while the welcome message is showing, so that
+        # its initial data is already loading in the background
+        self.prewarmed_window = None
+        self.prewarm_timer = QtCore.QTimer(self)
+        self.prewarm_timer.setSingleShot(True)
+        self.prewarm_timer.timeout.connect(lambda: self.prewarm_main_window(portal, customer_id))
+        self.prewarm_timer.start(0)
+
+        username_display = username.split('@')[0]
+        QMessageBox.information(self, "Login Successful", f"Welcome {portal} {username_display}!")
+        self.open_main_window(portal, customer_id)
+
+    def create_main_window(self, portal, customer_id):
+        """
+        Import the portal for the user's role and create its window.
+        The window starts loading its data as soon as it is created.
+
+        Input:
+            - portal (str): The user's role: customer, seller or manager.
+            - customer_id (int or None): The customer's ID, for the customer portal.
+
+        Output:
+            - The portal's window, not yet shown.
+        """
+        window_class = load_portal(portal)
+        if portal == "customer":
+            return window_class(customer_id=customer_id)
+        return window_class()
+
+    def prewarm_main_window(self, portal, customer_id):
+        """Create the portal's window ahead of time. Errors are reported when it is opened."""
+        try:
+            self.prewarmed_window = self.create_main_window(portal, customer_id)
+        except Exception as e:
+            print(f"Error preparing the {portal} portal: {e}")
+
+    def open_main_window(self, portal, customer_id):
         """Open the main window based on user role."""
+        self.prewarm_timer.stop()  # The welcome message may be dismissed before the portal was created
+
         try:
-            self.connection = make_connection(config_file='sqlproject.ini')
-            self.cursor = self.connection.cursor()
+            window = self.prewarmed_window or self.create_main_window(portal, customer_id)
+            self.prewarmed_window = None
 
             if portal == "customer":
-                query = "SELECT customer_id FROM customers WHERE customer_email = %s"
-                self.cursor.execute(query, (username,))
-                result = self.cursor.fetchone()
-
-                if result:
-                    customer_id = result[0]
-                    self.customer_home = CustomerHome(customer_id=customer_id)
-                    self.customer_home.show()
-                else:
-                    QMessageBox.warning(self, "Login Error", "Customer not found. Please contact support.")
-                    return
+                self.customer_home = window
+                self.customer_home.show()
 
             elif portal == "seller":
-                self.seller_portal = SellerPortal()
+                self.seller_portal = window
                 self.seller_portal.show()
 
             elif portal == "manager":
-                self.manager_portal = ManagerPortal()
+                self.manager_portal = window
                 self.manager_portal.show_dialog()
 
-            else:
-                QMessageBox.warning(self, "Login Error", "Unknown role. Please contact support.")
-
             self.close()
 
         except Exception as e:
@@ -18,17 +18,16 @@ Course: DATA 201
 import sys
 from PyQt5 import uic, QtWidgets, QtCore
 from PyQt5.QtWidgets import (QDialog, QApplication, QTableWidgetItem, QHeaderView, QMessageBox, QTableWidget)
-from data201 import make_connection
+from data201 import make_connection, cached_query, query_rows, query_dataframe, query_typed, format_trace_report
+from query_runner import QueryRunner
+from id_allocator import next_id
+from geo_index import get_geo_index
 import matplotlib.pyplot as plt
 import seaborn as sns
-import pandas as pd
 from shared import open_login_portal
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 
-conn = make_connection(config_file='sqlproject.ini')
-cursor = conn.cursor()
-
 class ManagerPortal(QDialog):
     """
     The main dialog for the Bike Store Manager portal.
@@ -39,6 +38,9 @@ class ManagerPortal(QDialog):
         """
         super().__init__()
         self.ui = uic.loadUi('manager_portal.ui')  # Load the UI file
+
+        # Runs the dashboard queries off the GUI thread
+        self.query_runner = QueryRunner(self)
              
         # Store the current seller_id
         self.current_seller_id = None
@@ -55,6 +57,7 @@ class ManagerPortal(QDialog):
 
         self._initialize_dropdowns()
         self._setup_refresh_button()
+        self._setup_query_report_action()
         self._setup_event_connections()
         self.setRevenue_trend_yearandmonth()  
 
@@ -234,9 +237,6 @@ class ManagerPortal(QDialog):
         This function populates the 'All Sellers' dropdown with seller full names (first + last name).
         It fetches the seller IDs and names from the database and adds them to the dropdown list.
         """
-        conn = make_connection(config_file="sqlproject.ini")
-        cursor = conn.cursor()
-
         try:
             # SQL query to fetch seller IDs and concatenated first and last names for the dropdown options
             sql = """
@@ -244,8 +244,8 @@ class ManagerPortal(QDialog):
                 FROM sellers
                 ORDER BY full_name
             """
-            cursor.execute(sql)
-            rows = cursor.fetchall()  # Fetch the rows containing seller information
+            # Served from the query cache; seller writes through data201 invalidate it
+            rows = cached_query(sql, ttl=120, config_file="sqlproject.ini")
 
             # Clear previous entries in the dropdown
             self.ui.cmbAllSellers.clear()
@@ -264,27 +264,17 @@ class ManagerPortal(QDialog):
         except Exception as e:
             # If there is an error with the database query, display a critical error message
             QMessageBox.critical(self, "Error", f"An error occurred while populating seller dropdown: {e}")
-        finally:
-            # Close the cursor and database connection after the operation is complete
-            cursor.close()
-            conn.close()
 
     # state and city dropdown
     def _populate_states_and_cities(self):
         """
         Populate the states and cities dropdowns with data, with default placeholder options.
         """
-        conn = make_connection(config_file="sqlproject.ini")
-        cursor = conn.cursor()
-
         try:
-            sql_states = "SELECT DISTINCT state_name FROM geolocation ORDER BY state_name"
-            sql_cities = "SELECT DISTINCT city FROM geolocation ORDER BY city"
-
-            cursor.execute(sql_states)
-            states = [row[0] for row in cursor.fetchall()]
-            cursor.execute(sql_cities)
-            cities = [row[0] for row in cursor.fetchall()]
+            # Geolocation data is nearly static, so it is served from the in-memory index
+            geo_index = get_geo_index(config_file="sqlproject.ini")
+            states = geo_index.states()
+            cities = geo_index.cities()
 
             # Clear and populate dropdowns with default options
             self.ui.cmbStates.clear()
@@ -301,9 +291,6 @@ class ManagerPortal(QDialog):
             QMessageBox.critical(
                 self, "Error", f"An error occurred while populating state/city dropdowns: {e}"
             )
-        finally:
-            cursor.close()
-            conn.close()
 
     def _update_cities_based_on_state(self):
         """
@@ -313,15 +300,9 @@ class ManagerPortal(QDialog):
         if selected_state == "Select a State": 
             return
 
-        conn = make_connection(config_file="sqlproject.ini")
-        cursor = conn.cursor()
-
         try:
             # Fetch cities for the selected state
-            sql = "SELECT DISTINCT city FROM geolocation WHERE state_name = %s ORDER BY city"
-            cursor.execute(sql, (selected_state,))
-            cities = [row[0] for row in cursor.fetchall()]
-
+            cities = get_geo_index(config_file="sqlproject.ini").cities(selected_state)
 
             self.ui.cmbCities.blockSignals(True)  
             self.ui.cmbCities.clear()
@@ -331,9 +312,6 @@ class ManagerPortal(QDialog):
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred while updating cities: {e}")
-        finally:
-            cursor.close()
-            conn.close()
 
     # search    
     def _search_seller(self):
@@ -376,7 +354,8 @@ class ManagerPortal(QDialog):
         try:
             # Build the SQL query for searching by seller_id, seller_first_name, or seller_last_name
             sql = """
-                SELECT seller_id, seller_first_name, seller_last_name, seller_email, seller_phone
+                SELECT seller_id, seller_first_name, seller_last_name, seller_email, seller_phone,
+                       seller_zip_code
                 FROM sellers
                 WHERE (%s IS NULL OR seller_id = %s)
                 AND (%s IS NULL OR seller_first_name LIKE %s)
@@ -426,7 +405,8 @@ class ManagerPortal(QDialog):
 
             try:
                 sql = """
-                    SELECT seller_id, seller_first_name, seller_last_name, seller_email, seller_phone
+                    SELECT seller_id, seller_first_name, seller_last_name, seller_email, seller_phone,
+                           seller_zip_code
                     FROM sellers
                     WHERE seller_id = %s
                 """
@@ -451,21 +431,11 @@ class ManagerPortal(QDialog):
         """
         try:
             # Extract seller information from the tuple
-            seller_id, first_name, last_name, email, phone = seller_details
+            seller_id, first_name, last_name, email, phone, zip_code = seller_details
             
-            # Fetch city and state from geolocation table based on seller's zip code
-            conn = make_connection(config_file="sqlproject.ini")
-            cursor = conn.cursor()
-    
-            # Fetch the city and state based on the seller's zip code (seller_zip_code)
-            cursor.execute("""
-                SELECT DISTINCT city, state_name
-                FROM geolocation
-                WHERE geolocation_id = (
-                    SELECT seller_zip_code FROM sellers WHERE seller_id = %s
-                )
-            """, (seller_id,))
-            location = cursor.fetchone()
+            # Look up the city and state of the seller's zip code in the geolocation index
+            geo_index = get_geo_index(config_file="sqlproject.ini")
+            location = geo_index.location(zip_code)
 
             # Set default city and state to "Unknown" if not found
             city = location[0] if location else "Unknown"
@@ -477,12 +447,9 @@ class ManagerPortal(QDialog):
             self.ui.seller_email_edit.setText(email)
             self.ui.seller_phone_edit.setText(phone)
 
-            # Fetch all available cities and states from the geolocation table
-            cursor.execute("SELECT DISTINCT city FROM geolocation ORDER BY city")
-            cities = [row[0] for row in cursor.fetchall()]
-            
-            cursor.execute("SELECT DISTINCT state_name FROM geolocation ORDER BY state_name")
-            states = [row[0] for row in cursor.fetchall()]
+            # All available cities and states from the geolocation index
+            cities = geo_index.cities()
+            states = geo_index.states()
 
             # Clear existing items in dropdowns
             self.ui.cmbStates.clear()
@@ -603,22 +570,13 @@ class ManagerPortal(QDialog):
             conn = make_connection(config_file="sqlproject.ini")
             cursor = conn.cursor()
 
-            # Fetch ZIP code based on city and state
-            geolocation_query = """
-                SELECT geolocation_id
-                FROM geolocation
-                WHERE city = %s AND state_name = %s
-            """
-            cursor.execute(geolocation_query, (seller_city, seller_state,))
-            geolocation_data = cursor.fetchone()
+            # Look up the ZIP code of the city and state in the geolocation index
+            seller_zip_code = get_geo_index(config_file="sqlproject.ini").zip_for(seller_city, seller_state)
 
-            if not geolocation_data:
-                seller_zip_code = None
+            if seller_zip_code is None:
                 QMessageBox.warning(self, "Geolocation Warning", "No matching ZIP Code found for the provided city and state. Setting ZIP code to NULL.")
-
-
-            seller_zip_code = geolocation_data[0]
-            print(f"Found ZIP Code: {seller_zip_code}")
+            else:
+                print(f"Found ZIP Code: {seller_zip_code}")
 
             # Update seller information in the database
             update_sql = """
@@ -689,6 +647,8 @@ class ManagerPortal(QDialog):
             cursor.execute("SELECT COUNT(*) FROM product_stock WHERE seller_id = %s", (seller_id,))
             product_stock_count = cursor.fetchone()[0]
             if product_stock_count > 0:
+                cursor.execute("DELETE FROM product_stock_shards WHERE seller_id = %s", (seller_id,))
+                cursor.execute("DELETE FROM stock_holds WHERE seller_id = %s", (seller_id,))
                 cursor.execute("DELETE FROM product_stock WHERE seller_id = %s", (seller_id,))
 
             # Finally, delete the seller record from the sellers table
@@ -738,25 +698,19 @@ class ManagerPortal(QDialog):
         cursor = conn.cursor()
 
         try:
-            # Fetch the geolocation_id based on the city and state selected
-            cursor.execute(
-                "SELECT geolocation_id FROM geolocation WHERE city = %s AND state_name = %s LIMIT 1",
-                (seller_city, seller_state)
-            )
-            geolocation_result = cursor.fetchone()
+            # Look up the geolocation_id (zip code) of the city and state selected
+            seller_zip_code = get_geo_index(config_file="sqlproject.ini").zip_for(seller_city, seller_state)
 
             # If no matching geolocation found, show an error message
-            if not geolocation_result:
+            if seller_zip_code is None:
                 QMessageBox.warning(
                     self, "Geolocation Error", 
                     f"No matching geolocation found for City: {seller_city}, State: {seller_state}!"
                 )
                 return
 
-            seller_zip_code = geolocation_result[0]  # Retrieve geolocation_id (zip code)
-
-            # Generate a new seller ID
-            new_seller_id = self._generate_new_seller_id(cursor)
+            # Allocate a new seller ID from the shared sequence
+            new_seller_id = f"S{next_id('sellers', config_file='sqlproject.ini')}"
 
             # SQL query to insert a new seller into the database
             sql = """
@@ -792,20 +746,6 @@ class ManagerPortal(QDialog):
 
 
     
-    def _generate_new_seller_id(self, cursor):
-        """
-        Generate the next available seller_id.
-        """
-        cursor.execute("SELECT seller_id FROM sellers WHERE seller_id REGEXP '^S[0-9]+'")
-        all_ids = [int(row[0][1:]) for row in cursor.fetchall()]
-        all_ids.sort()
-
-        for i in range(1001, 9999):  # Assuming max seller_id is S9999
-            if i not in all_ids:
-                return f"S{i}"
-        raise ValueError("No available seller ID!")
-    
-
     def _handle_navigation(self, subpage_name):
         """
         Handle navigation between subpages, prompting for unsaved changes if necessary.
@@ -879,15 +819,37 @@ class ManagerPortal(QDialog):
         # call the original chart function 
         self.showDashboard() 
 
+    def _setup_query_report_action(self):
+        """
+        Add a "Query Performance Report" action to the portal's right-click
+        menu, also bound to Ctrl+Shift+Q.
+        """
+        action = QtWidgets.QAction("Query Performance Report", self.ui)
+        action.setShortcut("Ctrl+Shift+Q")
+        action.triggered.connect(self._show_query_report)
+        self.ui.addAction(action)
+        self.ui.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
+
+    def _show_query_report(self):
+        """
+        Print the per-query timing summary and show it in a dialog.
+        """
+        report = format_trace_report()
+        print(report)
+
+        box = QMessageBox(self.ui)
+        box.setWindowTitle("Query Performance Report")
+        box.setText("Query timings per query (p50/p95/p99), slowest first. "
+                    "Statements over the slow-query threshold are also written to the slow-query log.")
+        box.setDetailedText(report)
+        box.exec_()
+
 
     # month dropdown        
     def _populate_month(self):
         """
         Populate the 'All Month' dropdown with the month names.
         """
-        conn = make_connection(config_file="sqlproject_wh.ini")
-        cursor = conn.cursor()
-
         try:
             # Fetch months for dropdown population
             sql = """
@@ -895,8 +857,7 @@ class ManagerPortal(QDialog):
                 FROM Dim_Time
                 ORDER BY month
             """
-            cursor.execute(sql)
-            rows = cursor.fetchall()
+            rows = cached_query(sql, ttl=3600, config_file="sqlproject_wh.ini")
 
             # Clear previous dropdown entries
             self.ui.cmbAllMonth.clear()
@@ -912,9 +873,6 @@ class ManagerPortal(QDialog):
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred while populating month dropdown: {e}")
-        finally:
-            cursor.close()
-            conn.close()
     
     def _get_month_name(self, month_num):
         """Convert month number to month name."""
@@ -929,9 +887,6 @@ class ManagerPortal(QDialog):
         """
         Populate the 'Category' dropdown with product categories.
         """
-        conn = make_connection(config_file="sqlproject_wh.ini")
-        cursor = conn.cursor()
-
         try:
             # Fetch product categories for dropdown population
             sql = """
@@ -939,8 +894,7 @@ class ManagerPortal(QDialog):
                 FROM Dim_Products
                 ORDER BY product_category
             """
-            cursor.execute(sql)
-            rows = cursor.fetchall()
+            rows = cached_query(sql, ttl=3600, config_file="sqlproject_wh.ini")
 
             # Clear previous dropdown entries
             self.ui.cmbAllCategory.clear()
@@ -955,18 +909,12 @@ class ManagerPortal(QDialog):
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred while populating category dropdown: {e}")
-        finally:
-            cursor.close()
-            conn.close()
     
     # status dropdown
     def _populate_status(self):
         """
         Populate the 'Status' dropdown with order statuses.
         """
-        conn = make_connection(config_file="sqlproject.ini")
-        cursor = conn.cursor()
-
         try:
             # Fetch order statuses for dropdown population
             sql = """
@@ -974,8 +922,7 @@ class ManagerPortal(QDialog):
                 FROM orders
                 ORDER BY order_status
             """
-            cursor.execute(sql)
-            rows = cursor.fetchall()
+            rows = cached_query(sql, ttl=300, config_file="sqlproject.ini")
 
             # Clear previous dropdown entries
             self.ui.cmbAllStatus.clear()
@@ -990,9 +937,6 @@ class ManagerPortal(QDialog):
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred while populating status dropdown: {e}")
-        finally:
-            cursor.close()
-            conn.close()
 
 
     def _selected_dropdown(self):
@@ -1032,40 +976,39 @@ class ManagerPortal(QDialog):
         Generate and display Monthly Revenue Trends in the Revenue_trend_yearandmonth layout.
         Updates dynamically based on dropdown selections or defaults to full data.
         """
-        try:
-            conn = make_connection(config_file="sqlproject.ini")
-            cursor = conn.cursor()
-            
-            # Generate conditions based on selected options.
-            conditions = self._selected_dropdown()
-            if conditions:
-                query = f"""
-                    SELECT DATE_FORMAT(order_purchase_timestamp, '%Y-%m') AS year_and_month, 
-                        SUM(payment_value) AS total_revenue
-                    FROM orders
-                    JOIN order_payments ON orders.order_id = order_payments.order_id
-                    JOIN order_items ON orders.order_id = order_items.order_id
-                    JOIN products ON products.product_id = order_items.product_id
-                    WHERE {conditions}
-                    GROUP BY DATE_FORMAT(order_purchase_timestamp, '%Y-%m')
-                    ORDER BY year_and_month;
-                """
-            else:
-                # Default to displaying complete data.
-                query = """
-                    SELECT DATE_FORMAT(order_purchase_timestamp, '%Y-%m') AS year_and_month, 
-                        SUM(payment_value) AS total_revenue
-                    FROM orders
-                    JOIN order_payments ON orders.order_id = order_payments.order_id
-                    GROUP BY DATE_FORMAT(order_purchase_timestamp, '%Y-%m')
-                    ORDER BY year_and_month;
-                """
-            
-            cursor.execute(query)
-            revenue_data = cursor.fetchall()
-            cursor.close()
-            conn.close()
+        # Generate conditions based on selected options.
+        conditions = self._selected_dropdown()
+        if conditions:
+            query = f"""
+                SELECT DATE_FORMAT(order_purchase_timestamp, '%Y-%m') AS year_and_month, 
+                    SUM(payment_value) AS total_revenue
+                FROM orders
+                JOIN order_payments ON orders.order_id = order_payments.order_id
+                JOIN order_items ON orders.order_id = order_items.order_id
+                JOIN products ON products.product_id = order_items.product_id
+                WHERE {conditions}
+                GROUP BY DATE_FORMAT(order_purchase_timestamp, '%Y-%m')
+                ORDER BY year_and_month;
+            """
+        else:
+            # Default to displaying complete data.
+            query = """
+                SELECT DATE_FORMAT(order_purchase_timestamp, '%Y-%m') AS year_and_month, 
+                    SUM(payment_value) AS total_revenue
+                FROM orders
+                JOIN order_payments ON orders.order_id = order_payments.order_id
+                GROUP BY DATE_FORMAT(order_purchase_timestamp, '%Y-%m')
+                ORDER BY year_and_month;
+            """
+        self.query_runner.submit(
+            "revenue_trend", query_rows, query, config_file="sqlproject.ini",
+            on_result=self._draw_revenue_trend,
+            on_error=lambda err: QMessageBox.critical(self, "Error", f"Failed to display Revenue Trends: {err}")
+        )
 
+    def _draw_revenue_trend(self, revenue_data):
+        """Draw the Monthly Revenue Trends chart from the fetched rows."""
+        try:
             # draw plot
             if revenue_data:
                 year_and_month = [row[0] for row in revenue_data]
@@ -1114,39 +1057,37 @@ class ManagerPortal(QDialog):
         Generate a bar chart of review scores by product categories and embed it into the UI.
         Updates dynamically based on dropdown selections or defaults to full data.
         """
-        try:
-            conn = make_connection(config_file="sqlproject.ini")
-            cursor = conn.cursor()
-            
-            # Generate conditions based on selected options
-            conditions = self._selected_dropdown()
-            if conditions:
-                query = f"""
-                    SELECT products.product_category, AVG(order_reviews.review_score) AS avg_review_score
-                    FROM products
-                    JOIN order_items ON products.product_id = order_items.product_id
-                    JOIN orders ON order_items.order_id = orders.order_id
-                    JOIN order_reviews ON orders.order_id = order_reviews.order_id
-                    WHERE {conditions}
-                    GROUP BY products.product_category;
-                """
-            else:
-                # Default to displaying complete data
-                query = """
-                    SELECT products.product_category, AVG(order_reviews.review_score) AS avg_review_score
-                    FROM products
-                    JOIN order_items ON products.product_id = order_items.product_id
-                    JOIN orders ON order_items.order_id = orders.order_id
-                    JOIN order_reviews ON orders.order_id = order_reviews.order_id
-                    GROUP BY products.product_category;
-                """
+        # Generate conditions based on selected options
+        conditions = self._selected_dropdown()
+        if conditions:
+            query = f"""
+                SELECT products.product_category, AVG(order_reviews.review_score) AS avg_review_score
+                FROM products
+                JOIN order_items ON products.product_id = order_items.product_id
+                JOIN orders ON order_items.order_id = orders.order_id
+                JOIN order_reviews ON orders.order_id = order_reviews.order_id
+                WHERE {conditions}
+                GROUP BY products.product_category;
+            """
+        else:
+            # Default to displaying complete data
+            query = """
+                SELECT products.product_category, AVG(order_reviews.review_score) AS avg_review_score
+                FROM products
+                JOIN order_items ON products.product_id = order_items.product_id
+                JOIN orders ON order_items.order_id = orders.order_id
+                JOIN order_reviews ON orders.order_id = order_reviews.order_id
+                GROUP BY products.product_category;
+            """
+        self.query_runner.submit(
+            "customer_satisfaction", query_rows, query, config_file="sqlproject.ini",
+            on_result=self._draw_customer_satisfaction,
+            on_error=lambda err: QMessageBox.critical(self, "Error", f"Failed to display Revenue Trends: {err}")
+        )
 
-            cursor.execute(query)
-            result = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            
-            
+    def _draw_customer_satisfaction(self, result):
+        """Draw the Customer Satisfaction chart from the fetched rows."""
+        try:
             if result:
                 # Prepare data for plotting
                 categories = [row[0] for row in result]  # Product categories
@@ -1201,161 +1142,139 @@ class ManagerPortal(QDialog):
         """
         Generate a stacked bar chart of total payment value by payment type over time and embed it into the UI.
         """
-        try:            
-            conn = make_connection(config_file="sqlproject_wh.ini")
+        conditions = self._selected_dropdown()
+        self.query_runner.submit(
+            "payment_value", self._fetch_payment_values, conditions,
+            on_result=self._draw_payment_values,
+            on_error=lambda err: QMessageBox.critical(self, "Error", f"Failed to display Payment Value Over Time: {err}")
+        )
+
+    def _fetch_payment_values(self, conditions):
+        """
+        Fetch the total payment value by payment type and month from the warehouse.
+        Runs on a worker thread. Return None if the selected filters match no data.
+        """
+        if conditions:
+            q2 = f"""
+                SELECT products.product_id as product_id, orders.order_id as order_id, Month(orders.order_purchase_timestamp) as month
+                FROM products
+                JOIN order_items ON products.product_id = order_items.product_id
+                JOIN orders ON orders.order_id = order_items.order_id
+                WHERE {conditions}
+            """
+            # Fetch the result of the second query to use in the main query
+            result_db2 = query_rows(q2, config_file="sqlproject.ini")
+
+            # Extract the product_ids and order_ids from the result
+            product_ids = [row[0] for row in result_db2]
+            order_ids = [row[1] for row in result_db2]
+            months = [row[2] for row in result_db2]  # month values for filtering
+
+            conditions_combined = []
+        
+            if product_ids:
+                # Add product_id condition if product_ids exists
+                product_list = ','.join(f"'{pid}'" for pid in product_ids)
+                product_condition = f"Dim_Products.product_id IN ({product_list})"
+                conditions_combined.append(product_condition)
             
-            conditions = self._selected_dropdown()
-            if conditions:
-                conn_db2 = make_connection(config_file="sqlproject.ini")
-                cursor_db2 = conn_db2.cursor()
-                q2 = f"""
-                    SELECT products.product_id as product_id, orders.order_id as order_id, Month(orders.order_purchase_timestamp) as month
-                    FROM products
-                    JOIN order_items ON products.product_id = order_items.product_id
-                    JOIN orders ON orders.order_id = order_items.order_id
-                    WHERE {conditions}
-                """
-                cursor_db2.execute(q2)
-                # Fetch the result of the second query to use in the main query
-                result_db2 = cursor_db2.fetchall()
-
-                # Extract the product_ids and order_ids from the result
-                product_ids = [row[0] for row in result_db2]
-                order_ids = [row[1] for row in result_db2]
-                months = [row[2] for row in result_db2]  # month values for filtering
-
-                # Close the second database connection
-                cursor_db2.close()
-                conn_db2.close()
-                
-                conditions_combined = []
+            if order_ids:
+                # Add order_id condition if order_ids exists
+                order_condition = f"Fact_Payments.order_id IN ({','.join(map(str, order_ids))})"
+                conditions_combined.append(order_condition)
             
-                if product_ids:
-                    # Add product_id condition if product_ids exists
-                    product_condition = f"Dim_Products.product_id IN ({','.join([f"'{pid}'" for pid in product_ids])})"
-                    conditions_combined.append(product_condition)
-                
-                if order_ids:
-                    # Add order_id condition if order_ids exists
-                    order_condition = f"Fact_Payments.order_id IN ({','.join(map(str, order_ids))})"
-                    conditions_combined.append(order_condition)
-                
-                if months:
-                    # Add month condition if months exists
-                    month_condition = f"Dim_Time.month IN ({','.join(map(str, months))})"
-                    conditions_combined.append(month_condition)
-
-                # Combine conditions dynamically with AND
-                if conditions_combined:
-                    conditions_combined = " AND ".join(conditions_combined)
-                    conditions_combined = f"({conditions_combined})"
-
-                if conditions_combined:
-                    # Main query with dynamic WHERE clause
-                    query = f"""
-                        SELECT Dim_Time.year, Dim_Time.month, Fact_Payments.payment_type, SUM(Fact_Payments.payment_value) AS total_payment_value
-                        FROM Fact_Payments
-                        JOIN Dim_Time ON Fact_Payments.time_id = Dim_Time.time_id
-                        JOIN Dim_Products ON Dim_Products.product_id = Fact_Payments.product_id
-                        WHERE {conditions_combined}
-                        GROUP BY Dim_Time.year, Dim_Time.month, Fact_Payments.payment_type
-                        ORDER BY Dim_Time.year, Dim_Time.month, total_payment_value DESC;
-                    """
-                    df = pd.read_sql(query, conn)
-                    # Pivot data for stacked bar chart
-                    df_pivot = df.pivot(index=['year', 'month'], columns='payment_type', values='total_payment_value').fillna(0)
-
-                    # Plot the stacked bar chart
-                    fig, ax = plt.subplots(figsize=(5, 3.5))
-                    df_pivot.plot(kind='bar', stacked=True, ax=ax, colormap='Set2')
-
-                    # Customize chart
-                    ax.set_title("Payment Value by Payment Type Over Time", color='#37383b', fontsize=10, fontweight='bold')
-                    ax.set_xlabel("Year and Month", fontname='serif', color='#6f7782')
-                    ax.set_ylabel("Total Payment Value", fontname='serif', color='#6f7782')
-                    
-                    ax.set_facecolor('#ebebeb')
-                    ax.grid(True, which='both', axis='y', linestyle='--', color='#6f7782', zorder=1) 
-                    ax.tick_params(axis='x', labelrotation=45, labelsize=6)  # x ticks
-                    ax.tick_params(axis='y', labelsize=6, left = False)
-                    ax.legend(title="Payment Type", loc="center left", bbox_to_anchor=(1, 0.5), fontsize=8)
-                    fig.tight_layout(rect=[0, 0, 0.95, 1]) 
-
-                    # Embed the plot into the UI layout
-                    self._embed_plot(self.ui.Payment_Value_Over_Time, fig)
-                else:
-                    # Handle No Data Condition
-                    while self.ui.Payment_Value_Over_Time.count():
-                        item = self.ui.Payment_Value_Over_Time.takeAt(0)
-                        if item.widget():
-                            item.widget().deleteLater()
-                    noData = QtWidgets.QLabel("No Data")
-                    noData.setStyleSheet("color: white; background-color: DodgerBlue;")
-                    noData.setAlignment(QtCore.Qt.AlignCenter)
-                    self.ui.Payment_Value_Over_Time.addWidget(noData)
-            else:
-                query = """
-                    SELECT d_t.year, d_t.month, f.payment_type, SUM(f.payment_value) AS total_payment_value
-                    FROM Fact_Payments f
-                    JOIN Dim_Time d_t ON f.time_id = d_t.time_id
-                    GROUP BY d_t.year, d_t.month, f.payment_type
-                    ORDER BY d_t.year, d_t.month, total_payment_value DESC;
-                """
-                df = pd.read_sql(query, conn)
-                # Pivot data for stacked bar chart
-                df_pivot = df.pivot(index=['year', 'month'], columns='payment_type', values='total_payment_value').fillna(0)
+            if months:
+                # Add month condition if months exists
+                month_condition = f"Dim_Time.month IN ({','.join(map(str, months))})"
+                conditions_combined.append(month_condition)
+
+            # Combine conditions dynamically with AND
+            if conditions_combined:
+                conditions_combined = " AND ".join(conditions_combined)
+                conditions_combined = f"({conditions_combined})"
+
+            if not conditions_combined:
+                return None
+
+            # Main query with dynamic WHERE clause
+            query = f"""
+                SELECT Dim_Time.year, Dim_Time.month, Fact_Payments.payment_type, SUM(Fact_Payments.payment_value) AS total_payment_value
+                FROM Fact_Payments
+                JOIN Dim_Time ON Fact_Payments.time_id = Dim_Time.time_id
+                JOIN Dim_Products ON Dim_Products.product_id = Fact_Payments.product_id
+                WHERE {conditions_combined}
+                GROUP BY Dim_Time.year, Dim_Time.month, Fact_Payments.payment_type
+                ORDER BY Dim_Time.year, Dim_Time.month, total_payment_value DESC;
+            """
+        else:
+            query = """
+                SELECT d_t.year, d_t.month, f.payment_type, SUM(f.payment_value) AS total_payment_value
+                FROM Fact_Payments f
+                JOIN Dim_Time d_t ON f.time_id = d_t.time_id
+                GROUP BY d_t.year, d_t.month, f.payment_type
+                ORDER BY d_t.year, d_t.month, total_payment_value DESC;
+            """
+        return query_typed(query, config_file="sqlproject_wh.ini")
+
+    def _draw_payment_values(self, df):
+        """Draw the Payment Value by Payment Type chart from the fetched data."""
+        if df is None:
+            # Handle No Data Condition
+            self._embed_no_data(self.ui.Payment_Value_Over_Time)
+            return
 
-                # Plot the stacked bar chart
-                fig, ax = plt.subplots(figsize=(5, 3.5))
-                df_pivot.plot(kind='bar', stacked=True, ax=ax, colormap='Set2')
+        # Pivot data for stacked bar chart
+        df_pivot = df.pivot(index=['year', 'month'], columns='payment_type', values='total_payment_value').fillna(0)
 
-                # Customize chart
-                ax.set_title("Payment Value by Payment Type Over Time", color='#37383b', fontsize=10, fontweight='bold', fontname='serif')
-                ax.set_xlabel("Year and Month", fontname='serif', color='#6f7782')
-                ax.set_ylabel("Total Payment Value", fontname='serif', color='#6f7782')
+        # Plot the stacked bar chart
+        fig, ax = plt.subplots(figsize=(5, 3.5))
+        df_pivot.plot(kind='bar', stacked=True, ax=ax, colormap='Set2')
 
-                ax.set_facecolor('#ebebeb')
-                ax.grid(True, which='both', axis='y', linestyle='--', color='#6f7782', zorder=1) 
-                ax.tick_params(axis='x', labelrotation=45, labelsize=6) 
-                ax.tick_params(axis='y', labelsize=6, left = False)
-                ax.legend(title="Payment Type", loc="center left", bbox_to_anchor=(1, 0.5), fontsize=8)
-                fig.tight_layout(rect=[0, 0, 0.95, 0.95]) 
+        # Customize chart
+        ax.set_title("Payment Value by Payment Type Over Time", color='#37383b', fontsize=10, fontweight='bold', fontname='serif')
+        ax.set_xlabel("Year and Month", fontname='serif', color='#6f7782')
+        ax.set_ylabel("Total Payment Value", fontname='serif', color='#6f7782')
 
-                # Embed the plot into the UI layout
-                self._embed_plot(self.ui.Payment_Value_Over_Time, fig)
-        finally:
-            conn.close()
+        ax.set_facecolor('#ebebeb')
+        ax.grid(True, which='both', axis='y', linestyle='--', color='#6f7782', zorder=1) 
+        ax.tick_params(axis='x', labelrotation=45, labelsize=6) 
+        ax.tick_params(axis='y', labelsize=6, left = False)
+        ax.legend(title="Payment Type", loc="center left", bbox_to_anchor=(1, 0.5), fontsize=8)
+        fig.tight_layout(rect=[0, 0, 0.95, 0.95]) 
+
+        # Embed the plot into the UI layout
+        self._embed_plot(self.ui.Payment_Value_Over_Time, fig)
 
     # plot 1,1  
     def setOrder_Status_proportion(self):
         """
         Generate a pie chart for order status proportions and embed it into the UI.
         """
+        conditions = self._selected_dropdown()
+        if conditions:
+            query = f"""
+                SELECT orders.order_status, COUNT(*) AS status_count
+                FROM orders
+                JOIN order_items ON order_items.order_id = orders.order_id
+                JOIN products ON products.product_id = order_items.product_id
+                WHERE {conditions}
+                GROUP BY orders.order_status;
+            """
+        else:
+            query = """
+                SELECT order_status, COUNT(*) AS status_count
+                FROM orders
+                GROUP BY order_status;
+            """
+        self.query_runner.submit(
+            "order_status", query_rows, query, config_file="sqlproject.ini",
+            on_result=self._draw_order_status,
+            on_error=lambda err: QMessageBox.critical(self, "Error", f"Failed to generate Order Status pie chart: {err}")
+        )
+
+    def _draw_order_status(self, result):
+        """Draw the Order Status pie chart from the fetched rows."""
         try:
-            conn = make_connection(config_file="sqlproject.ini")
-            cursor = conn.cursor()
-            
-            conditions = self._selected_dropdown()
-            if conditions:
-                query = f"""
-                    SELECT orders.order_status, COUNT(*) AS status_count
-                    FROM orders
-                    JOIN order_items ON order_items.order_id = orders.order_id
-                    JOIN products ON products.product_id = order_items.product_id
-                    WHERE {conditions}
-                    GROUP BY orders.order_status;
-                """
-            else:
-                query = """
-                    SELECT order_status, COUNT(*) AS status_count
-                    FROM orders
-                    GROUP BY order_status;
-                """
-            cursor.execute(query)
-            result = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            
             if result:
                 order_status = [row[0] for row in result]
                 status_count = [row[1] for row in result]
@@ -1414,39 +1333,49 @@ class ManagerPortal(QDialog):
     # ------------------------ #
     # show top labels
     def showLabels(self):
-        try:
-            conn = make_connection(config_file="sqlproject.ini")
-            
-            total_sales_query = """SELECT SUM(payment_value) AS total_sales FROM order_payments"""
-            total_orders_query = """SELECT COUNT(*) AS total_orders FROM orders"""
-            avg_rating_query = """SELECT AVG(review_score) AS avg_rating FROM order_reviews"""
-            top_seller_query = """
-                SELECT CONCAT(s.seller_id, ' - ', s.seller_last_name, ' ', s.seller_first_name) AS top_seller
-                FROM sellers s
-                JOIN order_items oi ON oi.seller_id = s.seller_id
-                JOIN orders o ON o.order_id = oi.order_id
-                JOIN order_payments op ON op.order_id = o.order_id
-                GROUP BY s.seller_id
-                ORDER BY SUM(op.payment_value) DESC 
-                LIMIT 1; 
-            """
+        self.query_runner.submit(
+            "labels", self._fetch_labels,
+            on_result=self._draw_labels,
+            on_error=lambda err: QMessageBox.critical(self, "Error", f"Failed to load the dashboard labels: {err}")
+        )
 
-            total_sales_df = pd.read_sql(total_sales_query, conn)
-            total_orders_df = pd.read_sql(total_orders_query, conn)
-            avg_rating_df = pd.read_sql(avg_rating_query, conn)
-            top_seller_df = pd.read_sql(top_seller_query, conn)
-            
-            if total_sales_df.empty or total_orders_df.empty or avg_rating_df.empty or top_seller_df.empty:
-                QMessageBox.warning(self, "No Data", "No data available for the labels.")
-                return
+    def _fetch_labels(self):
+        """
+        Fetch the values of the top labels. Runs on a worker thread.
+        Return None if any of them has no data.
+        """
+        total_sales_query = """SELECT SUM(payment_value) AS total_sales FROM order_payments"""
+        total_orders_query = """SELECT COUNT(*) AS total_orders FROM orders"""
+        avg_rating_query = """SELECT AVG(review_score) AS avg_rating FROM order_reviews"""
+        top_seller_query = """
+            SELECT CONCAT(s.seller_id, ' - ', s.seller_last_name, ' ', s.seller_first_name) AS top_seller
+            FROM sellers s
+            JOIN order_items oi ON oi.seller_id = s.seller_id
+            JOIN orders o ON o.order_id = oi.order_id
+            JOIN order_payments op ON op.order_id = o.order_id
+            GROUP BY s.seller_id
+            ORDER BY SUM(op.payment_value) DESC 
+            LIMIT 1; 
+        """
 
-            total_sales = total_sales_df.iloc[0]['total_sales']
-            total_orders = total_orders_df.iloc[0]['total_orders']
-            avg_rating = avg_rating_df.iloc[0]['avg_rating']
-            top_seller = top_seller_df.iloc[0]['top_seller']
-        finally:
-            conn.close()
-            
+        total_sales_df = query_dataframe(total_sales_query, config_file="sqlproject.ini")
+        total_orders_df = query_dataframe(total_orders_query, config_file="sqlproject.ini")
+        avg_rating_df = query_dataframe(avg_rating_query, config_file="sqlproject.ini")
+        top_seller_df = query_dataframe(top_seller_query, config_file="sqlproject.ini")
+
+        if total_sales_df.empty or total_orders_df.empty or avg_rating_df.empty or top_seller_df.empty:
+            return None
+
+        return (total_sales_df.iloc[0]['total_sales'], total_orders_df.iloc[0]['total_orders'],
+                avg_rating_df.iloc[0]['avg_rating'], top_seller_df.iloc[0]['top_seller'])
+
+    def _draw_labels(self, labels):
+        """Show the fetched values in the top labels."""
+        if labels is None:
+            QMessageBox.warning(self, "No Data", "No data available for the labels.")
+            return
+
+        total_sales, total_orders, avg_rating, top_seller = labels
         self.ui.Sales.setText(f"${total_sales: .2f}")
         self.ui.Orders.setText(f"{total_orders} orders")
         self.ui.AvgRating.setText(f"{avg_rating} / 5")
@@ -1467,119 +1396,126 @@ class ManagerPortal(QDialog):
         """
         Generate a pie chart for payment method preferences and embed it into the UI.
         """
-        try:
-            conn = make_connection(config_file="sqlproject.ini")
-            query = """
-            SELECT payment_type, COUNT(*) AS count
-            FROM order_payments
-            GROUP BY payment_type;
-            """
-            df = pd.read_sql(query, conn)
-            # Plot
-            fig, ax = plt.subplots(figsize=(3, 3))
-            ax.pie(
-                df['count'],
-                labels=df['payment_type'],
-                autopct='%1.1f%%',
-                startangle=90,
-                colors=sns.color_palette("muted")
-            )
-            ax.axis('equal')  # Ensure circular pie chart
-            ax.set_title("Payment Method Preferences", color='#37383b', fontsize=12, fontweight='bold',fontname='serif')
-            self._embed_plot(self.ui.Payment_Method_preferences, fig)
-            
-            if df.empty:
-                # dealing with no data condition
-                while self.ui.Payment_Method_preferences.count():
-                    item = self.ui.Payment_Method_preferences.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                noData = QtWidgets.QLabel("No Data")
-                noData.setStyleSheet("color: white; background-color: DodgerBlue;")
-                noData.setAlignment(QtCore.Qt.AlignCenter)
-                self.ui.Payment_Method_preferences.addWidget(noData)   
-        finally:
-            conn.close()
+        query = """
+        SELECT payment_type, COUNT(*) AS count
+        FROM order_payments
+        GROUP BY payment_type;
+        """
+        self.query_runner.submit(
+            "payment_methods", query_typed, query, config_file="sqlproject.ini",
+            on_result=self._draw_payment_methods,
+            on_error=lambda err: QMessageBox.critical(self, "Error", f"Failed to display Payment Method Preferences: {err}")
+        )
+
+    def _draw_payment_methods(self, df):
+        """Draw the Payment Method Preferences pie chart from the fetched data."""
+        # Plot
+        fig, ax = plt.subplots(figsize=(3, 3))
+        ax.pie(
+            df['count'],
+            labels=df['payment_type'],
+            autopct='%1.1f%%',
+            startangle=90,
+            colors=sns.color_palette("muted")
+        )
+        ax.axis('equal')  # Ensure circular pie chart
+        ax.set_title("Payment Method Preferences", color='#37383b', fontsize=12, fontweight='bold',fontname='serif')
+        self._embed_plot(self.ui.Payment_Method_preferences, fig)
+        
+        if df.empty:
+            # dealing with no data condition
+            while self.ui.Payment_Method_preferences.count():
+                item = self.ui.Payment_Method_preferences.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+            noData = QtWidgets.QLabel("No Data")
+            noData.setStyleSheet("color: white; background-color: DodgerBlue;")
+            noData.setAlignment(QtCore.Qt.AlignCenter)
+            self.ui.Payment_Method_preferences.addWidget(noData)   
     
     # plot 0,1wh
     def setProduct_Sales_Over_Time(self):
         """
         Generate a stacked bar chart of product sales (quantity and freight value) by product category over time and embed it into the UI.
         """
-        try:
-            conn = make_connection(config_file="sqlproject_wh.ini")
-            query = """
-            SELECT 
-                d_t.year,  
-                d_t.month,  
-                d_p.product_category, 
-                SUM(f.quantity) AS total_quantity,     
-                SUM(f.freight_value) AS total_freight_value
-            FROM Fact_Orders f
-            JOIN Dim_Products d_p ON f.product_id = d_p.product_id
-            JOIN Dim_Time d_t ON f.time_id = d_t.time_id
-            GROUP BY d_t.year, d_t.month, d_p.product_category
-            ORDER BY d_t.year, d_t.month, d_p.product_category;
-            """
-            df = pd.read_sql(query, conn)
-            # Pivot data for stacked bar chart
-            df_pivot = df.pivot(index=['year', 'month'], columns='product_category', values='total_quantity').fillna(0)
+        query = """
+        SELECT 
+            d_t.year,  
+            d_t.month,  
+            d_p.product_category, 
+            SUM(f.quantity) AS total_quantity,     
+            SUM(f.freight_value) AS total_freight_value
+        FROM Fact_Orders f
+        JOIN Dim_Products d_p ON f.product_id = d_p.product_id
+        JOIN Dim_Time d_t ON f.time_id = d_t.time_id
+        GROUP BY d_t.year, d_t.month, d_p.product_category
+        ORDER BY d_t.year, d_t.month, d_p.product_category;
+        """
+        self.query_runner.submit(
+            "product_sales", query_typed, query, config_file="sqlproject_wh.ini",
+            schema={'total_quantity': 'int', 'total_freight_value': 'float32'},
+            on_result=self._draw_product_sales,
+            on_error=lambda err: QMessageBox.critical(self, "Error", f"Failed to display Product Sales Over Time: {err}")
+        )
 
-            fig, ax = plt.subplots(figsize=(7, 3))  
-            df_pivot.plot(kind='bar', stacked=True, ax=ax, colormap='Set3')
+    def _draw_product_sales(self, df):
+        """Draw the Product Category Sales chart from the fetched data."""
+        # Pivot data for stacked bar chart
+        df_pivot = df.pivot(index=['year', 'month'], columns='product_category', values='total_quantity').fillna(0)
 
-            ax.set_title("Product Category Sales by Year and Month", color='#37383b', fontsize=12, fontweight='bold', fontname='serif')
-            ax.set_xlabel("Year and Month", fontsize=10, fontname='serif', color='#6f7782')
-            ax.set_ylabel("Total Quantity", fontsize=10, fontname='serif', color='#6f7782')
-            ax.set_facecolor('#ebebeb')
-            ax.grid(True, which='both', axis='y', linestyle='--', color='#6f7782', zorder=1) 
-            ax.tick_params(axis='x', labelrotation=45, labelsize=6)  
-            ax.tick_params(axis='y', labelsize=6, left = False)
+        fig, ax = plt.subplots(figsize=(7, 3))  
+        df_pivot.plot(kind='bar', stacked=True, ax=ax, colormap='Set3')
 
-            ax.legend(title="Product Categories", loc="center left", bbox_to_anchor=(1, 0.5), fontsize=8)
+        ax.set_title("Product Category Sales by Year and Month", color='#37383b', fontsize=12, fontweight='bold', fontname='serif')
+        ax.set_xlabel("Year and Month", fontsize=10, fontname='serif', color='#6f7782')
+        ax.set_ylabel("Total Quantity", fontsize=10, fontname='serif', color='#6f7782')
+        ax.set_facecolor('#ebebeb')
+        ax.grid(True, which='both', axis='y', linestyle='--', color='#6f7782', zorder=1) 
+        ax.tick_params(axis='x', labelrotation=45, labelsize=6)  
+        ax.tick_params(axis='y', labelsize=6, left = False)
 
-            fig.tight_layout(rect=[0, 0, 0.95, 1]) 
+        ax.legend(title="Product Categories", loc="center left", bbox_to_anchor=(1, 0.5), fontsize=8)
 
+        fig.tight_layout(rect=[0, 0, 0.95, 1]) 
 
-            # Embed the plot into the UI layout
-            self._embed_plot(self.ui.Product_Sales_Over_Time, fig)
-            
-            if df.empty:
-                # dealing with no data condition
-                while self.ui.Product_Sales_Over_Time.count():
-                    item = self.ui.Product_Sales_Over_Time.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                noData = QtWidgets.QLabel("No Data")
-                noData.setStyleSheet("color: white; background-color: DodgerBlue;")
-                noData.setAlignment(QtCore.Qt.AlignCenter)
-                self.ui.Product_Sales_Over_Time.addWidget(noData)  
-        finally:
-            conn.close()
+
+        # Embed the plot into the UI layout
+        self._embed_plot(self.ui.Product_Sales_Over_Time, fig)
+        
+        if df.empty:
+            # dealing with no data condition
+            while self.ui.Product_Sales_Over_Time.count():
+                item = self.ui.Product_Sales_Over_Time.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+            noData = QtWidgets.QLabel("No Data")
+            noData.setStyleSheet("color: white; background-color: DodgerBlue;")
+            noData.setAlignment(QtCore.Qt.AlignCenter)
+            self.ui.Product_Sales_Over_Time.addWidget(noData)  
    
     # plot 1,0 
     def setRevenue_by_product_categories(self):
         """
         Generate and display Revenue by Product Categories in the Revenue_by_product_categories layout.
         """
-        try:
-            conn = make_connection(config_file="sqlproject.ini")
-            cursor = conn.cursor()
-
-            # SQL Query to fetch revenue by product categories
-            query = """
-            SELECT p.product_category, SUM(op.payment_value) AS total_revenue
-            FROM products p
-            JOIN order_items oi ON p.product_id = oi.product_id
-            JOIN orders o ON oi.order_id = o.order_id
-            JOIN order_payments op ON o.order_id = op.order_id
-            GROUP BY p.product_category;
-            """
-            cursor.execute(query)
-            data = cursor.fetchall()
-            cursor.close()
-            conn.close()
+        # SQL Query to fetch revenue by product categories
+        query = """
+        SELECT p.product_category, SUM(op.payment_value) AS total_revenue
+        FROM products p
+        JOIN order_items oi ON p.product_id = oi.product_id
+        JOIN orders o ON oi.order_id = o.order_id
+        JOIN order_payments op ON o.order_id = op.order_id
+        GROUP BY p.product_category;
+        """
+        self.query_runner.submit(
+            "revenue_by_category", query_rows, query, config_file="sqlproject.ini",
+            on_result=self._draw_revenue_by_category,
+            on_error=lambda err: QMessageBox.critical(self, "Error", f"Failed to display Revenue by Product Categories: {err}")
+        )
 
+    def _draw_revenue_by_category(self, data):
+        """Draw the Revenue by Product Categories chart from the fetched rows."""
+        try:
             # Plot the data if available
             if data:
                 categories = [row[0] for row in data]
@@ -1630,42 +1566,46 @@ class ManagerPortal(QDialog):
         """
         Generate a bar chart comparing estimated vs. actual delivery times.
         """
-        try:
-            conn = make_connection(config_file="sqlproject.ini")
-            query = """
-            SELECT 
-                DATEDIFF(order_delivered_customer_date, order_estimated_delivery_date) AS delivery_delay,
-                COUNT(*) AS count
-            FROM orders
-            WHERE order_delivered_customer_date IS NOT NULL
-            GROUP BY delivery_delay;
-            """
-            df = pd.read_sql(query, conn)
-            # Plot
-            fig, ax = plt.subplots(figsize=(5, 3))
-            sns.barplot(x=df['delivery_delay'], y=df['count'], ax=ax, palette="viridis")
-            ax.set_title("Delivery Performance (Estimated vs. Actual)", color='#37383b', fontsize=12, fontweight='bold', fontname='serif')
-            ax.set_xlabel("Delivery Delay (Days)",fontsize=9, fontname='serif', color='#6f7782')
-            ax.set_ylabel("Count", fontsize=9, color='#6f7782', fontname='serif')
-            ax.set_facecolor('#ebebeb')
-            ax.grid(True, which='both', axis='y', linestyle='--', color='#6f7782', zorder=1) 
-            ax.tick_params(axis='x', labelsize=5)  # x ticks
-            ax.tick_params(axis='y', labelsize=5, left = False)
-            fig.tight_layout(rect=[0, 0, 0.95, 1]) 
-            self._embed_plot(self.ui.Delivery_Performance, fig)
-            
-            if df.empty:
-                # No data to display
-                while self.ui.Delivery_Performance.count():
-                    item = self.ui.Delivery_Performance.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                noData = QtWidgets.QLabel("No Data")
-                noData.setStyleSheet("color: white; background-color: DodgerBlue;")
-                noData.setAlignment(QtCore.Qt.AlignCenter)
-                self.ui.Delivery_Performance.addWidget(noData)
-        finally:
-            conn.close()
+        query = """
+        SELECT 
+            DATEDIFF(order_delivered_customer_date, order_estimated_delivery_date) AS delivery_delay,
+            COUNT(*) AS count
+        FROM orders
+        WHERE order_delivered_customer_date IS NOT NULL
+        GROUP BY delivery_delay;
+        """
+        self.query_runner.submit(
+            "delivery_performance", query_typed, query, config_file="sqlproject.ini",
+            schema={'delivery_delay': 'int', 'count': 'int'},
+            on_result=self._draw_delivery_performance,
+            on_error=lambda err: QMessageBox.critical(self, "Error", f"Failed to display Delivery Performance: {err}")
+        )
+
+    def _draw_delivery_performance(self, df):
+        """Draw the Delivery Performance chart from the fetched data."""
+        # Plot
+        fig, ax = plt.subplots(figsize=(5, 3))
+        sns.barplot(x=df['delivery_delay'], y=df['count'], ax=ax, palette="viridis")
+        ax.set_title("Delivery Performance (Estimated vs. Actual)", color='#37383b', fontsize=12, fontweight='bold', fontname='serif')
+        ax.set_xlabel("Delivery Delay (Days)",fontsize=9, fontname='serif', color='#6f7782')
+        ax.set_ylabel("Count", fontsize=9, color='#6f7782', fontname='serif')
+        ax.set_facecolor('#ebebeb')
+        ax.grid(True, which='both', axis='y', linestyle='--', color='#6f7782', zorder=1) 
+        ax.tick_params(axis='x', labelsize=5)  # x ticks
+        ax.tick_params(axis='y', labelsize=5, left = False)
+        fig.tight_layout(rect=[0, 0, 0.95, 1]) 
+        self._embed_plot(self.ui.Delivery_Performance, fig)
+        
+        if df.empty:
+            # No data to display
+            while self.ui.Delivery_Performance.count():
+                item = self.ui.Delivery_Performance.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+            noData = QtWidgets.QLabel("No Data")
+            noData.setStyleSheet("color: white; background-color: DodgerBlue;")
+            noData.setAlignment(QtCore.Qt.AlignCenter)
+            self.ui.Delivery_Performance.addWidget(noData)
    
    
    
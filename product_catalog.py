@@ -0,0 +1,841 @@
+"""
+This module contains the product catalog shown in the Customer Portal.
+
+ProductCatalog holds the cached products as parallel column arrays and
+answers the portal's category, search and price-order filters with a list
+of row positions; no Qt objects are created per product.
+
+ProductTableModel presents one filtered view of the catalog to a QTableView.
+The view asks only for the rows it is painting, so the cost of showing the
+catalog depends on the visible rows rather than on the number of products,
+and a new filter replaces one list of positions instead of rebuilding widgets.
+
+AddToCartDelegate paints the "+" button of the Add to Cart column and reports
+clicks on it, instead of a QPushButton and layout per row.
+
+Large catalogs can instead be paged from the server ([catalog] mode = paged in
+the configuration file). PagedProductTableModel then fetches pages of
+page_size products with keyset pagination on (product_price, product_id), with
+the category and search filters applied by the database, prefetches the next
+page as the view scrolls towards it, and keeps at most cache_pages pages in
+memory. An evicted page is fetched again from its stored keyset position when
+it is scrolled back into view.
+
+Search queries are answered by a TrigramIndex built once when the catalog is
+loaded: every three-character substring of a product's text maps to the
+sorted positions of the products containing it, and a query looks only at the
+products in the intersection of its trigrams' lists. A query that extends the
+previous one (the user typed another character) only rechecks the previous
+matches. The benchmark compares it with a linear scan:
+
+    python product_catalog.py benchmark
+
+File: product_catalog.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+"""
+
+import sys
+import time
+import random
+from array import array
+from bisect import bisect_left
+from collections import defaultdict, OrderedDict
+from configparser import ConfigParser
+from data201 import query_rows
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect, QEvent, pyqtSignal
+from PyQt5.QtGui import QColor, QPen, QFont
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle
+
+COLUMNS = ["Product ID", "Category", "Description", "Price", "Add to Cart"]
+ADD_TO_CART_COLUMN = 4
+
+# Role that tells the delegate whether a product is already in the cart
+# (None while the row's page is still being fetched).
+InCartRole = Qt.UserRole + 1
+
+PINK = "#FFC0CB"
+HOT_PINK = "#FF69B4"
+
+# The products with their numeric price; the price label is formatted by the catalog
+PRODUCTS_SQL = """
+    SELECT product_id, product_category, product_description, product_price
+    FROM products
+"""
+
+# Optional section of the configuration file that selects how the Customer
+# Portal loads the catalog: all products at once (full) or a page at a time (paged).
+CATALOG_SECTION = 'catalog'
+
+CATALOG_DEFAULTS = {
+    'mode': 'full',
+    'page_size': 200,     # products per page in paged mode
+    'cache_pages': 25,    # pages kept in memory in paged mode
+    'snapshot': 'catalog.snapshot',  # catalog file kept between runs in full mode; empty for none
+    'sync_interval': 300,  # seconds between checks for changed products in full mode
+}
+
+# Separates the fields of a product's search text, so that a match cannot span two fields.
+FIELD_SEPARATOR = "\0"
+
+
+class TrigramIndex:
+    """
+    A substring index over a list of lowercased texts.
+    """
+    CHUNK_SIZE = 65536
+
+    def __init__(self, texts, postings=None):
+        """
+        Input:
+            - texts (list of str): The lowercased text of each position.
+            - postings (dict): The trigram -> sorted position array lists of the texts,
+              e.g. from a catalog snapshot. Computed from the texts if not given.
+        """
+        self.texts = texts
+        self._last_query = None
+        self._last_matches = None
+
+        if postings is not None:
+            self.postings = postings
+            return
+
+        self.postings = {}
+
+        # Index the texts a chunk at a time, moving each chunk's lists into compact
+        # arrays, so that the lists of Python ints never hold more than one chunk
+        for start in range(0, len(texts), self.CHUNK_SIZE):
+            chunk = defaultdict(list)
+            for position in range(start, min(start + self.CHUNK_SIZE, len(texts))):
+                trigrams = set()
+                for field in texts[position].split(FIELD_SEPARATOR):
+                    trigrams.update([field[i:i + 3] for i in range(len(field) - 2)])
+                for trigram in trigrams:
+                    chunk[trigram].append(position)
+
+            # Positions are appended in order, so every list stays sorted
+            for trigram, positions in chunk.items():
+                if trigram in self.postings:
+                    self.postings[trigram].fromlist(positions)
+                else:
+                    self.postings[trigram] = array('i', positions)
+
+    @staticmethod
+    def _trigrams(text):
+        trigrams = set()
+        for field in text.split(FIELD_SEPARATOR):
+            trigrams.update([field[i:i + 3] for i in range(len(field) - 2)])
+        return trigrams
+
+    def add(self, position):
+        """
+        Index the text at the position, e.g. after it was appended or changed.
+        """
+        for trigram in self._trigrams(self.texts[position]):
+            positions = self.postings.get(trigram)
+            if positions is None:
+                self.postings[trigram] = array('i', [position])
+            elif not positions or positions[-1] < position:
+                positions.append(position)
+            else:
+                positions.insert(bisect_left(positions, position), position)
+        self._last_query = None
+
+    def remove(self, position):
+        """
+        Remove the text at the position from the index, e.g. before it is changed.
+        """
+        for trigram in self._trigrams(self.texts[position]):
+            positions = self.postings.get(trigram)
+            if positions:
+                i = bisect_left(positions, position)
+                if i < len(positions) and positions[i] == position:
+                    del positions[i]
+        self._last_query = None
+
+    def _posting_lists(self, query):
+        """
+        Return the position lists of the query's trigrams, shortest
+        first, or None if the query is shorter than a trigram.
+        """
+        trigrams = {query[i:i + 3] for i in range(len(query) - 2)}
+        if not trigrams:
+            return None
+        return sorted((self.postings.get(trigram, ()) for trigram in trigrams), key=len)
+
+    @staticmethod
+    def _intersect(lists):
+        """
+        Return the sorted positions that are in every list, looking each
+        position of the shortest list up in the others by binary search.
+        """
+        candidates = list(lists[0])
+        for positions in lists[1:]:
+            if not candidates:
+                break
+            end = len(positions)
+            candidates = [p for p in candidates
+                          if (i := bisect_left(positions, p)) < end and positions[i] == p]
+        return candidates
+
+    def search(self, query):
+        """
+        Return the sorted positions whose texts contain the lowercased query.
+
+        Input:
+            - query (str): The text to look for, already lowercased.
+
+        Output:
+            - list: The matching positions.
+        """
+        texts = self.texts
+        lists = self._posting_lists(query)
+
+        if self._last_query is not None and self._last_query in query and \
+                (lists is None or len(self._last_matches) <= len(lists[0])):
+            # The query narrows the previous one: only its matches can match
+            candidates = self._last_matches
+        elif lists is None:
+            candidates = range(len(texts))
+        else:
+            candidates = self._intersect(lists)
+
+        # A product with all the trigrams may still not contain the query
+        matches = [p for p in candidates if query in texts[p]]
+
+        self._last_query = query
+        self._last_matches = matches
+        return matches
+
+
+class ProductCatalog:
+    """
+    The products cached by the Customer Portal, stored column by column.
+
+    The price orders are computed once: the positions of all products and of each
+    category's products sorted by price, ascending and descending. Showing a
+    category in either order then returns one of these arrays instead of sorting.
+
+    version is the data version of the products table that the catalog reflects
+    (the latest product_updated_at), or None if it is not known. changed is true
+    once changes were applied that a saved snapshot does not have yet.
+    """
+    def __init__(self, rows=(), version=None):
+        """
+        Input:
+            - rows (iterable of tuple): (product_id, product_category, product_description,
+              product_price) for each product.
+        """
+        self.product_ids = []
+        self.categories = []
+        self.descriptions = []
+        self.price_labels = []
+        self.prices = array('d')
+        self.search_texts = []  # The lowercased text that search queries are matched against
+        self.version = version
+        self.changed = False
+
+        for row in rows:
+            self._append(*row[:4])
+
+        self.search_index = TrigramIndex(self.search_texts)
+        self._build_price_orders()
+
+    @classmethod
+    def from_columns(cls, product_ids, categories, descriptions, prices, price_labels,
+                     postings, ascending, version=None):
+        """
+        Return a catalog made of stored columns, its search index's postings and its
+        ascending price order, e.g. from a snapshot, without indexing or sorting again.
+        """
+        catalog = cls.__new__(cls)
+        catalog.product_ids = product_ids
+        catalog.categories = categories
+        catalog.descriptions = descriptions
+        catalog.price_labels = price_labels
+        catalog.prices = prices
+        catalog.search_texts = [catalog._search_text(i) for i in range(len(product_ids))]
+        catalog.version = version
+        catalog.changed = False
+        catalog.search_index = TrigramIndex(catalog.search_texts, postings)
+        catalog._build_price_orders(ascending)
+        return catalog
+
+    def _search_text(self, position):
+        return FIELD_SEPARATOR.join(str(value).lower() for value in self.product(position))
+
+    def _append(self, product_id, category, description, price):
+        self.product_ids.append(product_id)
+        self.categories.append(category)
+        self.descriptions.append(description)
+        self.price_labels.append(f"${price:,.2f}" if price is not None else None)
+        self.prices.append(float(price) if price is not None else 0.0)
+        self.search_texts.append(self._search_text(len(self.product_ids) - 1))
+
+    def apply_changes(self, rows, version=None):
+        """
+        Update the products of the rows in place and add the new ones,
+        keeping the search index and the price orders current.
+
+        Input:
+            - rows (iterable of tuple): Changed products, shaped like PRODUCTS_SQL rows.
+            - version: The data version of the products table the rows were read at.
+
+        Output:
+            - int: The number of products added or changed.
+        """
+        positions = {product_id: i for i, product_id in enumerate(self.product_ids)}
+        changes = 0
+
+        for row in rows:
+            product_id, category, description, price = row[:4]
+            position = positions.get(product_id)
+
+            if position is None:
+                self._append(product_id, category, description, price)
+                position = positions[product_id] = len(self.product_ids) - 1
+            else:
+                price_label = f"${price:,.2f}" if price is not None else None
+                if (category, description, price_label) == (self.categories[position],
+                                                           self.descriptions[position], self.price_labels[position]):
+                    continue
+                self.search_index.remove(position)
+                self.categories[position] = category
+                self.descriptions[position] = description
+                self.price_labels[position] = price_label
+                self.prices[position] = float(price) if price is not None else 0.0
+                self.search_texts[position] = self._search_text(position)
+
+            self.search_index.add(position)
+            changes += 1
+
+        if changes:
+            self._build_price_orders()
+            self.changed = True
+        if version is not None:
+            self.version = version
+        return changes
+
+    def _build_price_orders(self, ascending=None):
+        """
+        Sort the products by price once, then split the order by category.
+        Products with the same price keep their catalog order.
+        """
+        if ascending is None:
+            ascending = array('i', sorted(range(len(self)), key=self.prices.__getitem__))
+
+        # rank[position] is the product's place in the ascending order
+        self.rank = array('i', [0]) * len(self)
+        for place, position in enumerate(ascending):
+            self.rank[position] = place
+
+        by_category = {}
+        categories = self.categories
+        for position in ascending:
+            category = categories[position]
+            if category not in by_category:
+                by_category[category] = array('i')
+            by_category[category].append(position)
+
+        # (ascending, descending) positions of all products and of each category
+        self.price_order = (ascending, ascending[::-1])
+        self.category_price_orders = {category: (order, order[::-1]) for category, order in by_category.items()}
+
+    def __len__(self):
+        return len(self.product_ids)
+
+    def product(self, position):
+        """
+        Return the product at the position as the (product_id, product_category,
+        product_description, price label) tuple used by the cart.
+        """
+        return (self.product_ids[position], self.categories[position],
+                self.descriptions[position], self.price_labels[position])
+
+    def filter(self, category=None, search_query=None, descending=True):
+        """
+        Return the positions of the products in the category (all categories if None
+        or "All Categories") whose fields contain the search query, ordered by price.
+
+        Input:
+            - category (str): The selected category.
+            - search_query (str): Text to look for, ignoring case.
+            - descending (bool): True for high to low prices, False for low to high.
+
+        Output:
+            - sequence: The matching positions in the catalog. Without a search query
+              this is one of the precomputed orders and must not be modified.
+        """
+        all_categories = not category or category == "All Categories"
+
+        if not search_query:
+            if all_categories:
+                orders = self.price_order
+            else:
+                orders = self.category_price_orders.get(category, (array('i'), array('i')))
+            return orders[1] if descending else orders[0]
+
+        positions = self.search_index.search(search_query.lower())
+        if not all_categories:
+            categories = self.categories
+            positions = [i for i in positions if categories[i] == category]
+
+        # Only the matches are sorted, by their precomputed rank
+        return sorted(positions, key=self.rank.__getitem__, reverse=descending)
+
+
+class ProductTableModel(QAbstractTableModel):
+    """
+    A table model over the rows of a ProductCatalog selected by the current filter.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.catalog = ProductCatalog()
+        self.positions = []     # catalog position of each table row
+        self.in_cart = set()    # product IDs added to the cart
+
+    def set_catalog(self, catalog, category=None, search_query=None, descending=True):
+        """
+        Replace the catalog and show the products selected by the filter.
+        """
+        self.beginResetModel()
+        self.catalog = catalog
+        self.positions = catalog.filter(category, search_query, descending)
+        self.endResetModel()
+
+    def apply_filter(self, category=None, search_query=None, descending=True):
+        """
+        Show the products of the catalog selected by the filter.
+        """
+        self.beginResetModel()
+        self.positions = self.catalog.filter(category, search_query, descending)
+        self.endResetModel()
+
+    def product(self, row):
+        """
+        Return the cart tuple (product_id, product_category, product_description,
+        price label) of the product shown in the row.
+        """
+        return self.catalog.product(self.positions[row])
+
+    def mark_in_cart(self, row):
+        """
+        Record that the product shown in the row is in the cart and repaint its button.
+        """
+        product = self.product(row)
+        if product is not None:
+            self.in_cart.add(product[0])
+        index = self.index(row, ADD_TO_CART_COLUMN)
+        self.dataChanged.emit(index, index, [InCartRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.positions)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        product = self.product(index.row())
+        column = index.column()
+
+        if product is None:
+            # A paged row whose page is still being fetched
+            return "Loading..." if role == Qt.DisplayRole and column == 0 else None
+
+        if role == Qt.DisplayRole:
+            if column < ADD_TO_CART_COLUMN:
+                return str(product[0]) if column == 0 else product[column]
+        elif role == Qt.ToolTipRole:
+            if column == 2:
+                return product[2]
+            if column == ADD_TO_CART_COLUMN:
+                return "Add to Cart"
+        elif role == InCartRole and column == ADD_TO_CART_COLUMN:
+            return product[0] in self.in_cart
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+class PagedProductTableModel(ProductTableModel):
+    """
+    A table model that fetches the products selected by the current filter
+    from the server a page at a time, as the view scrolls.
+
+    Input:
+        - query_runner (QueryRunner): Runs the page queries off the GUI thread.
+        - page_size (int): Products per page.
+        - cache_pages (int): Pages kept in memory, least recently used evicted first.
+    """
+    def __init__(self, query_runner, config_file='sqlproject.ini', section='mysql',
+                 page_size=CATALOG_DEFAULTS['page_size'], cache_pages=CATALOG_DEFAULTS['cache_pages'], parent=None):
+        super().__init__(parent)
+        self.query_runner = query_runner
+        self.config_file = config_file
+        self.section = section
+        self.page_size = page_size
+        self.cache_pages = max(cache_pages, 2)
+
+        self.filter_args = (None, None, True)
+        self.generation = 0         # changes with the filter, so late pages of an old filter are dropped
+        self.rows_shown = 0
+        self.page_starts = [None]   # keyset position after which each known page starts
+        self.last_page = None       # number of the last page, once a short page was fetched
+        self.pages = OrderedDict()  # page number -> products, least recently used first
+        self.requested = set()      # pages being fetched
+        self.waiting = False        # the view asked for the next page before it arrived
+
+    def set_catalog(self, catalog, category=None, search_query=None, descending=True):
+        """
+        Paged models read from the server; a full catalog is not used.
+        """
+        self.apply_filter(category, search_query, descending)
+
+    def apply_filter(self, category=None, search_query=None, descending=True):
+        """
+        Show the products selected by the filter, starting with their first page.
+        """
+        self.beginResetModel()
+        self.filter_args = (category, search_query, descending)
+        self.generation += 1
+        self.rows_shown = 0
+        self.page_starts = [None]
+        self.last_page = None
+        self.pages.clear()
+        self.requested.clear()
+        self.waiting = True
+        self.endResetModel()
+        self._request(0)
+
+    def _request(self, page):
+        """
+        Fetch the page in the background unless it is cached, being
+        fetched, or its keyset position is not known yet.
+        """
+        if page in self.pages or page in self.requested or page >= len(self.page_starts):
+            return
+        if self.last_page is not None and page > self.last_page:
+            return
+
+        self.requested.add(page)
+        generation = self.generation
+        category, search_query, descending = self.filter_args
+        self.query_runner.submit(
+            f"products page {page}", fetch_product_page,
+            category, search_query, descending, self.page_starts[page], self.page_size,
+            config_file=self.config_file, section=self.section,
+            on_result=lambda rows: self._on_page_loaded(generation, page, rows),
+            on_error=lambda err: self._on_page_failed(generation, page, err)
+        )
+
+    def _on_page_failed(self, generation, page, err):
+        if generation == self.generation:
+            self.requested.discard(page)
+        print(f"Database error: {err}")
+
+    def _on_page_loaded(self, generation, page, rows):
+        """
+        Cache a fetched page and show it if the view is waiting for it.
+        """
+        if generation != self.generation:
+            return
+        self.requested.discard(page)
+
+        if page == len(self.page_starts) - 1:
+            # The first fetch of the last known page tells where the next one starts
+            if len(rows) < self.page_size:
+                self.last_page = page if rows else page - 1
+            else:
+                last = rows[-1]
+                self.page_starts.append((last[3], last[0]))
+
+        self._cache(page, [(product_id, category, description, f"${price:,.2f}")
+                           for product_id, category, description, price in rows])
+
+        first_row = page * self.page_size
+        if first_row < self.rows_shown:
+            # An evicted page was scrolled back into view
+            last_row = min(first_row + len(rows), self.rows_shown) - 1
+            self.dataChanged.emit(self.index(first_row, 0), self.index(last_row, len(COLUMNS) - 1))
+        elif first_row == self.rows_shown and self.waiting:
+            self._show(page)
+
+    def _cache(self, page, products):
+        self.pages[page] = products
+        self.pages.move_to_end(page)
+        while len(self.pages) > self.cache_pages:
+            self.pages.popitem(last=False)
+
+    def _show(self, page):
+        """
+        Append the cached page to the table and prefetch the next one.
+        """
+        self.waiting = False
+        products = self.pages[page]
+        if products:
+            self.beginInsertRows(QModelIndex(), self.rows_shown, self.rows_shown + len(products) - 1)
+            self.rows_shown += len(products)
+            self.endInsertRows()
+        self._request(page + 1)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.rows_shown % self.page_size:
+            return False
+        next_page = self.rows_shown // self.page_size
+        return self.last_page is None or next_page <= self.last_page
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        next_page = self.rows_shown // self.page_size
+        if next_page in self.pages:
+            self._show(next_page)
+        else:
+            self.waiting = True
+            self._request(next_page)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows_shown
+
+    def product(self, row):
+        """
+        Return the cart tuple of the product shown in the row, or None if its
+        page was evicted; the page is then fetched again.
+        """
+        page, offset = divmod(row, self.page_size)
+        products = self.pages.get(page)
+        if products is None:
+            self._request(page)
+            return None
+        self.pages.move_to_end(page)
+        return products[offset]
+
+
+class AddToCartDelegate(QStyledItemDelegate):
+    """
+    Paints a "+" button in each cell of the Add to Cart column and
+    emits add_clicked with the row when the button is clicked. Rows
+    whose page is still being fetched get no button.
+    """
+    add_clicked = pyqtSignal(int)
+
+    BUTTON_SIZE = 20
+
+    def button_rect(self, cell):
+        """
+        Return the rectangle of the button centered in the cell.
+        """
+        size = self.BUTTON_SIZE
+        return QRect(cell.center().x() - size // 2 + 1, cell.center().y() - size // 2 + 1, size, size)
+
+    def paint(self, painter, option, index):
+        in_cart = index.data(InCartRole)
+        if in_cart is None:
+            return  # Still loading
+        rect = self.button_rect(option.rect)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(painter.Antialiasing)
+        painter.setPen(QPen(QColor(HOT_PINK)))
+        painter.setBrush(QColor(HOT_PINK if in_cart or hovered else PINK))
+        painter.drawRoundedRect(rect, 5, 5)
+
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor("white"))
+        painter.drawText(rect, Qt.AlignCenter, "+")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton \
+                and self.button_rect(option.rect).contains(event.pos()) \
+                and index.data(InCartRole) is not None:
+            self.add_clicked.emit(index.row())
+            return True
+        return False
+
+
+def read_catalog_config(config_file='config.ini'):
+    """
+    Read the optional [catalog] section of the configuration file
+    config_file and return its settings as a dictionary, using the
+    defaults for any setting that is not given.
+    """
+    settings = dict(CATALOG_DEFAULTS)
+    parser = ConfigParser()
+    parser.read(config_file)
+
+    if parser.has_section(CATALOG_SECTION):
+        for key, value in parser.items(CATALOG_SECTION):
+            if key in settings:
+                settings[key] = type(CATALOG_DEFAULTS[key])(value)
+
+    return settings
+
+
+def _like_pattern(text):
+    # A LIKE pattern that matches text anywhere, with ! escaping the wildcards in text
+    return "%" + text.replace("!", "!!").replace("%", "!%").replace("_", "!_") + "%"
+
+
+def product_page_query(category=None, search_query=None, descending=True, after=None,
+                       page_size=CATALOG_DEFAULTS['page_size']):
+    """
+    Return the SQL query and parameters of one page of the products selected by
+    the filter, ordered by (product_price, product_id).
+
+    Input:
+        - after (tuple): The (product_price, product_id) of the last product of the
+          previous page, or None for the first page.
+
+    Output:
+        - (str, list): The query and its parameters. Only products with a price are
+          listed, since the keyset cannot continue past a NULL price.
+    """
+    conditions = ["product_price IS NOT NULL"]
+    params = []
+
+    if category and category != "All Categories":
+        conditions.append("product_category = %s")
+        params.append(category)
+
+    if search_query:
+        conditions.append("(product_id LIKE %s ESCAPE '!' OR product_category LIKE %s ESCAPE '!' "
+                          "OR product_description LIKE %s ESCAPE '!')")
+        params += [_like_pattern(search_query)] * 3
+
+    if after is not None:
+        comparison = "<" if descending else ">"
+        conditions.append(f"(product_price {comparison} %s OR "
+                          f"(product_price = %s AND product_id {comparison} %s))")
+        params += [after[0], after[0], after[1]]
+
+    direction = "DESC" if descending else "ASC"
+    sql = f"""
+        SELECT product_id, product_category, product_description, product_price
+        FROM products
+        WHERE {' AND '.join(conditions)}
+        ORDER BY product_price {direction}, product_id {direction}
+        LIMIT %s
+    """
+    return sql, params + [page_size]
+
+
+def fetch_product_page(category=None, search_query=None, descending=True, after=None,
+                       page_size=CATALOG_DEFAULTS['page_size'], config_file='sqlproject.ini', section='mysql'):
+    """
+    Fetch one page of products; see product_page_query(). Runs on a QueryRunner thread.
+    """
+    sql, params = product_page_query(category, search_query, descending, after, page_size)
+    return query_rows(sql, params, config_file=config_file, section=section)
+
+
+def load_catalog(config_file='sqlproject.ini', section='mysql'):
+    """
+    Load the products and build their catalog and search index. Runs on a
+    QueryRunner thread, so the GUI stays responsive while a large catalog is indexed.
+
+    Output:
+        - ProductCatalog: The loaded catalog.
+    """
+    return ProductCatalog(query_rows(PRODUCTS_SQL, config_file=config_file, section=section))
+
+
+#---------------------------#
+# Benchmark                 #
+#---------------------------#
+
+WORDS = ["wooden", "metal", "glass", "leather", "cotton", "smart", "portable", "wireless",
+         "classic", "modern", "vintage", "premium", "compact", "digital", "organic", "deluxe",
+         "chair", "lamp", "phone", "watch", "jacket", "bottle", "speaker", "camera",
+         "blanket", "table", "shoes", "headphones", "backpack", "mirror", "charger", "frame"]
+CATEGORIES = ["Electronics", "Clothing", "Home", "Books", "Toys", "Garden", "Sports", "Beauty"]
+
+
+def synthetic_products(count, seed=201):
+    """
+    Return count made-up product rows in the shape of PRODUCTS_SQL.
+    """
+    generator = random.Random(seed)
+    rows = []
+    for i in range(count):
+        price = round(generator.uniform(1, 2000), 2)
+        description = " ".join(generator.choice(WORDS) for _ in range(4)) + f" model {generator.randrange(10000)}"
+        rows.append((f"P{100000 + i}", generator.choice(CATEGORIES), description, price))
+    return rows
+
+
+def _linear_search(rows, query):
+    # The search that populate_table_view used to run on every keystroke
+    query = query.lower()
+    return [row for row in rows if
+            query in str(row[0]).lower() or query in str(row[1]).lower() or
+            query in str(row[2]).lower() or query in str(row[3]).lower()]
+
+
+def _ms_per_query(search, queries):
+    started = time.perf_counter()
+    for query in queries:
+        matches = search(query)
+    return (time.perf_counter() - started) * 1000 / len(queries), matches
+
+
+def benchmark_search(sizes=(10000, 100000, 1000000), typed="leather jacket"):
+    """
+    Time typing a query one character at a time against catalogs of the given
+    sizes, with the old linear scan and with the trigram index. Queries shorter
+    than a trigram are answered by a scan either way, so the keystrokes from the
+    third character on are also timed separately. Return a list of (size, index
+    build seconds, linear ms per keystroke, indexed ms per keystroke, indexed ms
+    per keystroke from the third character, matches of the full query).
+    """
+    results = []
+
+    for size in sizes:
+        rows = synthetic_products(size)
+        # The rows as the old load query returned them, with the price formatted by the server
+        labelled_rows = [(*row[:3], f"${row[3]:,.2f}") for row in rows]
+
+        started = time.perf_counter()
+        catalog = ProductCatalog(rows)
+        build = time.perf_counter() - started
+
+        prefixes = [typed[:n] for n in range(1, len(typed) + 1)]
+        index = catalog.search_index
+
+        linear_ms, expected = _ms_per_query(lambda query: _linear_search(labelled_rows, query), prefixes)
+        indexed_ms, matches = _ms_per_query(index.search, prefixes)
+        index.search("")  # Forget the typed query, so the next one is looked up afresh
+        trigram_ms, _ = _ms_per_query(index.search, prefixes[2:])
+
+        if len(matches) != len(expected):
+            raise Exception(f"The index found {len(matches)} products, the scan {len(expected)}.")
+
+        results.append((size, build, linear_ms, indexed_ms, trigram_ms, len(matches)))
+
+    return results
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["benchmark"]:
+        sizes = [int(size) for size in sys.argv[2:]] or [10000, 100000, 1000000]
+        print(f"{'products':>9} {'index build':>12} {'linear scan':>15} {'trigram index':>15} "
+              f"{'3+ characters':>15} {'matches':>8}")
+        for size, build, linear_ms, indexed_ms, trigram_ms, matches in benchmark_search(sizes):
+            print(f"{size:>9} {build:>10.2f} s {linear_ms:>8.2f} ms/key {indexed_ms:>8.2f} ms/key "
+                  f"{trigram_ms:>8.2f} ms/key {matches:>8}")
+    else:
+        print("Usage: python product_catalog.py benchmark [SIZE ...]")
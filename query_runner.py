@@ -0,0 +1,168 @@
+'''
+This module contains the QueryRunner, which runs database queries off the Qt GUI thread.
+
+Queries are executed on a QThreadPool and their results are delivered back to the GUI
+thread through Qt signals, so windows stay responsive while a query is in flight.
+Each request is submitted under a key; submitting a new request for the same key
+supersedes the previous one, whose result is then discarded (or never computed,
+if it had not started yet).
+
+Typical use in a window:
+
+    self.query_runner = QueryRunner(self)
+    self.query_runner.submit("orders", query_rows, sql, config_file='sqlproject.ini',
+                             on_result=self._show_orders, on_error=self._show_error)
+
+File: query_runner.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+'''
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from data201 import calling_site, trace_caller
+
+
+class _TaskSignals(QObject):
+    """
+    Signals emitted by a query task from its worker thread; each task emits
+    exactly one. They belong to the runner, which deletes them on the GUI thread.
+    """
+    result = pyqtSignal(object, object)  # (task, result)
+    error = pyqtSignal(object, str)      # (task, error message)
+    skipped = pyqtSignal(object)         # (task), cancelled before it started
+
+
+class QueryTask(QRunnable):
+    """
+    A query submitted to a QueryRunner. The function runs on a pool thread
+    and must not touch any widgets.
+    """
+
+    def __init__(self, key, func, args, kwargs, on_result, on_error, caller=None):
+        super().__init__()
+        self.setAutoDelete(False)  # The runner keeps a reference until the task has finished
+        self.key = key
+        self.caller = caller  # The method that submitted the task, for query tracing
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.on_result = on_result
+        self.on_error = on_error
+        self.cancelled = False
+        self.signals = _TaskSignals()
+
+    def cancel(self):
+        """Mark the task as superseded; its result will not be delivered."""
+        self.cancelled = True
+
+    def run(self):
+        try:
+            if self.cancelled:
+                self.signals.skipped.emit(self)
+                return
+            try:
+                with trace_caller(self.caller):
+                    result = self.func(*self.args, **self.kwargs)
+            except Exception as e:
+                self.signals.error.emit(self, str(e))
+            else:
+                self.signals.result.emit(self, result)
+        except RuntimeError:
+            pass  # The runner, and the signals with it, were deleted while the query ran
+
+
+class QueryRunner(QObject):
+    """
+    Run query functions on a thread pool and deliver their results on the GUI thread.
+
+    Input:
+        - parent (QObject): The window that owns the runner. Results are not delivered
+          after the owner is destroyed.
+        - thread_pool (QThreadPool, optional): The pool to run on. Defaults to the
+          application's global pool.
+    """
+
+    def __init__(self, parent=None, thread_pool=None):
+        super().__init__(parent)
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self._latest = {}  # key -> the most recent QueryTask for that key
+        # Every task the pool has not finished with, including cancelled ones: a task
+        # must not be garbage collected while the pool still holds it
+        self._tasks = set()
+
+    def submit(self, key, func, *args, on_result=None, on_error=None, **kwargs):
+        """
+        Run func(*args, **kwargs) on the thread pool.
+
+        Input:
+            - key (str): Identifies the request. A newer request with the same key
+              cancels this one.
+            - func (callable): The query function, e.g. data201.query_rows.
+            - on_result (callable): Called on the GUI thread with the function's result.
+            - on_error (callable): Called on the GUI thread with the error message.
+
+        Output:
+            - QueryTask: The submitted task.
+        """
+        self.cancel(key)
+
+        task = QueryTask(key, func, args, kwargs, on_result, on_error, calling_site())
+        task.signals.setParent(self)
+        task.signals.result.connect(self._deliver_result)
+        task.signals.error.connect(self._deliver_error)
+        task.signals.skipped.connect(self._release)
+        self._latest[key] = task
+        self._tasks.add(task)
+        self.thread_pool.start(task)
+        return task
+
+    def cancel(self, key):
+        """Cancel the pending request for the key, if any."""
+        task = self._latest.pop(key, None)
+        if task is not None:
+            task.cancel()
+            if self.thread_pool.tryTake(task):  # Drop it from the queue if it has not started
+                self._release(task)
+
+    def cancel_all(self, prefix=""):
+        """Cancel every pending request of this runner whose key starts with prefix."""
+        for key in list(self._latest):
+            if key.startswith(prefix):
+                self.cancel(key)
+
+    def is_pending(self, key):
+        """Return whether a request for the key is still in flight."""
+        return key in self._latest
+
+    def _is_current(self, task):
+        self._release(task)
+        if task.cancelled or self._latest.get(task.key) is not task:
+            return False
+        del self._latest[task.key]
+        return True
+
+    def _release(self, task):
+        """Let go of a task the pool has finished with or dropped."""
+        if task in self._tasks:
+            self._tasks.discard(task)
+            task.signals.deleteLater()
+
+    def _deliver_result(self, task, result):
+        if self._is_current(task) and task.on_result:
+            try:
+                task.on_result(result)
+            except RuntimeError as e:
+                # The receiving widget was deleted while the query ran.
+                print(f"Dropped result for {task.key}: {e}")
+
+    def _deliver_error(self, task, message):
+        if not self._is_current(task):
+            return
+        if task.on_error:
+            try:
+                task.on_error(message)
+            except RuntimeError as e:
+                print(f"Dropped error for {task.key}: {e}")
+        else:
+            print(f"Query {task.key} failed: {message}")
@@ -15,9 +15,20 @@ import sys
 from PyQt5.QtWidgets import QApplication, QMainWindow, QTableWidgetItem, QHeaderView, QMessageBox
 from PyQt5.uic import loadUi
 import mysql.connector
-from data201 import make_connection
+from data201 import make_connection, cached_query, query_rows, register_statement, query_named
+from query_runner import QueryRunner
 from shared import open_login_portal
 
+# The products of one order, looked up each time an order row is clicked.
+ORDER_DETAILS = register_statement('seller_order_details', """
+    SELECT 
+        oi.product_id, p.product_category, p.product_description, 
+        CONCAT('$', p.product_price), oi.quantity
+    FROM order_items oi
+    JOIN products p ON oi.product_id = p.product_id
+    WHERE oi.order_id = %s
+""")
+
 class SellerPortal(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -29,6 +40,9 @@ class SellerPortal(QMainWindow):
         # Setup navigation for QStackedWidget (handles page transitions)
         self.setup_navigation()
 
+        # Run the heavy table loads off the GUI thread
+        self.query_runner = QueryRunner(self)
+
         # Load initial data from the database
         self.load_orders_data()  # Load orders data
         self.load_customers_data()  # Load customers data
@@ -109,13 +123,9 @@ class SellerPortal(QMainWindow):
     def populate_product_categories(self):
         """Populate the ComboBox with unique product categories."""
 
-        connection = make_connection(config_file='sqlproject.ini')
-        cursor = connection.cursor()
-
         # SQL query to fetch unique product categories from the 'products' table
         query = "SELECT DISTINCT product_category FROM products"
-        cursor.execute(query)
-        categories = cursor.fetchall()  # Fetch all the categories
+        categories = cached_query(query, ttl=300, config_file='sqlproject.ini')  # Fetch all the categories
 
         # Add a default option ("All") to the ComboBox
         self.ComboBox_product_category.addItem("All")  # Default option to show all categories
@@ -124,20 +134,13 @@ class SellerPortal(QMainWindow):
         for category in categories:
             self.ComboBox_product_category.addItem(category[0])
 
-        cursor.close()
-        connection.close()
-
 
     def populate_order_status_combobox(self):
         """Populate the order status ComboBox."""
 
-        connection = make_connection(config_file='sqlproject.ini')
-        cursor = connection.cursor()
-
         # SQL query to fetch distinct order statuses from the 'orders' table
         query = "SELECT DISTINCT order_status FROM orders"
-        cursor.execute(query)
-        statuses = cursor.fetchall()  # Fetch all the order statuses
+        statuses = cached_query(query, ttl=300, config_file='sqlproject.ini')  # Fetch all the order statuses
 
         # Add an empty option as the default in the ComboBox
         self.ComboBox_status_order.addItem("")
@@ -146,9 +149,6 @@ class SellerPortal(QMainWindow):
         for status in statuses:
             self.ComboBox_status_order.addItem(status[0])
 
-        cursor.close()
-        connection.close()
-
     
     def setup_table(self, table_widget, columns):
         """Setup table headers and adjust column sizes."""
@@ -170,10 +170,7 @@ class SellerPortal(QMainWindow):
 
     # === Orders Functionality ===
     def load_orders_data(self):
-        """Load orders data into tblPg1Orders_4."""
-        connection = make_connection(config_file='sqlproject.ini')
-        cursor = connection.cursor()
-
+        """Load orders data into tblPg1Orders_4 without blocking the window."""
         # SQL query to fetch order data from the database
         query = """
         SELECT 
@@ -182,41 +179,36 @@ class SellerPortal(QMainWindow):
             order_estimated_delivery_date
         FROM orders
         """
-        cursor.execute(query)
-        results = cursor.fetchall()
+        # The results are written into the table on the GUI thread when the query finishes
+        self.query_runner.submit(
+            "orders", query_rows, query, config_file='sqlproject.ini',
+            on_result=lambda results: self._fill_table(self.tblPg1Orders_4, results),
+            on_error=lambda err: self._show_load_error("orders", err)
+        )
 
+    def _fill_table(self, table_widget, results):
+        """Fill a table widget with rows of query results."""
         # Set the number of rows in the table based on the fetched data
-        self.tblPg1Orders_4.setRowCount(len(results))
-        
+        table_widget.setRowCount(len(results))
+
         # Iterate through the fetched data and populate the table with the results
         for row_idx, row_data in enumerate(results):
             for col_idx, col_data in enumerate(row_data):
                 # Insert each data element into the corresponding cell in the table
-                self.tblPg1Orders_4.setItem(row_idx, col_idx, QTableWidgetItem(str(col_data)))
+                table_widget.setItem(row_idx, col_idx, QTableWidgetItem(str(col_data)))
 
-        cursor.close()
-        connection.close()
+    def _show_load_error(self, what, err):
+        """Report a failed background load."""
+        print(f"Error loading {what}: {err}")
+        QMessageBox.critical(self, "Database Error", f"Failed to load {what}: {err}")
     
     def load_order_details(self, row, column):
         """Load order details into tblPg1OrderDetails_4."""
         # Get the order_id from the selected row in the orders table
         order_id = self.tblPg1Orders_4.item(row, 0).text()
 
-        # Establish a connection to the database
-        connection = make_connection(config_file='sqlproject.ini')
-        cursor = connection.cursor()
-
-        # SQL query to fetch order details (products) for the selected order_id
-        query = """
-        SELECT 
-            oi.product_id, p.product_category, p.product_description, 
-            CONCAT('$', p.product_price), oi.quantity
-        FROM order_items oi
-        JOIN products p ON oi.product_id = p.product_id
-        WHERE oi.order_id = %s
-        """
-        cursor.execute(query, (order_id,))
-        results = cursor.fetchall()
+        # Fetch order details (products) for the selected order_id with the prepared statement
+        results = query_named(ORDER_DETAILS, (order_id,), config_file='sqlproject.ini')
 
         # Set the number of rows in the order details table based on the fetched data
         self.tblPg1OrderDetails_4.setRowCount(len(results))
@@ -227,19 +219,12 @@ class SellerPortal(QMainWindow):
                 # Insert each data element into the corresponding cell in the table
                 self.tblPg1OrderDetails_4.setItem(row_idx, col_idx, QTableWidgetItem(str(col_data)))
 
-        cursor.close()
-        connection.close()
-
 
     def populate_payment_types(self):
         """Populate the payment types ComboBox."""
-        connection = make_connection(config_file='sqlproject.ini')
-        cursor = connection.cursor()
-
         # SQL query to fetch distinct payment types from the order_payments table
         query = "SELECT DISTINCT payment_type FROM order_payments"
-        cursor.execute(query)
-        payment_types = cursor.fetchall()
+        payment_types = cached_query(query, ttl=300, config_file='sqlproject.ini')
 
         # Add a default "All" option to the ComboBox to show all payment types
         self.comboBox.addItem("All")
@@ -248,9 +233,6 @@ class SellerPortal(QMainWindow):
         for payment_type in payment_types:
             self.comboBox.addItem(payment_type[0])
 
-        cursor.close()
-        connection.close()
-
         
     def search_orders(self):
         """Search orders based on Order ID, Product Category, and Order Status."""
@@ -282,6 +264,9 @@ class SellerPortal(QMainWindow):
             query += " AND o.order_status = %s"
             params.append(order_status)
 
+        # A pending full reload must not overwrite the search results
+        self.query_runner.cancel("orders")
+
         # Connect to the database and execute the query
         connection = make_connection(config_file='sqlproject.ini')
         cursor = connection.cursor()
@@ -306,57 +291,35 @@ class SellerPortal(QMainWindow):
 
     def populate_product_categories(self):
         """Populate the Product Category ComboBox."""
-        connection = make_connection(config_file='sqlproject.ini')
-        cursor = connection.cursor()
-
         query = "SELECT DISTINCT product_category FROM products"
-        cursor.execute(query)
-        categories = cursor.fetchall()
+        categories = cached_query(query, ttl=300, config_file='sqlproject.ini')
 
         self.ComboBox_product_category.addItem("All")  # Default option to show all categories
         for category in categories:
             self.ComboBox_product_category.addItem(category[0])
 
-        cursor.close()
-        connection.close()
-
     def populate_order_status(self):
         """Populate the Order Status ComboBox."""
-        connection = make_connection(config_file='sqlproject.ini')
-        cursor = connection.cursor()
-
         query = "SELECT DISTINCT order_status FROM orders"
-        cursor.execute(query)
-        statuses = cursor.fetchall()
+        statuses = cached_query(query, ttl=300, config_file='sqlproject.ini')
 
         self.ComboBox_status_order_2.addItem("All")  # Default option to show all statuses
         for status in statuses:
             self.ComboBox_status_order_2.addItem(status[0])
 
-        cursor.close()
-        connection.close()
-
     # === Customers Functionality ===
     def load_customers_data(self):
-        """Load customers data into tblCustomers_3."""
-        connection = make_connection(config_file='sqlproject.ini')
-        cursor = connection.cursor()
-
+        """Load customers data into tblCustomers_3 without blocking the window."""
         query = """
         SELECT DISTINCT customer_id, customer_first_name, customer_last_name, customer_email, 
             customer_phone, customer_zip_code
         FROM customers
         """
-        cursor.execute(query)
-        results = cursor.fetchall()
-
-        self.tblCustomers_3.setRowCount(len(results))
-        for row_idx, row_data in enumerate(results):
-            for col_idx, col_data in enumerate(row_data):
-                self.tblCustomers_3.setItem(row_idx, col_idx, QTableWidgetItem(str(col_data)))
-
-        cursor.close()
-        connection.close()
+        self.query_runner.submit(
+            "customers", query_rows, query, config_file='sqlproject.ini',
+            on_result=lambda results: self._fill_table(self.tblCustomers_3, results),
+            on_error=lambda err: self._show_load_error("customers", err)
+        )
 
     def load_customer_order_details(self, row, column):
         """Load customer order details into tblCustOrders_3."""
@@ -387,10 +350,7 @@ class SellerPortal(QMainWindow):
         connection.close()
 
     def load_payments_data(self):
-        """Load payment details into tblPaymentsDetails_7."""
-        connection = make_connection(config_file='sqlproject.ini')
-        cursor = connection.cursor()
-
+        """Load payment details into tblPaymentsDetails_7 without blocking the window."""
         # Query to join customers, orders, and order_payments tables
         query = """
             SELECT 
@@ -408,19 +368,11 @@ class SellerPortal(QMainWindow):
             JOIN 
                 order_payments op ON o.order_id = op.order_id
         """
-        cursor.execute(query)
-        results = cursor.fetchall()
-
-        # Set the row count for tblPaymentsDetails_7
-        self.tblPaymentsDetails_7.setRowCount(len(results))
-
-        # Populate the table with results
-        for row_idx, row_data in enumerate(results):
-            for col_idx, col_data in enumerate(row_data):
-                self.tblPaymentsDetails_7.setItem(row_idx, col_idx, QTableWidgetItem(str(col_data)))
-
-        cursor.close()
-        connection.close()
+        self.query_runner.submit(
+            "payments", query_rows, query, config_file='sqlproject.ini',
+            on_result=lambda results: self._fill_table(self.tblPaymentsDetails_7, results),
+            on_error=lambda err: self._show_load_error("payments", err)
+        )
 
 
     def load_order_items_from_payment(self, row, column):
@@ -497,6 +449,9 @@ class SellerPortal(QMainWindow):
             query += " AND o.order_status = %s"
             params.append(order_status)
 
+        # A pending full reload must not overwrite the search results
+        self.query_runner.cancel("customers")
+
         connection = make_connection(config_file='sqlproject.ini')
         cursor = connection.cursor()
         cursor.execute(query, params)
@@ -543,6 +498,9 @@ class SellerPortal(QMainWindow):
             query += " AND c.customer_last_name LIKE %s"
             params.append(f"%{last_name}%")
 
+        # A pending full reload must not overwrite the search results
+        self.query_runner.cancel("payments")
+
         # Execute the query and populate the Payment Details table
         connection = make_connection(config_file='sqlproject.ini')
         cursor = connection.cursor()
@@ -13,7 +13,6 @@ Author: A SQL Master
 Course: DATA 201
 '''
 
-import mysql.connector
 from PyQt5 import QtWidgets
 from data201 import make_connection
 
@@ -21,6 +20,8 @@ def connect_to_database():
     """
     Establish a connection to the MySQL database using credentials and settings 
     from the provided config file ('sqlproject.ini').
+    The connection is borrowed from the shared connection pool in data201,
+    and closing it returns it to the pool.
     If an error occurs during the connection, an error message is displayed.
     
     Returns:
@@ -28,7 +29,7 @@ def connect_to_database():
     """
     try:
         return make_connection(config_file = 'sqlproject.ini')
-    except mysql.connector.Error as e:
+    except Exception as e:
         QtWidgets.QMessageBox.critical(None, "Database Error", f"Error connecting to the database: {e}")
         return None
 
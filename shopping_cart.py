@@ -0,0 +1,235 @@
+'''
+This module contains the Cart of the Customer Portal: the products a customer
+is about to order, keyed by product ID.
+
+Unit prices are kept as Decimal amounts of whole cents, and the cart maintains
+its subtotal and item count as lines are added, changed and removed, so adding
+a product, changing a quantity or showing the total costs the same for a cart
+of three lines as for a business buyer's cart of thousands. Lines keep the
+order they were added in.
+
+    cart = Cart()
+    cart.add('P1', 'Books', 'Fictional novel', '$19.99')
+    cart.set_quantity('P1', 3)
+    cart.subtotal, cart.count   # Decimal('59.97'), 3
+
+The benchmark compares the add and quantity-change path with the list of
+tuples the portal used before, which scanned the list to find a product and
+parsed every price label again to total the cart:
+
+    python shopping_cart.py benchmark [LINES...]
+
+File: shopping_cart.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+'''
+
+import sys
+import time
+import uuid
+import random
+from decimal import Decimal, InvalidOperation
+
+CENT = Decimal('0.01')
+
+def to_price(value):
+    """
+    Return a unit price as a Decimal of whole cents. value may be a
+    Decimal, a number or a price label such as "$1,234.50".
+    """
+    try:
+        if isinstance(value, str):
+            value = value.strip().lstrip('$').replace(',', '')
+        elif not isinstance(value, Decimal):
+            value = str(value)   # a float's shortest repr, not its binary expansion
+        return Decimal(value).quantize(CENT)
+    except (InvalidOperation, ValueError):
+        raise ValueError(f'Not a price: {value!r}') from None
+
+class CartLine:
+    """
+    One product in the cart and its quantity.
+    """
+    __slots__ = ('product_id', 'category', 'description', 'unit_price', 'quantity')
+
+    def __init__(self, product_id, category, description, unit_price, quantity):
+        self.product_id = product_id
+        self.category = category
+        self.description = description
+        self.unit_price = unit_price
+        self.quantity = quantity
+
+    @property
+    def total(self):
+        return self.unit_price * self.quantity
+
+    @property
+    def price_label(self):
+        return f"${self.unit_price:,.2f}"
+
+    def __repr__(self):
+        return f"CartLine({self.product_id!r}, {self.description!r}, {self.price_label}, x{self.quantity})"
+
+class Cart:
+    """
+    The lines of a shopping cart keyed by product ID, with a running
+    subtotal (Decimal) and item count (the sum of the quantities).
+    cart_id identifies the cart's stock holds (see stock_holds.py); a
+    cleared cart gets a new one.
+    """
+    def __init__(self):
+        self.cart_id = uuid.uuid4().hex
+        self._lines = {}   # product_id -> CartLine, in the order added
+        self.subtotal = Decimal('0.00')
+        self.count = 0
+
+    def add(self, product_id, category, description, unit_price, quantity = 1):
+        """
+        Add quantity of the product to the cart and return its line. A product
+        already in the cart gets the new unit price, e.g. after a price change.
+        """
+        unit_price = to_price(unit_price)
+        line = self._lines.get(product_id)
+
+        if line is None:
+            line = self._lines[product_id] = CartLine(product_id, category, description, unit_price, 0)
+        elif line.unit_price != unit_price:
+            self.subtotal += (unit_price - line.unit_price) * line.quantity
+            line.unit_price = unit_price
+
+        line.quantity += quantity
+        self.subtotal += unit_price * quantity
+        self.count += quantity
+        return line
+
+    def set_quantity(self, product_id, quantity):
+        """
+        Set the quantity of a product in the cart and return its line. A
+        quantity of 0 or less removes the product and returns None. Raise
+        a KeyError if the product is not in the cart.
+        """
+        if quantity <= 0:
+            if product_id not in self._lines:
+                raise KeyError(product_id)
+            self.remove(product_id)
+            return None
+
+        line = self._lines[product_id]
+        change = quantity - line.quantity
+        line.quantity = quantity
+        self.subtotal += line.unit_price * change
+        self.count += change
+        return line
+
+    def remove(self, product_id):
+        """
+        Remove a product from the cart and return its line,
+        or None if it was not in the cart.
+        """
+        line = self._lines.pop(product_id, None)
+        if line is not None:
+            self.subtotal -= line.total
+            self.count -= line.quantity
+        return line
+
+    def clear(self):
+        # Holds still being placed for the old ID cannot add to the new cart's
+        self.cart_id = uuid.uuid4().hex
+        self._lines.clear()
+        self.subtotal = Decimal('0.00')
+        self.count = 0
+
+    def get(self, product_id):
+        return self._lines.get(product_id)
+
+    def __contains__(self, product_id):
+        return product_id in self._lines
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __iter__(self):
+        return iter(self._lines.values())
+
+    def __repr__(self):
+        return f"Cart({len(self)} lines, {self.count} items, ${self.subtotal:,.2f})"
+
+#---------------------------#
+# Benchmark                 #
+#---------------------------#
+
+def _list_cart_add(cart_items, row_data):
+    """
+    Add a product to a list of (product_id, category, description,
+    price label, quantity) tuples the way the portal used to.
+    """
+    for i, item in enumerate(cart_items):
+        if item[:4] == row_data:
+            cart_items[i] = (*item[:4], item[4] + 1)
+            break
+    else:
+        cart_items.append((*row_data, 1))
+    count = sum(item[4] for item in cart_items)
+    total = sum(float(item[3].replace('$', '')) * item[4] for item in cart_items)
+    return count, total
+
+def _list_cart_update(cart_items, row_index, quantity):
+    cart_items[row_index] = (*cart_items[row_index][:4], quantity)
+    return sum(float(item[3].replace('$', '')) * item[4] for item in cart_items)
+
+def benchmark_cart(lines = (10, 100, 1000, 5000), updates = 2000, seed = 201):
+    """
+    Time adding lines products to a cart, then updates quantity changes
+    and re-adds of random lines, for the list of tuples and the Cart.
+    Return a list of (lines, list add us, cart add us, list update us,
+    cart update us) with the mean microseconds per operation.
+    """
+    results = []
+    for size in lines:
+        generator = random.Random(seed)
+        products = [(f'P{i}', 'Books', f'Product {i}', f"${generator.randint(100, 99999) / 100:.2f}")
+                    for i in range(size)]
+        changes = [(generator.randrange(size), generator.randint(1, 50)) for _ in range(updates)]
+
+        cart_items = []
+        started = time.perf_counter()
+        for product in products:
+            _list_cart_add(cart_items, product)
+        list_add = (time.perf_counter() - started) / size * 1e6
+
+        started = time.perf_counter()
+        for row_index, quantity in changes:
+            _list_cart_update(cart_items, row_index, quantity)
+            _list_cart_add(cart_items, products[row_index])
+        list_update = (time.perf_counter() - started) / (2 * updates) * 1e6
+
+        cart = Cart()
+        started = time.perf_counter()
+        for product in products:
+            cart.add(*product)
+            cart.subtotal, cart.count
+        cart_add = (time.perf_counter() - started) / size * 1e6
+
+        started = time.perf_counter()
+        for row_index, quantity in changes:
+            cart.set_quantity(products[row_index][0], quantity)
+            cart.add(*products[row_index])
+        cart_update = (time.perf_counter() - started) / (2 * updates) * 1e6
+
+        # Both carts must agree on the total to the cent
+        expected = sum(to_price(item[3]) * item[4] for item in cart_items)
+        if cart.subtotal != expected or cart.count != sum(item[4] for item in cart_items):
+            raise Exception(f'Cart totals differ for {size} lines: {cart.subtotal} != {expected}')
+
+        results.append((size, list_add, cart_add, list_update, cart_update))
+    return results
+
+if __name__ == '__main__':
+    if len(sys.argv) >= 2 and sys.argv[1] == 'benchmark':
+        sizes = [int(size) for size in sys.argv[2:]] or [10, 100, 1000, 5000]
+        print(f"{'Lines':>7} {'List add':>10} {'Cart add':>10} {'List update':>12} {'Cart update':>12}  (us per operation)")
+        for size, list_add, cart_add, list_update, cart_update in benchmark_cart(sizes):
+            print(f"{size:>7} {list_add:>10.1f} {cart_add:>10.1f} {list_update:>12.1f} {cart_update:>12.1f}")
+    else:
+        print('Usage: python shopping_cart.py benchmark [LINES...]')
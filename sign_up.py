@@ -19,7 +19,7 @@ from PyQt5.QtWidgets import QMessageBox, QApplication
 import os
 import mysql
 from shared import open_login_portal
-from data201 import make_connection 
+from customer_accounts import sign_up_customer, SignUpError
 
 class SignUpPage(QtWidgets.QDialog):
     def __init__(self):
@@ -179,78 +179,27 @@ class SignUpPage(QtWidgets.QDialog):
         if not self.validate_inputs():
             return
 
-        first_name = self.first_name.text().strip()
-        last_name = self.last_name.text().strip()
-        phone = self.phone.text().strip()
-        zip_code = self.zip_code.text().strip()
-        email = self.email.text().strip()
-        password = self.password.text().strip()
-
-        if not (first_name and last_name and phone and zip_code and email and password):
-            QMessageBox.warning(self, "Input Error", "All fields must be filled!")
-            return
-
-        conn = make_connection(config_file="sqlproject.ini")
-        cursor = conn.cursor()
+        customer = {
+            "first_name": self.first_name.text(),
+            "last_name": self.last_name.text(),
+            "phone": self.phone.text(),
+            "zip_code": self.zip_code.text(),
+            "email": self.email.text(),
+            "password": self.password.text(),
+        }
 
         try:
-            # Check if the email already exists in the customers table
-            cursor.execute("SELECT COUNT(*) FROM customers WHERE customer_email = %s", (email,))
-            if cursor.fetchone()[0] > 0:
-                # If email exists, show a warning and exit
-                QMessageBox.warning(self, "Email Already Taken", "This email is already registered. Please use a different email.")
-                return
-
-            # Check if the zip code exists in the geolocation table
-            cursor.execute("SELECT COUNT(*) FROM geolocation WHERE geolocation_id = %s", (zip_code,))
-            if cursor.fetchone()[0] == 0:
-                # If the zip code does not exist, show an error message and exit
-                QMessageBox.warning(self, "Invalid Zip Code", "The provided zip code is invalid.")
-                return
-
-            # Generate a new customer ID
-            new_customer_id = self._generate_new_customer_id(cursor)
-
-            # Insert the new customer record
-            sql = """
-                INSERT INTO customers (customer_id, customer_first_name, customer_last_name, customer_email, customer_phone, customer_zip_code)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            cursor.execute(sql, (new_customer_id, first_name, last_name, email, phone, zip_code))
-            conn.commit()
-
-            # Insert into user_portal table
-            user_portal_query = """
-                INSERT INTO user_portal (portal, user_name, password)
-                VALUES (%s, %s, %s)
-            """
-            cursor.execute(user_portal_query, ("customer", email, password))
-            conn.commit()
+            # Validate the customer and create the account in one transaction
+            sign_up_customer(customer, config_file="sqlproject.ini")
 
             QMessageBox.information(self, "Sign Up Successful", "Welcome! Thank you for signing up.")
             open_login_portal(self)  # Redirect to the login page
 
+        except SignUpError as e:
+            QMessageBox.warning(self, e.title, str(e))
         except Exception as e:
             print(f"Error during creation: {e}")  # Log error
             QMessageBox.critical(self, "Error", "Failed to create account.")
-        finally:
-            cursor.close()
-            conn.close()
-
-
-    def _generate_new_customer_id(self, cursor):
-        """
-        Generate a new customer ID starting from 1001 and incrementing by 1.
-        """
-        cursor.execute("SELECT customer_id FROM customers ORDER BY customer_id DESC LIMIT 1")
-        last_id = cursor.fetchone()
-
-        if last_id:
-            new_customer_id = last_id[0] + 1 
-        else:
-            new_customer_id = 1001
-
-        return new_customer_id
 
 
     def validate_inputs(self):
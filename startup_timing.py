@@ -0,0 +1,172 @@
+'''
+This module measures how quickly the application starts.
+
+For the login window and for each portal it reports how long the module takes
+to import and how long the window takes to be painted for the first time
+(construction, startup queries and the first paint). Each portal is measured
+in a fresh Python process, so that its imports are not already loaded by an
+earlier measurement.
+
+Usage:
+    python startup_timing.py                  # the login window and every portal
+    python startup_timing.py seller manager   # only the named portals
+
+Opening a portal runs its startup queries, so the database named in
+sqlproject.ini must be reachable (the embedded SQLite backend works too).
+
+File: startup_timing.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+'''
+
+import sys
+import json
+import time
+import subprocess
+
+# Marks the line of a measuring process's output that holds its timings.
+RESULT_PREFIX = "STARTUP_TIMING "
+
+# Seconds to wait for one measuring process.
+PROCESS_TIMEOUT = 120
+
+
+def first_paint(app, widget, show, timeout=30):
+    """
+    Show a widget and wait for its first paint event.
+
+    Input:
+        - app (QApplication): The running application.
+        - widget (QWidget): The widget whose paint event is awaited.
+        - show (callable): Shows the widget.
+        - timeout (float): Seconds to wait for the paint.
+
+    Output:
+        - float: The time of the first paint from time.perf_counter(), or None on timeout.
+    """
+    from PyQt5.QtCore import QObject, QEvent, QEventLoop
+
+    class PaintWatcher(QObject):
+        painted_at = None
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and self.painted_at is None:
+                self.painted_at = time.perf_counter()
+            return False
+
+    watcher = PaintWatcher()
+    widget.installEventFilter(watcher)
+    show()
+
+    deadline = time.monotonic() + timeout
+    while watcher.painted_at is None and time.monotonic() < deadline:
+        app.processEvents(QEventLoop.AllEvents, 50)
+
+    widget.removeEventFilter(watcher)
+    return watcher.painted_at
+
+
+def measure(portal=None):
+    """
+    Measure the login window and optionally one portal in this process.
+
+    Input:
+        - portal (str or None): customer, seller or manager.
+
+    Output:
+        - dict: Seconds for each step, or None for a window that was never painted.
+    """
+    timings = {}
+
+    started = time.perf_counter()
+    from PyQt5.QtWidgets import QApplication
+    import login_page
+    timings["login import"] = time.perf_counter() - started
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    started = time.perf_counter()
+    login = login_page.LoginPage()
+    painted = first_paint(app, login, login.show)
+    timings["login paint"] = painted - started if painted else None
+    login.close()
+
+    if portal:
+        started = time.perf_counter()
+        window_class = login_page.load_portal(portal)
+        timings["portal import"] = time.perf_counter() - started
+
+        if portal == "customer":
+            from data201 import query_rows
+            rows = query_rows("SELECT customer_id FROM customers LIMIT 1", config_file='sqlproject.ini')
+            arguments = {"customer_id": rows[0][0] if rows else None}
+        else:
+            arguments = {}
+
+        started = time.perf_counter()
+        window = window_class(**arguments)
+        if portal == "manager":
+            painted = first_paint(app, window.ui, window.show_dialog)
+        else:
+            painted = first_paint(app, window, window.show)
+        timings["portal paint"] = painted - started if painted else None
+
+    return timings
+
+
+def run_measurement(portal):
+    """
+    Measure the login window and a portal in a fresh Python process.
+
+    Input:
+        - portal (str or None): The portal to open after the login window.
+
+    Output:
+        - dict: The timings reported by the process, or None if it failed.
+    """
+    command = [sys.executable, __file__, "--measure"] + ([portal] if portal else [])
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=PROCESS_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        print(f"{portal or 'login'}: timed out after {PROCESS_TIMEOUT} seconds")
+        return None
+
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+
+    print(f"{portal or 'login'}: failed\n{completed.stderr.strip()}")
+    return None
+
+
+def format_seconds(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:8.0f} ms"
+
+
+def main(portals):
+    """
+    Print the import and first-paint times of the login window and each portal.
+    """
+    from login_page import PORTALS
+
+    for portal in portals:
+        if portal not in PORTALS:
+            sys.exit(f"Unknown portal {portal}; choose from {', '.join(PORTALS)}")
+
+    columns = ["login import", "login paint", "portal import", "portal paint"]
+    print(f"{'':10}" + "".join(f"{column:>15}" for column in columns))
+
+    for portal in [None] + list(portals or PORTALS):
+        timings = run_measurement(portal)
+        if timings is not None:
+            print(f"{portal or 'login':10}" +
+                  "".join(f"{format_seconds(timings.get(column)):>15}" for column in columns))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"]:
+        timings = measure(sys.argv[2] if len(sys.argv) > 2 else None)
+        print(RESULT_PREFIX + json.dumps(timings), flush=True)
+    else:
+        main(sys.argv[1:])
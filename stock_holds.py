@@ -0,0 +1,280 @@
+'''
+This module holds stock for the products in the customers' carts.
+
+Adding a product to a cart or changing its quantity places a hold on one
+seller's product_stock row for a short time ([stock_holds] ttl), if the row
+has that many units available: its stock minus the units other carts hold.
+Every change of a cart renews its holds, so the holds of an abandoned cart
+expire ttl seconds after its last change. Expired holds are ignored by every
+query and deleted by a sweeper in the background.
+
+At checkout the units held by the cart are counted as available to it, so a
+line the cart holds cannot run out of stock, and the order's transaction
+turns the holds into stock decrements and deletes them (see checkout.py).
+Products whose stock is sharded (see stock_shards.py) are not held; their
+stock is checked at checkout as before.
+
+    hold_stock(cart.cart_id, 'P1001', 2, config_file='sqlproject.ini')
+    available_stock(['P1001'], config_file='sqlproject.ini')   # {'P1001': 48}
+
+The sweeper runs in every process that places holds. It keeps the expiry
+times of its holds in a heap and deletes the expired holds of all carts when
+the earliest one is due, or at least every sweep_interval seconds. It can
+also run on its own:
+
+    python stock_holds.py sweep sqlproject.ini [--every SECONDS]
+    python stock_holds.py available sqlproject.ini PRODUCT_ID...
+
+File: stock_holds.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+'''
+
+import os
+import sys
+import time
+import heapq
+import threading
+from configparser import ConfigParser
+from datetime import datetime, timedelta
+from data201 import pooled_connection, pooled_read_connection
+from stock_shards import get_sharded_stock
+
+# Optional section of the configuration file with how
+# long stock is held and how often expired holds are deleted.
+HOLDS_SECTION = 'stock_holds'
+
+HOLDS_DEFAULTS = {
+    'ttl': 900,             # seconds a hold lasts after the last change of its cart
+    'sweep_interval': 60,   # longest time between deletions of expired holds
+}
+
+# The units of a product each seller's row has held, for other carts and for this one.
+HELD_SQL = """
+    SELECT seller_id,
+           SUM(CASE WHEN cart_id = %s THEN 0 ELSE quantity END),
+           SUM(CASE WHEN cart_id = %s THEN quantity ELSE 0 END)
+    FROM stock_holds
+    WHERE product_id = %s AND expires_at > %s
+    GROUP BY seller_id
+"""
+
+AVAILABLE_SQL = """
+    SELECT t.product_id, t.stock, COALESCE(SUM(h.quantity), 0)
+    FROM product_stock_totals t
+    LEFT JOIN stock_holds h
+      ON h.product_id = t.product_id AND h.seller_id = t.seller_id AND h.expires_at > %s
+    WHERE t.product_id IN ({})
+    GROUP BY t.product_id, t.seller_id, t.stock
+"""
+
+def read_holds_config(config_file = 'config.ini'):
+    """
+    Read the optional [stock_holds] section of the configuration file
+    config_file and return its settings as a dictionary, using the
+    defaults for any setting that is not given.
+    """
+    settings = dict(HOLDS_DEFAULTS)
+    parser = ConfigParser()
+    parser.read(config_file)
+
+    if parser.has_section(HOLDS_SECTION):
+        for key, value in parser.items(HOLDS_SECTION):
+            if key in settings:
+                settings[key] = type(HOLDS_DEFAULTS[key])(value)
+
+    return settings
+
+def _timestamp(moment):
+    return moment.strftime('%Y-%m-%d %H:%M:%S')
+
+def hold_stock(cart_id, product_id, quantity, config_file = 'config.ini', section = 'mysql', now = None):
+    """
+    Hold quantity units of the product for the cart in place of any units it
+    held before, and renew the cart's other holds. A quantity of 0 releases
+    the product. If no seller has quantity units available, the cart keeps
+    what it held. Return the units held, the most units one seller could
+    hold for the cart, and when the holds expire (None if nothing is held,
+    or the product is sharded and not held at all).
+    """
+    settings = read_holds_config(config_file)
+    quantity = max(quantity, 0)
+    now = now or datetime.now()
+    expires_at = now + timedelta(seconds=settings['ttl'])
+
+    if product_id in get_sharded_stock(config_file, section).products():
+        return quantity, quantity, None
+
+    with pooled_connection(config_file, section) as conn:
+        cursor = conn.cursor()
+        try:
+            # Holds of a row are placed only while it is locked, so its available units cannot change
+            cursor.execute("SELECT seller_id, stock FROM product_stock WHERE product_id = %s "
+                           "ORDER BY seller_id FOR UPDATE", (product_id,))
+            stocks = cursor.fetchall()
+            cursor.execute(HELD_SQL, (cart_id, cart_id, product_id, _timestamp(now)))
+            held = {seller_id: (int(others), int(own)) for seller_id, others, own in cursor.fetchall()}
+
+            available = {seller_id: (stock or 0) - held.get(seller_id, (0, 0))[0] for seller_id, stock in stocks}
+            most = max(available.values(), default=0)
+            sellers = [seller_id for seller_id, units in available.items() if units >= quantity]
+            if quantity > 0 and not sellers:
+                quantity = sum(own for _, own in held.values())
+            else:
+                cursor.execute("DELETE FROM stock_holds WHERE cart_id = %s AND product_id = %s", (cart_id, product_id))
+                if quantity > 0:
+                    cursor.execute("INSERT INTO stock_holds (cart_id, product_id, seller_id, quantity, expires_at) "
+                                   "VALUES (%s, %s, %s, %s, %s)",
+                                   (cart_id, product_id, sellers[0], quantity, _timestamp(expires_at)))
+
+            # Expired holds are not renewed: their units may have been held or sold since
+            cursor.execute("UPDATE stock_holds SET expires_at = %s WHERE cart_id = %s AND expires_at > %s",
+                           (_timestamp(expires_at), cart_id, _timestamp(now)))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    get_hold_sweeper(config_file, section).schedule(expires_at)
+    return quantity, max(most, 0), expires_at if quantity > 0 else None
+
+def release_holds(cart_id, config_file = 'config.ini', section = 'mysql'):
+    """
+    Release all holds of the cart, e.g. when its window is closed.
+    """
+    with pooled_connection(config_file, section) as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("DELETE FROM stock_holds WHERE cart_id = %s", (cart_id,))
+            conn.commit()
+        finally:
+            cursor.close()
+
+def available_stock(product_ids, config_file = 'config.ini', section = 'mysql', now = None):
+    """
+    Return {product_id: units available to sell} of the products: the
+    stock of all their sellers, shards included, minus the units held.
+    """
+    product_ids = list(product_ids)
+    if not product_ids:
+        return {}
+    now = now or datetime.now()
+
+    with pooled_read_connection(config_file, section) as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(AVAILABLE_SQL.format(', '.join(['%s'] * len(product_ids))),
+                           [_timestamp(now), *product_ids])
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+    available = dict.fromkeys(product_ids, 0)
+    for product_id, stock, held in rows:
+        available[product_id] += max(0, int(stock or 0) - int(held))
+    return available
+
+def sweep_expired(config_file = 'config.ini', section = 'mysql', now = None):
+    """
+    Delete the expired holds of all carts and return how many there were.
+    """
+    now = now or datetime.now()
+
+    with pooled_connection(config_file, section) as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("DELETE FROM stock_holds WHERE expires_at <= %s", (_timestamp(now),))
+            deleted = cursor.rowcount
+            conn.commit()
+        finally:
+            cursor.close()
+
+    return deleted
+
+class HoldSweeper:
+    """
+    A background thread that deletes expired holds when the earliest hold
+    placed by this process expires, and at least every interval seconds.
+    """
+    def __init__(self, config_file = 'config.ini', section = 'mysql', interval = None):
+        self.config_file = config_file
+        self.section = section
+        self.interval = interval or read_holds_config(config_file)['sweep_interval']
+
+        self._expiries = []     # heap of the expiry times (epoch seconds) of this process's holds
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def schedule(self, expires_at):
+        """
+        Have the holds swept once expires_at (a datetime) has passed.
+        """
+        with self._condition:
+            heapq.heappush(self._expiries, expires_at.timestamp())
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='HoldSweeper', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        swept = time.time()
+        while True:
+            with self._condition:
+                due = swept + self.interval
+                if self._expiries:
+                    due = min(due, self._expiries[0])
+                self._condition.wait(max(0.0, due - time.time()))
+
+                now = time.time()
+                if now < due:
+                    continue    # woken by an earlier expiry; wait for it
+                # Holds that expire together, or were renewed, are swept once
+                while self._expiries and self._expiries[0] <= now:
+                    heapq.heappop(self._expiries)
+
+            try:
+                sweep_expired(self.config_file, self.section)
+            except Exception as e:
+                print(f"Error sweeping expired stock holds: {e}")
+            swept = time.time()
+
+_sweepers = {}
+_sweepers_lock = threading.Lock()
+
+def get_hold_sweeper(config_file = 'config.ini', section = 'mysql'):
+    """
+    Return the HoldSweeper of the configuration file config_file
+    with the given section, creating it on first use.
+    """
+    key = (os.path.abspath(config_file), section)
+
+    with _sweepers_lock:
+        sweeper = _sweepers.get(key)
+        if sweeper is None:
+            sweeper = _sweepers[key] = HoldSweeper(config_file, section)
+
+    return sweeper
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+
+    if command == 'sweep' and len(sys.argv) in (3, 5):
+        config_file = sys.argv[2]
+        every = float(sys.argv[4]) if len(sys.argv) == 5 and sys.argv[3] == '--every' else None
+        while True:
+            deleted = sweep_expired(config_file)
+            print(f"{time.strftime('%H:%M:%S')} Deleted {deleted} expired holds.")
+            if every is None:
+                break
+            time.sleep(every)
+
+    elif command == 'available' and len(sys.argv) >= 4:
+        for product_id, units in available_stock(sys.argv[3:], config_file=sys.argv[2]).items():
+            print(f"{product_id}: {units}")
+
+    else:
+        print('Usage: python stock_holds.py sweep CONFIG_FILE [--every SECONDS]')
+        print('       python stock_holds.py available CONFIG_FILE PRODUCT_ID...')
@@ -0,0 +1,342 @@
+'''
+This module splits the stock of hot products, e.g. the ones on sale during
+a promotion, across several rows, so that concurrent checkouts of the same
+product do not all wait for the lock of one product_stock row.
+
+The stock of a sharded (product, seller) row is held in product_stock_shards,
+one row per shard. A checkout takes a product's units from a randomly chosen
+shard that has enough of them, trying the other shards in turn, and from
+several shards together only if no single one has enough. The product_stock
+row keeps the stock not yet moved into the shards, e.g. a seller's restock;
+it is 0 right after sharding, and checkouts never take from it.
+
+The product_stock_totals view adds the shards to product_stock, so reports
+see each row's whole stock. The rebalancing job moves the stock left on the
+product_stock rows into the shards and evens the shards out, as some run
+empty before others:
+
+    python stock_shards.py shard sqlproject.ini P1001 S1002 [SHARDS]
+    python stock_shards.py unshard sqlproject.ini P1001 S1002
+    python stock_shards.py rebalance sqlproject.ini [--every SECONDS]
+
+The throughput of one hot product with and without shards can be compared
+with the checkout load test:
+
+    python checkout.py loadtest sqlproject.ini --products 1 --stock 100000
+    python checkout.py loadtest sqlproject.ini --products 1 --stock 100000 --shards 8
+
+File: stock_shards.py
+Project: E-Commerce Management System
+Author: A SQL Master
+Course: DATA 201
+'''
+
+import os
+import sys
+import time
+import random
+import threading
+from configparser import ConfigParser
+from mysql.connector import Error
+from data201 import pooled_connection, pooled_read_connection
+
+# Optional section of the configuration file with the
+# number of shards and how often the sharded products are checked.
+SHARDS_SECTION = 'stock_shards'
+
+SHARDS_DEFAULTS = {
+    'shards': 8,                # shards a product's stock is split into by default
+    'check_interval': 60,       # seconds between reloads of which products are sharded
+    'rebalance_interval': 60,   # seconds between runs of the rebalancing job
+}
+
+SHARDED_SQL = """
+    SELECT product_id, seller_id, COUNT(*)
+    FROM product_stock_shards
+    GROUP BY product_id, seller_id
+"""
+
+# Takes the units from one shard, if it has them all.
+TAKE_SQL = """
+    UPDATE product_stock_shards
+    SET stock = stock - %s
+    WHERE product_id = %s AND seller_id = %s AND shard = %s AND stock >= %s
+"""
+
+def read_shards_config(config_file = 'config.ini'):
+    """
+    Read the optional [stock_shards] section of the configuration file
+    config_file and return its settings as a dictionary, using the
+    defaults for any setting that is not given.
+    """
+    settings = dict(SHARDS_DEFAULTS)
+    parser = ConfigParser()
+    parser.read(config_file)
+
+    if parser.has_section(SHARDS_SECTION):
+        for key, value in parser.items(SHARDS_SECTION):
+            if key in settings:
+                settings[key] = type(SHARDS_DEFAULTS[key])(value)
+
+    return settings
+
+class ShardedStock:
+    """
+    Which products of one database have sharded stock. Safe to use
+    from several threads.
+    """
+    def __init__(self, config_file = 'config.ini', section = 'mysql', check_interval = None):
+        self.config_file = config_file
+        self.section = section
+        self.check_interval = check_interval or read_shards_config(config_file)['check_interval']
+
+        self._products = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """
+        Reload the sharded products now, e.g. after sharding a product.
+        """
+        with pooled_read_connection(self.config_file, self.section) as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(SHARDED_SQL)
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+
+        products = {}
+        for product_id, seller_id, shards in rows:
+            products.setdefault(product_id, {})[seller_id] = int(shards)
+
+        with self._lock:
+            self._products = products   # replaced, never modified, so readers need no lock
+            self._checked = time.monotonic()
+
+    def products(self):
+        """
+        Return {product_id: {seller_id: number of shards}} of the sharded
+        products, reloading it once every check_interval seconds.
+        """
+        if self._products is None or time.monotonic() - self._checked > self.check_interval:
+            self.refresh()
+        return self._products
+
+_sharded = {}
+_sharded_lock = threading.Lock()
+
+def get_sharded_stock(config_file = 'config.ini', section = 'mysql'):
+    """
+    Return the ShardedStock of the configuration file config_file
+    with the given section, creating it on first use.
+    """
+    key = (os.path.abspath(config_file), section)
+
+    with _sharded_lock:
+        sharded = _sharded.get(key)
+        if sharded is None:
+            sharded = _sharded[key] = ShardedStock(config_file, section)
+
+    return sharded
+
+def _split(total, shards):
+    """
+    Return total split into shards nearly equal parts.
+    """
+    return [total // shards + (1 if i < total % shards else 0) for i in range(shards)]
+
+def _lock_stock(cursor, product_id, seller_id):
+    """
+    Lock a product_stock row and its shards, in shard order, and return
+    the stock left on the row and the stock of each shard.
+    """
+    cursor.execute("SELECT stock FROM product_stock WHERE product_id = %s AND seller_id = %s FOR UPDATE",
+                   (product_id, seller_id))
+    row = cursor.fetchone()
+    if row is None:
+        raise Exception(f'Seller {seller_id} has no stock row for product {product_id}.')
+    cursor.execute("""
+        SELECT shard, stock FROM product_stock_shards
+        WHERE product_id = %s AND seller_id = %s
+        ORDER BY shard
+        FOR UPDATE
+    """, (product_id, seller_id))
+    return row[0] or 0, cursor.fetchall()
+
+def _write_shards(cursor, product_id, seller_id, total, shards):
+    cursor.execute("DELETE FROM product_stock_shards WHERE product_id = %s AND seller_id = %s",
+                   (product_id, seller_id))
+    if shards:
+        cursor.executemany(
+            "INSERT INTO product_stock_shards (product_id, seller_id, shard, stock) VALUES (%s, %s, %s, %s)",
+            [(product_id, seller_id, shard, stock) for shard, stock in enumerate(_split(total, shards))])
+    cursor.execute("UPDATE product_stock SET stock = %s WHERE product_id = %s AND seller_id = %s",
+                   (0 if shards else total, product_id, seller_id))
+
+def shard_stock(product_id, seller_id, shards = None, config_file = 'config.ini', section = 'mysql'):
+    """
+    Split the seller's stock of the product evenly across shards rows
+    ([stock_shards] shards by default), or re-split it if it is already
+    sharded. Return the stock.
+    """
+    shards = shards or read_shards_config(config_file)['shards']
+    if shards < 1:
+        raise ValueError('A product needs at least one shard.')
+
+    with pooled_connection(config_file, section) as conn:
+        cursor = conn.cursor()
+        try:
+            reserve, current = _lock_stock(cursor, product_id, seller_id)
+            total = reserve + sum(stock for _, stock in current)
+            _write_shards(cursor, product_id, seller_id, total, shards)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    get_sharded_stock(config_file, section).refresh()
+    return total
+
+def unshard_stock(product_id, seller_id, config_file = 'config.ini', section = 'mysql'):
+    """
+    Move the stock of the product's shards back to its product_stock row
+    and remove the shards. Return the stock.
+    """
+    with pooled_connection(config_file, section) as conn:
+        cursor = conn.cursor()
+        try:
+            reserve, current = _lock_stock(cursor, product_id, seller_id)
+            total = reserve + sum(stock for _, stock in current)
+            _write_shards(cursor, product_id, seller_id, total, 0)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    get_sharded_stock(config_file, section).refresh()
+    return total
+
+def rebalance_stock(config_file = 'config.ini', section = 'mysql'):
+    """
+    Move the stock left on the product_stock rows of sharded products into
+    their shards and even the shards out, with one short transaction per
+    product. A product whose rows stay locked is left for the next run.
+    Return the number of products rebalanced and skipped.
+    """
+    sharded = get_sharded_stock(config_file, section)
+    sharded.refresh()
+    rebalanced = skipped = 0
+
+    with pooled_connection(config_file, section) as conn:
+        for product_id, sellers in sharded.products().items():
+            for seller_id, shards in sellers.items():
+                cursor = conn.cursor()
+                try:
+                    reserve, current = _lock_stock(cursor, product_id, seller_id)
+                    stocks = [stock for _, stock in current]
+                    total = reserve + sum(stocks)
+                    if reserve or max(stocks, default=0) - min(stocks, default=0) > 1:
+                        cursor.executemany(
+                            "UPDATE product_stock_shards SET stock = %s "
+                            "WHERE product_id = %s AND seller_id = %s AND shard = %s",
+                            [(stock, product_id, seller_id, shard)
+                             for (shard, _), stock in zip(current, _split(total, len(current)))])
+                        cursor.execute("UPDATE product_stock SET stock = 0 WHERE product_id = %s AND seller_id = %s",
+                                       (product_id, seller_id))
+                        rebalanced += 1
+                    conn.commit()
+                except Error as e:
+                    # A deadlock or lock wait with the checkouts: try again next run
+                    conn.rollback()
+                    print(f"Skipped rebalancing {product_id}/{seller_id}: {e}")
+                    skipped += 1
+                finally:
+                    cursor.close()
+
+    return rebalanced, skipped
+
+def take_sharded_stock(cursor, product_id, sellers, quantity):
+    """
+    Take quantity units of a sharded product in the transaction of cursor,
+    from the first of its sellers that has them. sellers is the product's
+    {seller_id: number of shards}. Return the seller ID, or None if no
+    seller has enough stock.
+
+    A failed UPDATE keeps its row lock until the transaction ends (rolling
+    back to a savepoint does not release InnoDB's locks), so the shards are
+    chosen by a non-locking read, and only a shard that seemed to have the
+    units is updated. The locks of the fallback, which takes from several
+    shards in shard order, can then deadlock only if such an UPDATE lost
+    a race for the units; place_order retries the transaction.
+    """
+    for seller_id in sorted(sellers):
+        shards = sellers[seller_id]
+        cursor.execute("SELECT shard, stock FROM product_stock_shards "
+                       "WHERE product_id = %s AND seller_id = %s", (product_id, seller_id))
+        stocks = dict(cursor.fetchall())
+
+        # Start at a random shard, so concurrent checkouts spread across the shards
+        start = random.randrange(shards)
+        for i in range(shards):
+            shard = (start + i) % shards
+            if (stocks.get(shard) or 0) < quantity:
+                continue
+            cursor.execute(TAKE_SQL, (quantity, product_id, seller_id, shard, quantity))
+            if cursor.rowcount == 1:
+                return seller_id
+
+        # No shard has all the units: take them from several, locked in shard order
+        cursor.execute("""
+            SELECT shard, stock FROM product_stock_shards
+            WHERE product_id = %s AND seller_id = %s AND stock > 0
+            ORDER BY shard
+            FOR UPDATE
+        """, (product_id, seller_id))
+        rows = cursor.fetchall()
+        if sum(stock for _, stock in rows) >= quantity:
+            takes = []
+            remaining = quantity
+            for shard, stock in rows:
+                take = min(stock, remaining)
+                takes.append((take, product_id, seller_id, shard, take))
+                remaining -= take
+                if not remaining:
+                    break
+            cursor.executemany(TAKE_SQL, takes)
+            return seller_id
+
+    return None
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+
+    if command == 'shard' and len(sys.argv) in (5, 6):
+        shards = int(sys.argv[5]) if len(sys.argv) == 6 else None
+        total = shard_stock(sys.argv[3], sys.argv[4], shards, config_file=sys.argv[2])
+        print(f"Split {total} units of {sys.argv[3]} from seller {sys.argv[4]} into shards.")
+
+    elif command == 'unshard' and len(sys.argv) == 5:
+        total = unshard_stock(sys.argv[3], sys.argv[4], config_file=sys.argv[2])
+        print(f"Moved {total} units of {sys.argv[3]} from seller {sys.argv[4]} back to one row.")
+
+    elif command == 'rebalance' and len(sys.argv) in (3, 5):
+        config_file = sys.argv[2]
+        every = float(sys.argv[4]) if len(sys.argv) == 5 and sys.argv[3] == '--every' else None
+        if every is None and len(sys.argv) == 5:
+            every = read_shards_config(config_file)['rebalance_interval']
+        while True:
+            rebalanced, skipped = rebalance_stock(config_file)
+            print(f"{time.strftime('%H:%M:%S')} Rebalanced {rebalanced} products, skipped {skipped}.")
+            if every is None:
+                break
+            time.sleep(every)
+
+    else:
+        print('Usage: python stock_shards.py shard CONFIG_FILE PRODUCT_ID SELLER_ID [SHARDS]')
+        print('       python stock_shards.py unshard CONFIG_FILE PRODUCT_ID SELLER_ID')
+        print('       python stock_shards.py rebalance CONFIG_FILE [--every SECONDS]')